@@ -0,0 +1,68 @@
+# BUYMA 자동화 프로그램 - 가격 분석 결과 엑셀 기록 모듈
+import threading
+from datetime import datetime
+
+from search_tiles import parse_price
+
+
+REPORT_COLUMNS = ['페이지', '상품명', '현재가격', '최저가', '가격차이', '상태', '처리시간']
+
+
+def report_row(product, page, now=None):
+    """분석한 상품 1개의 엑셀 행 - 가격차이는 현재가격 - 최저가"""
+    title = product.get('title', '')
+    if '商品ID' in title:
+        title = title.split('商品ID')[0].strip()
+
+    current_price = parse_price(str(product.get('current_price', ''))) or 0
+    lowest_price = product.get('lowest_price', 0) or 0
+    price_diff = current_price - lowest_price if current_price > 0 and lowest_price > 0 else 0
+
+    return {
+        '페이지': page,
+        '상품명': title,
+        '현재가격': product.get('current_price', ''),
+        '최저가': f"¥{lowest_price:,}" if lowest_price > 0 else '-',
+        '가격차이': f"{price_diff:+,}엔" if price_diff != 0 else '-',
+        '상태': product.get('status', ''),
+        '처리시간': (now or datetime.now()).strftime('%H:%M:%S'),
+    }
+
+
+def create_report(path):
+    """헤더만 있는 결과 파일 생성"""
+    import pandas as pd
+    pd.DataFrame(columns=REPORT_COLUMNS).to_excel(path, index=False)
+
+
+def append_report(path, rows):
+    """기존 결과 파일 뒤에 행 추가"""
+    import pandas as pd
+    existing_df = pd.read_excel(path)
+    combined_df = pd.concat([existing_df, pd.DataFrame(rows, columns=REPORT_COLUMNS)], ignore_index=True)
+    combined_df.to_excel(path, index=False)
+
+
+class AnalysisReport:
+    """가격분석 결과 파일 1개 - 시작할 때 헤더만 만들고 페이지(묶음)가 끝날 때마다 행 추가
+    분석/수정 파이프라인의 여러 스레드에서 호출해도 파일 쓰기는 한 번에 하나씩"""
+
+    def __init__(self, path=None, now=None):
+        self.path = path or f"가격분석결과_{(now or datetime.now()).strftime('%Y%m%d_%H%M%S')}.xlsx"
+        self.rows = 0
+        self._lock = threading.Lock()
+
+    def create(self):
+        with self._lock:
+            create_report(self.path)
+            self.rows = 0
+        return self.path
+
+    def append(self, products, page):
+        """상품들의 결과 행 추가 - page 는 페이지 번호 또는 상품 → 페이지 번호 함수, 추가한 행 수 반환"""
+        page_of = page if callable(page) else (lambda product: page)
+        rows = [report_row(product, page_of(product)) for product in products]
+        with self._lock:
+            append_report(self.path, rows)
+            self.rows += len(rows)
+        return len(rows)
@@ -0,0 +1,128 @@
+# BUYMA 자동화 프로그램 - 가격 분석 우선순위 스케줄러 모듈
+import json
+import math
+import os
+import threading
+import time
+
+from product_index import product_id_of, title_key
+from search_tiles import parse_price
+
+
+# 우선순위 점수 가중치 (각 항목은 0~1 로 정규화)
+DEFAULT_WEIGHTS = {
+    'staleness': 0.45,   # 마지막 확인 후 경과 시간
+    'volatility': 0.25,  # 최근 경쟁사 최저가 변동폭
+    'favorite': 0.20,    # 주력상품 여부
+    'price_band': 0.10,  # 가격대 (고가 상품일수록 가격 차이의 영향이 큼)
+}
+
+STALENESS_CAP_HOURS = 72        # 이 시간 이상 확인하지 않은 상품은 최대 점수
+VOLATILITY_CAP = 0.10           # 최저가 변동률 10% 이상이면 최대 점수
+VOLATILITY_ALPHA = 0.3          # 변동률 지수이동평균 계수
+PRICE_BAND_RANGE = (3000, 300000)  # 가격대 점수 구간 (로그 스케일)
+
+
+def price_band_score(price):
+    """가격대 점수 - 로그 스케일로 PRICE_BAND_RANGE 안에서 0~1"""
+    low, high = PRICE_BAND_RANGE
+    if not price or price <= low:
+        return 0.0
+    if price >= high:
+        return 1.0
+    return math.log(price / low) / math.log(high / low)
+
+
+class AnalysisScheduler:
+    """상품별 마지막 확인 시각/최저가 변동률을 보관하고, 가치가 높은 상품부터 분석 순서를 정하는 클래스
+    상태는 상품ID 기준 JSON 파일에 저장하므로 내 상품을 새로 불러와도 유지된다."""
+
+    def __init__(self, state_file=None, weights=None, clock=None, history=None):
+        self.state_file = state_file
+        self.history = history   # PriceHistory - 상태 파일에 없는 상품의 마지막 확인 시각 조회
+        self.weights = dict(DEFAULT_WEIGHTS, **(weights or {}))
+        self.clock = clock or time.time
+        self._lock = threading.Lock()
+        self.state = {}   # {상품ID: {'last_checked': epoch 초, 'volatility': 0~, 'last_lowest': 엔, 'checks': 횟수}}
+        if state_file and os.path.exists(state_file):
+            self.load()
+
+    def load(self):
+        """상태 파일 불러오기 (손상된 파일은 무시)"""
+        try:
+            with open(self.state_file, 'r', encoding='utf-8') as f:
+                self.state = json.load(f)
+        except (OSError, ValueError):
+            self.state = {}
+
+    def save(self):
+        """상태 파일 저장"""
+        if not self.state_file:
+            return
+        with self._lock:
+            data = dict(self.state)
+        with open(self.state_file, 'w', encoding='utf-8') as f:
+            json.dump(data, f, ensure_ascii=False, indent=2)
+
+    def _entry(self, product):
+        product_id = product_id_of(product)
+        return self.state.get(product_id, {}) if product_id else {}
+
+    def score(self, product, favorites=frozenset(), now=None, history_checked=None):
+        """상품의 분석 우선순위 점수 (높을수록 먼저) - history_checked: 가격 이력의 마지막 확인 시각"""
+        now = self.clock() if now is None else now
+        entry = self._entry(product)
+
+        last_checked = entry.get('last_checked') or product.get('last_checked') or history_checked
+        if last_checked:
+            staleness = min(max(now - float(last_checked), 0) / 3600 / STALENESS_CAP_HOURS, 1.0)
+        else:
+            staleness = 1.0  # 한 번도 확인하지 않은 상품
+
+        volatility = min(float(entry.get('volatility', product.get('volatility', 0)) or 0) / VOLATILITY_CAP, 1.0)
+        favorite = 1.0 if (product_id_of(product) in favorites
+                           or title_key(product.get('title') or product.get('name')) in favorites) else 0.0
+        band = price_band_score(parse_price(str(product.get('current_price', ''))))
+
+        weights = self.weights
+        return (weights['staleness'] * staleness + weights['volatility'] * volatility
+                + weights['favorite'] * favorite + weights['price_band'] * band)
+
+    def order(self, products, favorites=frozenset()):
+        """점수 내림차순으로 정렬한 상품 목록 (점수가 같으면 원래 순서 유지)"""
+        now = self.clock()
+        checked = self.history.last_checked_map() if self.history else {}
+        scores = [self.score(product, favorites, now, checked.get(product_id_of(product))) for product in products]
+        ranked = sorted(range(len(products)), key=lambda i: -scores[i])
+        return [products[i] for i in ranked]
+
+    def time_boxed(self, products, budget_seconds):
+        """시간 제한 안에서만 상품을 하나씩 내보내는 제너레이터 (budget_seconds 가 0 이하면 제한 없음)"""
+        deadline = self.clock() + budget_seconds if budget_seconds and budget_seconds > 0 else None
+        for product in products:
+            if deadline is not None and self.clock() >= deadline:
+                return
+            yield product
+
+    def record_check(self, product, lowest_price):
+        """분석 완료 기록 - 마지막 확인 시각과 최저가 변동률(지수이동평균) 갱신, 상품 dict 에도 반영"""
+        product_id = product_id_of(product)
+        if not product_id:
+            return
+        now = self.clock()
+        with self._lock:
+            entry = dict(self.state.get(product_id, {}))
+            previous = entry.get('last_lowest')
+            volatility = float(entry.get('volatility', 0) or 0)
+            if previous and lowest_price:
+                change = abs(lowest_price - previous) / previous
+                volatility = VOLATILITY_ALPHA * change + (1 - VOLATILITY_ALPHA) * volatility
+            entry.update({
+                'last_checked': now,
+                'volatility': round(volatility, 6),
+                'last_lowest': lowest_price or previous,
+                'checks': entry.get('checks', 0) + 1,
+            })
+            self.state[product_id] = entry
+        product['last_checked'] = now
+        product['volatility'] = entry['volatility']
@@ -0,0 +1,137 @@
+# BUYMA 자동화 프로그램 - 브라우저 웜 스타트 모듈 (쿠키 저장/복원)
+import json
+import os
+import threading
+import time
+
+
+BUYMA_BASE_URL = "https://www.buyma.com"
+COOKIE_FILE = "buyma_cookies.json"
+
+
+class CookieStore:
+    """로그인 쿠키를 파일로 보관해 브라우저 재시작/프로그램 재실행 시 로그인 없이 복원하는 클래스
+    rate_limiter 를 지정하면 페이지 이동에 기본 주소 변경(재생 서버)과 페이지 기록을 적용"""
+
+    def __init__(self, path=COOKIE_FILE, max_age_hours=72, log=print, rate_limiter=None):
+        self.path = path
+        self.max_age_hours = max_age_hours
+        self.log = log
+        self.rate_limiter = rate_limiter
+
+        # 시작 방식별 소요 시간 (초) - cold: 폼 로그인, warm: 쿠키 복원
+        self.start_times = {'cold': [], 'warm': []}
+        self._lock = threading.Lock()
+
+    def save(self, driver):
+        """현재 브라우저 쿠키 저장"""
+        try:
+            cookies = driver.get_cookies()
+            if not cookies:
+                return False
+
+            data = {
+                'saved_at': time.time(),
+                'cookies': cookies,
+            }
+            tmp_path = self.path + ".tmp"
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                json.dump(data, f, ensure_ascii=False)
+            os.replace(tmp_path, self.path)
+            return True
+
+        except Exception as e:
+            self.log(f"⚠️ 로그인 쿠키 저장 실패: {str(e)}")
+            return False
+
+    def load(self):
+        """저장된 쿠키 목록 반환 (없거나 만료되었으면 빈 리스트)"""
+        try:
+            if not os.path.exists(self.path):
+                return []
+
+            with open(self.path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+
+            age_hours = (time.time() - data.get('saved_at', 0)) / 3600
+            if age_hours > self.max_age_hours:
+                self.log(f"⏰ 저장된 로그인 쿠키가 오래되어 사용하지 않습니다 ({age_hours:.0f}시간 경과)")
+                return []
+
+            now = time.time()
+            return [c for c in data.get('cookies', []) if not c.get('expiry') or c['expiry'] > now]
+
+        except Exception as e:
+            self.log(f"⚠️ 로그인 쿠키 불러오기 실패: {str(e)}")
+            return []
+
+    def clear(self):
+        """저장된 쿠키 삭제 (로그아웃 시)"""
+        try:
+            if os.path.exists(self.path):
+                os.remove(self.path)
+        except Exception as e:
+            self.log(f"⚠️ 로그인 쿠키 삭제 실패: {str(e)}")
+
+    def _navigate(self, driver, url):
+        if self.rate_limiter:
+            self.rate_limiter.navigate(driver, url)
+        else:
+            driver.get(url)
+
+    def restore(self, driver):
+        """저장된 쿠키를 브라우저에 주입 - 주입한 쿠키가 있으면 True"""
+        cookies = self.load()
+        if not cookies:
+            return False
+
+        # 쿠키는 해당 도메인 페이지에 있을 때만 추가 가능
+        self._navigate(driver, BUYMA_BASE_URL + "/")
+
+        added = 0
+        for cookie in cookies:
+            cookie = {k: v for k, v in cookie.items() if k in ('name', 'value', 'domain', 'path', 'expiry', 'secure', 'httpOnly')}
+            try:
+                driver.add_cookie(cookie)
+                added += 1
+            except Exception:
+                continue
+
+        return added > 0
+
+    def is_logged_in(self, driver):
+        """마이페이지 접근으로 로그인 여부 확인 (로그인 페이지로 튕기면 False)"""
+        self._navigate(driver, BUYMA_BASE_URL + "/my/")
+        return "login" not in driver.current_url.lower()
+
+    def warm_start(self, driver):
+        """쿠키 복원으로 로그인 상태 만들기 - 성공 시 True"""
+        start = time.time()
+        try:
+            if not self.restore(driver):
+                return False
+            if not self.is_logged_in(driver):
+                self.log("⚠️ 저장된 로그인 쿠키가 만료되었습니다.")
+                return False
+        except Exception as e:
+            self.log(f"⚠️ 쿠키 복원 실패: {str(e)}")
+            return False
+
+        self.record_start('warm', time.time() - start)
+        return True
+
+    def record_start(self, mode, seconds):
+        """브라우저 시작 소요 시간 기록 (mode: 'cold' 또는 'warm')"""
+        with self._lock:
+            self.start_times[mode].append(seconds)
+        self.log(f"⏱️ 브라우저 {'웜' if mode == 'warm' else '콜드'} 스타트: {seconds:.1f}초")
+
+    def summary(self):
+        """콜드/웜 스타트 평균 소요 시간 문자열"""
+        with self._lock:
+            parts = []
+            for mode, label in (('cold', '콜드'), ('warm', '웜')):
+                times = self.start_times[mode]
+                if times:
+                    parts.append(f"{label} {len(times)}회 평균 {sum(times) / len(times):.1f}초")
+        return ", ".join(parts) if parts else "기록 없음"
@@ -0,0 +1,148 @@
+# BUYMA 자동화 프로그램 - 브라우저 메모리 감시 모듈
+import threading
+
+from lazy_imports import lazy_import
+
+psutil = lazy_import('psutil')  # 첫 측정 때 import (프로그램 시작 시간 단축)
+
+
+class BrowserWatchdog:
+    """chromedriver/Chrome 프로세스 트리의 메모리(RSS)와 핸들 수를 감시해 재시작 시점을 알려주는 클래스"""
+
+    def __init__(self, max_rss_mb=2500, max_handles=20000, max_processes=40, log=print):
+        self.max_rss_mb = max_rss_mb
+        self.max_handles = max_handles
+        self.max_processes = max_processes
+        self.log = log
+
+        # 프로그램이 띄운 chromedriver PID -> 하위 Chrome PID 목록 (고아 프로세스 정리용)
+        self._trees = {}
+        self._released = set()
+        self._lock = threading.Lock()
+        self.recycle_count = 0
+        self.killed_count = 0
+
+    @staticmethod
+    def _driver_pid(driver):
+        try:
+            return driver.service.process.pid
+        except Exception:
+            return None
+
+    def _process_tree(self, driver):
+        """드라이버의 chromedriver 프로세스와 모든 하위 Chrome 프로세스"""
+        pid = self._driver_pid(driver)
+        if not pid:
+            return []
+        try:
+            root = psutil.Process(pid)
+            return [root] + root.children(recursive=True)
+        except (psutil.NoSuchProcess, psutil.AccessDenied):
+            return []
+
+    def track(self, driver):
+        """드라이버 프로세스 트리를 추적 대상에 등록 (새 렌더러 프로세스 포함)"""
+        root = self._driver_pid(driver)
+        pids = {p.pid for p in self._process_tree(driver)}
+        if root and pids:
+            with self._lock:
+                self._trees.setdefault(root, set()).update(pids)
+
+    def sample(self, driver):
+        """프로세스 트리의 RSS 합계(MB), 핸들 수, 프로세스 수 측정"""
+        rss = 0
+        handles = 0
+        processes = self._process_tree(driver)
+        for proc in processes:
+            try:
+                rss += proc.memory_info().rss
+                if hasattr(proc, 'num_handles'):
+                    handles += proc.num_handles()  # Windows
+                else:
+                    handles += proc.num_fds()
+            except (psutil.NoSuchProcess, psutil.AccessDenied):
+                continue
+
+        # 새로 생긴 렌더러 프로세스도 정리 대상에 포함
+        root = self._driver_pid(driver)
+        if root and processes:
+            with self._lock:
+                self._trees.setdefault(root, set()).update(p.pid for p in processes)
+
+        return {
+            'rss_mb': rss / (1024 * 1024),
+            'handles': handles,
+            'processes': len(processes),
+        }
+
+    def tracked_usage(self):
+        """추적 중인 모든 브라우저 프로세스의 RSS 합계(MB)와 프로세스 수 (종료 대기 중인 드라이버 제외)"""
+        with self._lock:
+            pids = set().union(*(pids for root, pids in self._trees.items() if root not in self._released))
+        rss = 0
+        processes = 0
+        for pid in pids:
+            try:
+                rss += psutil.Process(pid).memory_info().rss
+                processes += 1
+            except (psutil.NoSuchProcess, psutil.AccessDenied):
+                continue
+        return {'rss_mb': rss / (1024 * 1024), 'processes': processes}
+
+    def should_recycle(self, driver):
+        """임계치 초과 여부 확인 - (재시작 필요 여부, 사유) 반환"""
+        try:
+            stats = self.sample(driver)
+        except Exception as e:
+            self.log(f"⚠️ 브라우저 메모리 측정 실패: {str(e)}")
+            return False, ""
+
+        if stats['rss_mb'] > self.max_rss_mb:
+            return True, f"메모리 {stats['rss_mb']:.0f}MB > {self.max_rss_mb}MB"
+        if stats['handles'] > self.max_handles:
+            return True, f"핸들 {stats['handles']}개 > {self.max_handles}개"
+        if stats['processes'] > self.max_processes:
+            return True, f"프로세스 {stats['processes']}개 > {self.max_processes}개"
+        return False, ""
+
+    def check(self, driver):
+        """안전한 시점(상품 사이)에서 호출 - 재시작이 필요하면 True"""
+        recycle, reason = self.should_recycle(driver)
+        if recycle:
+            self.recycle_count += 1
+            self.log(f"♻️ 브라우저 재시작 필요: {reason} (누적 {self.recycle_count}회)")
+        return recycle
+
+    def release(self, driver):
+        """드라이버 종료 직전 호출 - 종료 후 남은 프로세스를 정리 대상으로 지정"""
+        self.track(driver)
+        root = self._driver_pid(driver)
+        if root:
+            with self._lock:
+                self._released.add(root)
+
+    def kill_orphans(self):
+        """종료된(또는 비정상 종료된) 드라이버가 남긴 Chrome 프로세스 강제 종료"""
+        with self._lock:
+            orphan_roots = [root for root in self._trees
+                            if root in self._released or not psutil.pid_exists(root)]
+            targets = set()
+            for root in orphan_roots:
+                targets |= self._trees.pop(root)
+                self._released.discard(root)
+
+        killed = 0
+        for pid in targets:
+            try:
+                proc = psutil.Process(pid)
+                if 'chrome' not in proc.name().lower():
+                    continue  # PID 재사용된 다른 프로세스
+                proc.kill()
+                killed += 1
+            except (psutil.NoSuchProcess, psutil.AccessDenied):
+                continue
+
+        if killed:
+            self.killed_count += killed
+            self.log(f"🧹 남은 Chrome 프로세스 {killed}개 정리")
+        return killed
@@ -0,0 +1,168 @@
+# BUYMA 자동화 프로그램 - 판매 목록 페이지 일괄 가격 수정 모듈
+from job_executor import JobCancelled
+from search_tiles import parse_price
+from tracing import traced
+
+
+# 내 상품 목록 (판매 중, 상품ID 내림차순, 페이지당 100개) - 내 상품 불러오기와 같은 정렬
+MY_SELL_LIST_URL = ("https://www.buyma.com/my/sell?duty_kind=all&facet=brand_id%2Ccate_pivot%2Cstatus%2Ctag_ids"
+                    "%2Cshop_labels%2Cstock_state&order=desc&page={page}&rows=100&sale_kind=all&sort=item_id"
+                    "&status=for_sale&timesale_kind=all#/")
+ROWS_PER_PAGE = 100
+ROW_SELECTOR = "tr.cursor_pointer.js-checkbox-check-row"
+
+# 페이지의 상품 행을 스크립트 1회 호출로 읽기 (행 위치, 상품ID, 표시 가격)
+ROW_SCRIPT = """
+var rows = document.querySelectorAll(arguments[0]);
+var result = [];
+for (var i = 0; i < rows.length; i++) {
+    var link = rows[i].querySelector('a.fab-design-d--b');
+    var price = rows[i].querySelector('span.js-item-price-display');
+    var match = link ? /\\/item\\/(\\d+)\\//.exec(link.href) : null;
+    if (!match) { continue; }
+    result.push({index: i, product_id: match[1], price: price ? price.textContent : ''});
+}
+return result;
+"""
+
+
+def group_targets_by_page(targets):
+    """수정 대상을 판매 목록 페이지별로 묶기 - targets: [{'product_id', 'new_price', 'page'}]"""
+    pages = {}
+    for target in targets:
+        pages.setdefault(target.get('page') or 1, []).append(target)
+    return dict(sorted(pages.items()))
+
+
+def read_sell_rows(driver):
+    """판매 목록 페이지의 상품 행 {상품ID: (행 위치, 표시 가격)}"""
+    rows = driver.execute_script(ROW_SCRIPT, ROW_SELECTOR) or []
+    return {str(row['product_id']): (row['index'], parse_price(row.get('price'))) for row in rows}
+
+
+class BulkPriceEditor:
+    """내 상품 목록 페이지(100개)를 한 번 열고 그 페이지에 있는 수정 대상의 가격을 모두 수정하는 클래스
+    상품마다 검색 페이지를 여는 대신 N개 수정에 약 N/100회 페이지 로딩"""
+
+    def __init__(self, rate_limiter=None, log=None, wait_seconds=10):
+        self.rate_limiter = rate_limiter
+        self.log = log or (lambda message: None)
+        self.wait_seconds = wait_seconds
+        self.stats = {'page_loads': 0, 'updated': 0, 'unchanged': 0, 'failed': 0, 'not_found': 0}
+
+    @property
+    def tracer(self):
+        return getattr(self.rate_limiter, 'tracer', None)
+
+    @traced("update.page_load")
+    def _load_page(self, driver, page):
+        url = MY_SELL_LIST_URL.format(page=page)
+        if self.rate_limiter:
+            self.rate_limiter.get_page('update', driver, url)
+        else:
+            driver.get(url)
+        self.stats['page_loads'] += 1
+
+        from selenium.webdriver.common.by import By
+        from selenium.webdriver.support.ui import WebDriverWait
+        from selenium.webdriver.support import expected_conditions as EC
+        WebDriverWait(driver, self.wait_seconds).until(
+            EC.presence_of_element_located((By.CSS_SELECTOR, ROW_SELECTOR))
+        )
+        return read_sell_rows(driver)
+
+    def _visible(self, driver, row, by, selector):
+        """행 안의 요소 우선, 없으면 페이지에 표시된 요소 (인라인 편집창 위치가 다른 경우 대비)"""
+        candidates = row.find_elements(by, selector) or driver.find_elements(by, selector)
+        for element in candidates:
+            if element.is_displayed():
+                return element
+        return None
+
+    @traced("update.row")
+    def edit_row(self, driver, row_index, new_price):
+        """행의 가격을 인라인 편집으로 수정하고 표시 가격(js-item-price-display)으로 확인"""
+        from selenium.webdriver.common.by import By
+        from selenium.webdriver.support.ui import WebDriverWait
+
+        row = driver.find_elements(By.CSS_SELECTOR, ROW_SELECTOR)[row_index]
+        row.find_element(By.CSS_SELECTOR, "a._item_edit_tanka").click()
+
+        wait = WebDriverWait(driver, self.wait_seconds)
+        price_input = wait.until(lambda d: self._visible(d, row, By.NAME, "item_price"))
+        price_input.clear()
+        price_input.send_keys(str(new_price))
+
+        commit_btn = wait.until(lambda d: self._visible(d, row, By.CSS_SELECTOR, "a.js-commit-item-price"))
+        commit_btn.click()
+
+        # 저장 후 행의 표시 가격이 새 가격으로 바뀌었는지 확인
+        def price_applied(d):
+            display = row.find_element(By.CSS_SELECTOR, "span.js-item-price-display")
+            return parse_price(display.get_attribute("textContent")) == new_price
+        try:
+            wait.until(price_applied)
+            return True
+        except Exception:
+            return False
+
+    def apply(self, driver, targets, should_stop=None):
+        """수정 대상 목록 적용 - {상품ID: 'updated' | 'unchanged' | 'failed' | 'not_found'}
+        대상의 'page' 페이지를 먼저 보고, 없으면 다음 페이지까지 확인 (새 상품 등록으로 밀린 경우)
+        페이지 로딩 중 중지 요청(JobCancelled)이 오면 거기서 멈추고 이미 수정한 결과를 반환"""
+        stop_requested = should_stop or (lambda: False)
+        cancelled = []
+        should_stop = lambda: bool(cancelled) or stop_requested()
+        results = {}
+        remaining = {str(t['product_id']): t for t in targets}
+        loaded = {}
+
+        for page, page_targets in group_targets_by_page(targets).items():
+            for probe in (page, page + 1):
+                wanted = [t for t in page_targets if str(t['product_id']) in remaining]
+                if not wanted or should_stop():
+                    break
+
+                if probe not in loaded:
+                    try:
+                        loaded[probe] = self._load_page(driver, probe)
+                    except JobCancelled:
+                        self.log(f"⏹️ 중지 요청으로 판매 목록 {probe}페이지부터 일괄 수정을 멈춥니다.")
+                        cancelled.append(probe)
+                        break
+                    except Exception as e:
+                        self.log(f"⚠️ 판매 목록 {probe}페이지 로딩 실패: {str(e)}")
+                        loaded[probe] = {}
+                rows = loaded[probe]
+
+                for target in wanted:
+                    product_id = str(target['product_id'])
+                    if product_id not in rows or should_stop():
+                        continue
+                    row_index, displayed_price = rows[product_id]
+                    new_price = int(target['new_price'])
+                    del remaining[product_id]
+
+                    if displayed_price == new_price:
+                        results[product_id] = 'unchanged'
+                        continue
+                    try:
+                        ok = self.edit_row(driver, row_index, new_price)
+                    except Exception as e:
+                        self.log(f"⚠️ 상품 {product_id} 가격 수정 오류: {str(e)}")
+                        ok = False
+                    results[product_id] = 'updated' if ok else 'failed'
+                    if ok:
+                        self.log(f"✅ 일괄 수정: 상품 {product_id} ¥{displayed_price or 0:,} → ¥{new_price:,}")
+
+        for product_id in remaining:
+            results[product_id] = 'not_found'
+        for result in results.values():
+            self.stats[result] += 1
+        return results
+
+    def summary(self):
+        """일괄 수정 통계 문자열"""
+        stats = self.stats
+        return (f"일괄 가격 수정: 페이지 로딩 {stats['page_loads']}회, 수정 {stats['updated']}개, "
+                f"변경 없음 {stats['unchanged']}개, 실패 {stats['failed']}개, 목록에 없음 {stats['not_found']}개")
@@ -6,16 +6,17 @@ BUYMA 자동화 프로그램
 버전: 1.0.0
 """
 
+from startup_timer import StartupTimer, requested_report_path
+startup_timer = StartupTimer()  # 시작 시간 측정 (다른 import 보다 먼저)
+
 import sys
 import os
 import json
-import psutil
-import requests
 import threading
 import random
 import re
 import time
-from datetime import datetime
+from datetime import datetime, timedelta
 import time 
 
 # 전역 예외 핸들러 추가 - 프로그램 튕김 방지
@@ -49,7 +50,7 @@ from PyQt6.QtWidgets import (QApplication, QMainWindow, QWidget, QVBoxLayout,
                             QSpinBox, QCheckBox, QGroupBox, QFrame, 
                             QFileDialog, QMessageBox, QScrollArea, 
                             QRadioButton, QButtonGroup, QAbstractItemView)
-from PyQt6.QtCore import Qt, QThread, pyqtSignal, pyqtSlot, QTimer, QObject
+from PyQt6.QtCore import Qt, pyqtSignal, pyqtSlot, QTimer, QObject
 from PyQt6.QtGui import QFont, QColor, QBrush
 
 # 안전한 슬롯 데코레이터 - 슬롯 함수에서 예외 발생 시 프로그램 튕김 방지
@@ -85,13 +86,41 @@ def safe_slot(func):
                 pass
     return wrapper
 
-from selenium import webdriver
-from selenium.webdriver.chrome.service import Service
-from selenium.webdriver.common.by import By
-from selenium.webdriver.chrome.options import Options
-from selenium.webdriver.support.ui import WebDriverWait
-from selenium.webdriver.support import expected_conditions as EC
-from selenium.webdriver.common.keys import Keys
+# 무거운 모듈(selenium/requests/psutil)은 처음 사용할 때 import - 첫 화면 표시 이후 백그라운드에서 미리 불러옴
+from lazy_imports import lazy_import, preload as preload_modules
+psutil = lazy_import('psutil')
+requests = lazy_import('requests')
+webdriver = lazy_import('selenium.webdriver')
+Service = lazy_import('selenium.webdriver.chrome.service', 'Service')
+By = lazy_import('selenium.webdriver.common.by', 'By')
+Options = lazy_import('selenium.webdriver.chrome.options', 'Options')
+WebDriverWait = lazy_import('selenium.webdriver.support.ui', 'WebDriverWait')
+EC = lazy_import('selenium.webdriver.support.expected_conditions')
+Keys = lazy_import('selenium.webdriver.common.keys', 'Keys')
+
+from variation_extractor import VariationExtractor
+from buyma_session import BuymaSessionBridge
+from browser_warmstart import CookieStore
+from browser_watchdog import BrowserWatchdog
+from system_sampler import BUYMA_URL, SystemSampler
+from rate_limiter import RateLimiterRegistry
+from page_fixtures import PageRecorder
+from tracing import Tracer, traced
+from job_executor import CANCELLED, JobExecutor, cancellable_sleep, checkpoint, is_cancelled, report_progress
+from throughput_meter import STAGE_NAMES, ThroughputMeter, metered
+from competitor_catalog import CompetitorCatalog
+from reprice_pipeline import RepricePipeline
+from bulk_price_editor import BulkPriceEditor, ROWS_PER_PAGE
+from product_index import ProductIndex, title_key
+from reprice_plan import RepricePlan
+from analysis_scheduler import AnalysisScheduler
+from price_history import PriceHistory
+from buyma_engine import BuymaEngine, build_snapshot, decide_price, extract_product_id
+from analysis_report import AnalysisReport
+from search_strategy import SearchLookupStats, SORT_PRICE_ASC, SORT_RELEVANCE
+from lazy_tabs import LazyTabs
+
+startup_timer.mark('imports')
 
 import time
 
@@ -99,10 +128,13 @@ import time
 # ==================== 진행률 위젯 클래스 ====================
 
 class ProgressWidget(QWidget):
-    """윈도우 스티커 메모 스타일의 진행률 위젯"""
+    """윈도우 스티커 메모 스타일의 진행률 위젯
+    metrics(ThroughputMeter) 를 지정하면 진행률과 함께 처리 속도/남은 시간을 표시"""
     
-    def __init__(self):
+    def __init__(self, metrics=None, stage=None):
         super().__init__()
+        self.metrics = metrics
+        self.stage = stage
         self.init_ui()
         self.is_dragging = False
         self.drag_position = None
@@ -111,7 +143,7 @@ class ProgressWidget(QWidget):
         """UI 초기화"""
         # 윈도우 설정
         self.setWindowTitle("작업 진행률")
-        self.setFixedSize(300, 150)
+        self.setFixedSize(300, 170)
         self.setWindowFlags(
             Qt.WindowType.WindowStaysOnTopHint |  # 항상 위에
             Qt.WindowType.FramelessWindowHint |   # 프레임 없음
@@ -221,6 +253,18 @@ class ProgressWidget(QWidget):
         """)
         bg_layout.addWidget(self.detail_label)
         
+        # 처리 속도 / 남은 시간
+        self.metrics_label = QLabel("")
+        self.metrics_label.setStyleSheet("""
+            QLabel {
+                font-family: '맑은 고딕';
+                font-size: 10px;
+                color: #6f42c1;
+                background: transparent;
+            }
+        """)
+        bg_layout.addWidget(self.metrics_label)
+        
         layout.addWidget(self.background_widget)
         
         # 초기 위치 설정 (화면 우상단)
@@ -234,6 +278,8 @@ class ProgressWidget(QWidget):
     def show_progress(self, title="🚀 작업 진행률", total=100, current=0, status="작업 시작..."):
         """진행률 위젯 표시 및 초기화"""
         self.title_label.setText(title)
+        if self.metrics:
+            self.metrics.start(self.stage, total)
         self.update_progress(current, total, status, "")
         self.show()
         self.raise_()  # 맨 앞으로 가져오기
@@ -246,12 +292,16 @@ class ProgressWidget(QWidget):
             self.progress_bar.setValue(percentage)
             self.progress_bar.setFormat(f"{current}/{total} ({percentage}%)")
         else:
+            percentage = 0
             self.progress_bar.setValue(0)
-            self.progress_bar.setFormat("0%")
+            self.progress_bar.setFormat(f"{current}개" if current else "0%")
         
         self.task_label.setText(task_name)
         if detail:
             self.detail_label.setText(detail)
+        if self.metrics:
+            self.metrics.progress(self.stage, current, total)
+        self.refresh_metrics()
         
         # 진행률에 따른 색상 변경
         if percentage >= 100:
@@ -292,6 +342,11 @@ class ProgressWidget(QWidget):
         self.show()
         QApplication.processEvents()
     
+    def refresh_metrics(self):
+        """처리 속도/남은 시간 표시 갱신 (진행이 멈춰 있는 동안에도 타이머에서 호출)"""
+        if self.metrics:
+            self.metrics_label.setText(self.metrics.describe(self.stage))
+    
     def set_task_complete(self, task_name="작업 완료", message="모든 작업이 완료되었습니다."):
         """작업 완료 상태로 설정"""
         self.progress_bar.setValue(100)
@@ -364,240 +419,6 @@ class ProgressWidget(QWidget):
         self.is_dragging = False
 
 
-# ==================== 스레드 워커 클래스들 ====================
-
-class PriceAnalysisWorker(QThread):
-    """가격 분석 작업을 위한 워커 스레드"""
-    progress_updated = pyqtSignal(int, int)  # 현재, 전체
-    product_analyzed = pyqtSignal(dict)  # 분석된 상품 정보
-    finished = pyqtSignal(dict)  # 완료 통계
-    log_message = pyqtSignal(str)
-    
-    def __init__(self, products, settings):
-        super().__init__()
-        self.products = products
-        self.settings = settings
-        self.is_running = True
-        
-    def run(self):
-        """가격 분석 실행"""
-        try:
-            self.log_message.emit("🔍 가격 분석을 시작합니다...")
-            
-            total_products = len(self.products)
-            analyzed_count = 0
-            updated_count = 0
-            excluded_count = 0
-            failed_count = 0
-            
-            for i, product in enumerate(self.products):
-                if not self.is_running:
-                    break
-                    
-                try:
-                    self.log_message.emit(f"📊 분석 중: {product.get('name', 'Unknown')} ({i+1}/{total_products})")
-                    
-                    # 경쟁사 최저가 조회 (시뮬레이션)
-                    competitor_price = self.get_competitor_price(product)
-                    
-                    # 제안가 계산
-                    discount = self.settings.get('discount_amount', 100)
-                    suggested_price = competitor_price - discount
-                    
-                    # 마진 계산
-                    cost_price = product.get('cost_price', product.get('current_price', 0) * 0.6)
-                    margin = suggested_price - cost_price
-                    min_margin = self.settings.get('min_margin', 500)
-                    
-                    # 분석 결과
-                    analysis_result = {
-                        'name': product.get('name', ''),
-                        'brand': product.get('brand', ''),
-                        'current_price': product.get('current_price', 0),
-                        'competitor_price': competitor_price,
-                        'suggested_price': suggested_price,
-                        'margin': margin,
-                        'status': '',
-                        'action': ''
-                    }
-                    
-                    # 상태 결정
-                    if margin < min_margin:
-                        analysis_result['status'] = '수정 불가 (마진 부족)'
-                        analysis_result['action'] = '제외'
-                        excluded_count += 1
-                    elif suggested_price >= product.get('current_price', 0):
-                        analysis_result['status'] = '현재가 적정'
-                        analysis_result['action'] = '유지'
-                    else:
-                        analysis_result['status'] = '수정 가능'
-                        analysis_result['action'] = '수정 대상'
-                        
-                        # 자동 모드인 경우 즉시 수정
-                        if self.settings.get('auto_mode', True):
-                            if self.update_product_price(product, suggested_price):
-                                analysis_result['action'] = '수정 완료'
-                                updated_count += 1
-                            else:
-                                analysis_result['action'] = '수정 실패'
-                                failed_count += 1
-                    
-                    analyzed_count += 1
-                    self.product_analyzed.emit(analysis_result)
-                    self.progress_updated.emit(i + 1, total_products)
-                    
-                    # 딜레이 (서버 부하 방지)
-                    self.msleep(random.randint(2000, 4000))  # 2-4초 대기
-                    
-                except Exception as e:
-                    self.log_message.emit(f"❌ 오류 발생: {product.get('name', 'Unknown')} - {str(e)}")
-                    failed_count += 1
-            
-            # 완료 통계
-            stats = {
-                'total': total_products,
-                'analyzed': analyzed_count,
-                'updated': updated_count,
-                'excluded': excluded_count,
-                'failed': failed_count
-            }
-            
-            self.finished.emit(stats)
-            self.log_message.emit("✅ 가격 분석이 완료되었습니다!")
-            
-        except Exception as e:
-            self.log_message.emit(f"❌ 심각한 오류 발생: {str(e)}")
-    
-    def get_competitor_price(self, product):
-        """경쟁사 최저가 조회 (시뮬레이션)"""
-        base_price = product.get('current_price', 15000)
-        return int(base_price * random.uniform(0.8, 0.95))
-    
-    def update_product_price(self, product, new_price):
-        """상품 가격 업데이트 (시뮬레이션)"""
-        try:
-            self.msleep(random.randint(1000, 3000))  # 업데이트 시뮬레이션
-            return random.choice([True, True, True, False])  # 75% 성공률
-        except:
-            return False
-    
-    def stop(self):
-        """작업 중지"""
-        self.is_running = False
-
-class FavoriteAnalysisWorker(QThread):
-    """주력 상품 분석 작업을 위한 워커 스레드"""
-    progress_updated = pyqtSignal(int, int)
-    product_checked = pyqtSignal(dict)
-    finished = pyqtSignal(dict)
-    log_message = pyqtSignal(str)
-    
-    def __init__(self, favorite_products, settings):
-        super().__init__()
-        self.favorite_products = favorite_products
-        self.settings = settings
-        self.is_running = True
-        
-    def run(self):
-        """주력 상품 가격 확인 및 수정"""
-        try:
-            self.log_message.emit("⭐ 주력 상품 가격 확인을 시작합니다...")
-            
-            total_products = len(self.favorite_products)
-            checked_count = 0
-            updated_count = 0
-            failed_count = 0
-            
-            for i, product in enumerate(self.favorite_products):
-                if not self.is_running:
-                    break
-                    
-                try:
-                    self.log_message.emit(f"⭐ 확인 중: {product.get('name', 'Unknown')} ({i+1}/{total_products})")
-                    
-                    # 경쟁사 최저가 조회
-                    competitor_price = self.get_competitor_price(product)
-                    
-                    # 제안가 계산
-                    discount = self.settings.get('discount_amount', 100)
-                    suggested_price = competitor_price - discount
-                    
-                    # 마진 확인
-                    cost_price = product.get('cost_price', product.get('current_price', 0) * 0.6)
-                    margin = suggested_price - cost_price
-                    min_margin = self.settings.get('min_margin', 500)
-                    
-                    result = {
-                        'name': product.get('name', ''),
-                        'brand': product.get('brand', ''),
-                        'current_price': product.get('current_price', 0),
-                        'competitor_price': competitor_price,
-                        'suggested_price': suggested_price,
-                        'margin': margin,
-                        'status': '',
-                        'updated': False
-                    }
-                    
-                    # 가격 수정 필요성 판단
-                    if margin >= min_margin and suggested_price < product.get('current_price', 0):
-                        # 가격 수정 실행
-                        if self.update_favorite_price(product, suggested_price):
-                            result['status'] = '가격 수정 완료'
-                            result['updated'] = True
-                            updated_count += 1
-                            
-                            # 원본 데이터도 업데이트
-                            product['current_price'] = suggested_price
-                        else:
-                            result['status'] = '가격 수정 실패'
-                            failed_count += 1
-                    elif margin < min_margin:
-                        result['status'] = '마진 부족으로 수정 불가'
-                    else:
-                        result['status'] = '현재가 적정'
-                    
-                    checked_count += 1
-                    self.product_checked.emit(result)
-                    self.progress_updated.emit(i + 1, total_products)
-                    
-                    # 딜레이
-                    self.msleep(random.randint(3000, 5000))  # 3-5초 대기
-                    
-                except Exception as e:
-                    self.log_message.emit(f"❌ 오류 발생: {product.get('name', 'Unknown')} - {str(e)}")
-                    failed_count += 1
-            
-            # 완료 통계
-            stats = {
-                'total': total_products,
-                'checked': checked_count,
-                'updated': updated_count,
-                'failed': failed_count
-            }
-            
-            self.finished.emit(stats)
-            self.log_message.emit("✅ 주력 상품 가격 확인이 완료되었습니다!")
-            
-        except Exception as e:
-            self.log_message.emit(f"❌ 심각한 오류 발생: {str(e)}")
-    
-    def get_competitor_price(self, product):
-        """경쟁사 최저가 조회"""
-        base_price = product.get('current_price', 15000)
-        return int(base_price * random.uniform(0.8, 0.95))
-    
-    def update_favorite_price(self, product, new_price):
-        """주력 상품 가격 업데이트"""
-        try:
-            self.msleep(random.randint(2000, 4000))  # 2-4초 대기
-            return random.choice([True, True, True, False])  # 75% 성공률
-        except:
-            return False
-    
-    def stop(self):
-        """작업 중지"""
-        self.is_running = False
-
 class Main(QMainWindow):
     # 크롤링 UI 업데이트용 시그널 추가
     crawling_progress_signal = pyqtSignal(int)  # 진행률
@@ -626,6 +447,7 @@ class Main(QMainWindow):
     
     # 진행률 위젯 업데이트 시그널 추가
     update_price_progress_signal = pyqtSignal(int, int, str)  # current, total, status
+    system_stats_signal = pyqtSignal(dict)  # SystemSampler 측정 결과
     hide_price_progress_signal = pyqtSignal()                 # 진행률 위젯 숨기기
     update_favorite_table_signal = pyqtSignal()              # 주력상품 테이블 업데이트
     complete_progress_signal = pyqtSignal(str, str)          # 진행률 위젯 완료 (title, message)
@@ -659,6 +481,10 @@ class Main(QMainWindow):
     dashboard_step_signal = pyqtSignal(str, str)             # step_text, color
     dashboard_progress_signal = pyqtSignal(str, int)         # progress_name, value
     dashboard_log_signal = pyqtSignal(str)                   # log_message
+    build_tab_signal = pyqtSignal(str)                       # 지연 생성 탭 만들기 (워커 스레드 → 메인 스레드)
+    job_log_signal = pyqtSignal(str)                         # 작업 실행기 로그
+    job_state_signal = pyqtSignal(dict)                      # 작업 상태 변경 (Job.snapshot())
+    call_on_main_signal = pyqtSignal(object)                 # 메인 스레드에서 함수 실행 (워커 스레드 → 메인 스레드)
     
     def __init__(self):
         super().__init__()
@@ -666,20 +492,37 @@ class Main(QMainWindow):
         # 공용 브라우저 드라이버
         self.shared_driver = None
         self.is_logged_in = False
-        self.login_thread = None
+        
+        # 단계별 소요 시간 측정 (설정 파일 trace_enabled 로 켜기, 작업 완료 시 추적_*.json 저장)
+        self.tracer = Tracer(log=self.log_message)
+        
+        # 백그라운드 작업 실행기 (동시 실행 4개, 같은 작업 중복 실행 방지, 중지/일시정지 토큰)
+        self.jobs = JobExecutor(max_workers=4, log=self.job_log_signal.emit, on_change=self.job_state_signal.emit)
+        
+        # BUYMA 요청 속도 제한 (엔드포인트 종류별, 응답 상태에 따라 자동 가감속)
+        self.rate_limiter = RateLimiterRegistry(should_stop=lambda: self.work_stopped, tracer=self.tracer)
+        
+        # 로그인 쿠키를 공유하는 HTTP 세션 (읽기 전용 인증 페이지용)
+        self.session_bridge = BuymaSessionBridge(lambda: self.shared_driver, self.log_message,
+                                                 rate_limiter=self.rate_limiter)
+        
+        # 로그인 쿠키 저장소 (재시작 시 폼 로그인 없이 복원)
+        self.cookie_store = CookieStore(log=self.log_message, rate_limiter=self.rate_limiter)
+        
+        # 브라우저 메모리 감시 (임계치 초과 시 안전한 시점에 재시작)
+        self.browser_watchdog = BrowserWatchdog(log=self.log_message)
         
         # 주력 상품 데이터 초기화
         self.favorite_products = []
         self.favorites_file = "주력상품_목록.json"
         
-        # 워커 스레드 초기화
-        self.price_analysis_worker = None
-        self.favorite_analysis_worker = None
+        # 단계별 처리 속도(개/분)/오류율/예상 완료 시간
+        self.metrics = ThroughputMeter()
         
         # 진행률 위젯 초기화
-        self.progress_widget = ProgressWidget()
-        self.upload_progress_widget = ProgressWidget()  # 업로드용 진행률 위젯
-        self.price_progress_widget = ProgressWidget()   # 가격분석용 진행률 위젯
+        self.progress_widget = ProgressWidget(self.metrics, 'crawl')
+        self.upload_progress_widget = ProgressWidget(self.metrics, 'upload')  # 업로드용 진행률 위젯
+        self.price_progress_widget = ProgressWidget(self.metrics, 'price')   # 가격분석용 진행률 위젯
         
         # 통계 데이터 초기화
         self.today_stats = {
@@ -695,9 +538,46 @@ class Main(QMainWindow):
         # 크롤링된 상품 데이터 저장용
         self.crawled_products = []
         
-        # 작업 상태 변수 초기화
-        self.work_paused = False
-        self.work_stopped = False
+        # 색상/사이즈 추출기 (클릭 폴백 횟수 집계 포함)
+        self.variation_extractor = VariationExtractor()
+        
+        # 경쟁사 검색 결과 누적 카탈로그 (최근 결과로 답할 수 있으면 실시간 검색 생략)
+        self.competitor_catalog = CompetitorCatalog()
+        
+        # 최저가 검색 전략 (가격순 정렬 + 조기 종료) 및 조회 통계
+        self.search_sort_mode = SORT_PRICE_ASC
+        self.search_stats = SearchLookupStats()
+        
+        # 가격 분석 중간 저장 카운터 (10개마다 JSON 저장)
+        self.analysis_save_counter = 0
+        
+        # 자동 모드 가격 수정은 내 상품 목록 페이지(100개) 단위로 일괄 처리
+        self.bulk_price_editor = BulkPriceEditor(rate_limiter=self.rate_limiter, log=self.log_message)
+        
+        # 가격 분석 결과 시계열 (상품별 확인마다 1줄)
+        self.price_history = PriceHistory()
+        
+        # 최저가 검색/가격 분석 엔진 (CLI 와 공용, 위의 속도 제한기/카탈로그/통계를 함께 사용)
+        self.engine = BuymaEngine(log=self.log_message, log_error=self.log_error, rate_limiter=self.rate_limiter,
+                                  catalog=self.competitor_catalog, search_stats=self.search_stats,
+                                  history=self.price_history, bulk_price_editor=self.bulk_price_editor,
+                                  session_bridge=self.session_bridge)
+        
+        # 가격 분석 우선순위 스케줄러 (상품별 마지막 확인 시각/최저가 변동률 저장)
+        self.analysis_scheduler = AnalysisScheduler(state_file="분석_스케줄.json", history=self.price_history)
+        
+        # 가격 수정 계획 (드라이런 결과)
+        self.reprice_plan = None
+        
+        # 가격 관리 탭 페이지네이션 변수 (탭을 만들기 전에 불러온 상품도 유지)
+        self.current_page = 0
+        self.total_pages = 0
+        self.page_size = 100
+        self.all_products = []  # 전체 상품 데이터 저장
+        self.product_index = ProductIndex()  # 상품ID/제목 → all_products 상품 조회, 화면 행 ↔ 상품 매핑
+        
+        # settings.json 에서 불러온 값 (아직 만들지 않은 탭은 처음 열 때 적용)
+        self.loaded_settings = {}
         
         self.init_ui()
         self.load_settings()
@@ -736,6 +616,7 @@ class Main(QMainWindow):
         
         # 진행률 위젯 시그널 연결
         self.update_price_progress_signal.connect(self.update_price_progress_widget_safe)
+        self.system_stats_signal.connect(self.update_system_stats)
         self.hide_price_progress_signal.connect(self.hide_price_progress_widget)
         self.update_favorite_table_signal.connect(self.update_favorite_table)
         self.complete_progress_signal.connect(self.complete_progress_widget_safe)
@@ -759,18 +640,54 @@ class Main(QMainWindow):
         self.progress_complete_signal.connect(self.set_progress_complete)
         self.progress_error_signal.connect(self.set_progress_error)
         
+        # 작업 실행기 시그널 연결
+        self.job_log_signal.connect(self.log_message)
+        self.job_state_signal.connect(self.on_job_state)
+        self.call_on_main_signal.connect(self.call_on_main)
+        # 진행률 시그널은 보내는 작업 스레드에서 바로 그 작업의 진행률로 기록
+        for signal in (self.progress_update_signal, self.update_price_progress_signal, self.my_products_progress_signal):
+            signal.connect(report_progress, Qt.ConnectionType.DirectConnection)
+        
         # 확인 결과 저장용
         self.confirmation_result = None
         
-        # 모든 UI 초기화 완료 후 주력 상품 자동 로드
-        self.load_favorite_products_on_startup()
+        # 주력 상품 자동 로드는 첫 화면 표시 후 (on_startup_painted)
+    
+    @property
+    def work_stopped(self):
+        """지금 스레드의 작업이 중지 요청을 받았는지 (작업 실행기 밖에서는 항상 False)"""
+        return is_cancelled()
+    
+    @property
+    def work_paused(self):
+        return self.jobs.paused
+    
+    def run_on_main(self, fn):
+        """워커 스레드에서 UI 함수를 메인 스레드로 넘겨 실행 (스레드에서 QTimer.singleShot 은 동작하지 않음)"""
+        self.call_on_main_signal.emit(fn)
+    
+    def call_on_main(self, fn):
+        try:
+            fn()
+        except Exception as e:
+            self.log_error(f"메인 스레드 작업 오류: {str(e)}")
+    
+    def on_job_state(self, job):
+        """작업 상태 변경 (메인 스레드) - 중지 로그/UI 복원, 모니터링 탭 작업 표시 갱신"""
+        if job['state'] == CANCELLED:
+            self.log_message(f"⏹️ '{job['title']}' 작업 중지됨 ({job['elapsed']:.1f}초)")
+            # 중지된 작업이 완료 처리 전에 끝났을 수 있으므로 남은 작업이 없으면 탭 잠금 해제
+            if not self.jobs.active_jobs():
+                self.set_tabs_enabled(True)
+                self.price_progress_widget.hide()
+        self.job_status.setText(self.jobs.summary())
     
     def toggle_work_pause(self):
         """작업 일시정지/재시작 토글"""
         try:
             if not self.work_paused:
                 # 일시정지
-                self.work_paused = True
+                self.jobs.pause()
                 self.pause_work_btn.setText("▶️ 재시작")
                 self.pause_work_btn.setStyleSheet("""
                     QPushButton {
@@ -789,7 +706,7 @@ class Main(QMainWindow):
                 self.log_message("⏸️ 작업이 일시정지되었습니다.")
             else:
                 # 재시작
-                self.work_paused = False
+                self.jobs.resume()
                 self.pause_work_btn.setText("⏸️ 일시정지")
                 self.pause_work_btn.setStyleSheet("""
                     QPushButton {
@@ -812,8 +729,8 @@ class Main(QMainWindow):
     def stop_all_work(self):
         """모든 작업 중지"""
         try:
-            self.work_stopped = True
-            self.work_paused = False
+            self.jobs.resume()
+            self.jobs.cancel()
             
             # 크롤링 중지
             if hasattr(self, 'start_crawling_btn'):
@@ -837,19 +754,15 @@ class Main(QMainWindow):
     
     def enable_work_controls(self):
         """작업 제어 버튼 활성화 (버튼 제거됨)"""
-        self.work_stopped = False
-        self.work_paused = False
+        self.jobs.resume()
     
     def disable_work_controls(self):
         """작업 제어 버튼 비활성화 (버튼 제거됨)"""
         pass
     
     def check_work_status(self):
-        """작업 상태 확인 (워커 스레드에서 호출)"""
-        while self.work_paused and not self.work_stopped:
-            import time
-            time.sleep(0.5)
-        return not self.work_stopped
+        """작업 상태 확인 (워커 스레드에서 호출) - 일시정지 중이면 재개/중지까지 대기, 계속 진행해도 되면 True"""
+        return checkpoint()
         
     def init_ui(self):
         """UI 초기화"""
@@ -1296,31 +1209,69 @@ class Main(QMainWindow):
         """
 
     def create_tabs(self, layout):
-        """탭 생성"""
+        """탭 생성 - 첫 화면인 크롤링 탭과 로그를 받는 모니터링 탭만 바로 만들고 나머지는 처음 열 때 생성"""
         self.tab_widget = QTabWidget()
+        self.lazy_tabs = LazyTabs(self.tab_widget, self.create_tab_placeholder,
+                                  on_built=self.on_tab_built, log=self.log_message)
         
         # 대시보드 탭 (첫 번째) - 주석처리
         # self.create_dashboard_tab()
         
         # 크롤링 탭
-        self.create_crawling_tab()
+        self.lazy_tabs.add('crawling', "🔍 상품 크롤링", self.create_crawling_tab, lazy=False)
         
         # 가격 관리 탭
-        self.create_price_tab()
+        self.lazy_tabs.add('price', "💰 가격 관리", self.create_price_tab)
         
         # 주력 상품 관리 탭
-        self.create_favorite_tab()
+        self.lazy_tabs.add('favorite', "⭐ 주력 상품", self.create_favorite_tab)
         
         # 업로드 탭
-        self.create_upload_tab()
+        self.lazy_tabs.add('upload', "📤 자동 업로드", self.create_upload_tab)
         
         # 모니터링 탭
-        self.create_monitoring_tab()
+        self.lazy_tabs.add('monitoring', "📺 모니터링", self.create_monitoring_tab, lazy=False)
         
         # 설정 탭
-        self.create_settings_tab()
+        self.lazy_tabs.add('settings', "⚙️ 설정", self.create_settings_tab)
+        
+        # 탭을 처음 열 때 생성, 워커 스레드에서 위젯에 접근하면 메인 스레드에서 만들 때까지 대기
+        self.tab_widget.currentChanged.connect(self.lazy_tabs.build_index)
+        self.build_tab_signal.connect(self.build_lazy_tab, Qt.ConnectionType.BlockingQueuedConnection)
         
         layout.addWidget(self.tab_widget)
+    
+    def create_tab_placeholder(self):
+        """지연 생성 탭의 빈 자리 위젯 (탭 내용이 이 안에 들어감)"""
+        page = QWidget()
+        page_layout = QVBoxLayout(page)
+        page_layout.setContentsMargins(0, 0, 0, 0)
+        return page
+    
+    def build_lazy_tab(self, key):
+        """지연 생성 탭 만들기 (메인 스레드)"""
+        try:
+            self.lazy_tabs.build(key)
+        except Exception as e:
+            self.log_message(f"❌ '{key}' 탭 생성 오류: {str(e)}")
+    
+    def on_tab_built(self, key):
+        """탭 생성 직후 - 불러온 설정 값 적용, 주력 상품 표 채우기"""
+        self.apply_tab_settings(key)
+        if key == 'favorite':
+            self.update_favorite_table()
+    
+    def __getattr__(self, name):
+        """아직 만들지 않은 탭의 위젯에 접근하면 그 탭을 먼저 생성"""
+        lazy_tabs = self.__dict__.get('lazy_tabs')
+        key = lazy_tabs.owner_of(name) if lazy_tabs is not None else None
+        if key is None:
+            return super().__getattr__(name)
+        if threading.current_thread() is threading.main_thread():
+            self.build_lazy_tab(key)
+        else:
+            self.build_tab_signal.emit(key)
+        return object.__getattribute__(self, name)
         
     def create_dashboard_tab(self):
         """대시보드 탭 생성"""
@@ -1870,6 +1821,22 @@ class Main(QMainWindow):
         self.exclude_loss_products.setToolTip("마진이 최소 마진보다 적은 상품은 가격 수정에서 제외")
         analysis_layout.addWidget(self.exclude_loss_products, 2, 0, 1, 4)
         
+        # 분석 순서: 우선순위(오래 확인 안 한/변동 큰/주력/고가 상품 먼저) + 시간 제한
+        self.priority_scheduling = QCheckBox("🎯 우선순위 순서로 분석")
+        self.priority_scheduling.setChecked(True)
+        self.priority_scheduling.setToolTip("오래 확인하지 않은 상품, 최저가 변동이 큰 상품, 주력상품, 고가 상품부터 분석합니다")
+        analysis_layout.addWidget(self.priority_scheduling, 3, 0, 1, 2)
+        
+        analysis_layout.addWidget(QLabel("분석 시간 제한:"), 3, 2)
+        self.analysis_time_limit = QSpinBox()
+        self.analysis_time_limit.setRange(0, 1440)
+        self.analysis_time_limit.setValue(0)
+        self.analysis_time_limit.setSuffix(" 분")
+        self.analysis_time_limit.setSpecialValueText("제한 없음")
+        self.analysis_time_limit.setToolTip("우선순위 분석 시 이 시간 동안 가치가 높은 상품부터 분석합니다 (0 = 제한 없음)")
+        self.analysis_time_limit.setStyleSheet(self.get_spinbox_style())
+        analysis_layout.addWidget(self.analysis_time_limit, 3, 3)
+        
         layout.addWidget(analysis_group)
         
         # 가격 관리 컨트롤
@@ -1939,6 +1906,29 @@ class Main(QMainWindow):
         """)
         self.load_json_btn.clicked.connect(self.load_products_from_json)
         
+        # 가격 수정 계획 (드라이런) - BUYMA 접속 없이 분석 결과로 계획을 만들고 검토 후 적용
+        self.build_plan_btn = QPushButton("📋 수정 계획 (드라이런)")
+        self.build_plan_btn.setMinimumHeight(45)
+        self.build_plan_btn.setStyleSheet("""
+            QPushButton {
+                background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
+                    stop:0 #17a2b8, stop:1 #117a8b);
+                font-size: 13px;
+                font-weight: bold;
+            }
+            QPushButton:hover {
+                background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
+                    stop:0 #117a8b, stop:1 #0c5460);
+            }
+        """)
+        self.build_plan_btn.clicked.connect(self.build_reprice_plan)
+        
+        self.apply_plan_btn = QPushButton("▶️ 계획 적용")
+        self.apply_plan_btn.setMinimumHeight(45)
+        self.apply_plan_btn.setStyleSheet(self.build_plan_btn.styleSheet())
+        self.apply_plan_btn.setEnabled(False)
+        self.apply_plan_btn.clicked.connect(self.apply_reprice_plan)
+        
         # 가격 수정 버튼 추가
         self.update_prices_btn = QPushButton("💰 가격수정")
         self.update_prices_btn.setMinimumHeight(45)
@@ -1967,6 +1957,8 @@ class Main(QMainWindow):
         # price_control_layout.addWidget(self.load_my_products_btn)
         # price_control_layout.addWidget(self.update_prices_btn)  # 개별 가격수정 버튼 주석처리
         price_control_layout.addWidget(self.load_json_btn)
+        price_control_layout.addWidget(self.build_plan_btn)
+        price_control_layout.addWidget(self.apply_plan_btn)
         price_control_layout.addWidget(self.analyze_price_btn)  # 개별 가격분석 버튼 주석처리
         
         layout.addLayout(price_control_layout)
@@ -2088,12 +2080,6 @@ class Main(QMainWindow):
         
         result_layout.addLayout(pagination_layout)
         
-        # 페이지네이션 변수 초기화
-        self.current_page = 0
-        self.total_pages = 0
-        self.page_size = 100
-        self.all_products = []  # 전체 상품 데이터 저장
-        
         layout.addWidget(result_group)
         
         self.tab_widget.addTab(tab, "💰 가격 관리")
@@ -2408,6 +2394,9 @@ class Main(QMainWindow):
         self.stop_upload_btn.setProperty("class", "danger")
         self.stop_upload_btn.setEnabled(False)
         
+        self.pause_upload_btn.clicked.connect(self.toggle_upload_pause)
+        self.stop_upload_btn.clicked.connect(self.stop_upload)
+        
         upload_control_layout.addWidget(self.start_upload_btn)
         upload_control_layout.addWidget(self.pause_upload_btn)
         upload_control_layout.addWidget(self.stop_upload_btn)
@@ -2548,6 +2537,17 @@ class Main(QMainWindow):
         self.avg_process_time.setStyleSheet("font-size: 16px; font-weight: bold; color: #6f42c1; padding: 5px;")
         stats_layout.addWidget(self.avg_process_time, 1, 3)
         
+        stats_layout.addWidget(QLabel("처리 속도:"), 2, 0)
+        self.throughput_label = QLabel("대기 중")
+        self.throughput_label.setStyleSheet("font-size: 13px; font-weight: bold; color: #17a2b8; padding: 5px;")
+        stats_layout.addWidget(self.throughput_label, 2, 1, 1, 3)
+        
+        stats_layout.addWidget(QLabel("단계별:"), 3, 0)
+        self.stage_metrics_label = QLabel("-")
+        self.stage_metrics_label.setStyleSheet("font-size: 11px; color: #495057; padding: 5px;")
+        self.stage_metrics_label.setWordWrap(True)
+        stats_layout.addWidget(self.stage_metrics_label, 3, 1, 1, 3)
+        
         layout.addWidget(stats_group)
         
         # 시스템 상태
@@ -2577,6 +2577,17 @@ class Main(QMainWindow):
         self.network_status.setStyleSheet("color: #ffc107; font-weight: bold; font-size: 12px; padding: 5px;")
         system_layout.addWidget(self.network_status, 2, 1)
         
+        system_layout.addWidget(QLabel("브라우저 메모리:"), 3, 0)
+        self.chrome_memory = QLabel("브라우저 없음")
+        self.chrome_memory.setStyleSheet("font-weight: bold; font-size: 12px; padding: 5px;")
+        system_layout.addWidget(self.chrome_memory, 3, 1)
+        
+        system_layout.addWidget(QLabel("실행 중인 작업:"), 4, 0)
+        self.job_status = QLabel("없음")
+        self.job_status.setWordWrap(True)
+        self.job_status.setStyleSheet("font-weight: bold; font-size: 12px; padding: 5px;")
+        system_layout.addWidget(self.job_status, 4, 1)
+        
         layout.addWidget(system_group)
         
         self.tab_widget.addTab(tab, "📺 모니터링")
@@ -2868,10 +2879,10 @@ class Main(QMainWindow):
         self.timer.timeout.connect(self.update_time)
         self.timer.start(1000)
         
-        # 시스템 모니터링 타이머 (5초마다 업데이트)
-        self.system_timer = QTimer()
-        self.system_timer.timeout.connect(self.update_system_stats)
-        self.system_timer.start(5000)  # 5초마다 업데이트
+        # 시스템 상태 측정 (백그라운드 스레드 1개, 결과는 system_stats_signal 로 화면 스레드에 전달)
+        self.system_sampler = SystemSampler(self.system_stats_signal.emit, watchdog=self.browser_watchdog,
+                                            log=print)  # 백그라운드 스레드라 화면 로그 대신 콘솔
+        self.system_sampler.start()
         
     # 메서드들
     def update_time(self):
@@ -2881,82 +2892,78 @@ class Main(QMainWindow):
         
         # 헤더의 마지막 업데이트 시간도 함께 업데이트
         self.last_update.setText(f"마지막 업데이트: {datetime.now().strftime('%Y-%m-%d %H:%M')}")
+        
+        self.update_throughput_panel()
     
-    def update_system_stats(self):
-        """실시간 시스템 상태 업데이트"""
+    def update_throughput_panel(self):
+        """처리 속도/예상 완료 시간 표시 갱신 (1초마다)"""
         try:
-            # CPU 사용률 업데이트
-            cpu_percent = psutil.cpu_percent(interval=0.1)
-            self.cpu_usage.setValue(int(cpu_percent))
+            stage = self.metrics.active
+            if not stage or not hasattr(self, 'throughput_label'):
+                return
+            self.throughput_label.setText(f"{STAGE_NAMES.get(stage, stage)} {self.metrics.describe(stage)}")
+            self.stage_metrics_label.setText("\n".join(self.metrics.summary()))
             
-            # CPU 사용률에 따른 색상 변경
-            if cpu_percent < 50:
-                cpu_color = "#28a745"  # 녹색
-            elif cpu_percent < 80:
-                cpu_color = "#ffc107"  # 노란색
-            else:
-                cpu_color = "#dc3545"  # 빨간색
-                
+            snapshot = self.metrics.snapshot(stage)
+            if hasattr(self, 'estimated_time') and snapshot['eta'] is not None:
+                self.estimated_time.setText(f"예상 완료: {(datetime.now() + timedelta(seconds=snapshot['eta'])).strftime('%H:%M')}")
+            
+            for widget in (self.progress_widget, self.upload_progress_widget, self.price_progress_widget):
+                if widget.isVisible():
+                    widget.refresh_metrics()
+        except Exception as e:
+            print(f"처리 속도 표시 오류: {e}")
+    
+    @staticmethod
+    def usage_color(percent, warn, danger):
+        """사용률 구간별 색상 (녹색/노란색/빨간색)"""
+        if percent < warn:
+            return "#28a745"
+        if percent < danger:
+            return "#ffc107"
+        return "#dc3545"
+    
+    def update_system_stats(self, snapshot):
+        """시스템 상태 표시 (SystemSampler 측정 결과 - 화면 스레드에서 실행)"""
+        try:
+            cpu_percent = snapshot['cpu']
+            self.cpu_usage.setValue(int(cpu_percent))
             self.cpu_usage.setStyleSheet(f"""
                 QProgressBar::chunk {{
-                    background: {cpu_color};
+                    background: {self.usage_color(cpu_percent, 50, 80)};
                     border-radius: 4px;
                 }}
             """)
             
-            # 메모리 사용률 업데이트
-            memory = psutil.virtual_memory()
-            memory_percent = int(memory.percent)
+            memory_percent = int(snapshot['memory'])
             self.memory_usage.setValue(memory_percent)
-            
-            # 메모리 사용률에 따른 색상 변경
-            if memory_percent < 60:
-                memory_color = "#28a745"  # 녹색
-            elif memory_percent < 85:
-                memory_color = "#ffc107"  # 노란색
-            else:
-                memory_color = "#dc3545"  # 빨간색
-                
             self.memory_usage.setStyleSheet(f"""
                 QProgressBar::chunk {{
-                    background: {memory_color};
+                    background: {self.usage_color(memory_percent, 60, 85)};
                     border-radius: 4px;
                 }}
             """)
             
-            # 네트워크 상태 확인 (비동기로 처리)
-            self.check_network_status()
+            if snapshot['chrome_processes']:
+                self.chrome_memory.setText(f"{snapshot['chrome_rss_mb']:,.0f}MB ({snapshot['chrome_processes']}개 프로세스)")
+            else:
+                self.chrome_memory.setText("브라우저 없음")
+            
+            self.job_status.setText(self.jobs.summary())
+            
+            text, color = {
+                'ok': ("● 정상", "#28a745"),
+                'slow': ("● 불안정", "#ffc107"),
+                'down': ("● 연결 실패", "#dc3545"),
+            }.get(snapshot['network'], ("● 확인중...", "#6c757d"))
+            if snapshot['network_latency'] is not None:
+                text += f" ({snapshot['network_latency']:.1f}초)"
+            self.network_status.setText(text)
+            self.network_status.setStyleSheet(f"color: {color}; font-weight: bold; font-size: 12px; padding: 5px;")
             
         except Exception as e:
             self.log_message(f"시스템 모니터링 오류: {str(e)}")
     
-    def check_network_status(self):
-        """네트워크 상태 확인 (별도 스레드에서 실행)"""
-        import threading
-        
-        def check_connection():
-            try:
-                # 빠른 연결 테스트
-                response = requests.get("https://www.google.com", timeout=3)
-                if response.status_code == 200:
-                    self.network_status.setText("● 정상")
-                    self.network_status.setStyleSheet("color: #28a745; font-weight: bold; font-size: 12px; padding: 5px;")
-                else:
-                    self.network_status.setText("● 불안정")
-                    self.network_status.setStyleSheet("color: #ffc107; font-weight: bold; font-size: 12px; padding: 5px;")
-            except requests.exceptions.RequestException:
-                self.network_status.setText("● 연결 실패")
-                self.network_status.setStyleSheet("color: #dc3545; font-weight: bold; font-size: 12px; padding: 5px;")
-            except Exception:
-                self.network_status.setText("● 확인 불가")
-                self.network_status.setStyleSheet("color: #6c757d; font-weight: bold; font-size: 12px; padding: 5px;")
-        
-        # 네트워크 확인을 별도 스레드에서 실행 (UI 블로킹 방지)
-        import threading
-        
-        thread = threading.Thread(target=check_connection, daemon=True)
-        thread.start()
-    
     # 대시보드 관련 메서드들
     def start_full_automation(self):
         """전체 자동화 프로세스 시작"""
@@ -2977,11 +2984,8 @@ class Main(QMainWindow):
         self.dashboard_log_message("🚀 전체 자동화 프로세스를 시작합니다...")
         self.dashboard_log_message(f"📋 설정: URL={url}, 개수={self.dashboard_count.value()}, 할인={self.dashboard_discount.value()}엔")
         
-        # 별도 스레드에서 자동화 실행
-        import threading
-        
-        self.automation_thread = threading.Thread(target=self.run_full_automation, daemon=True)
-        self.automation_thread.start()
+        # 작업 실행기에서 자동화 실행
+        self.jobs.submit('automation', self.run_full_automation, title="전체 자동화")
     
     def run_full_automation(self):
         """전체 자동화 프로세스 실행"""
@@ -3176,8 +3180,7 @@ class Main(QMainWindow):
             
             # 크롤링 실행
             driver.get(url)
-            import time
-            time.sleep(3)
+            self.tracer.sleep(3)
             
             # 간단한 크롤링 (실제 구현은 기존 로직 사용)
             collected_items = min(count, 5)  # 데모용으로 최대 5개
@@ -3192,7 +3195,8 @@ class Main(QMainWindow):
                 # 진행률 업데이트
                 progress = int(((i + 1) / collected_items) * 100)
                 self.step1_progress.setValue(progress)
-                time.sleep(0.5)
+                if not self.tracer.sleep(0.5):
+                    break
             
             return True
             
@@ -3271,8 +3275,8 @@ class Main(QMainWindow):
                 progress = int(((row + 1) / self.crawling_table.rowCount()) * 100)
                 self.step2_progress.setValue(progress)
                 
-                import time
-                time.sleep(0.3)
+                if not self.tracer.sleep(0.3):
+                    break
             
             return True
             
@@ -3340,8 +3344,8 @@ class Main(QMainWindow):
                 progress = int(((row + 1) / self.upload_table.rowCount()) * 100)
                 self.step3_progress.setValue(progress)
                 
-                import time
-                time.sleep(0.3)
+                if not self.tracer.sleep(0.3):
+                    break
             
             return True
             
@@ -3382,8 +3386,8 @@ class Main(QMainWindow):
                 progress = int(((row + 1) / self.price_table.rowCount()) * 100)
                 self.step4_progress.setValue(progress)
                 
-                import time
-                time.sleep(0.3)
+                if not self.tracer.sleep(0.3):
+                    break
             
             return updated_count > 0
             
@@ -3692,6 +3696,7 @@ class Main(QMainWindow):
     
     def stop_full_automation(self):
         """전체 자동화 프로세스 중지"""
+        self.jobs.cancel('automation')
         self.dashboard_log_message("⏹️ 사용자에 의해 프로세스가 중지되었습니다.")
         self.current_step_label.setText("현재 단계: 중지됨")
         self.current_step_label.setStyleSheet("font-size: 14px; font-weight: bold; color: #dc3545; padding: 5px;")
@@ -3798,14 +3803,11 @@ class Main(QMainWindow):
             'delay': self.delay_time.value()
         }
         
-        import threading
+        # 설정된 딜레이를 최소 간격으로 사용 (응답이 느리거나 차단되면 자동으로 더 느려짐)
+        self.rate_limiter.configure('crawl', initial_rate=1.0 / max(crawling_settings['delay'], 2),
+                                    max_rate=1.0 / crawling_settings['delay'])
         
-        self.crawling_thread = threading.Thread(
-            target=self.run_crawling, 
-            args=(url, count, crawling_settings), 
-            daemon=True
-        )
-        self.crawling_thread.start()
+        self.jobs.submit('crawl', self.run_crawling, url, count, crawling_settings, title="크롤링")
     
     def run_crawling_with_shared_driver(self, url, count, settings):
         """공용 드라이버를 사용한 크롤링 실행"""
@@ -3826,13 +3828,12 @@ class Main(QMainWindow):
             
             # 크롤링 페이지로 이동
             self.log_message(f"📄 페이지에 접속합니다: {url}")
-            self.shared_driver.get(url)
+            self.rate_limiter.get_page('crawl', self.shared_driver, url)
             
             # 페이지 로딩 대기
             from selenium.webdriver.support.ui import WebDriverWait
             from selenium.webdriver.support import expected_conditions as EC
             from selenium.webdriver.common.by import By
-            import time
             
             WebDriverWait(self.shared_driver, 10).until(
                 EC.presence_of_element_located((By.TAG_NAME, "body"))
@@ -3880,11 +3881,14 @@ class Main(QMainWindow):
                 if collected_items >= count:
                     break
                 
-                # 메모리 정리 (10개마다)
+                # 메모리 정리 (10개마다) - Chrome 메모리가 임계치를 넘으면 상품 사이에서 브라우저 재시작
                 if i > 0 and i % 10 == 0:
                     import gc
                     gc.collect()
-                    self.log_message(f"🧹 메모리 정리 완료 ({i}개 처리)")
+                    if self.browser_watchdog.check(self.shared_driver):
+                        if not self.restart_shared_driver():
+                            self.log_message("❌ 브라우저 재시작 실패, 크롤링 중단")
+                            break
                 
                 # 브라우저 상태 체크
                 try:
@@ -3932,8 +3936,6 @@ class Main(QMainWindow):
                         
                         self.log_message(f"✅ 상품 수집: {item_data.get('title', 'Unknown')[:30]}...")
                         
-                        # 설정된 딜레이 적용 (서버 부하 방지)
-                        time.sleep(max(settings['delay'], 2))  # 최소 2초 대기
                 
                 except Exception as e:
                     self.log_message(f"⚠️ 상품 추출 오류 (#{i+1}): {str(e)}")
@@ -3954,6 +3956,8 @@ class Main(QMainWindow):
             
             # 크롤링 완료
             self.log_message(f"🎉 크롤링 완료! 총 {collected_items}개 상품 수집")
+            if settings['include_options']:
+                self.log_message(f"📊 {self.variation_extractor.summary()}")
             self.crawling_status_signal.emit(f"완료: {collected_items}개 수집")
             self.crawling_progress_signal.emit(100)
             
@@ -3980,6 +3984,8 @@ class Main(QMainWindow):
             # UI 상태 복원
             self.crawling_finished_signal.emit()
     
+    @metered("crawl", failed=lambda item: not item or item.get('status') == '추출 실패')
+    @traced("crawl.item")
     def extract_item_data_with_shared_driver(self, url, index, settings):
         """공용 드라이버를 사용한 상품 데이터 추출"""
         try:
@@ -3990,8 +3996,7 @@ class Main(QMainWindow):
                 return None
             
             # 공용 드라이버 사용
-            self.shared_driver.get(url)
-            time.sleep(2)
+            self.rate_limiter.get_page('crawl', self.shared_driver, url)
             
             # 기본 정보 추출 (기존 로직과 동일)
             title = "상품명 없음"
@@ -4052,71 +4057,10 @@ class Main(QMainWindow):
             # 색상 및 사이즈 정보 추출 (설정 확인)
             if settings['include_options']:
                 try:
-                    color_size_buttons = self.shared_driver.find_elements(By.CSS_SELECTOR, "p.colorsize_selector")
-                    
-                    if len(color_size_buttons) >= 1:
-                        # 색상 정보 추출
-                        try:
-                            color_size_buttons[0].click()
-                            time.sleep(1)
-                            
-                            colors_ul = self.shared_driver.find_element(By.CSS_SELECTOR, "ul.colorsize_list")
-                            colors_li_elements = colors_ul.find_elements(By.TAG_NAME, "li")
-                            
-                            for li in colors_li_elements:
-                                try:
-                                    # 색상 카테고리 추출 (CSS 선택자 수정)
-                                    try:
-                                        color_category_element = li.find_element(By.CSS_SELECTOR, "span.item_color")
-                                        color_category = color_category_element.get_attribute("class").replace("item_color ", "").strip()
-                                        self.log_message(f"🎨 색상 카테고리 추출: {color_category}")
-                                    except Exception as cat_e:
-                                        color_category = ""  # 카테고리를 찾을 수 없는 경우 빈 문자열
-                                        self.log_message(f"⚠️ 색상 카테고리 추출 실패: {str(cat_e)}")
-                                    
-                                    color_text = li.text.strip()
-                                    self.log_message(f"🎨 색상 텍스트 추출: {color_text}")
-                                    
-                                    if color_text and [color_category, color_text] not in colors:
-                                        colors.append([color_category, color_text])
-                                        self.log_message(f"✅ 색상 추가: [{color_category}, {color_text}]")
-                                    else:
-                                        self.log_message(f"⏭️ 색상 건너뛰기 (중복 또는 빈 텍스트): {color_text}")
-                                except Exception as li_e:
-                                    self.log_message(f"❌ 색상 li 처리 오류: {str(li_e)}")
-                                    continue
-                            
-                            color_size_buttons[0].click()
-                            time.sleep(1)
-                            
-                        except Exception as e:
-                            self.log_message(f"⚠️ 색상 정보 추출 실패: {str(e)}")
-                    
-                    # 사이즈 정보 추출
-                    if len(color_size_buttons) >= 2:
-                        try:
-                            color_size_buttons[1].click()
-                            time.sleep(1)
-                            
-                            sizes_ul = self.shared_driver.find_element(By.CSS_SELECTOR, ".colorsize_list.js-size-list")
-                            sizes_li_elements = sizes_ul.find_elements(By.TAG_NAME, "li")
-                            
-                            for li in sizes_li_elements:
-                                try:
-                                    size_text = li.text.strip()
-                                    if size_text and size_text not in sizes:
-                                        sizes.append(size_text)
-                                except:
-                                    continue
-                            
-                            color_size_buttons[1].click()
-                            time.sleep(1)
-                            
-                        except Exception as e:
-                            self.log_message(f"⚠️ 사이즈 정보 추출 실패: {str(e)}")
-                        
+                    # 숨겨진 DOM/내장 JSON에서 한 번에 추출 (실패 시에만 클릭 방식으로 폴백)
+                    colors, sizes = self.variation_extractor.extract(self.shared_driver, self.log_message)
                 except Exception as e:
-                    self.log_message(f"⚠️ 색상/사이즈 버튼을 찾을 수 없습니다: {str(e)}")
+                    self.log_message(f"⚠️ 색상/사이즈 정보 추출 실패: {str(e)}")
             else:
                 self.log_message(f"⚙️ 색상/사이즈 수집 건너뛰기 (설정)")
             
@@ -4174,7 +4118,6 @@ class Main(QMainWindow):
             from selenium.webdriver.support import expected_conditions as EC
             from webdriver_manager.chrome import ChromeDriverManager
             
-            import time
             
             # Chrome 옵션 설정 (크롤링 최적화)
             chrome_options = self.get_stable_chrome_options()
@@ -4189,6 +4132,8 @@ class Main(QMainWindow):
                     
                     driver = webdriver.Chrome(options=chrome_options)
                     driver.implicitly_wait(self.timeout_setting.value())
+                    self.browser_watchdog.track(driver)
+                    self.tracer.instrument_driver(driver)
                     
                     # 브라우저 안정성 테스트
                     driver.get("about:blank")
@@ -4223,12 +4168,12 @@ class Main(QMainWindow):
                         self.crawling_finished_signal.emit()
                         return
                     
-                    time.sleep(3)  # 재시도 전 대기 시간 증가
+                    self.tracer.sleep(3)  # 재시도 전 대기 시간 증가
             
             self.log_message(f"📄 페이지에 접속합니다: {url}")
             
             # 페이지 접속
-            driver.get(url)
+            self.rate_limiter.get_page('crawl', driver, url)
             
             # 페이지 로딩 대기
             WebDriverWait(driver, 10).until(
@@ -4237,7 +4182,7 @@ class Main(QMainWindow):
             
             self.log_message("🔍 상품 정보를 수집합니다...")
             
-            time.sleep(1)
+            self.tracer.sleep(1)
             
             try:
                 driver.implicitly_wait(3)
@@ -4245,7 +4190,7 @@ class Main(QMainWindow):
                 popup = driver.find_element(By.CSS_SELECTOR, "span.bcIntro__closeBtn")
                 
                 driver.execute_script("arguments[0].click();", popup)
-                time.sleep(1)
+                self.tracer.sleep(1)
                 
                 self.log_message("✅ 팝업창을 성공적으로 닫았습니다.")
             except Exception as e:
@@ -4292,21 +4237,40 @@ class Main(QMainWindow):
             
             # 상품 정보 추출
             for i, link in enumerate(product_links):
-                # 작업 상태 체크
-                if self.work_stopped:
+                # 작업 상태 체크 (일시정지 중이면 재개/중지까지 대기)
+                if self.work_paused:
+                    self.crawling_log_signal.emit("⏸️ 크롤링 일시정지 중...")
+                if not self.check_work_status():
                     self.crawling_log_signal.emit("🛑 크롤링 중지됨")
                     break
                 
-                while self.work_paused:
-                    self.crawling_log_signal.emit("⏸️ 크롤링 일시정지 중...")
-                    time.sleep(1)
-                    if self.work_stopped:
-                        self.crawling_log_signal.emit("🛑 크롤링 중지됨")
-                        return
-                
                 if collected_items >= count:
                     break
                 
+                # Chrome 메모리가 임계치를 넘으면 상품 사이에서 브라우저 교체
+                if i > 0 and i % 10 == 0 and self.browser_watchdog.check(driver):
+                    self.browser_watchdog.release(driver)
+                    try:
+                        driver.quit()
+                    except:
+                        pass
+                    self.browser_watchdog.kill_orphans()
+                    driver = None
+                    try:
+                        driver = webdriver.Chrome(options=chrome_options)
+                        driver.implicitly_wait(self.timeout_setting.value())
+                    except Exception as e:
+                        self.log_error(f"❌ 브라우저 재시작 실패, 수집한 {collected_items}개 상품으로 크롤링을 마칩니다: {str(e)}")
+                        if driver:
+                            try:
+                                driver.quit()
+                            except:
+                                pass
+                            driver = None
+                        break
+                    self.browser_watchdog.track(driver)
+                    self.tracer.instrument_driver(driver)
+                
                 # 브라우저 상태 체크
                 try:
                     driver.current_url  # 브라우저가 살아있는지 체크
@@ -4334,6 +4298,7 @@ class Main(QMainWindow):
                             })
                         
                         collected_items += 1
+                        report_progress(collected_items, count)
                         
                         # UI 업데이트 (시그널로 안전하게 처리) - 데이터 저장용
                         self.crawling_result_signal.emit(item_data)
@@ -4347,9 +4312,6 @@ class Main(QMainWindow):
                         
                         self.log_message(f"✅ 상품 수집: {item_data.get('title', 'Unknown')[:30]}...")
                         
-                        # 설정된 딜레이 적용
-                        import time
-                        time.sleep(settings['delay'])
                 
                 except Exception as e:
                     self.log_message(f"⚠️ 상품 추출 오류 (#{i+1}): {str(e)}")
@@ -4363,6 +4325,8 @@ class Main(QMainWindow):
             
             # 완료 처리 (시그널로 안전하게 처리)
             self.log_message(f"✅ 크롤링 완료! 총 {collected_items}개 상품을 수집했습니다.")
+            if settings['include_options']:
+                self.log_message(f"📊 {self.variation_extractor.summary()}")
             self.crawling_status_signal.emit(f"완료: {collected_items}개")
             self.crawling_progress_signal.emit(100)
             self.crawling_finished_signal.emit()
@@ -4374,6 +4338,7 @@ class Main(QMainWindow):
         finally:
             # 브라우저 안전한 종료
             if driver:
+                self.browser_watchdog.release(driver)
                 try:
                     # 모든 탭 닫기
                     for handle in driver.window_handles:
@@ -4385,6 +4350,7 @@ class Main(QMainWindow):
                     self.log_message("🔄 크롤링용 브라우저가 안전하게 종료되었습니다.")
                 except Exception as cleanup_error:
                     self.log_message(f"⚠️ 브라우저 종료 중 오류: {str(cleanup_error)}")
+                self.browser_watchdog.kill_orphans()
             
             # 메모리 정리
             import gc
@@ -4393,6 +4359,8 @@ class Main(QMainWindow):
             # UI 상태 복원 (시그널로 안전하게 처리)
             self.crawling_finished_signal.emit()
     
+    @metered("crawl", failed=lambda item: not item or item.get('status') == '추출 실패')
+    @traced("crawl.item")
     def extract_item_data(self, url, index, driver, settings):
         """상품 데이터 추출 (안전장치 추가) - 설정 적용"""
         try:
@@ -4403,8 +4371,7 @@ class Main(QMainWindow):
                 self.log_message(f"⚠️ 상품 #{index+1} URL을 찾을 수 없습니다.")
                 return None
             
-            driver.get(url)
-            time.sleep(2)
+            self.rate_limiter.get_page('crawl', driver, url)
             
             driver.implicitly_wait(10)
             
@@ -4467,79 +4434,14 @@ class Main(QMainWindow):
             # 색상 및 사이즈 정보 추출 (설정 확인)
             if settings['include_options']:
                 try:
-                    color_size_buttons = driver.find_elements(By.CSS_SELECTOR, "p.colorsize_selector")
-                    
-                    if len(color_size_buttons) >= 1:
-                        # 색상 정보 추출
-                        try:
-                            color_size_buttons[0].click()
-                            time.sleep(1)
-                            
-                            colors_ul = driver.find_element(By.CSS_SELECTOR, "ul.colorsize_list")
-                            colors_li_elements = colors_ul.find_elements(By.TAG_NAME, "li")
-                            
-                            for li in colors_li_elements:
-                                try:
-                                    # 색상 카테고리 추출 (CSS 선택자 수정)
-                                    try:
-                                        color_category_element = li.find_element(By.CSS_SELECTOR, "span.item_color")
-                                        color_category = color_category_element.get_attribute("class").replace("item_color ", "").strip()
-                                        self.log_message(f"🎨 색상 카테고리 추출: {color_category}")
-                                    except Exception as cat_e:
-                                        color_category = ""  # 카테고리를 찾을 수 없는 경우 빈 문자열
-                                        self.log_message(f"⚠️ 색상 카테고리 추출 실패: {str(cat_e)}")
-                                    
-                                    color_text = li.text.strip()
-                                    self.log_message(f"🎨 색상 텍스트 추출: {color_text}")
-                                    
-                                    if color_text and [color_category, color_text] not in colors:
-                                        colors.append([color_category, color_text])
-                                        self.log_message(f"✅ 색상 추가: [{color_category}, {color_text}]")
-                                    else:
-                                        self.log_message(f"⏭️ 색상 건너뛰기 (중복 또는 빈 텍스트): {color_text}")
-                                except Exception as li_e:
-                                    self.log_message(f"❌ 색상 li 처리 오류: {str(li_e)}")
-                                    continue
-                            
-                            # 색상 정보 옵션 종료
-                            color_size_buttons[0].click()
-                            time.sleep(1)
-                            
-                        except Exception as e:
-                            self.log_message(f"⚠️ 색상 정보 추출 실패: {str(e)}")
-                    
-                    # 사이즈 정보 추출 (두 번째 버튼이 있는 경우에만)
-                    if len(color_size_buttons) >= 2:
-                        try:
-                            color_size_buttons[1].click()
-                            time.sleep(1)
-                            
-                            sizes_ul = driver.find_element(By.CSS_SELECTOR, ".colorsize_list.js-size-list")
-                            sizes_li_elements = sizes_ul.find_elements(By.TAG_NAME, "li")
-                            
-                            for li in sizes_li_elements:
-                                try:
-                                    size_text = li.text.strip()
-                                    if size_text and size_text not in sizes:
-                                        sizes.append(size_text)
-                                except:
-                                    continue
-                            
-                            # 사이즈 정보 옵션 종료
-                            color_size_buttons[1].click()
-                            time.sleep(1)
-                            
-                        except Exception as e:
-                            self.log_message(f"⚠️ 사이즈 정보 추출 실패: {str(e)}")
-                    else:
-                        self.log_message(f"⚠️ 사이즈 버튼을 찾을 수 없습니다.")
-                        
+                    # 숨겨진 DOM/내장 JSON에서 한 번에 추출 (실패 시에만 클릭 방식으로 폴백)
+                    colors, sizes = self.variation_extractor.extract(driver, self.log_message)
                 except Exception as e:
-                    self.log_message(f"⚠️ 색상/사이즈 버튼을 찾을 수 없습니다: {str(e)}")
+                    self.log_message(f"⚠️ 색상/사이즈 정보 추출 실패: {str(e)}")
             else:
                 self.log_message(f"⚙️ 색상/사이즈 수집 건너뛰기 (설정)")
             
-            time.sleep(0.5)
+            self.tracer.sleep(0.5)
             
             # 상품 설명 추출 (안전장치)
             try:
@@ -4547,7 +4449,7 @@ class Main(QMainWindow):
                 
                 # 해당 요소로 스크롤 
                 driver.execute_script("arguments[0].scrollIntoView(true);", description_element)
-                time.sleep(1)
+                self.tracer.sleep(1)
                 
                 description_text = description_element.text.strip() if description_element else ""
             except Exception as e:
@@ -4751,15 +4653,8 @@ class Main(QMainWindow):
                 }
             """)
             
-            # 별도 스레드에서 로그인 실행
-            import threading
-            
-            self.login_thread = threading.Thread(
-                target=self.perform_buyma_login, 
-                args=(email, password), 
-                daemon=True
-            )
-            self.login_thread.start()
+            # 작업 실행기에서 로그인 실행
+            self.jobs.submit('login', self.perform_buyma_login, email, password, title="로그인")
             
         except Exception as e:
             self.log_message(f"로그인 시작 오류: {str(e)}")
@@ -4772,11 +4667,13 @@ class Main(QMainWindow):
             
             # 기존 드라이버가 있으면 종료
             if self.shared_driver:
+                self.browser_watchdog.release(self.shared_driver)
                 try:
                     self.shared_driver.quit()
                 except:
                     pass
                 self.shared_driver = None
+            self.browser_watchdog.kill_orphans()
             
             # 새 브라우저 생성
             from selenium import webdriver
@@ -4786,6 +4683,8 @@ class Main(QMainWindow):
             from selenium.webdriver.support import expected_conditions as EC
             import time
             
+            login_start = time.time()
+            
             # Chrome 옵션 설정
             chrome_options = self.get_stable_chrome_options()
             
@@ -4798,6 +4697,8 @@ class Main(QMainWindow):
                     
                     # 페이지 로딩 타임아웃 설정 (10초)
                     self.shared_driver.set_page_load_timeout(10)
+                    self.browser_watchdog.track(self.shared_driver)
+                    self.tracer.instrument_driver(self.shared_driver)
                     
                     self.log_message(f"✅ 브라우저 초기화 성공 (시도 {attempt + 1}/{max_retries})")
                     break
@@ -4808,9 +4709,17 @@ class Main(QMainWindow):
                         return
                     time.sleep(2)
             
+            # 저장된 로그인 쿠키로 먼저 시도 (성공 시 폼 로그인 생략)
+            if self.cookie_store.warm_start(self.shared_driver):
+                self.is_logged_in = True
+                self.session_bridge.sync_from_driver(self.shared_driver)
+                self.login_success_signal.emit()
+                self.log_message("✅ BUYMA 로그인 성공! (저장된 세션 복원)")
+                return
+            
             # BUYMA 로그인 페이지 접속
             self.log_message("📄 BUYMA 로그인 페이지에 접속합니다...")
-            self.shared_driver.get("https://www.buyma.com/login/")
+            self.rate_limiter.navigate(self.shared_driver, "https://www.buyma.com/login/")
             
             # 페이지 로딩 대기
             WebDriverWait(self.shared_driver, 10).until(
@@ -4892,6 +4801,9 @@ class Main(QMainWindow):
                 "마이페이지" in page_source):
                 # 로그인 성공
                 self.is_logged_in = True
+                self.session_bridge.sync_from_driver(self.shared_driver)
+                self.cookie_store.save(self.shared_driver)
+                self.cookie_store.record_start('cold', time.time() - login_start)
                 self.login_success_signal.emit()
                 self.log_message("✅ BUYMA 로그인 성공!")
             else:
@@ -4965,6 +4877,8 @@ class Main(QMainWindow):
                 self.shared_driver = None
             
             self.is_logged_in = False
+            self.session_bridge.invalidate()
+            self.cookie_store.clear()
             self.login_status_label.setText("❌ 로그인 필요")
             self.login_status_label.setStyleSheet("""
                 QLabel {
@@ -5177,6 +5091,8 @@ class Main(QMainWindow):
                 self.shared_driver = None
             
             self.is_logged_in = False
+            self.session_bridge.invalidate()
+            self.cookie_store.clear()
             self.login_status_label.setText("❌ 로그인 필요")
             self.login_status_label.setStyleSheet("""
                 QLabel {
@@ -5228,11 +5144,13 @@ class Main(QMainWindow):
             
             # 기존 드라이버 종료
             if self.shared_driver:
+                self.browser_watchdog.release(self.shared_driver)
                 try:
                     self.shared_driver.quit()
                 except:
                     pass
                 self.shared_driver = None
+            self.browser_watchdog.kill_orphans()
             
             # 새 드라이버 생성
             from selenium import webdriver
@@ -5247,15 +5165,13 @@ class Main(QMainWindow):
                     
                     # 페이지 로딩 타임아웃 설정 (10초)
                     self.shared_driver.set_page_load_timeout(10)
+                    self.browser_watchdog.track(self.shared_driver)
+                    self.tracer.instrument_driver(self.shared_driver)
                     
-                    # BUYMA 메인 페이지로 이동 (로그인 상태 확인)
-                    self.shared_driver.get("https://www.buyma.com/")
-                    time.sleep(2)
-                    
-                    # 로그인 상태 확인
-                    page_source = self.shared_driver.page_source.lower()
-                    if "logout" in page_source or "마이페이지" in page_source:
+                    # 저장된 로그인 쿠키 복원 후 로그인 상태 확인
+                    if self.cookie_store.warm_start(self.shared_driver):
                         self.log_message("✅ 브라우저 재시작 및 로그인 상태 확인 완료")
+                        self.session_bridge.sync_from_driver(self.shared_driver)
                         return True
                     else:
                         self.log_message("⚠️ 로그인 상태가 유지되지 않았습니다.")
@@ -5264,6 +5180,16 @@ class Main(QMainWindow):
                         
                 except Exception as e:
                     self.log_message(f"⚠️ 브라우저 재시작 실패 (시도 {attempt + 1}/{max_retries}): {str(e)}")
+                    
+                    # 실패한 시도가 남긴 Chrome 프로세스 정리
+                    if self.shared_driver:
+                        self.browser_watchdog.release(self.shared_driver)
+                        try:
+                            self.shared_driver.quit()
+                        except:
+                            pass
+                        self.shared_driver = None
+                    self.browser_watchdog.kill_orphans()
                     if attempt == max_retries - 1:
                         return False
                     time.sleep(2)
@@ -5349,7 +5275,8 @@ class Main(QMainWindow):
             self.log_message("📊 테이블에 이미 데이터가 없습니다. 내 상품 불러오기를 시작합니다...")
             self.crawl_my_products()
         
-        time.sleep(1)
+        if not self.tracer.sleep(1):
+            return
         
         # UI 제어: 모니터링 탭으로 이동 및 다른 탭 비활성화
         self.switch_to_monitoring_tab()
@@ -5360,19 +5287,12 @@ class Main(QMainWindow):
         self.update_price_progress_widget(0, self.price_table.rowCount(), "기존 데이터로 가격분석 시작...")
         
         # 기존 테이블 데이터로 바로 가격분석 실행
-        import threading
-        
-        # 분석 설정
         discount = self.discount_amount.value()
         min_margin = self.min_margin.value()
         is_auto_mode = self.auto_mode.isChecked()
         
-        self.price_analysis_thread = threading.Thread(
-            target=self.analyze_all_pages_sequentially,
-            args=(discount, min_margin, is_auto_mode),
-            daemon=True
-        )
-        self.price_analysis_thread.start()
+        self.jobs.submit('price_analysis', self.analyze_all_pages_sequentially,
+                         discount, min_margin, is_auto_mode, title="가격 분석")
         return
         
         # UI 제어: 모니터링 탭으로 이동 및 다른 탭 비활성화
@@ -5395,18 +5315,15 @@ class Main(QMainWindow):
         # self.load_products_thread.start()
     
     def crawl_my_products(self):
-        """내 상품 크롤링 실행 - JSON 파일로 저장"""
+        """내 상품 크롤링 실행 - JSON 파일로 저장 (판매 목록 읽기는 엔진에 위임)"""
         try:
             if not self.shared_driver:
                 self.log_error("❌ 브라우저가 초기화되지 않았습니다.")
                 return
             
             # JSON 파일명 생성 (상품정보_수집날짜_수집시간.json)
-            from datetime import datetime
             now = datetime.now()
-            date_str = now.strftime("%Y%m%d")
-            time_str = now.strftime("%H%M%S")
-            json_filename = f"상품정보_{date_str}_{time_str}.json"
+            json_filename = f"상품정보_{now.strftime('%Y%m%d')}_{now.strftime('%H%M%S')}.json"
             json_filepath = os.path.join(os.getcwd(), json_filename)
             
             # 현재 JSON 파일 경로 저장 (분석 결과 업데이트용)
@@ -5414,178 +5331,40 @@ class Main(QMainWindow):
             
             self.log_message(f"📁 상품 정보를 {json_filename} 파일로 저장합니다.")
             
-            page_number = 1
-            total_products = 0
-            
-            # JSON 파일 초기화
-            json_data = {
-                "수집_정보": {
-                    "수집_날짜": now.strftime("%Y-%m-%d"),
-                    "수집_시간": now.strftime("%H:%M:%S"),
-                    "총_상품수": 0
-                },
-                "상품_목록": []
-            }
+            def save_json(products):
+                with open(json_filepath, 'w', encoding='utf-8') as f:
+                    json.dump(build_snapshot(products, now), f, ensure_ascii=False, indent=2)
             
-            while True:
-                
-                # 내 상품 페이지로 이동
-                my_products_url = f"https://www.buyma.com/my/sell?duty_kind=all&facet=brand_id%2Ccate_pivot%2Cstatus%2Ctag_ids%2Cshop_labels%2Cstock_state&order=desc&page={page_number}&rows=100&sale_kind=all&sort=item_id&status=for_sale&timesale_kind=all#/"
-                self.my_products_log_signal.emit(f"🌐 내 상품 페이지 {page_number} 접속 중...")
-                
-                self.shared_driver.get(my_products_url)
-                time.sleep(3)
-                
-                # 상품 목록 크롤링
-                from selenium.webdriver.common.by import By
-                from selenium.webdriver.support.ui import WebDriverWait
-                from selenium.webdriver.support import expected_conditions as EC
+            def on_page(page, products, expected_total):
+                # 진행률 위젯 업데이트 (시그널 사용) - 전체 상품 수를 모르면 0 (개수만 표시)
+                self.update_price_progress_signal.emit(len(products), expected_total, f"상품 수집 중: {len(products)}개 완료")
                 
-                # 상품 요소들 찾기
+                # 페이지마다 중간 저장
                 try:
-                    # 상품 리스트 대기
-                    WebDriverWait(self.shared_driver, 10).until(
-                        EC.presence_of_element_located((By.CSS_SELECTOR, "tr.cursor_pointer.js-checkbox-check-row"))
-                    )
-                    
-                    # 총 상품 개수 수집 (첫 페이지에서만)
-                    if page_number == 1:
-                        try:
-                            total_count_elem = self.shared_driver.find_element(By.CSS_SELECTOR, "p.itemedit_actions_nums")
-                            total_count_text = total_count_elem.text.strip()
-                            # 1～100件(全 2962件) 형식에서 2962 추출
-                            match = re.search(r'全\s*([\d,]+)件', total_count_text)
-                            if match:
-                                total_count = match.group(1).replace(',', '')
-                                self.my_products_log_signal.emit(f"📊 총 판매 중인 상품 수: {total_count}개")
-                                
-                                # 진행률 위젯 총 개수 업데이트 (시그널 사용)
-                                self.update_price_progress_signal.emit(0, int(total_count), f"총 {total_count}개 상품 발견")
-                                
-                            else:
-                                self.log_message("⚠️ 총 상품 수를 추출하지 못했습니다.")
-                        except Exception as e:
-                            self.log_message(f"⚠️ 총 상품 수 추출 실패: {str(e)}")
-                    
-                    # 상품 요소들 수집
-                    product_elements = self.shared_driver.find_elements(By.CSS_SELECTOR, "tr.cursor_pointer.js-checkbox-check-row")
-                    
-                    if not product_elements:
-                        self.log_message("⚠️ 판매 중인 상품을 찾을 수 없습니다.")
-                        return
-                    
-                    # 홀수일때 상품, 짝수일때 태그라서 태그는 제외
-                    product_elements = [elem for i, elem in enumerate(product_elements) if i % 2 == 0] # 홀수 인덱스 제외, ex 0,2,4... -> 상품
-                    
-                    self.log_message(f"✅ {len(product_elements)}개의 상품을 발견했습니다.")
-                    
-                    # 각 상품 정보 추출
-                    for i, element in enumerate(product_elements):  # 최대 50개까지
-                        try:
-                            # 상품명 추출
-                            title_elem = element.find_element(By.CSS_SELECTOR, "td.item_name")
-                            title = title_elem.text.strip()
-                            
-                            # 가격 추출
-                            price_elem = element.find_element(By.CSS_SELECTOR, "span.js-item-price-display")
-                            price_text = price_elem.text.strip()
-                            
-                            # 브랜드 추출 (선택사항)
-                            # try:
-                            #     brand_elem = element.find_element(By.CSS_SELECTOR, ".brand, .product-brand, [class*='brand']")
-                            #     brand = brand_elem.text.strip()
-                            # except:
-                            #     brand = "브랜드 미상"
-                            
-                            # 상품 URL 추출 및 상품ID 추출
-                            try:
-                                link_elem = element.find_element(By.CSS_SELECTOR, "a.fab-design-d--b")
-                                product_url = link_elem.get_attribute("href")
-                                
-                                # URL에서 상품ID 추출 (예: /item/12345678/ → 12345678)
-                                id_match = re.search(r'/item/(\d+)/', product_url)
-                                if id_match:
-                                    product_id = id_match.group(1)
-                                    # 상품명에 상품ID 추가
-                                    title_with_id = f"{title} 商品ID: {product_id}"
-                                else:
-                                    title_with_id = title
-                                    product_id = "ID 없음"
-                            except:
-                                product_url = "상품 URL 없음"
-                                title_with_id = title
-                                product_id = "ID 없음"
-                            
-                            product_data = {
-                                'title': title_with_id,  # 상품ID 포함된 제목
-                                'original_title': title,  # 원본 제목
-                                'product_id': product_id,  # 상품ID 별도 저장
-                                'current_price': price_text,
-                                # 'brand': brand,
-                                'url': product_url,
-                                'status': '분석 대기'
-                            }
-                            
-                            # JSON 데이터에 추가 (메모리 절약)
-                            json_data["상품_목록"].append(product_data)
-                            total_products += 1
-                            
-                            # 진행 상황 로그 (10개마다)
-                            if total_products % 10 == 0:
-                                self.my_products_log_signal.emit(f"📦 진행 상황: {total_products}개 상품 수집 완료")
-                                
-                                # 진행률 위젯 업데이트 (시그널 사용)
-                                self.update_price_progress_signal.emit(
-                                    total_products, 
-                                    3000,  # 임시 총 개수 (실제로는 위에서 업데이트됨)
-                                    f"상품 수집 중: {total_products}개 완료"
-                                )
-                            else:
-                                self.my_products_log_signal.emit(f"📦 상품 {total_products}: {title[:30]}... - {price_text}")
-                            
-                            # 중간 저장 (50개마다 메모리 절약)
-                            if total_products % 50 == 0:
-                                try:
-                                    with open(json_filepath, 'w', encoding='utf-8') as f:
-                                        json.dump(json_data, f, ensure_ascii=False, indent=2)
-                                    self.my_products_log_signal.emit(f"💾 중간 저장 완료: {total_products}개 상품")
-                                except Exception as e:
-                                    self.my_products_log_signal.emit(f"❌ 중간 저장 실패: {str(e)}")
-                            
-                        except Exception as e:
-                            self.my_products_log_signal.emit(f"⚠️ 상품 {i+1} 정보 추출 실패: {str(e)}")
-                            continue
-                    
-                    # 다음 페이지로 이동 준비
-                    page_number += 1
-                    
-                    # 마지막 페이지인지 확인 (페이지당 100개씩이고, 총 개수 파악 후 비교)
-                    try:
-                        if len(product_elements) < 100:
-                            self.my_products_log_signal.emit("📃 마지막 페이지에 도달했습니다.")
-                            break
-                    except:
-                        break
-                    
+                    save_json(products)
+                    self.my_products_log_signal.emit(f"💾 중간 저장 완료: {len(products)}개 상품")
                 except Exception as e:
-                    self.my_products_log_signal.emit(f"❌ 상품 목록 크롤링 실패: {str(e)}")
-                    continue
-                    
-                    
+                    self.my_products_log_signal.emit(f"❌ 중간 저장 실패: {str(e)}")
+            
+            # 판매 목록 읽기 (페이지당 스크립트 1회) - 진행 메시지는 내 상품 로그 시그널로
+            engine = self.engine.with_log(self.my_products_log_signal.emit)
+            display_products = engine.sync_my_products(self.shared_driver, on_page=on_page)
+            
+            if not display_products:
+                self.log_message("⚠️ 판매 중인 상품을 찾을 수 없습니다.")
+                return
+            
             # 최종 JSON 저장
             try:
-                json_data["수집_정보"]["총_상품수"] = total_products
-                with open(json_filepath, 'w', encoding='utf-8') as f:
-                    json.dump(json_data, f, ensure_ascii=False, indent=2)
+                save_json(display_products)
                 self.my_products_log_signal.emit(f"💾 최종 저장 완료: {json_filename}")
                 self.my_products_log_signal.emit(f"📁 파일 위치: {json_filepath}")
             except Exception as e:
                 self.my_products_log_signal.emit(f"❌ 최종 저장 실패: {str(e)}")
                     
             # UI 테이블에 결과 표시 (시그널 사용)
-            display_products = json_data["상품_목록"]
             self.my_products_display_signal.emit(display_products)
-            self.my_products_log_signal.emit(f"🎉 내 상품 {total_products}개 수집 완료! (테이블에 {len(display_products)}개 표시)")
+            self.my_products_log_signal.emit(f"🎉 내 상품 {len(display_products)}개 수집 완료! (테이블에 {len(display_products)}개 표시)")
             
             # # 가격분석 시작 (내 상품 불러오기 완료 후)
             # self.my_products_log_signal.emit("🔍 가격분석을 시작합니다...")
@@ -5703,6 +5482,14 @@ class Main(QMainWindow):
             # 테이블에 페이지네이션으로 표시
             self.display_my_products(products)
             
+            # 스냅샷의 분석 결과를 가격 이력에 추가 (이미 있는 기록은 무시)
+            try:
+                imported = self.price_history.import_snapshot(file_path)
+                if imported:
+                    self.log_message(f"📈 가격 이력에 {imported}건 추가 ({self.price_history.summary()})")
+            except Exception as e:
+                self.log_message(f"⚠️ 가격 이력 추가 실패: {str(e)}")
+            
             # 수집 정보 표시
             collect_info = json_data.get("수집_정보", {})
             collect_date = collect_info.get("수집_날짜", "알 수 없음")
@@ -5740,6 +5527,7 @@ class Main(QMainWindow):
             end_idx = min(start_idx + self.page_size, len(self.all_products))
             
             current_page_products = self.all_products[start_idx:end_idx]
+            self.product_index.set_view(current_page_products)
             
             # UI 업데이트는 시그널로 처리 (워커 스레드에서 직접 UI 조작 금지)
             # QApplication.processEvents() 제거 - 크래시 원인
@@ -5903,6 +5691,7 @@ class Main(QMainWindow):
         try:
             # 전체 상품 데이터 저장
             self.all_products = products
+            self.product_index.rebuild(products)
             
             # 페이지네이션 설정
             self.total_pages = (len(products) + self.page_size - 1) // self.page_size
@@ -5980,12 +5769,7 @@ class Main(QMainWindow):
             self.update_price_progress_widget(0, 100, "내 상품 불러오기 시작...")
             
             # 내 상품 불러오기 실행 (완료 후 자동으로 가격분석 시작됨)
-            import threading
-            self.my_products_thread = threading.Thread(
-                target=self.load_my_products,
-                daemon=True
-            )
-            self.my_products_thread.start()
+            self.jobs.submit('my_products', self.load_my_products, title="내 상품 불러오기")
             return
         
         except Exception as e:
@@ -6028,99 +5812,190 @@ class Main(QMainWindow):
         #     # 오류 시 UI 제어 해제
         #     self.set_tabs_enabled(True)
     
+    def create_excel_file_for_analysis(self):
+        """가격분석 시작 시 엑셀 파일 생성"""
+        try:
+            self.analysis_report = AnalysisReport()
+            self.analysis_report.create()
+            self.my_products_log_signal.emit(f"📊 엑셀 파일 생성: {self.analysis_report.path}")
+            
+        except Exception as e:
+            self.analysis_report = None
+            self.my_products_log_signal.emit(f"❌ 엑셀 파일 생성 오류: {str(e)}")
+
+    def append_page_results_to_excel(self, page_num, products=None):
+        """페이지별 결과를 엑셀 파일에 추가 (products 지정 시 해당 상품들 - 우선순위 분석 묶음)"""
+        try:
+            report = getattr(self, 'analysis_report', None)
+            if report is None:
+                return
+            
+            if products is None:
+                # 현재 페이지 상품들
+                start_idx = (page_num - 1) * self.page_size
+                added = report.append(self.all_products[start_idx:start_idx + self.page_size], page_num)
+            else:
+                # 우선순위 묶음이면 상품별 원래 페이지
+                added = report.append(products, lambda product: (self.product_index.position(product) or 0) // self.page_size + 1)
+            
+            self.my_products_log_signal.emit(f"📊 페이지 {page_num} 결과를 엑셀에 추가: {added}개 상품")
+            
+        except Exception as e:
+            self.my_products_log_signal.emit(f"❌ 엑셀 추가 오류: {str(e)}")
+
     def analyze_all_pages_sequentially(self, discount, min_margin, is_auto_mode):
-        """페이지별 순차 처리: 각 페이지마다 가격분석 → 가격수정"""
+        """가격분석 → 가격수정 파이프라인: 검색 전용 브라우저가 분석하는 동안 공용 브라우저가 수정"""
         try:
-            total_analyzed = 0
-            total_updated = 0
-            total_failed = 0
+            # 엑셀 파일 생성
+            self.create_excel_file_for_analysis()
             
-            self.my_products_log_signal.emit(f"🚀 페이지별 순차 처리 시작 (총 {self.total_pages}페이지)")
+            self.my_products_log_signal.emit(f"🚀 가격분석/수정 파이프라인 시작 (총 {self.total_pages}페이지)")
             self.my_products_log_signal.emit(f"🔧 설정: 할인 {discount}엔, 최소마진 {min_margin}엔, 모드: {'🤖 자동' if is_auto_mode else '👤 수동'}")
 
-            # 현재 페이지부터 마지막 페이지까지 처리
-            for page_num in range(self.current_page, self.total_pages):
-                try:
-                    self.my_products_log_signal.emit(f"📄 페이지 {page_num + 1}/{self.total_pages} 처리 시작...")
-                    
-                    # 해당 페이지로 이동
-                    self.current_page = page_num
-                    QTimer.singleShot(0, lambda p=page_num: self.display_current_page_products(p))
-                    time.sleep(2)  # 페이지 전환 대기
+            # 경쟁사 검색은 로그인이 필요 없으므로 별도 브라우저에서 실행 (수정과 동시 진행)
+            search_driver = self.create_search_driver()
+            if not search_driver:
+                self.my_products_log_signal.emit("⚠️ 검색 전용 브라우저 생성 실패 - 공용 브라우저로 분석/수정을 번갈아 진행합니다.")
 
-                    # ==================== 1단계: 현재 페이지 가격 분석 ====================
-                    self.my_products_log_signal.emit(f"🔍 페이지 {page_num + 1} - 1단계: 가격 분석 시작")
-                    
-                    # 현재 페이지 상품들 분석
-                    page_analyzed, page_failed = self.analyze_current_page_products_v2(page_num, discount, min_margin)
-                    total_analyzed += page_analyzed
-                    total_failed += page_failed
-                    
-                    self.my_products_log_signal.emit(f"✅ 페이지 {page_num + 1} 가격 분석 완료: 분석 {page_analyzed}개, 실패 {page_failed}개")
+            work, position_of, group_of, prioritized = self.plan_analysis_order()
+            displayed_group = [None]
+            group_products = {}  # 우선순위 모드: {묶음: 분석한 상품} - 엑셀 기록용
 
-                    # ==================== 2단계: 현재 페이지 가격 수정 ====================
-                    self.my_products_log_signal.emit(f"🔄 페이지 {page_num + 1} - 2단계: 가격 수정 시작")
-                    
-                    # 현재 페이지 상품들 가격 수정
-                    page_updated = self.update_current_page_products(page_num, is_auto_mode)
-                    total_updated += page_updated
-                    
-                    self.my_products_log_signal.emit(f"✅ 페이지 {page_num + 1} 가격 수정 완료: 수정 {page_updated}개")
-                    
-                    # 페이지 간 딜레이
-                    time.sleep(3)
-                    
-                except Exception as page_error:
-                    self.my_products_log_signal.emit(f"❌ 페이지 {page_num + 1} 처리 오류: {str(page_error)}")
-                    continue
+            def analyze(product):
+                group = group_of(product)
+                if group != displayed_group[0]:
+                    displayed_group[0] = group
+                    if prioritized:
+                        self.my_products_log_signal.emit(f"🎯 우선순위 {group * self.page_size + 1}번째 상품부터 분석 시작...")
+                    else:
+                        # 분석 중인 페이지를 화면에 표시
+                        self.current_page = group
+                        self.my_products_log_signal.emit(f"📄 페이지 {group + 1}/{self.total_pages} 분석 시작...")
+                        self.run_on_main(lambda p=group: self.display_current_page_products(p))
+                if prioritized:
+                    group_products.setdefault(group, []).append(product)
+                needs_update = self.analyze_my_product(product, discount, min_margin, driver=search_driver)
+                self.analysis_scheduler.record_check(product, product.get('lowest_price') if needs_update is not None else None)
+                return needs_update
+
+            def on_page_done(group):
+                # 페이지(묶음)의 분석과 수정이 모두 끝나면 엑셀에 결과 추가
+                if prioritized:
+                    self.append_page_results_to_excel(group + 1, group_products.pop(group, []))
+                else:
+                    self.append_page_results_to_excel(group + 1)
+                if prioritized:
+                    self.my_products_log_signal.emit(f"✅ 우선순위 묶음 {group + 1} 분석/수정 완료")
+                else:
+                    self.my_products_log_signal.emit(f"✅ 페이지 {group + 1} 분석/수정 완료")
+
+            pipeline = RepricePipeline(
+                analyze,
+                lambda product: self.update_my_product(product, is_auto_mode),
+                overlap=search_driver is not None,
+                should_stop=lambda: self.work_stopped,
+                log=self.my_products_log_signal.emit,
+                # 자동 모드는 확인 창이 없으므로 판매 목록 페이지 단위로 일괄 수정
+                update_batch=(lambda batch: self.update_my_products_batch(
+                    batch, [position_of[id(p)] // ROWS_PER_PAGE + 1 for p in batch], is_auto_mode
+                )) if is_auto_mode else None,
+            )
+            try:
+                stats = pipeline.run(
+                    work,
+                    group_of=group_of,
+                    on_group_done=on_page_done,
+                )
+            finally:
+                self.close_search_driver(search_driver)
+                self.analysis_scheduler.save()
+
+            remaining = len(self.all_products) - stats['analyzed'] - stats['failed']
+            if prioritized and remaining > 0 and not self.work_stopped:
+                self.my_products_log_signal.emit(f"⏳ 시간 제한 도달 - 남은 {remaining}개 상품은 다음 실행에서 우선 분석됩니다.")
+
+            total_analyzed, total_updated, total_failed = stats['analyzed'], stats['updated'], stats['failed']
 
             # 전체 처리 완료
             self.my_products_log_signal.emit(f"🎉 전체 페이지별 순차 처리 완료!")
+            self.my_products_log_signal.emit(f"📚 {self.competitor_catalog.summary()}")
+            self.my_products_log_signal.emit(f"📈 {self.price_history.summary()}")
+            self.my_products_log_signal.emit(f"⏱️ {self.search_stats.summary()}")
+            self.my_products_log_signal.emit(f"🔀 {pipeline.summary()}")
+            self.my_products_log_signal.emit(f"📝 {self.bulk_price_editor.summary()}")
             self.my_products_log_signal.emit(f"📊 최종 결과: 분석 {total_analyzed}개, 수정 {total_updated}개, 실패 {total_failed}개")
             
             # 진행률 위젯 완료 상태
-            QTimer.singleShot(0, lambda: self.price_progress_widget.set_task_complete(
+            self.run_on_main(lambda: self.price_progress_widget.set_task_complete(
                 "페이지별 처리 완료", 
                 f"분석 {total_analyzed}개, 수정 {total_updated}개 완료"
             ))
             
             # UI 제어 해제
-            QTimer.singleShot(0, lambda: self.set_tabs_enabled(True))
+            self.run_on_main(lambda: self.set_tabs_enabled(True))
             
         except Exception as e:
             self.my_products_log_signal.emit(f"❌ 페이지별 순차 처리 오류: {str(e)}")
             # 오류 시 UI 제어 해제
-            QTimer.singleShot(0, lambda: self.set_tabs_enabled(True))
-    
-    def extract_product_id(self, product_name):
-        """상품명에서 상품ID 추출"""
+            self.run_on_main(lambda: self.set_tabs_enabled(True))
+    
+    def plan_analysis_order(self):
+        """가격 분석 순서 결정 - (분석할 상품, {상품 id: 전체 목록 위치}, 묶음 함수, 우선순위 여부)
+        우선순위 모드는 전체 상품을 점수순으로 100개씩 묶고, 시간 제한이 있으면 그 시간 안에서만 분석"""
+        position_of = {id(product): position for position, product in enumerate(self.all_products)}
+        if not self.priority_scheduling.isChecked():
+            products = self.all_products[self.current_page * self.page_size:]
+            return products, position_of, (lambda product: position_of[id(product)] // self.page_size), False
+        
+        products = self.analysis_scheduler.order(self.all_products, self.favorite_keys())
+        rank_of = {id(product): rank for rank, product in enumerate(products)}
+        time_limit = self.analysis_time_limit.value() * 60
+        self.my_products_log_signal.emit(f"🎯 우선순위 분석: {len(products)}개 상품 (오래 확인 안 한/변동 큰/주력/고가 상품 먼저)")
+        if time_limit:
+            self.my_products_log_signal.emit(f"⏳ 분석 시간 제한: {self.analysis_time_limit.value()}분")
+        return (self.analysis_scheduler.time_boxed(products, time_limit), position_of,
+                (lambda product: rank_of[id(product)] // self.page_size), True)
+    
+    def favorite_keys(self):
+        """주력상품의 상품ID/제목 키 집합 (분석 우선순위용)"""
+        keys = set()
+        for favorite in self.favorite_products:
+            if favorite.get('product_id'):
+                keys.add(str(favorite['product_id']))
+            keys.add(title_key(favorite.get('name', '')))
+        keys.discard('')
+        return keys
+    
+    def create_search_driver(self):
+        """경쟁사 검색 전용 브라우저 생성 (로그인 불필요) - 실패 시 None"""
         try:
-            import re
-            
-            # 패턴 1: "商品ID: 12345" 형태
-            pattern1 = r'商品ID[:\s]*(\d+)'
-            match1 = re.search(pattern1, product_name)
-            if match1:
-                return match1.group(1)
-            
-            # 패턴 2: "ID: 12345" 형태
-            pattern2 = r'ID[:\s]*(\d+)'
-            match2 = re.search(pattern2, product_name)
-            if match2:
-                return match2.group(1)
-            
-            # 패턴 3: 숫자만 있는 경우 (마지막 숫자 그룹)
-            pattern3 = r'(\d+)(?!.*\d)'
-            match3 = re.search(pattern3, product_name)
-            if match3:
-                return match3.group(1)
-            
-            return None
-            
+            from selenium import webdriver
+            driver = webdriver.Chrome(options=self.get_stable_chrome_options())
+            driver.implicitly_wait(10)
+            driver.set_page_load_timeout(10)
+            self.browser_watchdog.track(driver)
+            self.tracer.instrument_driver(driver)
+            return driver
         except Exception as e:
-            self.my_products_log_signal.emit(f"❌ 상품ID 추출 오류: {str(e)}")
+            self.my_products_log_signal.emit(f"⚠️ 검색 전용 브라우저 생성 오류: {str(e)}")
             return None
     
+    def close_search_driver(self, driver):
+        """검색 전용 브라우저 종료 및 남은 Chrome 프로세스 정리"""
+        if not driver:
+            return
+        self.browser_watchdog.release(driver)
+        try:
+            driver.quit()
+        except:
+            pass
+        self.browser_watchdog.kill_orphans()
+    
+    def extract_product_id(self, product_name):
+        """상품명에서 상품ID 추출 (엔진과 같은 규칙)"""
+        return extract_product_id(product_name)
+    
+    @traced("json.save")
     def save_current_products_to_json(self):
         """현재 상품 데이터를 JSON 파일에 저장"""
         try:
@@ -6157,56 +6032,11 @@ class Main(QMainWindow):
             end_idx = min(start_idx + self.page_size, len(self.all_products))
             current_page_products = self.all_products[start_idx:end_idx]
             
-            for i, product in enumerate(current_page_products):
-                try:
-                    product_name = product.get('title', '')
-                    current_price = product.get('current_price', '0')
-                    
-                    # 현재가격에서 숫자만 추출
-                    import re
-                    current_price_numbers = re.findall(r'[\d,]+', current_price)
-                    current_price_int = int(current_price_numbers[0].replace(',', '')) if current_price_numbers else 0
-                    
-                    # BUYMA에서 최저가 검색
-                    lowest_price = self.search_buyma_lowest_price(product_name, product.get('brand', ''))
-                    
-                    if lowest_price and lowest_price > 0:
-                        # 제안가 계산
-                        suggested_price = max(lowest_price - discount, 0)
-                        price_difference = suggested_price - current_price_int
-                        
-                        # 상품 데이터 업데이트
-                        product['lowest_price'] = lowest_price
-                        product['suggested_price'] = suggested_price
-                        product['price_difference'] = price_difference
-                        
-                        # 수정 필요 여부 판단
-                        if price_difference >= -abs(min_margin):
-                            product['status'] = '💰 가격 수정 필요'
-                            product['needs_update'] = True
-                        else:
-                            product['status'] = f'⚠️ 손실 예상 ({price_difference:+,}엔)'
-                            product['needs_update'] = False
-                        
-                        analyzed_count += 1
-                        
-                        # 10개마다 중간 저장
-                        if analyzed_count % 10 == 0:
-                            self.my_products_log_signal.emit(f"💾 가격 분석 결과 중간 저장 중... ({analyzed_count}개 완료)")
-                            # JSON 파일 업데이트
-                            self.save_current_products_to_json()
-                        
-                    else:
-                        product['status'] = '❌ 최저가 검색 실패'
-                        product['needs_update'] = False
-                        failed_count += 1
-                    
-                    time.sleep(1)  # 상품 간 딜레이
-                    
-                except Exception as e:
-                    self.my_products_log_signal.emit(f"❌ 상품 분석 오류: {product.get('name', 'Unknown')} - {str(e)}")
+            for product in current_page_products:
+                if self.analyze_my_product(product, discount, min_margin) is None:
                     failed_count += 1
-                    continue
+                else:
+                    analyzed_count += 1
             
             return analyzed_count, failed_count
             
@@ -6214,9 +6044,42 @@ class Main(QMainWindow):
             self.my_products_log_signal.emit(f"❌ 페이지 분석 오류: {str(e)}")
             return 0, 0
     
+    @metered("price", failed=lambda needs_update: needs_update is None)
+    @traced("analyze.item")
+    def analyze_my_product(self, product, discount, min_margin, driver=None):
+        """상품 1개 가격 분석 - 수정 필요 여부 반환 (분석 실패 시 None)"""
+        try:
+            product_name = product.get('title', '')
+            
+            # BUYMA에서 최저가 검색
+            lowest_price = self.search_buyma_lowest_price(product_name, product.get('brand', ''), driver=driver)
+            
+            if lowest_price and lowest_price > 0:
+                # 제안가 계산 및 수정 필요 여부 판단 (CLI 와 같은 규칙)
+                decide_price(product, lowest_price, discount, min_margin)
+                
+                # 가격 이력에 이번 확인 결과 기록
+                self.price_history.record(product)
+                
+                # 10개마다 중간 저장
+                self.analysis_save_counter += 1
+                if self.analysis_save_counter % 10 == 0:
+                    self.my_products_log_signal.emit(f"💾 가격 분석 결과 중간 저장 중... ({self.analysis_save_counter}개 완료)")
+                    # JSON 파일 업데이트
+                    self.save_current_products_to_json()
+                
+                return product['needs_update']
+            
+            product['status'] = '❌ 최저가 검색 실패'
+            product['needs_update'] = False
+            return None
+            
+        except Exception as e:
+            self.my_products_log_signal.emit(f"❌ 상품 분석 오류: {product.get('name', 'Unknown')} - {str(e)}")
+            return None
+    
     def update_current_page_products(self, page_num, is_auto_mode):
         """현재 페이지 상품들의 가격 수정"""
-        import time
         try:
             updated_count = 0
             
@@ -6231,35 +6094,157 @@ class Main(QMainWindow):
             self.my_products_log_signal.emit(f"📝 페이지 {page_num + 1}에서 수정 대상: {len(products_to_update)}개 상품")
             
             for product in products_to_update:
-                try:
-                    product_name = product.get('title', '')
-                    suggested_price = product.get('suggested_price', 0)
-                    
-                    if suggested_price > 0:
-                        # 실제 BUYMA 가격 수정 실행
-                        success = self.update_buyma_product_price(product_name, suggested_price, is_auto_mode)
-                        
-                        if success:
-                            product['status'] = '✅ 가격 수정 완료'
-                            product['needs_update'] = False
-                            updated_count += 1
-                            self.my_products_log_signal.emit(f"✅ 가격 수정 완료: {product_name[:20]}... → ¥{suggested_price:,}")
-                        else:
-                            product['status'] = '❌ 가격 수정 실패'
-                            self.my_products_log_signal.emit(f"❌ 가격 수정 실패: {product_name[:20]}...")
-                    
-                    time.sleep(2)  # 상품 간 딜레이
-                    
-                except Exception as e:
-                    self.my_products_log_signal.emit(f"❌ 가격 수정 오류: {product.get('name', 'Unknown')} - {str(e)}")
-                    continue
+                if self.update_my_product(product, is_auto_mode):
+                    updated_count += 1
             
             return updated_count
             
         except Exception as e:
             self.my_products_log_signal.emit(f"❌ 페이지 수정 오류: {str(e)}")
             return 0
+    
+    def update_my_product(self, product, is_auto_mode):
+        """상품 1개 가격 수정 (공용 브라우저 사용) - 수정 완료 여부 반환"""
+        try:
+            product_name = product.get('title', '')
+            suggested_price = product.get('suggested_price', 0)
+            
+            if suggested_price <= 0:
+                return False
+            
+            # 실제 BUYMA 가격 수정 실행
+            success = self.update_buyma_product_price(product_name, suggested_price, is_auto_mode)
+            
+            if success == "unchanged":
+                product['status'] = '✅ 현재가 적정 (변경 없음)'
+                product['needs_update'] = False
+                return False
+            
+            if success:
+                product['status'] = '✅ 가격 수정 완료'
+                product['needs_update'] = False
+                self.my_products_log_signal.emit(f"✅ 가격 수정 완료: {product_name[:20]}... → ¥{suggested_price:,}")
+                return True
+            
+            product['status'] = '❌ 가격 수정 실패'
+            self.my_products_log_signal.emit(f"❌ 가격 수정 실패: {product_name[:20]}...")
+            return False
+            
+        except Exception as e:
+            self.my_products_log_signal.emit(f"❌ 가격 수정 오류: {product.get('name', 'Unknown')} - {str(e)}")
+            return False
 
+    def update_my_products_batch(self, products, pages, is_auto_mode):
+        """같은 판매 목록 페이지의 상품들을 한 번에 가격 수정 - 수정 완료 개수 반환
+        pages: 상품별 판매 목록 페이지 번호 (내 상품 불러오기 순서 기준), 목록에서 찾지 못한 상품은 개별 수정"""
+        targets = []
+        for product, page in zip(products, pages):
+            product_id = self.extract_product_id(product.get('title', ''))
+            if product_id and product.get('suggested_price', 0) > 0:
+                targets.append({'product_id': product_id, 'new_price': product['suggested_price'], 'page': page, 'product': product})
+        
+        results = self.apply_price_targets(targets, is_auto_mode)
+        return sum(1 for result in results.values() if result == 'updated')
+    
+    def apply_price_targets(self, targets, is_auto_mode):
+        """수정 대상을 판매 목록 페이지 단위로 적용하고 상품 상태 기록 - {상품ID: 결과} 반환
+        targets: [{'product_id', 'new_price', 'page', 'product'}]"""
+        results = self.bulk_price_editor.apply(self.shared_driver, targets, should_stop=lambda: self.work_stopped)
+        
+        for target in targets:
+            product = target['product']
+            product_name = product.get('title', '')
+            product_id = str(target['product_id'])
+            result = results.get(product_id)
+            if result == 'updated':
+                product['status'] = '✅ 가격 수정 완료'
+                product['needs_update'] = False
+                self.my_products_log_signal.emit(f"✅ 가격 수정 완료: {product_name[:20]}... → ¥{target['new_price']:,}")
+            elif result == 'unchanged':
+                product['status'] = '✅ 현재가 적정 (변경 없음)'
+                product['needs_update'] = False
+            elif result == 'not_found' and not self.work_stopped:
+                # 목록 순서가 바뀌어 페이지에서 찾지 못한 상품은 기존 방식(상품ID 검색)으로 수정
+                if self.update_my_product(product, is_auto_mode):
+                    results[product_id] = 'updated'
+            elif result == 'failed':
+                product['status'] = '❌ 가격 수정 실패'
+                self.my_products_log_signal.emit(f"❌ 가격 수정 실패: {product_name[:20]}...")
+        return results
+    
+    def build_reprice_plan(self):
+        """가격 수정 계획 생성 (드라이런) - 분석된 상품 데이터만 사용하고 BUYMA 에는 접속하지 않음"""
+        try:
+            if not self.all_products:
+                QMessageBox.warning(self, "경고", "먼저 가격분석을 실행하거나 JSON 파일을 불러와주세요.")
+                return
+            
+            self.reprice_plan = RepricePlan.from_products(self.all_products, history=self.price_history)
+            updates = self.reprice_plan.updates()
+            for entry in updates[:20]:
+                self.log_message(f"📋 {entry['product_id']}: ¥{entry['current']:,} → ¥{entry['proposed']:,} "
+                                 f"({entry['delta']:+,}엔, 최저가 ¥{entry['lowest']:,}) {entry['title'][:20]}...")
+            if len(updates) > 20:
+                self.log_message(f"📋 ... 외 {len(updates) - 20}개")
+            self.log_message(f"📋 {self.reprice_plan.summary()}")
+            
+            plan_file = f"가격수정계획_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json"
+            self.reprice_plan.save(plan_file)
+            self.log_message(f"💾 수정 계획 저장: {plan_file}")
+            
+            self.apply_plan_btn.setEnabled(bool(updates))
+            QMessageBox.information(
+                self, "수정 계획 (드라이런)",
+                f"수정 대상: {len(updates)}개 / 전체 {len(self.reprice_plan.entries)}개\n\n"
+                f"계획 파일: {plan_file}\n\n검토 후 '▶️ 계획 적용'을 누르면 수정 대상만 BUYMA에 반영합니다."
+            )
+        except Exception as e:
+            self.log_error(f"수정 계획 생성 오류: {str(e)}")
+    
+    def apply_reprice_plan(self):
+        """검토한 수정 계획 적용 - 'update' 항목만 판매 목록 페이지 단위로 수정"""
+        if not self.reprice_plan or not self.reprice_plan.updates():
+            QMessageBox.information(self, "정보", "적용할 수정 계획이 없습니다. 먼저 '📋 수정 계획 (드라이런)'을 실행해주세요.")
+            return
+        if self.jobs.is_active('reprice_plan'):
+            QMessageBox.information(self, "정보", "수정 계획을 적용하는 중입니다.")
+            return
+        if not self.shared_driver:
+            QMessageBox.warning(self, "로그인 필요", "계획을 적용하려면 먼저 BUYMA 로그인이 필요합니다.")
+            return
+        
+        reply = QMessageBox.question(
+            self, "계획 적용 확인",
+            f"수정 계획의 {len(self.reprice_plan.updates())}개 상품 가격을 수정하시겠습니까?\n\n"
+            f"⚠️ 주의: 실제 BUYMA 상품 가격이 변경됩니다.",
+            QMessageBox.StandardButton.Yes | QMessageBox.StandardButton.No
+        )
+        if reply != QMessageBox.StandardButton.Yes:
+            return
+        
+        self.jobs.submit('reprice_plan', self.run_reprice_plan, self.reprice_plan, title="가격 수정 계획 적용")
+    
+    def run_reprice_plan(self, plan):
+        """수정 계획 적용 (별도 스레드) - 실시간 가격이 이미 제안가와 같은 상품은 수정 생략"""
+        try:
+            targets = []
+            for target in plan.targets():
+                product = self.product_index.get(target['product_id'])
+                if product is not None:
+                    targets.append(dict(target, product=product))
+            
+            self.log_message(f"▶️ 수정 계획 적용 시작: {len(targets)}개 상품")
+            page_loads = self.bulk_price_editor.stats['page_loads']
+            results = self.apply_price_targets(targets, True)
+            plan.record(results, self.bulk_price_editor.stats['page_loads'] - page_loads)
+            
+            self.log_message(f"🎉 {plan.summary()}")
+            self.save_current_products_to_json()
+        except Exception as e:
+            self.log_message(f"❌ 수정 계획 적용 오류: {str(e)}")
+    
+    @metered("update", failed=lambda result: result is False)
+    @traced("update.item")
     def update_buyma_product_price(self, product_name, new_price, is_auto_mode=False, show_dialog=True):
         """BUYMA에서 상품 가격 수정"""
         try:
@@ -6273,9 +6258,7 @@ class Main(QMainWindow):
             edit_url = f"https://www.buyma.com/my/sell/search?sale_kind=all&duty_kind=all&keyword={product_id}&status=for_sale&multi_id=#/"
             self.log_message(f"🔗 상품 수정 페이지 접속: {edit_url}")
             
-            self.shared_driver.get(edit_url)
-            import time
-            time.sleep(3)
+            self.rate_limiter.get_page('update', self.shared_driver, edit_url)
             
             # 3. 가격 수정 버튼 클릭 (a._item_edit_tanka)
             try:
@@ -6305,24 +6288,21 @@ class Main(QMainWindow):
                 current_price_on_page = 0
             
             # ★★★ 핵심 수정: 실시간 현재 가격 기준으로 제안가 재계산 ★★★
-            # 테이블에서 최저가 정보 가져오기
-            lowest_price = 0
-            discount_amount = self.discount_amount.value()
-            
-            for row in range(self.price_table.rowCount()):
-                table_product_name = self.price_table.item(row, 0).text()
-                if table_product_name == product_name:
-                    lowest_price_text = self.price_table.item(row, 2).text()
-                    import re
-                    price_numbers = re.findall(r'[\d,]+', lowest_price_text)
-                    lowest_price = int(price_numbers[0].replace(',', '')) if price_numbers else 0
-                    break
+            # 상품 인덱스에서 분석된 최저가 가져오기 (테이블 셀을 다시 읽지 않음)
+            discount_amount = self.discount_amount.value()
+            indexed_product = self.product_index.find(product_id) or self.product_index.find(product_name)
+            lowest_price = int(indexed_product.get('lowest_price') or 0) if indexed_product else 0
             
             # 실시간 현재 가격 기준으로 제안가 재계산
             if lowest_price > 0:
                 new_price = max(lowest_price - discount_amount, 0)
                 self.log_message(f"🔄 실시간 재계산: 최저가 ¥{lowest_price:,} - 할인 ¥{discount_amount:,} = 제안가 ¥{new_price:,}")
             
+            # 실시간 가격이 이미 제안가와 같으면 저장하지 않음 (변경 없는 수정 작업 생략)
+            if current_price_on_page > 0 and current_price_on_page == new_price:
+                self.log_message(f"⏭️ 실시간 가격 ¥{current_price_on_page:,} = 제안가 - 수정 생략")
+                return "unchanged"
+            
             # 5. 수동 모드일 경우 설정하기 버튼 클릭 전에 사용자 확인 (show_dialog=True일 때만)
             if not is_auto_mode and show_dialog:
                 # 수동 모드: 사용자 확인
@@ -6751,11 +6731,9 @@ class Main(QMainWindow):
         """전체 상품 가격 수정 시작"""
         try:
             # 가격 수정이 필요한 상품 개수 확인
-            update_needed_count = 0
-            for row in range(self.price_table.rowCount()):
-                status_item = self.price_table.item(row, 5)
-                if status_item and "가격 수정 필요" in status_item.text():
-                    update_needed_count += 1
+            update_targets = [(row, product) for row, product in self.product_index.view_items()
+                              if "가격 수정 필요" in product.get('status', '')]
+            update_needed_count = len(update_targets)
             
             if update_needed_count == 0:
                 self.log_message("📋 가격 수정이 필요한 상품이 없습니다.")
@@ -6773,47 +6751,43 @@ class Main(QMainWindow):
             updated_count = 0
             cancelled_count = 0
             
-            for row in range(self.price_table.rowCount()):
-                status_item = self.price_table.item(row, 5)
-                if status_item and "가격 수정 필요" in status_item.text():
-                    try:
-                        # 상품 정보 가져오기
-                        product_name = self.price_table.item(row, 0).text()
-                        suggested_price_item = self.price_table.item(row, 3)
+            for row, product in update_targets:
+                try:
+                    # 상품 정보 가져오기 (인덱스의 상품 데이터 - 테이블 셀을 다시 읽지 않음)
+                    product_name = product.get('title') or product.get('name', '')
+                    suggested_price = int(product.get('suggested_price') or 0)
+                    
+                    if suggested_price > 0:
+                        # 가격 수정 중 상태 표시
+                        self.price_table.setItem(row, 5, QTableWidgetItem("🔄 가격 수정 중..."))
                         
-                        if suggested_price_item:
-                            suggested_price_text = suggested_price_item.text()
-                            # 가격에서 숫자만 추출
-                            import re
-                            price_numbers = re.findall(r'[\d,]+', suggested_price_text)
-                            suggested_price = int(price_numbers[0].replace(',', '')) if price_numbers else 0
-                            
-                            # 가격 수정 중 상태 표시
-                            self.price_table.setItem(row, 5, QTableWidgetItem("🔄 가격 수정 중..."))
-                            
-                            # 실제 가격 수정 로직 호출
-                            result = self.update_buyma_product_price(product_name, suggested_price, is_auto_mode)
-                            
-                            if result == True:
-                                self.price_table.setItem(row, 5, QTableWidgetItem("✅ 수정 완료"))
-                                updated_count += 1
-                                self.log_message(f"✅ 가격 수정 완료: {product_name[:20]}... → ¥{suggested_price:,}")
-                            elif result == "cancelled":
-                                self.price_table.setItem(row, 5, QTableWidgetItem("❌ 상품 수정 취소"))
-                                cancelled_count += 1
-                                self.log_message(f"❌ 상품 수정 취소: {product_name[:20]}...")
-                            else:
-                                self.price_table.setItem(row, 5, QTableWidgetItem("❌ 수정 실패"))
-                                self.log_message(f"❌ 가격 수정 실패: {product_name[:20]}...")
-                            
-                            # 수정 간 딜레이
-                            import time
-                            time.sleep(2)
+                        # 실제 가격 수정 로직 호출
+                        result = self.update_buyma_product_price(product_name, suggested_price, is_auto_mode)
                         
-                    except Exception as e:
-                        self.price_table.setItem(row, 5, QTableWidgetItem("❌ 수정 실패"))
-                        self.log_message(f"❌ 가격 수정 오류: {str(e)}")
-                        continue
+                        if result == True:
+                            product['status'] = "✅ 수정 완료"
+                            updated_count += 1
+                            self.log_message(f"✅ 가격 수정 완료: {product_name[:20]}... → ¥{suggested_price:,}")
+                        elif result == "unchanged":
+                            product['status'] = "✅ 현재가 적정 (변경 없음)"
+                        elif result == "cancelled":
+                            product['status'] = "❌ 상품 수정 취소"
+                            cancelled_count += 1
+                            self.log_message(f"❌ 상품 수정 취소: {product_name[:20]}...")
+                        else:
+                            product['status'] = "❌ 수정 실패"
+                            self.log_message(f"❌ 가격 수정 실패: {product_name[:20]}...")
+                        self.price_table.setItem(row, 5, QTableWidgetItem(product['status']))
+                        
+                        # 수정 간 딜레이
+                        import time
+                        time.sleep(2)
+                    
+                except Exception as e:
+                    product['status'] = "❌ 수정 실패"
+                    self.price_table.setItem(row, 5, QTableWidgetItem(product['status']))
+                    self.log_message(f"❌ 가격 수정 오류: {str(e)}")
+                    continue
             
             self.log_message(f"🎉 전체 가격 수정 완료! 수정: {updated_count}개, 취소: {cancelled_count}개")
             
@@ -6838,19 +6812,14 @@ class Main(QMainWindow):
                 )
                 return
             
-            # 상품 정보 가져오기
-            product_name = self.price_table.item(row, 0).text()
-            suggested_price_item = self.price_table.item(row, 3)
-            
-            if not suggested_price_item or suggested_price_item.text() == "계산 필요":
+            # 상품 정보 가져오기 (화면 행 → 상품 인덱스)
+            product = self.product_index.product_at_row(row)
+            if not product or 'suggested_price' not in product:
                 QMessageBox.warning(self, "경고", "먼저 가격 분석을 실행해주세요.")
                 return
             
-            suggested_price_text = suggested_price_item.text()
-            # 가격에서 숫자만 추출
-            import re
-            price_numbers = re.findall(r'[\d,]+', suggested_price_text)
-            suggested_price = int(price_numbers[0].replace(',', '')) if price_numbers else 0
+            product_name = product.get('title') or product.get('name', '')
+            suggested_price = int(product.get('suggested_price') or 0)
             
             if suggested_price <= 0:
                 QMessageBox.warning(self, "경고", "유효한 제안가가 없습니다.")
@@ -6866,176 +6835,32 @@ class Main(QMainWindow):
             result = self.update_buyma_product_price(product_name, suggested_price, is_auto_mode)
             
             if result == True:
-                self.price_table.setItem(row, 5, QTableWidgetItem("✅ 수정 완료"))
+                product['status'] = "✅ 수정 완료"
                 self.log_message(f"✅ 단일 가격 수정 완료: {product_name[:20]}... → ¥{suggested_price:,}")
+            elif result == "unchanged":
+                product['status'] = "✅ 현재가 적정 (변경 없음)"
             elif result == "cancelled":
-                self.price_table.setItem(row, 5, QTableWidgetItem("❌ 상품 수정 취소"))
+                product['status'] = "❌ 상품 수정 취소"
                 self.log_message(f"❌ 단일 상품 수정 취소: {product_name[:20]}...")
             else:
-                self.price_table.setItem(row, 5, QTableWidgetItem("❌ 수정 실패"))
+                product['status'] = "❌ 수정 실패"
                 self.log_message(f"❌ 단일 가격 수정 실패: {product_name[:20]}...")
+            self.price_table.setItem(row, 5, QTableWidgetItem(product['status']))
+            return result == True
                 
         except Exception as e:
             self.price_table.setItem(row, 5, QTableWidgetItem("❌ 수정 실패"))
             self.log_message(f"❌ 단일 가격 수정 오류: {str(e)}")
 
-    def search_buyma_lowest_price(self, product_name, brand_name=""):
-        """BUYMA에서 상품 검색하여 최저가 찾기"""
-        try:
-            # 1. 상품명에서 실제 검색어 추출 (商品ID 이전까지)
-            search_name = product_name
-            if "商品ID" in product_name:
-                search_name = product_name.split("商品ID")[0].strip()
-            
-            # 추가 정리 (줄바꿈, 특수문자 제거)
-            search_name = search_name.replace("\n", " ").replace("★", " ").strip()
-            
-            # 숫자가 포함된 단어 제거 후 영어만 남기기
-            import re
-            # 1단계: 숫자가 포함된 단어 전체 제거 (M0455, A1234, bag123 등)
-            search_name = re.sub(r'\b\w*\d+\w*\b', '', search_name)
-            # 2단계: 영어와 공백만 남기기 (숫자 완전 제거)
-            search_name = re.sub(r'[^a-zA-Z\s]', '', search_name)
-            # 3단계: 연속된 공백을 하나로 정리
-            search_name = re.sub(r'\s+', ' ', search_name).strip()
-            
-            # 브랜드명 정리
-            # search_name = search_name.replace(brand_name, "").strip()
-            
-            self.log_message(f"🔍 검색어: '{search_name}'")
-            
-            if not self.shared_driver:
-                self.log_error("❌ 브라우저가 초기화되지 않았습니다.")
-                return None
-            
-            # 2. BUYMA 검색 URL로 이동 (첫 페이지)
-            page_number = 1
-            lowest_price = float('inf')
-            found_products = 0
-            
-            current_url = ""
-            already_visited_urls = ""
-            max_page = 20  # 최대 20페이지까지만 검색
-            while page_number <= max_page:
-                
-                if search_name == "":
-                    self.log_message("⚠️ 유효한 검색어가 없습니다.")
-                    break
-                
-                search_url = f"https://www.buyma.com/r/-R120/{search_name}_{page_number}/"
-                self.log_message(f"🌐 페이지 {page_number} 접속: {search_url}")
-                            
-                try:
-                    self.shared_driver.get(search_url)
-                    time.sleep(3)
-                except Exception as e:
-                    # 페이지 로딩 타임아웃 또는 네트워크 오류
-                    self.log_message(f"⏱️ 페이지 {page_number} 로딩 실패: {str(e)}")
-                    break
-                
-                current_url = self.shared_driver.current_url
-                
-                if current_url == already_visited_urls:
-                    self.log_message(f"🔄 동일한 페이지 URL 감지, 중복 방문 감지로 인해 다음 상품으로 넘어갑니다.")
-                    break
-                
-                else:
-                    already_visited_urls = ""
-                
-                # 3. ul.product_lists 요소 로딩 대기
-                from selenium.webdriver.common.by import By
-                from selenium.webdriver.support.ui import WebDriverWait
-                from selenium.webdriver.support import expected_conditions as EC
-                
-                # 상품이 없는 경우 처리
-                try:
-                    self.shared_driver.implicitly_wait(1)
-                    no_product_elem = self.shared_driver.find_element(By.CSS_SELECTOR, "a.search_requestlink_btn")
-                    if no_product_elem:
-                        self.log_message(f"⚠️ 페이지 {page_number}: '{search_name}' 상품이 없습니다.")
-                        break
-                except:
-                    pass  # no_product_elem이 없으면 계속 진행
-                
-                finally:
-                    self.shared_driver.implicitly_wait(10)  # 기본 대기 시간 복원
-                
-                try:
-                    # 상품 리스트 로딩 대기 (최대 10초)
-                    product_list = WebDriverWait(self.shared_driver, 10).until(
-                        EC.presence_of_element_located((By.CSS_SELECTOR, "ul.product_lists"))
-                    )
-                    
-                    # 4. 각 li 요소들 (상품들) 수집
-                    product_items = product_list.find_elements(By.TAG_NAME, "li")
-                    
-                    if not product_items:
-                        self.log_message(f"⚠️ 페이지 {page_number}에서 상품을 찾을 수 없습니다.")
-                        break
-                    
-                    self.log_message(f"📦 페이지 {page_number}에서 {len(product_items)}개 상품 발견")
-                    
-                    # 5. 각 상품 정보 분석
-                    for item in product_items:
-                        try:
-                            # 6. 상품명 추출 (div.product_name)
-                            name_elem = item.find_element(By.CSS_SELECTOR, "div.product_name")
-                            item_name = name_elem.text.strip()
-                            
-                            # 7. 검색한 상품명이 포함되어 있는지 확인
-                            if search_name.lower() in item_name.lower():
-                                # 5. 상품가격 추출 (span.Price_Txt)
-                                try:
-                                    price_elem = item.find_element(By.CSS_SELECTOR, "span.Price_Txt")
-                                    price_text = price_elem.text.strip()
-                                    
-                                    # 가격에서 숫자만 추출 (¥12,000 → 12000)
-                                    import re
-                                    price_numbers = re.findall(r'[\d,]+', price_text)
-                                    if price_numbers:
-                                        price = int(price_numbers[0].replace(',', ''))
-                                        
-                                        # 7. 최저가 비교 및 갱신
-                                        if price < lowest_price:
-                                            lowest_price = price
-                                            self.log_message(f"💰 새로운 최저가 발견: ¥{price:,} - {item_name[:30]}...")
-                                        
-                                        found_products += 1
-                                    
-                                except Exception as e:
-                                    # 가격 정보가 없는 상품은 건너뛰기
-                                    continue
-                            
-                        except Exception as e:
-                            # 개별 상품 처리 오류는 건너뛰기
-                            continue
-                    
-                    # 4. 다음 페이지 확인 (li 개수가 120개면 다음 페이지 있음)
-                    if len(product_items) >= 120:
-                        page_number += 1
-                        self.log_message(f"➡️ 다음 페이지({page_number})로 이동...")
-                        already_visited_urls = current_url
-                        time.sleep(2)  # 페이지 간 딜레이
-                    else:
-                        # 마지막 페이지 도달
-                        self.log_message(f"✅ 모든 페이지 검색 완료 (총 {page_number} 페이지)")
-                        break
-                
-                except Exception as e:
-                    self.log_error(f"❌ 페이지 {page_number} 로딩 실패: {str(e)}")
-                    continue
-            
-            # 8. 결과 반환
-            if lowest_price != float('inf'):
-                self.log_message(f"🎉 검색 완료: 총 {found_products}개 상품 중 최저가 ¥{lowest_price:,}")
-                return lowest_price
-            else:
-                self.log_message(f"⚠️ '{search_name}' 상품을 찾을 수 없습니다.")
-                return None
-                
-        except Exception as e:
-            self.log_error(f"❌ 가격 검색 오류: {str(e)}")
-            return None
+    def search_buyma_lowest_price(self, product_name, brand_name="", driver=None):
+        """BUYMA에서 상품 검색하여 최저가 찾기 (driver 미지정 시 공용 드라이버 사용)"""
+        return self.engine.lowest_price(driver or self.shared_driver, product_name, brand_name,
+                                        sort=self.search_sort_mode)
+    
+    def scan_buyma_search_pages(self, driver, search_name, sort=SORT_RELEVANCE, max_page=20, brand_name=""):
+        """검색 결과 페이지를 순서대로 확인하여 검색어 일치 상품의 최저가 찾기 (엔진에 위임)
+        반환: {'lowest_price', 'found_products', 'tiles', 'pages', 'complete', 'failed'}"""
+        return self.engine.scan_search_pages(driver, search_name, sort=sort, max_page=max_page, brand_name=brand_name)
     
     def analyze_all_my_products(self):
         """내 상품 전체 분석 & 자동 수정"""
@@ -7079,23 +6904,21 @@ class Main(QMainWindow):
             product_name = self.price_table.item(row, 0).text()
             self.log_message(f"🔍 단일 상품 분석: {product_name[:30]}...")
             
-            # 별도 스레드에서 실행
-            import threading
+            discount = self.discount_amount.value()
             
+            # 작업 실행기에서 실행 (테이블은 시그널로 메인 스레드에서 갱신)
             def analyze():
                 lowest_price = self.search_buyma_lowest_price(product_name, brand_name="")
                 if lowest_price:
-                    discount = self.discount_amount.value()
                     suggested_price = max(lowest_price - discount, 0)
                     
-                    self.price_table.setItem(row, 2, QTableWidgetItem(f"¥{lowest_price:,}"))
-                    self.price_table.setItem(row, 3, QTableWidgetItem(f"¥{suggested_price:,}"))
-                    self.price_table.setItem(row, 5, QTableWidgetItem("✅ 분석 완료"))
+                    self.price_analysis_table_update_signal.emit(row, 2, f"¥{lowest_price:,}")
+                    self.price_analysis_table_update_signal.emit(row, 3, f"¥{suggested_price:,}")
+                    self.price_analysis_table_update_signal.emit(row, 5, "✅ 분석 완료")
                     
-                    self.log_message(f"✅ 분석 완료: {product_name[:20]}... - 최저가: ¥{lowest_price:,}")
+                    self.price_analysis_log_signal.emit(f"✅ 분석 완료: {product_name[:20]}... - 최저가: ¥{lowest_price:,}")
             
-            thread = threading.Thread(target=analyze, daemon=True)
-            thread.start()
+            self.jobs.submit('analyze_single', analyze, title="단일 상품 분석")
             
         except Exception as e:
             self.log_message(f"❌ 단일 상품 분석 오류: {str(e)}")
@@ -7678,6 +7501,7 @@ class Main(QMainWindow):
         """크롤링 중지"""
         self.log_message("⏹️ 크롤링 중지 요청...")
         self.crawling_status.setText("중지 중...")
+        self.jobs.cancel('crawl')
         
         # UI 상태 복원
         self.start_crawling_btn.setEnabled(True)
@@ -8534,15 +8358,9 @@ class Main(QMainWindow):
             mode_text = "자동" if auto_mode else "수동"
             self.log_message(f"🌐 BUYMA 로그인 중... ({mode_text} 모드)")
             
-            # 별도 스레드에서 가격 수정 실행
-            import threading
-            
-            update_thread = threading.Thread(
-                target=self.run_buyma_price_update, 
-                args=(product_name, new_price, row, auto_mode), 
-                daemon=True
-            )
-            update_thread.start()
+            # 작업 실행기에서 가격 수정 실행 (한 번에 1개 상품 - 공용 브라우저 사용)
+            self.jobs.submit('price_update', self.run_buyma_price_update,
+                             product_name, new_price, row, auto_mode, title="가격 수정")
             
         except Exception as e:
             self.log_message(f"가격 수정 실행 오류: {str(e)}")
@@ -8550,6 +8368,8 @@ class Main(QMainWindow):
     def run_buyma_price_update(self, product_name, new_price, row, auto_mode):
         """BUYMA 가격 수정 실행 (별도 스레드)"""
         driver = None
+        # 브라우저 작업 중 페이지가 바뀌어도 결과가 올바른 상품에 기록되도록 상품을 먼저 찾아둠
+        product = self.product_index.find(product_name) or self.product_index.product_at_row(row)
         try:
             self.log_message("🌐 브라우저를 시작합니다...")
             
@@ -8581,17 +8401,17 @@ class Main(QMainWindow):
                 
                 if success:
                     self.log_message(f"✅ 가격 수정 완료: {product_name}")
-                    self.price_table_update_signal.emit(row, "수정 완료", True)
+                    self.report_price_update_status(product, row, "수정 완료", True)
                 else:
                     self.log_message(f"❌ 가격 수정 실패: {product_name}")
-                    self.price_table_update_signal.emit(row, "수정 실패", False)
+                    self.report_price_update_status(product, row, "수정 실패", False)
             else:
                 self.log_message("❌ BUYMA 로그인 실패")
-                self.price_table_update_signal.emit(row, "로그인 실패", False)
+                self.report_price_update_status(product, row, "로그인 실패", False)
                 
         except Exception as e:
             self.log_message(f"❌ 가격 수정 오류: {str(e)}")
-            self.price_table_update_signal.emit(row, "오류 발생", False)
+            self.report_price_update_status(product, row, "오류 발생", False)
         finally:
             if driver:
                 driver.quit()
@@ -8603,7 +8423,7 @@ class Main(QMainWindow):
             
             # BUYMA 로그인 페이지 접속
             login_url = "https://www.buyma.com/my/login/"
-            driver.get(login_url)
+            self.rate_limiter.navigate(driver, login_url)
             
             # 페이지 로딩 대기
             WebDriverWait(driver, 10).until(
@@ -8716,11 +8536,7 @@ class Main(QMainWindow):
             
             # BUYMA 셀러 관리 페이지로 이동
             seller_page_url = "https://www.buyma.com/my/item/"
-            driver.get(seller_page_url)
-            
-            # 페이지 로딩 대기
-            import time
-            time.sleep(3)
+            self.rate_limiter.get_page('update', driver, seller_page_url)
             
             # 상품 검색 (상품명으로)
             # TODO: 실제 BUYMA 셀러 페이지 구조에 맞게 수정 필요
@@ -8815,6 +8631,16 @@ class Main(QMainWindow):
             self.log_message(f"상품 가격 업데이트 오류: {str(e)}")
             return False
     
+    def report_price_update_status(self, product, row, status, success):
+        """가격 수정 결과를 상품에 기록하고, 상품이 아직 화면에 있으면 그 행의 상태 갱신 요청"""
+        if product is None:
+            self.price_table_update_signal.emit(row, status, success)
+            return
+        product['status'] = status
+        current_row = self.product_index.row_of(product)
+        if current_row is not None:
+            self.price_table_update_signal.emit(current_row, status, success)
+    
     @safe_slot
     def update_price_table_status_safe(self, row, status, success):
         """가격 테이블 상태 업데이트 (안전)"""
@@ -8874,11 +8700,8 @@ class Main(QMainWindow):
         # 로그 시작
         self.log_message(f"🚀 전체 상품 가격 분석 시작: {self.crawling_table.rowCount()}개 상품")
         
-        # 별도 스레드에서 전체 가격 분석 실행
-        import threading
-        
-        self.bulk_analysis_thread = threading.Thread(target=self.run_bulk_price_analysis, daemon=True)
-        self.bulk_analysis_thread.start()
+        # 작업 실행기에서 전체 가격 분석 실행
+        self.jobs.submit('bulk_analysis', self.run_bulk_price_analysis, title="전체 가격 분석")
     
     def run_bulk_price_analysis(self):
         """전체 상품 가격 분석 실행 (별도 스레드)"""
@@ -8929,9 +8752,10 @@ class Main(QMainWindow):
                         failed_count += 1
                         self.log_message(f"❌ 분석 실패: {product_name} (검색 결과 없음)")
                     
-                    # 딜레이 추가 (서버 부하 방지)
-                    import time
-                    time.sleep(self.delay_time.value())
+                    # 딜레이 추가 (서버 부하 방지, 중지 요청 시 바로 종료)
+                    if not self.tracer.sleep(self.delay_time.value()):
+                        self.log_message("⏹️ 전체 가격 분석이 중지되었습니다.")
+                        break
                     
                     # 진행률 업데이트
                     progress = int(((row + 1) / total_products) * 100)
@@ -8968,12 +8792,8 @@ class Main(QMainWindow):
             search_query = f"{brand} {product}"
             search_url = f"https://www.buyma.com/r/_/4FK1249/?q={search_query}"
             
-            # 검색 페이지 접속
-            driver.get(search_url)
-            
-            # 페이지 로딩 대기
-            import time
-            time.sleep(2)
+            # 검색 페이지 접속 (검색 속도 제한 적용)
+            self.rate_limiter.get_page('search', driver, search_url)
             
             # 경쟁사 상품 정보 추출
             competitor_products = self.extract_competitor_products(driver, brand, product)
@@ -9331,14 +9151,8 @@ class Main(QMainWindow):
             self.switch_to_monitoring_tab()
             self.set_tabs_enabled(False)
             
-            # 6. 별도 스레드에서 업로드 실행
-            import threading
-            
-            self.upload_thread = threading.Thread(
-                target=self.run_bulk_upload, 
-                daemon=True
-            )
-            self.upload_thread.start()
+            # 6. 작업 실행기에서 업로드 실행
+            self.jobs.submit('upload', self.run_bulk_upload, title="업로드")
             
         except Exception as e:
             self.log_message(f"❌ 업로드 시작 오류: {str(e)}")
@@ -9346,7 +9160,6 @@ class Main(QMainWindow):
     
     def run_bulk_upload(self):
         """대량 업로드 실행 (별도 스레드)"""
-        import time
         total_products = 0  # 변수 초기화
         uploaded_count = 0
         failed_count = 0
@@ -9376,8 +9189,8 @@ class Main(QMainWindow):
             for row in range(total_products):
                 try:
                     
-                    # 중단 요청 확인 (기존 코드 유지)
-                    if hasattr(self, 'upload_stopped') and self.upload_stopped:
+                    # 중단 요청 확인 (일시정지 중이면 재개/중지까지 대기)
+                    if not self.check_work_status():
                         self.log_message("⏹️ 사용자에 의해 업로드가 중단되었습니다.")
                         break
                     
@@ -9393,6 +9206,7 @@ class Main(QMainWindow):
                     progress = int((row / total_products) * 100)
                     self.upload_progress_signal.emit(progress)
                     status_text = f"업로드 중: {row + 1}/{total_products} - {product_data['title'][:30]}..."
+                    report_progress(row + 1, total_products, status_text)
                     self.upload_status_signal.emit(status_text)
                     
                     # 업로드 진행률 위젯 업데이트
@@ -9405,6 +9219,9 @@ class Main(QMainWindow):
                     result = None
                     
                     for attempt in range(max_retries):
+                        if attempt and self.work_stopped:
+                            result = {'success': False, 'error': "중지 요청"}
+                            break
                         try:
                             self.log_message(f"📤 업로드 시도 {attempt + 1}/{max_retries}: {product_data['title'][:30]}...")
                             result = self.upload_single_product(product_data, row + 1, max_images_setting)
@@ -9414,12 +9231,12 @@ class Main(QMainWindow):
                             else:
                                 if attempt < max_retries - 1:  # 마지막 시도가 아니면
                                     self.log_message(f"⚠️ 업로드 실패, 재시도 중... ({attempt + 1}/{max_retries})")
-                                    time.sleep(3)  # 재시도 전 3초 대기
+                                    self.tracer.sleep(3)  # 재시도 전 3초 대기
                                 
                         except Exception as e:
                             if attempt < max_retries - 1:
                                 self.log_message(f"⚠️ 업로드 오류, 재시도 중... ({attempt + 1}/{max_retries}): {str(e)}")
-                                time.sleep(3)
+                                self.tracer.sleep(3)
                             else:
                                 result = {'success': False, 'error': f"재시도 실패: {str(e)}"}
                     
@@ -9441,9 +9258,8 @@ class Main(QMainWindow):
                     error_msg = result.get('error', '') if result and not result['success'] else ''
                     self.add_upload_result_to_table(product_data, status, status_color, error_msg)
                     
-                    # 업로드 간 딜레이 (서버 부하 방지)
-                    import time
-                    time.sleep(5)
+                    # 업로드 간 딜레이 (서버 부하 방지, 중지 요청 시 바로 깨어남)
+                    self.tracer.sleep(5)
                     
                 except Exception as e:
                     failed_count += 1
@@ -9916,6 +9732,13 @@ class Main(QMainWindow):
             'discount_amount': self.discount_amount.value(),
             'min_margin': self.min_margin.value(),  # 다시 추가됨
             'exclude_loss_products': self.exclude_loss_products.isChecked(),
+            'priority_scheduling': self.priority_scheduling.isChecked(),
+            'analysis_time_limit': self.analysis_time_limit.value(),
+            # 재생 서버 주소 / 페이지 기록 (화면 설정 없음, 설정 파일에서 지정)
+            'base_url': self.rate_limiter.base_url or '',
+            'record_pages': self.rate_limiter.recorder is not None,
+            'trace_enabled': self.tracer.enabled,
+            'system_sample_interval': self.system_sampler.interval,
             'auto_mode': self.auto_mode.isChecked(),
             # 업로드 설정
             'max_images': self.max_images.value(),
@@ -9937,13 +9760,36 @@ class Main(QMainWindow):
             QMessageBox.critical(self, "오류", f"설정 저장에 실패했습니다: {str(e)}")
     
     def load_settings(self):
-        """설정 불러오기"""
+        """설정 불러오기 - 화면 위젯 값은 만들어진 탭에만 적용하고 나머지 탭은 처음 열 때 적용 (apply_tab_settings)"""
         try:
             if os.path.exists('settings.json'):
                 with open('settings.json', 'r', encoding='utf-8') as f:
                     settings = json.load(f)
+                self.loaded_settings = settings
+                
+                # 재생 서버 주소 / 페이지 기록 (네트워크 없는 테스트·벤치마크용)
+                self.rate_limiter.base_url = settings.get('base_url') or None
+                self.rate_limiter.recorder = PageRecorder(log=self.log_message) if settings.get('record_pages') else None
+                self.tracer.enabled = bool(settings.get('trace_enabled', False))
+                # 시스템 상태 측정 주기 (초) - 접속 확인 대상도 재생 서버 주소를 따름
+                self.system_sampler.interval = max(float(settings.get('system_sample_interval', 5)), 1.0)
+                self.system_sampler.url = self.rate_limiter.rebase(BUYMA_URL)
+                
+                # 설정 적용 (이미 만들어진 탭)
+                for key in self.lazy_tabs.built:
+                    self.apply_tab_settings(key)
                 
-                # 설정 적용
+                self.log_message("설정을 불러왔습니다.")
+        except Exception as e:
+            self.log_message(f"설정 불러오기 실패: {str(e)}")
+    
+    def apply_tab_settings(self, key):
+        """불러온 설정 값을 탭 위젯에 적용 (설정 파일이 없으면 위젯 기본값 유지)"""
+        settings = self.loaded_settings
+        if not settings:
+            return
+        try:
+            if key == 'settings':
                 self.email_input.setText(settings.get('email', ''))
                 # 비밀번호 디코딩하여 설정
                 encoded_password = settings.get('password', '')
@@ -9956,26 +9802,28 @@ class Main(QMainWindow):
                 # self.request_delay.setValue(settings.get('request_delay', 3))  # 주석처리됨
                 self.timeout_setting.setValue(settings.get('timeout', 10))  # 기본값 10으로 변경
                 self.retry_count.setValue(settings.get('retry_count', 3))
+            elif key == 'crawling':
                 self.crawl_count.setValue(settings.get('crawl_count', 50))
                 self.delay_time.setValue(settings.get('delay_time', 3))
+                self.include_images.setChecked(settings.get('include_images', True))
+                self.include_options.setChecked(settings.get('include_options', True))
+                self.skip_duplicates.setChecked(settings.get('skip_duplicates', True))
+                # self.auto_translate.setChecked(settings.get('auto_translate', False))  # 주석처리됨
+                # self.auto_categorize.setChecked(settings.get('auto_categorize', False))  # 주석처리됨
+                # self.watermark_images.setChecked(settings.get('watermark_images', False))  # 주석처리됨
+            elif key == 'price':
                 self.discount_amount.setValue(settings.get('discount_amount', 100))
                 self.min_margin.setValue(settings.get('min_margin', 500))  # 다시 추가됨
                 self.exclude_loss_products.setChecked(settings.get('exclude_loss_products', True))
+                self.priority_scheduling.setChecked(settings.get('priority_scheduling', True))
+                self.analysis_time_limit.setValue(settings.get('analysis_time_limit', 0))
                 self.auto_mode.setChecked(settings.get('auto_mode', True))
                 if not settings.get('auto_mode', True):
                     self.manual_mode.setChecked(True)
-                # 업로드 설정
+            elif key == 'upload':
                 self.max_images.setValue(settings.get('max_images', 10))
-                self.include_images.setChecked(settings.get('include_images', True))
-                self.include_options.setChecked(settings.get('include_options', True))
-                self.skip_duplicates.setChecked(settings.get('skip_duplicates', True))
-                # self.auto_translate.setChecked(settings.get('auto_translate', False))  # 주석처리됨
-                # self.auto_categorize.setChecked(settings.get('auto_categorize', False))  # 주석처리됨
-                # self.watermark_images.setChecked(settings.get('watermark_images', False))  # 주석처리됨
-                
-                self.log_message("설정을 불러왔습니다.")
         except Exception as e:
-            self.log_message(f"설정 불러오기 실패: {str(e)}")
+            self.log_message(f"설정 적용 실패 ({key}): {str(e)}")
     
     def reset_settings(self):
         """설정 초기화"""
@@ -10075,6 +9923,18 @@ class Main(QMainWindow):
             except Exception as e:
                 QMessageBox.critical(self, "오류", f"데이터 초기화에 실패했습니다: {str(e)}")
     
+    def export_trace(self, stage):
+        """단계별 소요 시간 요약을 로그에 남기고 Chrome 추적 파일(추적_*.json)로 저장 (측정 중일 때만)"""
+        if not self.tracer.enabled or not self.tracer.events:
+            return
+        try:
+            self.log_message(f"⏱️ {stage} {self.tracer.summary()}")
+            self.tracer.export_chrome_trace(f"추적_{stage}_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json")
+            self.tracer.reset()
+        except Exception as e:
+            self.log_message(f"⚠️ 추적 파일 저장 실패: {str(e)}")
+
+    @traced("log")
     def log_message(self, message, show_in_status=True):
         """로그 메시지 출력 (자동 스크롤 포함)"""
         try:
@@ -10143,68 +10003,6 @@ class Main(QMainWindow):
         except Exception as e:
             pass  # 스크롤 오류는 무시
     
-    def closeEvent(self, event):
-        """프로그램 종료 시 설정 저장 및 리소스 정리"""
-        try:
-            # 모든 QThread 안전하게 종료
-            threads_to_wait = []
-            
-            if hasattr(self, 'crawling_thread') and self.crawling_thread and self.crawling_thread.isRunning():
-                self.crawling_thread.quit()
-                threads_to_wait.append(self.crawling_thread)
-            
-            if hasattr(self, 'login_thread') and self.login_thread and self.login_thread.isRunning():
-                self.login_thread.quit()
-                threads_to_wait.append(self.login_thread)
-            
-            if hasattr(self, 'automation_thread') and self.automation_thread and self.automation_thread.isRunning():
-                self.automation_thread.quit()
-                threads_to_wait.append(self.automation_thread)
-            
-            if hasattr(self, 'price_analysis_thread') and self.price_analysis_thread and self.price_analysis_thread.isRunning():
-                self.price_analysis_thread.quit()
-                threads_to_wait.append(self.price_analysis_thread)
-            
-            if hasattr(self, 'bulk_analysis_thread') and self.bulk_analysis_thread and self.bulk_analysis_thread.isRunning():
-                self.bulk_analysis_thread.quit()
-                threads_to_wait.append(self.bulk_analysis_thread)
-            
-            if hasattr(self, 'upload_thread') and self.upload_thread and self.upload_thread.isRunning():
-                self.upload_thread.quit()
-                threads_to_wait.append(self.upload_thread)
-            
-            # 모든 스레드가 종료될 때까지 대기 (최대 3초)
-            for thread in threads_to_wait:
-                thread.wait(3000)  # 3초 대기
-            
-            # 공용 드라이버 정리
-            if hasattr(self, 'shared_driver') and self.shared_driver:
-                try:
-                    self.shared_driver.quit()
-                    self.log_message("🔄 브라우저가 안전하게 종료되었습니다.")
-                except:
-                    pass
-            
-            # 타이머 정리
-            if hasattr(self, 'timer'):
-                self.timer.stop()
-            if hasattr(self, 'system_timer'):
-                self.system_timer.stop()
-                
-            # 설정 저장
-            self.save_settings()
-            
-            # 주력 상품 자동 저장
-            if hasattr(self, 'favorite_products'):
-                self.save_favorite_products_auto()
-            
-            self.log_message("👋 프로그램을 종료합니다.")
-            
-        except Exception as e:
-            print(f"프로그램 종료 중 오류: {e}")
-        
-        event.accept()
-        
     def add_favorite_product(self):
         """주력 상품 추가"""
         try:
@@ -10617,6 +10415,23 @@ class Main(QMainWindow):
         except Exception as e:
             self.log_message(f"자동 저장 오류: {str(e)}")
     
+    def on_startup_painted(self):
+        """첫 화면 표시 직후 - 시작 후속 작업(주력 상품 불러오기), 시작 시간 기록, 무거운 모듈 미리 불러오기"""
+        startup_timer.mark('first_paint')
+        self.load_favorite_products_on_startup()
+        startup_timer.mark('interactive')
+        self.log_message(f"⏱️ {startup_timer.summary()}")
+        
+        # 시작 시간 측정 모드 (startup_benchmark.py) - 결과 기록 후 종료
+        report_path = requested_report_path()
+        if report_path:
+            startup_timer.write(report_path)
+            self.close()
+            return
+        
+        # selenium/requests 등은 화면이 뜬 뒤 백그라운드에서 미리 import (첫 작업 시작 지연 제거)
+        preload_modules(log=self.crawling_log_signal.emit)
+    
     def load_favorite_products_on_startup(self):
         """프로그램 시작 시 자동 로드 (안전장치 포함)"""
         try:
@@ -10624,9 +10439,8 @@ class Main(QMainWindow):
                 with open(self.favorites_file, 'r', encoding='utf-8') as f:
                     self.favorite_products = json.load(f)
                 
-                # 테이블 업데이트 (테이블이 존재하는 경우에만)
-                if hasattr(self, 'favorite_table') and self.favorite_table is not None:
-                    self.update_favorite_table()
+                # 테이블 업데이트 (주력 상품 탭을 만든 경우에만)
+                self.update_favorite_table()
                 
                 self.log_message(f"📂 주력 상품 자동 로드: {len(self.favorite_products)}개")
             else:
@@ -10642,22 +10456,26 @@ class Main(QMainWindow):
         try:
             self.log_message("🔄 프로그램을 종료하는 중...")
             
-            # 실행 중인 워커 스레드들 정리
-            if self.price_analysis_worker and self.price_analysis_worker.isRunning():
-                self.log_message("⏹️ 가격 분석 작업을 중지하는 중...")
-                self.price_analysis_worker.stop()
-                self.price_analysis_worker.wait(5000)  # 5초 대기
-            
-            if self.favorite_analysis_worker and self.favorite_analysis_worker.isRunning():
-                self.log_message("⏹️ 주력 상품 확인 작업을 중지하는 중...")
-                self.favorite_analysis_worker.stop()
-                self.favorite_analysis_worker.wait(5000)  # 5초 대기
+            # 실행 중인 작업 중지 요청 (대기 중인 작업은 바로 깨어남, 최대 3초 대기)
+            if self.jobs.active_jobs():
+                self.log_message(f"⏹️ 실행 중인 작업을 중지하는 중... ({self.jobs.summary()})")
+            if not self.jobs.shutdown(3.0):
+                self.log_message("⚠️ 3초 안에 끝나지 않은 작업은 그대로 두고 종료합니다.")
             
             # 주력 상품 자동 저장
             if self.favorite_products:
                 self.save_favorite_products_auto()
                 self.log_message("💾 주력 상품 자동 저장 완료")
             
+            # 다음 실행 시 웜 스타트를 위해 로그인 쿠키 저장
+            if self.shared_driver and self.is_logged_in:
+                self.cookie_store.save(self.shared_driver)
+                self.log_message(f"⏱️ 브라우저 시작 통계: {self.cookie_store.summary()}")
+            
+            # 시스템 상태 측정 중지
+            if hasattr(self, 'system_sampler'):
+                self.system_sampler.stop()
+            
             # 진행률 위젯 종료
             if hasattr(self, 'progress_widget'):
                 self.progress_widget.close()
@@ -10775,6 +10593,7 @@ class Main(QMainWindow):
     def crawling_finished_safe(self):
         """크롤링 완료 처리 (메인 스레드에서 안전하게)"""
         try:
+            self.export_trace("크롤링")
             # 처리 시간 계산
             if self.today_stats['start_time']:
                 import time
@@ -10895,6 +10714,7 @@ class Main(QMainWindow):
     def price_analysis_finished(self, stats):
         """가격 분석 완료 처리"""
         try:
+            self.export_trace("가격분석")
             # UI 상태 복원 (더 이상 사용하지 않는 버튼 제거됨)
             # self.analyze_all_my_products_btn.setEnabled(True)
             # self.analyze_all_my_products_btn.setText("🔍 내 상품 전체 분석 & 수정")
@@ -10958,15 +10778,9 @@ class Main(QMainWindow):
             
             self.log_message(f"🔧 설정: 할인 {discount_amount}엔, 최소마진 {min_margin}엔, 모드: {'🤖 자동' if is_auto_mode else '👤 수동'}")
             
-            # 별도 스레드에서 통합 처리 실행
-            import threading
-            
-            self.favorite_integrated_thread = threading.Thread(
-                target=self.run_favorite_integrated_process, 
-                args=(discount_amount, min_margin, is_auto_mode),
-                daemon=True
-            )
-            self.favorite_integrated_thread.start()
+            # 작업 실행기에서 통합 처리 실행
+            self.jobs.submit('favorite', self.run_favorite_integrated_process,
+                             discount_amount, min_margin, is_auto_mode, title="주력상품 가격확인-수정")
             
         except Exception as e:
             self.log_message(f"❌ 주력상품 통합 처리 시작 오류: {str(e)}")
@@ -11032,10 +10846,7 @@ class Main(QMainWindow):
     def stop_price_analysis(self):
         """가격 분석 중지"""
         try:
-            if self.price_analysis_worker and self.price_analysis_worker.isRunning():
-                self.price_analysis_worker.stop()
-                self.price_analysis_worker.wait(3000)  # 3초 대기
-                
+            if sum(self.jobs.cancel(name) for name in ('price_analysis', 'my_products', 'bulk_analysis', 'reprice_plan')):
                 # UI 상태 복원 (더 이상 사용하지 않는 버튼 제거됨)
                 # self.analyze_all_my_products_btn.setEnabled(True)
                 # self.analyze_all_my_products_btn.setText("🔍 내 상품 전체 분석 & 수정")
@@ -11049,10 +10860,7 @@ class Main(QMainWindow):
     def stop_favorite_analysis(self):
         """주력 상품 분석 중지"""
         try:
-            if self.favorite_analysis_worker and self.favorite_analysis_worker.isRunning():
-                self.favorite_analysis_worker.stop()
-                self.favorite_analysis_worker.wait(3000)  # 3초 대기
-                
+            if self.jobs.cancel('favorite'):
                 # UI 상태 복원
                 self.fav_start_analysis_btn.setEnabled(True)
                 self.fav_start_analysis_btn.setText("🚀 가격확인-가격수정 시작")
@@ -11409,7 +11217,9 @@ class Main(QMainWindow):
         return True
     
     def update_favorite_table(self):
-        """주력상품 테이블 업데이트"""
+        """주력상품 테이블 업데이트 (주력 상품 탭을 아직 만들지 않았으면 생략 - 탭을 만들 때 채움)"""
+        if not self.lazy_tabs.is_built('favorite'):
+            return
         try:
             self.favorite_table.setRowCount(len(self.favorite_products))
             
@@ -11549,11 +11359,12 @@ class Main(QMainWindow):
     def add_to_favorite_from_price_table(self, row):
         """가격관리 테이블에서 주력상품으로 추가"""
         try:
-            if row >= len(self.all_products):
+            # 화면 행 → 현재 페이지의 상품 (페이지 오프셋 반영)
+            product = self.product_index.product_at_row(row)
+            if product is None:
                 QMessageBox.warning(self, "오류", "선택한 상품 정보를 찾을 수 없습니다.")
                 return
             
-            product = self.all_products[row]
             product_name = product.get('title', '')
             current_price_str = product.get('current_price', '0')
             
@@ -11584,9 +11395,8 @@ class Main(QMainWindow):
             # 주력상품 목록에 추가
             self.favorite_products.append(favorite_product)
             
-            # 주력상품 테이블 업데이트 (테이블이 존재하는 경우에만)
-            if hasattr(self, 'favorite_table'):
-                self.update_favorite_table()
+            # 주력상품 테이블 업데이트 (주력 상품 탭을 만든 경우에만)
+            self.update_favorite_table()
             
             # 자동 저장
             self.save_favorite_products_auto()
@@ -11701,7 +11511,7 @@ class Main(QMainWindow):
                     continue
             
             # 테이블 업데이트 (메인 스레드에서 안전하게)
-            QTimer.singleShot(0, lambda: self.update_favorite_table())
+            self.run_on_main(lambda: self.update_favorite_table())
             
             self.my_products_log_signal.emit(f"✅ 1단계 완료: 분석 {analyzed_count}개, 실패 {failed_count}개")
             
@@ -11739,11 +11549,11 @@ class Main(QMainWindow):
                             )
                             
                             # 사용자 응답 대기 (최대 30초)
-                            import time
                             timeout = 30
                             elapsed = 0
                             while elapsed < timeout and self.confirmation_result is None:
-                                time.sleep(0.1)
+                                if not cancellable_sleep(0.1):
+                                    break
                                 elapsed += 0.1
                             
                             # 타임아웃 또는 취소 시 건너뛰기
@@ -11763,14 +11573,12 @@ class Main(QMainWindow):
                             product['status'] = "❌ 가격 수정 실패"
                             self.my_products_log_signal.emit(f"❌ 가격 수정 실패: {product_name}")
                         
-                        time.sleep(2)  # 상품 간 딜레이
-                        
                     except Exception as e:
                         self.my_products_log_signal.emit(f"❌ 가격 수정 오류: {product.get('name', 'Unknown')} - {str(e)}")
                         continue
             
             # 최종 테이블 업데이트
-            QTimer.singleShot(0, lambda: self.update_favorite_table())
+            self.run_on_main(lambda: self.update_favorite_table())
             
             # 완료 처리
             self.my_products_log_signal.emit(f"🎉 주력상품 통합 처리 완료! 분석: {analyzed_count}개, 수정: {updated_count}개")
@@ -11778,24 +11586,18 @@ class Main(QMainWindow):
             # 진행률 100% 완료 후 종료 - 시그널 사용
             self.progress_update_signal.emit(len(self.favorite_products)*2, len(self.favorite_products)*2, "✅ 통합 처리 완료")
             
-            # 1초 후 위젯 숨기기, 1.2초 후 UI 활성화
-            def delayed_actions():
-                import time
-                time.sleep(1)
-                self.progress_hide_signal.emit()
-                time.sleep(0.2)
-                self.ui_enable_signal.emit(True)
-            
-            threading.Thread(target=delayed_actions, daemon=True).start()
+            # 1초 후 위젯 숨기기, 1.2초 후 UI 활성화 (메인 스레드 타이머)
+            self.run_on_main(lambda: QTimer.singleShot(1000, self.hide_price_progress_widget))
+            self.run_on_main(lambda: QTimer.singleShot(1200, lambda: self.set_tabs_enabled(True)))
             
         except Exception as e:
             self.my_products_log_signal.emit(f"❌ 주력상품 통합 처리 오류: {str(e)}")
             
             # 진행률 위젯 종료
             if hasattr(self, 'price_progress_widget'):
-                QTimer.singleShot(0, lambda: self.price_progress_widget.hide())
+                self.run_on_main(lambda: self.price_progress_widget.hide())
             # 오류 시에도 UI 제어 해제
-            QTimer.singleShot(0, lambda: self.set_tabs_enabled(True))
+            self.run_on_main(lambda: self.set_tabs_enabled(True))
 
             # UI 상태 복원 (시그널 사용)
             self.restore_ui_signal.emit()
@@ -11816,12 +11618,35 @@ class Main(QMainWindow):
         except Exception as e:
             self.log_message(f"❌ 업로드 상태 업데이트 오류: {str(e)}")
     
+    def toggle_upload_pause(self):
+        """업로드 일시정지/재시작 (상품 사이/대기 중에 멈춤)"""
+        job = self.jobs.find('upload')
+        if job is None:
+            return
+        if job.token.paused:
+            job.token.resume()
+            self.pause_upload_btn.setText("⏸️ 일시정지")
+            self.log_message("▶️ 업로드가 재시작되었습니다.")
+        else:
+            job.token.pause()
+            self.pause_upload_btn.setText("▶️ 재시작")
+            self.log_message("⏸️ 업로드가 일시정지되었습니다.")
+        self.job_status.setText(self.jobs.summary())
+    
+    def stop_upload(self):
+        """업로드 중지 (진행 중인 상품 처리 후 또는 대기 중 바로 중지)"""
+        if self.jobs.cancel('upload'):
+            self.log_message("⏹️ 업로드 중지 요청...")
+            self.current_upload_status.setText("중지 중...")
+    
     @safe_slot
     def on_upload_finished(self):
         """업로드 완료 처리 (안전)"""
         try:
+            self.export_trace("업로드")
             self.start_upload_btn.setEnabled(True)
             self.pause_upload_btn.setEnabled(False)
+            self.pause_upload_btn.setText("⏸️ 일시정지")
             self.stop_upload_btn.setEnabled(False)
             self.current_upload_status.setText("대기 중")
             
@@ -11845,168 +11670,13 @@ class Main(QMainWindow):
         except Exception as e:
             self.log_message(f"UI 복원 오류: {str(e)}")
     
-    def get_buyma_lowest_price_for_favorite(self, product_name, brand_name):
-        """주력상품용 BUYMA 최저가 조회 (search_buyma_lowest_price 로직 활용)"""
-        try:
-            # 1. 상품명에서 실제 검색어 추출 (商品ID 이전까지)
-            search_name = product_name
-            if "商品ID" in product_name:
-                search_name = product_name.split("商品ID")[0].strip()
-            
-            # 추가 정리 (줄바꿈, 특수문자 제거)
-            search_name = search_name.replace("\n", " ").replace("★", " ").strip()
-            
-            # 숫자가 포함된 단어 제거 후 영어만 남기기
-            import re
-            # 1단계: 숫자가 포함된 단어 전체 제거 (M0455, A1234, bag123 등)
-            search_name = re.sub(r'\b\w*\d+\w*\b', '', search_name)
-            # 2단계: 영어와 공백만 남기기 (숫자 완전 제거)
-            search_name = re.sub(r'[^a-zA-Z\s]', '', search_name)
-            # 3단계: 연속된 공백을 하나로 정리
-            search_name = re.sub(r'\s+', ' ', search_name).strip()
-            
-            # 브랜드명 정리
-            # search_name = search_name.replace(brand_name, "").strip()
-            
-            self.log_message(f"🔍 검색어: '{search_name}'")
-            
-            # 브랜드명 제거 
-            # search_name = search_name.replace(brand_name, "").strip()
-            
-            self.log_message(f"🔍 주력상품 검색어: '{search_name}'")
-            
-            if not self.shared_driver:
-                self.log_message("❌ 브라우저가 초기화되지 않았습니다.")
-                return None
-            
-            # 2. BUYMA 검색 URL로 이동 (첫 페이지)
-            page_number = 1
-            lowest_price = float('inf')
-            found_products = 0
-            
-            current_url = ""
-            already_visited_urls = ""
-            max_pages = 20  # 최대 20페이지까지 검색
-            while page_number <= max_pages:
-                
-                if search_name == "":
-                    self.log_message("⚠️ 유효한 검색어가 없습니다.")
-                    break
-                
-                search_url = f"https://www.buyma.com/r/-R120/{search_name}_{page_number}"
-                self.log_message(f"🌐 주력상품 페이지 {page_number} 접속: {search_url}")
-                
-                try:
-                    self.shared_driver.get(search_url)
-                    time.sleep(3)
-                except Exception as e:
-                    # 페이지 로딩 타임아웃 또는 네트워크 오류
-                    self.log_message(f"⏱️ 페이지 {page_number} 로딩 실패: {str(e)}")
-                    break
-                
-                current_url = self.shared_driver.current_url
-                
-                if current_url == already_visited_urls:
-                    self.log_message(f"🔄 동일한 페이지 URL 감지, 중복 방문 감지로 인해 다음 상품으로 넘어갑니다.")
-                    break
-                
-                else:
-                    already_visited_urls = ""
-                
-                # 3. ul.product_lists 요소 로딩 대기 (가격관리 탭과 동일한 로직)
-                from selenium.webdriver.common.by import By
-                from selenium.webdriver.support.ui import WebDriverWait
-                from selenium.webdriver.support import expected_conditions as EC
-                
-                try:
-                    # 상품 리스트 로딩 대기 (최대 10초)
-                    product_list = WebDriverWait(self.shared_driver, 10).until(
-                        EC.presence_of_element_located((By.CSS_SELECTOR, "ul.product_lists"))
-                    )
-                    
-                    # 4. 각 li 요소들 (상품들) 수집
-                    product_items = product_list.find_elements(By.TAG_NAME, "li")
-                    
-                    if not product_items:
-                        self.log_message(f"⚠️ 페이지 {page_number}에서 상품을 찾을 수 없습니다.")
-                        break
-                    
-                    try:
-                        self.shared_driver.implicitly_wait(1)
-                        a_tag = self.shared_driver.find_element(By.CSS_SELECTOR, "a.search_requestlink_btn")
-                        
-                        if a_tag:   
-                            self.log_message("⚠️ 페이지 {page_number}에서 상품을 찾을 수 없습니다. (검색결과 없음)")
-                            break
-                    except:
-                        pass
-                    
-                    finally:
-                        self.shared_driver.implicitly_wait(10)
-                    
-                    self.log_message(f"📦 페이지 {page_number}에서 {len(product_items)}개 상품 발견")
-                    
-                    # 5. 각 상품 정보 분석
-                    for item in product_items:
-                        try:
-                            # 6. 상품명 추출 (div.product_name)
-                            name_elem = item.find_element(By.CSS_SELECTOR, "div.product_name")
-                            item_name = name_elem.text.strip()
-                            
-                            # 7. 검색한 상품명이 포함되어 있는지 확인
-                            if search_name.lower() in item_name.lower():
-                                # 8. 상품가격 추출 (span.Price_Txt)
-                                try:
-                                    price_elem = item.find_element(By.CSS_SELECTOR, "span.Price_Txt")
-                                    price_text = price_elem.text.strip()
-                                    
-                                    # 가격에서 숫자만 추출 (¥12,000 → 12000)
-                                    import re
-                                    price_numbers = re.findall(r'[\d,]+', price_text)
-                                    if price_numbers:
-                                        price = int(price_numbers[0].replace(',', ''))
-                                        
-                                        # 9. 최저가 비교 및 갱신
-                                        if price < lowest_price:
-                                            lowest_price = price
-                                            self.log_message(f"💰 새로운 최저가 발견: ¥{price:,} - {item_name[:30]}...")
-                                        
-                                        found_products += 1
-                                    
-                                except Exception as e:
-                                    # 가격 정보가 없는 상품은 건너뛰기
-                                    continue
-                            
-                        except Exception as e:
-                            # 개별 상품 처리 오류는 건너뛰기
-                            continue
-                    
-                    # 4. 다음 페이지 확인 (li 개수가 120개면 다음 페이지 있음)
-                    if len(product_items) == 120:
-                        page_number += 1
-                        self.log_message(f"➡️ 다음 페이지({page_number})로 이동...")
-                        already_visited_urls = current_url
-                        time.sleep(2)  # 페이지 간 딜레이
-                    else:
-                        # 마지막 페이지 도달
-                        self.log_message(f"✅ 모든 페이지 검색 완료 (총 {page_number} 페이지)")
-                        break
-                
-                except Exception as e:
-                    self.log_message(f"❌ 페이지 {page_number} 로딩 실패: {str(e)}")
-                    break
-            
-            # 11. 결과 반환
-            if lowest_price != float('inf'):
-                self.log_message(f"🎉 검색 완료: 총 {found_products}개 상품 중 최저가 ¥{lowest_price:,}")
-                return lowest_price
-            else:
-                self.log_message(f"⚠️ '{search_name}' 상품을 찾을 수 없습니다.")
-                return None
-                
-        except Exception as e:
-            self.log_message(f"❌ 주력상품 최저가 검색 오류: {str(e)}")
-            return None
+    def get_current_price_from_buyma(self, product_name, product_id=None):
+        """BUYMA 내 상품 검색으로 현재가 조회 (상품ID 우선 사용, 엔진에 위임)"""
+        return self.engine.current_price(self.shared_driver, product_name, product_id=product_id)
+    
+    def get_buyma_lowest_price_for_favorite(self, product_name, brand_name=""):
+        """주력상품용 BUYMA 최저가 조회 (카탈로그 없이 실시간 검색, 엔진에 위임)"""
+        return self.engine.favorite_lowest_price(self.shared_driver, product_name, brand_name)
     
     def update_buyma_product_price_for_favorite(self, product, new_price, is_auto_mode):
         """주력상품용 BUYMA 가격 수정 (가격관리 로직 활용)"""
@@ -12029,23 +11699,16 @@ class Main(QMainWindow):
         try:
             self.progress_widget.show()
             
-            # 테스트 진행률 시뮬레이션
-            import threading
-            import time
-            
-            def simulate_progress():
-                for i in range(101):
-                    QTimer.singleShot(i * 50, lambda p=i: self.progress_widget.update_progress(
-                        p, 100, "테스트 진행 중", f"진행률: {p}%"
-                    ))
-                
-                # 완료 상태 표시
-                QTimer.singleShot(5500, lambda: self.progress_widget.set_task_complete(
-                    "테스트 완료", "진행률 위젯 테스트가 완료되었습니다!"
+            # 테스트 진행률 시뮬레이션 (메인 스레드 타이머 - 다른 스레드의 QTimer.singleShot 은 실행되지 않음)
+            for i in range(101):
+                QTimer.singleShot(i * 50, lambda p=i: self.progress_widget.update_progress(
+                    p, 100, "테스트 진행 중", f"진행률: {p}%"
                 ))
             
-            thread = threading.Thread(target=simulate_progress, daemon=True)
-            thread.start()
+            # 완료 상태 표시
+            QTimer.singleShot(5500, lambda: self.progress_widget.set_task_complete(
+                "테스트 완료", "진행률 위젯 테스트가 완료되었습니다!"
+            ))
             
         except Exception as e:
             self.log_message(f"❌ 진행률 위젯 테스트 오류: {str(e)}")
@@ -12081,6 +11744,8 @@ class Main(QMainWindow):
             self.log_message(f"❌ 상품 데이터 추출 오류 (행 {row}): {str(e)}")
             return None
     
+    @metered("upload", failed=lambda result: not (result or {}).get('success'))
+    @traced("upload.item")
     def upload_single_product(self, product_data, product_number, max_images):
         """단일 상품 BUYMA 업로드 - 실제 구현"""
         try:
@@ -12106,7 +11771,7 @@ class Main(QMainWindow):
             
             # BUYMA 상품 등록 페이지로 이동
             try:
-                self.shared_driver.get("https://www.buyma.com/my/sell/new?tab=b")
+                self.rate_limiter.navigate(self.shared_driver, "https://www.buyma.com/my/sell/new?tab=b")
                 import time
                 time.sleep(5)  # 페이지 로딩 대기
             except Exception as e:
@@ -13310,6 +12975,7 @@ class Main(QMainWindow):
         try:
             self.start_upload_btn.setEnabled(True)
             self.pause_upload_btn.setEnabled(False)
+            self.pause_upload_btn.setText("⏸️ 일시정지")
             self.stop_upload_btn.setEnabled(False)
             self.current_upload_status.setText("대기 중")
             
@@ -13553,6 +13219,7 @@ class Main(QMainWindow):
     def on_my_products_finished(self):
         """내 상품 크롤링 완료 처리"""
         try:
+            self.export_trace("내상품")
             # 분석된 데이터로 테이블 업데이트
             self.update_price_analysis_table()
             
@@ -13924,11 +13591,8 @@ class Main(QMainWindow):
             return
         
         # 수정이 필요한 상품 찾기
-        need_update = []
-        for row in range(self.price_table.rowCount()):
-            status_item = self.price_table.item(row, 5)  # 상태 컬럼
-            if status_item and "수정 필요" in status_item.text():
-                need_update.append(row)
+        need_update = [row for row, product in self.product_index.view_items()
+                       if "수정 필요" in product.get('status', '')]
         
         if not need_update:
             QMessageBox.information(self, "정보", "수정이 필요한 상품이 없습니다.")
@@ -13957,9 +13621,9 @@ class Main(QMainWindow):
         failed_count = 0
         
         for i, row in enumerate(need_update):
+            product = self.product_index.product_at_row(row)
+            product_name = product.get('title') or product.get('name', '')
             try:
-                
-                product_name = self.price_table.item(row, 0).text()
                 self.log_message(f"💰 가격 수정 중 ({i+1}/{len(need_update)}): {product_name[:30]}...")
                 
                 # 가격수정 진행률 위젯 업데이트
@@ -14128,6 +13792,7 @@ def main():
         
         # 메인 윈도우 생성 및 표시
         window = Main()
+        startup_timer.mark('window')
         window.show()
         
         # 시작 메시지
@@ -14145,6 +13810,10 @@ def main():
         
         QTimer.singleShot(300000, cleanup_memory)
         
+        # 첫 화면을 그린 뒤 시작 후속 작업 (주력 상품 불러오기, 시작 시간 기록)
+        # log_message 가 processEvents 를 호출하므로 이벤트 루프 시작 직전에 예약
+        QTimer.singleShot(0, window.on_startup_painted)
+        
         sys.exit(app.exec())
         
     except Exception as e:
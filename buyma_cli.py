@@ -0,0 +1,209 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+BUYMA 가격 관리 명령줄 실행 스크립트 (화면 없이 서버/야간 작업용)
+
+  python buyma_cli.py sync-my-products -o 상품정보.json
+  python buyma_cli.py analyze 상품정보.json --discount 100 --min-margin 500 --jsonl 분석결과.jsonl
+  python buyma_cli.py reprice 상품정보.json --dry-run
+  python buyma_cli.py --base-url http://127.0.0.1:8765 analyze 상품정보.json   (page_fixtures 재생 서버)
+
+로그인은 GUI 에서 저장한 쿠키(buyma_cookies.json)를 사용하고, 진행 메시지는 stderr,
+결과(JSON/JSONL)는 stdout 또는 지정한 파일로 출력한다.
+"""
+
+import argparse
+import json
+import sys
+from datetime import datetime
+
+from analysis_scheduler import AnalysisScheduler
+from browser_warmstart import COOKIE_FILE, CookieStore
+from buyma_engine import BuymaEngine, build_snapshot, create_driver, load_snapshot
+from page_fixtures import PageRecorder
+from price_history import HISTORY_FILE, PriceHistory
+from rate_limiter import RateLimiterRegistry
+from tracing import Tracer
+from reprice_plan import RepricePlan
+
+
+def log(message):
+    print(message, file=sys.stderr, flush=True)
+
+
+def write_json(data, path=None):
+    """JSON 1개 출력 - path 가 없거나 '-' 면 stdout"""
+    text = json.dumps(data, ensure_ascii=False, indent=2)
+    if not path or path == '-':
+        print(text)
+    else:
+        with open(path, 'w', encoding='utf-8') as f:
+            f.write(text + "\n")
+
+
+def open_jsonl(path):
+    """JSONL 출력 대상 - path 가 없거나 '-' 면 stdout"""
+    if not path or path == '-':
+        return sys.stdout
+    return open(path, 'w', encoding='utf-8')
+
+
+def analysis_record(product):
+    """분석 결과 JSONL 1줄"""
+    return {field: product.get(field) for field in (
+        'product_id', 'title', 'current_price', 'lowest_price', 'suggested_price',
+        'price_difference', 'needs_update', 'status')}
+
+
+def start_browser(args, engine):
+    """브라우저 시작 후 저장된 쿠키로 로그인 - 실패 시 None
+    --fixtures 면 Chrome 대신 기록한 페이지를 읽는 가짜 드라이버 사용"""
+    if args.fixtures:
+        from fake_driver import FakeDriver
+        return engine.tracer.instrument_driver(FakeDriver.from_fixtures(args.fixtures))
+    driver = engine.tracer.instrument_driver(create_driver(headless=not args.show_browser))
+    if args.base_url:
+        return driver  # 재생 서버는 로그인 없이 기록한 페이지를 그대로 돌려줌
+    if CookieStore(path=args.cookies, log=log, rate_limiter=engine.rate_limiter).warm_start(driver):
+        return driver
+    log("❌ 로그인 쿠키가 없거나 만료되었습니다. GUI 에서 한 번 로그인해주세요.")
+    driver.quit()
+    return None
+
+
+def cmd_sync_my_products(args, engine):
+    driver = start_browser(args, engine)
+    if not driver:
+        return 1
+    try:
+        products = engine.sync_my_products(driver, max_pages=args.max_pages)
+    finally:
+        driver.quit()
+    output = args.output or datetime.now().strftime("상품정보_%Y%m%d_%H%M%S.json")
+    write_json(build_snapshot(products), output)
+    log(f"🎉 내 상품 {len(products)}개 수집 완료: {output}")
+    return 0
+
+
+def cmd_analyze(args, engine):
+    data, products = load_snapshot(args.snapshot)
+    scheduler = AnalysisScheduler(state_file=args.schedule, history=engine.history)
+    work = [product for product in products if not product.get('excluded', False)]
+    if not args.no_priority:
+        work = scheduler.order(work)
+    if args.limit:
+        work = work[:args.limit]
+
+    driver = start_browser(args, engine)
+    if not driver:
+        return 1
+    out = open_jsonl(args.jsonl)
+    analyzed = 0
+    try:
+        for product in scheduler.time_boxed(work, args.time_limit * 60):
+            needs_update = engine.analyze_product(driver, product, args.discount, args.min_margin)
+            if needs_update is not None:
+                scheduler.record_check(product, product.get('lowest_price'))
+                analyzed += 1
+            out.write(json.dumps(analysis_record(product), ensure_ascii=False) + "\n")
+            out.flush()
+    finally:
+        driver.quit()
+        scheduler.save()
+        if out is not sys.stdout:
+            out.close()
+
+    # 분석 결과를 스냅샷에 반영 (reprice 입력)
+    write_json(data, args.save or args.snapshot)
+    log(f"📊 {analyzed}/{len(work)}개 분석 완료 | {engine.search_stats.summary()}")
+    return 0
+
+
+def cmd_reprice(args, engine):
+    _, products = load_snapshot(args.snapshot)
+    plan = RepricePlan.from_products(products, history=engine.history)
+    log(f"📋 {plan.summary()}")
+
+    if not args.dry_run and plan.updates():
+        driver = start_browser(args, engine)
+        if not driver:
+            return 1
+        try:
+            engine.reprice(driver, plan)
+        finally:
+            driver.quit()
+        log(f"✅ {plan.summary()}")
+
+    if args.plan:
+        plan.save(args.plan)
+    write_json({
+        "생성_시간": plan.created_at,
+        "드라이런": args.dry_run,
+        "요약": dict(plan.counts()),
+        "수정_대상": plan.targets(),
+        "적용_결과": plan.results,
+    }, args.output)
+    return 0
+
+
+def build_parser():
+    parser = argparse.ArgumentParser(prog="buyma_cli", description="BUYMA 가격 관리 (화면 없이 실행)")
+    parser.add_argument('--cookies', default=COOKIE_FILE, help="로그인 쿠키 파일")
+    parser.add_argument('--history', default=HISTORY_FILE, help="가격 이력 DB")
+    parser.add_argument('--show-browser', action='store_true', help="헤드리스 대신 브라우저 창 표시")
+    parser.add_argument('--base-url', help="BUYMA 대신 접속할 기본 주소 (재생 서버, 속도 제한 없음)")
+    parser.add_argument('--record', metavar='DIR', help="접속한 페이지를 DIR 에 기록 (재생 서버용)")
+    parser.add_argument('--fixtures', metavar='DIR', help="Chrome 없이 DIR 의 기록 페이지로 실행 (가짜 드라이버, 속도 제한 없음)")
+    parser.add_argument('--trace', metavar='FILE', help="단계별 소요 시간을 Chrome 추적 JSON 으로 저장 (요약은 stderr)")
+    commands = parser.add_subparsers(dest='command', required=True)
+
+    sync = commands.add_parser('sync-my-products', help="판매 중인 내 상품을 스냅샷 JSON 으로 저장")
+    sync.add_argument('-o', '--output', help="저장할 파일 (기본: 상품정보_날짜_시간.json, '-' 는 stdout)")
+    sync.add_argument('--max-pages', type=int, default=0, help="최대 페이지 수 (0 = 전체)")
+    sync.set_defaults(handler=cmd_sync_my_products)
+
+    analyze = commands.add_parser('analyze', help="스냅샷 상품의 경쟁사 최저가 분석")
+    analyze.add_argument('snapshot', help="상품정보 JSON")
+    analyze.add_argument('--discount', type=int, default=100, help="최저가에서 뺄 할인 금액 (엔)")
+    analyze.add_argument('--min-margin', type=int, default=500, help="허용 손실 한도 (엔)")
+    analyze.add_argument('--limit', type=int, default=0, help="분석할 최대 상품 수 (0 = 전체)")
+    analyze.add_argument('--time-limit', type=int, default=0, help="분석 시간 제한 (분, 0 = 제한 없음)")
+    analyze.add_argument('--no-priority', action='store_true', help="우선순위 대신 목록 순서로 분석")
+    analyze.add_argument('--schedule', default="분석_스케줄.json", help="우선순위 상태 파일")
+    analyze.add_argument('--jsonl', help="상품별 분석 결과 JSONL (기본: stdout)")
+    analyze.add_argument('--save', help="분석 결과를 반영한 스냅샷 저장 위치 (기본: 입력 파일 덮어쓰기)")
+    analyze.set_defaults(handler=cmd_analyze)
+
+    reprice = commands.add_parser('reprice', help="분석된 스냅샷으로 가격 수정 (판매 목록 페이지 단위)")
+    reprice.add_argument('snapshot', help="분석 결과가 들어 있는 상품정보 JSON")
+    reprice.add_argument('--dry-run', action='store_true', help="계획만 출력하고 수정하지 않음")
+    reprice.add_argument('--plan', help="수정 계획 JSON 저장 위치")
+    reprice.add_argument('-o', '--output', help="결과 JSON (기본: stdout)")
+    reprice.set_defaults(handler=cmd_reprice)
+
+    return parser
+
+
+def main(argv=None):
+    args = build_parser().parse_args(argv)
+    tracer = Tracer(enabled=bool(args.trace), log=log)
+    rate_limiter = RateLimiterRegistry(base_url=args.base_url,
+                                       recorder=PageRecorder(args.record, log) if args.record else None,
+                                       tracer=tracer)
+    if args.base_url or args.fixtures:
+        # 로컬 재생 서버/기록 페이지는 요청 간격을 둘 필요가 없음
+        for name in list(rate_limiter.limits):
+            rate_limiter.configure(name, initial_rate=1000, max_rate=1000, burst=1000)
+    engine = BuymaEngine(log=log, rate_limiter=rate_limiter, history=PriceHistory(args.history))
+    try:
+        return args.handler(args, engine)
+    finally:
+        engine.history.close()
+        engine.catalog.close()
+        if args.trace:
+            log(f"⏱️ {tracer.summary()}")
+            tracer.export_chrome_trace(args.trace)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
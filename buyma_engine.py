@@ -0,0 +1,505 @@
+# BUYMA 자동화 프로그램 - 화면 없이 동작하는 가격 관리 엔진 모듈 (GUI / CLI 공용)
+import copy
+import json
+import re
+import time
+from datetime import datetime
+from urllib.parse import quote
+
+from bulk_price_editor import BulkPriceEditor, MY_SELL_LIST_URL, ROW_SELECTOR, ROWS_PER_PAGE
+from competitor_catalog import CompetitorCatalog
+from name_matcher import NameMatcher
+from rate_limiter import RateLimiterRegistry
+from search_strategy import SearchLookupStats, build_search_url, SORT_PRICE_ASC, SORT_RELEVANCE
+from search_tiles import parse_price, read_product_tiles
+from tracing import traced
+
+
+# 판매 목록 페이지의 상품 행과 전체 상품 수를 스크립트 1회 호출로 읽기 (태그 행은 링크가 없어 제외)
+MY_SELL_SCRIPT = """
+var rows = document.querySelectorAll(arguments[0]);
+var result = [];
+for (var i = 0; i < rows.length; i++) {
+    var link = rows[i].querySelector('a.fab-design-d--b');
+    var name = rows[i].querySelector('td.item_name');
+    var price = rows[i].querySelector('span.js-item-price-display');
+    if (!link || !name) { continue; }
+    result.push({
+        title: (name.innerText || '').trim(),
+        price: price ? (price.innerText || '').trim() : '',
+        url: link.href
+    });
+}
+var total = document.querySelector('p.itemedit_actions_nums');
+return {total: total ? total.innerText : '', rows: result};
+"""
+
+# 내 상품 검색 (상품ID 또는 상품명) - 판매 목록과 같은 행 구조
+MY_SELL_SEARCH_URL = "https://www.buyma.com/my/sell/search?sale_kind=all&duty_kind=all&keyword={keyword}&multi_id=#/"
+
+ITEM_ID_PATTERN = re.compile(r'/item/(\d+)')
+TOTAL_COUNT_PATTERN = re.compile(r'全\s*([\d,]+)件')
+# 상품명의 상품ID - "商品ID: 12345" → "ID: 12345" → 마지막 숫자 묶음 순서로 확인
+PRODUCT_ID_PATTERNS = (
+    re.compile(r'商品ID[:\s]*(\d+)'),
+    re.compile(r'ID[:\s]*(\d+)'),
+    re.compile(r'(\d+)(?!.*\d)'),
+)
+
+
+def clean_search_name(product_name, english_only=True):
+    """상품명에서 검색어 추출 - 商品ID 이전까지, english_only 면 숫자 포함 단어를 지우고 영어만 남김"""
+    search_name = (product_name or "").split("商品ID")[0]
+    search_name = search_name.replace("\n", " ").replace("★", " ")
+    if english_only:
+        # 숫자가 포함된 단어 전체 제거 (M0455, A1234, bag123 등) 후 영어와 공백만 남기기
+        search_name = re.sub(r'\b\w*\d+\w*\b', '', search_name)
+        search_name = re.sub(r'[^a-zA-Z\s]', '', search_name)
+    return re.sub(r'\s+', ' ', search_name).strip()
+
+
+def extract_product_id(product_name):
+    """상품명에서 상품ID 추출 (없으면 None)"""
+    for pattern in PRODUCT_ID_PATTERNS:
+        match = pattern.search(product_name or "")
+        if match:
+            return match.group(1)
+    return None
+
+
+def decide_price(product, lowest_price, discount, min_margin):
+    """경쟁사 최저가로 제안가/수정 필요 여부를 계산해 상품 dict 에 기록 - 수정 필요 여부 반환
+    제안가가 현재가보다 낮아도 차이가 최소 마진 이내면 수정, 그보다 크면 손실 예상으로 보류"""
+    current_price = parse_price(str(product.get('current_price', ''))) or 0
+    suggested_price = max(lowest_price - discount, 0)
+    price_difference = suggested_price - current_price
+
+    product['lowest_price'] = lowest_price
+    product['suggested_price'] = suggested_price
+    product['price_difference'] = price_difference
+
+    if price_difference >= -abs(min_margin):
+        product['status'] = '💰 가격 수정 필요'
+        product['needs_update'] = True
+    else:
+        product['status'] = f'⚠️ 손실 예상 ({price_difference:+,}엔)'
+        product['needs_update'] = False
+    return product['needs_update']
+
+
+def parse_sell_rows(raw_rows, id_prefix=""):
+    """판매 목록 스크립트 결과를 내 상품 dict 목록으로 변환 (GUI 내 상품 불러오기와 같은 형식)
+    id_prefix 는 상품ID 앞에 붙일 문자 (PySide 판은 제외 목록과 맞추려고 '0' 을 붙인다)"""
+    products = []
+    for raw in raw_rows or []:
+        title = raw.get('title', '')
+        url = raw.get('url') or "상품 URL 없음"
+        match = ITEM_ID_PATTERN.search(url)
+        product_id = id_prefix + match.group(1) if match else "ID 없음"
+        products.append({
+            'title': f"{title} 商品ID: {product_id}" if match else title,
+            'original_title': title,
+            'product_id': product_id,
+            'current_price': raw.get('price', ''),
+            'url': url,
+            'status': '분석 대기',
+        })
+    return products
+
+
+def build_snapshot(products, now=None):
+    """상품정보_*.json 형식의 스냅샷 dict"""
+    now = now or datetime.now()
+    return {
+        "수집_정보": {
+            "수집_날짜": now.strftime("%Y-%m-%d"),
+            "수집_시간": now.strftime("%H:%M:%S"),
+            "총_상품수": len(products),
+        },
+        "상품_목록": products,
+    }
+
+
+def load_snapshot(path):
+    """스냅샷 JSON 불러오기 - (원본 데이터, 상품 목록)"""
+    with open(path, 'r', encoding='utf-8') as f:
+        data = json.load(f)
+    if isinstance(data, list):
+        return {"상품_목록": data}, data
+    return data, data.get("상품_목록", [])
+
+
+def create_driver(headless=True):
+    """크롬 드라이버 생성 - headless 면 화면 없이 실행 (서버/야간 작업용)"""
+    from selenium import webdriver
+    from selenium.webdriver.chrome.options import Options
+
+    options = Options()
+    if headless:
+        options.add_argument('--headless=new')
+    options.add_argument('--no-sandbox')
+    options.add_argument('--disable-dev-shm-usage')
+    options.add_argument('--disable-gpu')
+    options.add_argument('--window-size=1920,1080')
+    options.add_argument('--log-level=3')
+    options.add_argument('--disable-blink-features=AutomationControlled')
+    options.add_experimental_option('excludeSwitches', ['enable-logging'])
+    driver = webdriver.Chrome(options=options)
+    driver.implicitly_wait(10)
+    return driver
+
+
+class BuymaEngine:
+    """BUYMA 내 상품 불러오기 / 최저가 검색 / 가격 분석 / 가격 수정을 Qt 없이 수행하는 엔진
+    GUI 는 자신의 속도 제한기/카탈로그/통계를 넘겨 같은 엔진을 쓰고, CLI 는 기본 구성으로 생성한다.
+    log 는 진행 메시지, log_error 는 오류 메시지를 받는 함수 - GUI 는 시그널의 emit 을 넘겨 화면 스레드에서 표시한다."""
+
+    def __init__(self, log=print, log_error=None, rate_limiter=None, catalog=None, search_stats=None,
+                 history=None, bulk_price_editor=None, sort_mode=SORT_PRICE_ASC,
+                 name_matching=True, english_only=True, cache_bust=False,
+                 session_bridge=None, favorite_pages=20, product_id_prefix=""):
+        self.log = log
+        self.log_error = log_error or log
+        self.rate_limiter = rate_limiter or RateLimiterRegistry()
+        self.tracer = self.rate_limiter.tracer  # 단계별 소요 시간 측정 (속도 제한기와 공유)
+        self.catalog = catalog if catalog is not None else CompetitorCatalog()
+        self.search_stats = search_stats or SearchLookupStats()
+        self.history = history  # PriceHistory - 지정하면 분석 결과를 기록
+        self.bulk_price_editor = bulk_price_editor or BulkPriceEditor(rate_limiter=self.rate_limiter, log=log)
+        self.sort_mode = sort_mode
+        self.name_matching = name_matching  # 검색어와 일치하는 상품만 최저가 후보로 사용
+        self.english_only = english_only    # 검색어에서 숫자 포함 단어/영어 외 문자 제거
+        self.cache_bust = cache_bust        # 검색 URL 에 타임스탬프를 붙이고 새로고침 후 접속
+        self.session_bridge = session_bridge  # BuymaSessionBridge - 현재가를 페이지 로딩 없이 HTTP 로 먼저 조회
+        self.favorite_pages = favorite_pages  # 주력상품 최저가 검색 최대 페이지 수
+        self.product_id_prefix = product_id_prefix
+
+    def with_log(self, log, log_error=None):
+        """같은 속도 제한기/카탈로그/통계를 쓰면서 메시지만 다른 곳(작업별 로그 시그널 등)으로 보내는 엔진"""
+        engine = copy.copy(self)
+        engine.log = log
+        engine.log_error = log_error or log
+        return engine
+
+    # ----- 내 상품 불러오기 -----
+
+    def read_sell_rows(self, driver):
+        """열린 판매 목록(또는 내 상품 검색) 페이지의 상품 행 읽기 - (상품 목록, 전체 상품 수 또는 None)"""
+        with self.tracer.span("my_sell.parse", "parse"):
+            data = driver.execute_script(MY_SELL_SCRIPT, ROW_SELECTOR) or {}
+            match = TOTAL_COUNT_PATTERN.search(data.get('total') or '')
+            total = int(match.group(1).replace(',', '')) if match else None
+            return parse_sell_rows(data.get('rows'), self.product_id_prefix), total
+
+    @traced("my_sell.page")
+    def read_my_sell_page(self, driver, page, prepare=None):
+        """판매 목록 페이지 1개 읽기 - (상품 목록, 전체 상품 수 또는 None)
+        prepare(driver, page) 는 페이지 접속 후 행을 읽기 전에 호출 (정렬 버튼 클릭 등)"""
+        from selenium.webdriver.common.by import By
+        from selenium.webdriver.support.ui import WebDriverWait
+        from selenium.webdriver.support import expected_conditions as EC
+
+        self.rate_limiter.get_page('update', driver, MY_SELL_LIST_URL.format(page=page))
+        if prepare:
+            prepare(driver, page)
+        WebDriverWait(driver, 10).until(EC.presence_of_element_located((By.CSS_SELECTOR, ROW_SELECTOR)))
+        return self.read_sell_rows(driver)
+
+    def sync_my_products(self, driver, max_pages=None, should_stop=None, prepare=None, exclude_ids=(),
+                         on_page=None, retries=0):
+        """판매 중인 내 상품 전체 불러오기 (페이지당 100개, 마지막 페이지까지)
+        exclude_ids 의 상품은 건너뛰고, on_page(페이지, 지금까지 모은 상품, 전체 상품 수 또는 0) 는
+        페이지마다 호출 (GUI 진행률 표시/중간 저장용). 페이지 읽기 실패 시 retries 번까지 다시 시도"""
+        should_stop = should_stop or (lambda: False)
+        excluded = set(exclude_ids or ())
+        products = []
+        expected_total = 0
+        page = 1
+        while not should_stop() and (not max_pages or page <= max_pages):
+            self.log(f"🌐 내 상품 페이지 {page} 접속 중...")
+            page_products = None
+            for attempt in range(retries + 1):
+                try:
+                    page_products, total = self.read_my_sell_page(driver, page, prepare)
+                    break
+                except Exception as e:
+                    if attempt < retries:
+                        self.log(f"⚠️ 페이지 로딩 재시도 {attempt + 1}/{retries + 1}... ({str(e)[:50]})")
+                        self.tracer.sleep(5)
+                    else:
+                        self.log_error(f"❌ 상품 목록 크롤링 실패: {str(e)}")
+            if page_products is None:
+                break
+            if page == 1 and total is not None:
+                expected_total = total
+                self.log(f"📊 총 판매 중인 상품 수: {total}개")
+            row_count = len(page_products)
+            if excluded:
+                page_products = [product for product in page_products if product['product_id'] not in excluded]
+                if len(page_products) < row_count:
+                    self.log(f"⏭️ 제외된 상품 {row_count - len(page_products)}개 건너뛰기")
+            products.extend(page_products)
+            self.log(f"📦 진행 상황: {len(products)}개 상품 수집 완료")
+            if on_page:
+                on_page(page, products, expected_total)
+            if row_count < ROWS_PER_PAGE:
+                self.log("📃 마지막 페이지에 도달했습니다.")
+                break
+            page += 1
+        return products
+
+    @traced("my_sell.price")
+    def current_price(self, driver, product_name, product_id=None):
+        """내 상품 검색으로 현재가 조회 (상품ID 우선) - 로그인 세션 HTTP 조회를 먼저 시도하고
+        실패하면 브라우저로 검색 페이지를 읽는다 (찾지 못하면 None)"""
+        keyword = product_id or extract_product_id(product_name) or product_name
+        self.log(f"📋 현재가 조회: {keyword}")
+
+        if self.session_bridge is not None:
+            price = self.session_bridge.fetch_my_sell_price(keyword)
+            if price is not None:
+                return price
+
+        if not driver:
+            self.log_error("❌ 브라우저가 초기화되지 않았습니다.")
+            return None
+
+        from selenium.webdriver.common.by import By
+        from selenium.webdriver.support.ui import WebDriverWait
+        from selenium.webdriver.support import expected_conditions as EC
+
+        try:
+            self.rate_limiter.get_page('update', driver, MY_SELL_SEARCH_URL.format(keyword=quote(str(keyword))))
+            WebDriverWait(driver, 10).until(EC.presence_of_element_located((By.CSS_SELECTOR, ROW_SELECTOR)))
+            products, _ = self.read_sell_rows(driver)
+        except Exception as e:
+            self.log(f"⚠️ 검색 결과에서 가격을 찾을 수 없습니다: {str(e)}")
+            return None
+
+        if not products:
+            self.log("⚠️ 검색 결과에서 상품을 찾을 수 없습니다.")
+            return None
+        price = parse_price(products[0]['current_price'])
+        if not price:
+            self.log(f"⚠️ 가격 텍스트에서 숫자를 추출할 수 없습니다: {products[0]['current_price']}")
+            return None
+        return price
+
+    # ----- 최저가 검색 -----
+
+    def scan_search_pages(self, driver, search_name, sort=SORT_RELEVANCE, max_page=20, brand_name=""):
+        """검색 결과 페이지를 순서대로 확인하여 최저가 찾기
+        가격순(SORT_PRICE_ASC)이면 후보 상품이 나온 첫 페이지에서 종료,
+        관련도순이면 마지막 페이지(최대 max_page)까지 확인
+        name_matching 이면 검색어와 일치하는 상품만, 아니면 모든 상품이 최저가 후보
+        반환: {'lowest_price', 'found_products', 'tiles', 'pages', 'complete', 'failed'}"""
+        from selenium.webdriver.common.by import By
+        from selenium.webdriver.support.ui import WebDriverWait
+        from selenium.webdriver.support import expected_conditions as EC
+
+        page_number = 1
+        lowest_price = float('inf')
+        found_products = 0
+
+        observed_tiles = []  # 이번 검색에서 본 모든 경쟁사 상품 (카탈로그 저장용)
+        search_complete = False
+        search_failed = False
+        pages_visited = 0
+        matcher = NameMatcher(search_name, brand_name) if self.name_matching else None
+
+        already_visited_url = ""
+        while page_number <= max_page:
+
+            if search_name == "":
+                self.log("⚠️ 유효한 검색어가 없습니다.")
+                break
+
+            search_url = build_search_url(search_name, page_number, sort)
+            if self.cache_bust:
+                # 캐시 무효화를 위한 타임스탬프 추가
+                search_url = f"{search_url}?t={int(time.time())}"
+            self.log(f"🌐 페이지 {page_number} 접속: {search_url}")
+
+            try:
+                if self.cache_bust:
+                    # 브라우저 캐시 강제 새로고침
+                    driver.execute_script("window.location.reload(true);")
+                    self.tracer.sleep(1)
+                self.rate_limiter.get_page('search', driver, search_url)
+                pages_visited += 1
+            except Exception as e:
+                # 페이지 로딩 타임아웃 또는 네트워크 오류
+                self.log(f"⏱️ 페이지 {page_number} 로딩 실패: {str(e)}")
+                search_failed = True
+                break
+
+            current_url = driver.current_url
+            if current_url == already_visited_url:
+                self.log("🔄 동일한 페이지 URL 감지, 중복 방문 감지로 인해 다음 상품으로 넘어갑니다.")
+                break
+            already_visited_url = ""
+
+            # 상품이 없는 경우 처리
+            try:
+                driver.implicitly_wait(1)
+                if driver.find_element(By.CSS_SELECTOR, "a.search_requestlink_btn"):
+                    self.log(f"⚠️ 페이지 {page_number}: '{search_name}' 상품이 없습니다.")
+                    search_complete = True
+                    break
+            except Exception:
+                pass  # 요소가 없으면 계속 진행
+            finally:
+                driver.implicitly_wait(10)  # 기본 대기 시간 복원
+
+            try:
+                WebDriverWait(driver, 10).until(
+                    EC.presence_of_element_located((By.CSS_SELECTOR, "ul.product_lists"))
+                )
+
+                # 스크립트 1회 호출로 이름/가격/URL/판매자 일괄 추출
+                with self.tracer.span("search.parse", "parse"):
+                    tile_count, tiles = read_product_tiles(driver)
+                if not tile_count:
+                    self.log(f"⚠️ 페이지 {page_number}에서 상품을 찾을 수 없습니다.")
+                    break
+
+                self.log(f"📦 페이지 {page_number}에서 {tile_count}개 상품 발견")
+                observed_tiles.extend(tiles)
+
+                # 페이지 단위 토큰 매칭 (단어 순서/추가 수식어가 달라도 일치 판단)
+                page_matches = matcher.match_page(tiles) if matcher else [(tile, None) for tile in tiles]
+                for tile, score in page_matches:
+                    price = tile['price']
+                    if price < lowest_price:
+                        lowest_price = price
+                        detail = f" (일치도 {score:.2f})" if score is not None else ""
+                        self.log(f"💰 새로운 최저가 발견: ¥{price:,} - {tile['name'][:30]}...{detail}")
+                    found_products += 1
+
+                # 가격순이면 후보 상품이 나온 페이지 이후는 모두 더 비싸므로 종료
+                if sort == SORT_PRICE_ASC and page_matches:
+                    self.log(f"⏹️ 가격순 검색: 페이지 {page_number}에서 최저가 확정, 이후 페이지 생략")
+                    break
+
+                # 다음 페이지 확인 (li 개수가 120개면 다음 페이지 있음)
+                if tile_count >= 120:
+                    page_number += 1
+                    self.log(f"➡️ 다음 페이지({page_number})로 이동...")
+                    already_visited_url = current_url
+                else:
+                    self.log(f"✅ 모든 페이지 검색 완료 (총 {page_number} 페이지)")
+                    search_complete = True
+                    break
+
+            except Exception as e:
+                self.log_error(f"❌ 페이지 {page_number} 로딩 실패: {str(e)}")
+                continue
+
+        return {
+            'lowest_price': lowest_price if lowest_price != float('inf') else None,
+            'found_products': found_products,
+            'tiles': observed_tiles,
+            'pages': pages_visited,
+            'complete': search_complete,
+            'failed': search_failed,
+        }
+
+    @traced("search.product")
+    def lowest_price(self, driver, product_name, brand_name="", sort=None):
+        """상품명으로 경쟁사 최저가 찾기 - 카탈로그로 답할 수 있으면 실시간 검색 생략 (없으면 None)"""
+        try:
+            search_name = clean_search_name(product_name, self.english_only)
+            self.log(f"🔍 검색어: '{search_name}'")
+
+            answered, cached_price = self.catalog.lookup_lowest_price(search_name, brand_name,
+                                                                      covering=self.name_matching)
+            if answered:
+                self.log("📚 카탈로그 응답 (실시간 검색 생략): " +
+                         (f"최저가 ¥{cached_price:,}" if cached_price else "일치 상품 없음"))
+                return cached_price
+
+            if not driver:
+                self.log_error("❌ 브라우저가 초기화되지 않았습니다.")
+                return None
+
+            sort = sort or self.sort_mode
+            max_page = 20
+            if not self.name_matching:
+                # 상품명 검사 없이 가격순으로 보면 검색어의 아무 상품(액세서리 등)이 최저가가 되므로 관련도순 첫 페이지만 확인
+                sort, max_page = SORT_RELEVANCE, 1
+            started = time.monotonic()
+            result = self.scan_search_pages(driver, search_name, sort=sort, max_page=max_page, brand_name=brand_name)
+            self.search_stats.record_lookup(sort, time.monotonic() - started, result['pages'])
+
+            # 가격순 결과 일부를 전체 페이지 검색(관련도순)과 비교해 정렬 신뢰성 확인
+            if sort == SORT_PRICE_ASC and not result['failed'] and self.search_stats.should_verify():
+                self.log("🔬 가격순 검색 결과 검증: 전체 페이지 검색과 비교합니다.")
+                started = time.monotonic()
+                exhaustive = self.scan_search_pages(driver, search_name, sort=SORT_RELEVANCE, brand_name=brand_name)
+                self.search_stats.record_lookup(SORT_RELEVANCE, time.monotonic() - started, exhaustive['pages'])
+                if not exhaustive['failed']:
+                    if not self.search_stats.record_consistency(result['lowest_price'], exhaustive['lowest_price']):
+                        self.log(f"⚠️ 가격순 검색 불일치: 가격순 {result['lowest_price']} / 전체 {exhaustive['lowest_price']}")
+                    result = exhaustive
+
+            lowest_price = result['lowest_price']
+
+            # 검색 중 본 상품들을 카탈로그에 저장 (다음 검색 생략용)
+            if not result['failed']:
+                self.catalog.record_search(search_name, result['tiles'], lowest_price=lowest_price,
+                                           complete=result['complete'], brand=brand_name)
+
+            if lowest_price is not None:
+                self.log(f"🎉 검색 완료: 총 {result['found_products']}개 상품 중 최저가 ¥{lowest_price:,}")
+                return lowest_price
+            self.log(f"⚠️ '{search_name}' 상품을 찾을 수 없습니다.")
+            return None
+
+        except Exception as e:
+            self.log_error(f"❌ 가격 검색 오류: {str(e)}")
+            return None
+
+    @traced("search.favorite")
+    def favorite_lowest_price(self, driver, product_name, brand_name=""):
+        """주력상품 경쟁사 최저가 - 카탈로그 없이 항상 실시간 검색 (관련도순, 최대 favorite_pages 페이지)"""
+        try:
+            search_name = clean_search_name(product_name, self.english_only)
+            self.log(f"🔍 주력상품 검색어: '{search_name}'")
+            if not driver:
+                self.log_error("❌ 브라우저가 초기화되지 않았습니다.")
+                return None
+
+            result = self.scan_search_pages(driver, search_name, sort=SORT_RELEVANCE,
+                                            max_page=self.favorite_pages, brand_name=brand_name)
+            if result['lowest_price'] is not None:
+                self.log(f"🎉 검색 완료: 총 {result['found_products']}개 상품 중 최저가 ¥{result['lowest_price']:,}")
+            else:
+                self.log(f"⚠️ '{search_name}' 상품을 찾을 수 없습니다.")
+            return result['lowest_price']
+
+        except Exception as e:
+            self.log_error(f"❌ 주력상품 최저가 검색 오류: {str(e)}")
+            return None
+
+    # ----- 가격 분석 / 수정 -----
+
+    @traced("analyze.item")
+    def analyze_product(self, driver, product, discount, min_margin):
+        """상품 1개 가격 분석 - 수정 필요 여부 반환 (분석 실패 시 None)"""
+        lowest_price = self.lowest_price(driver, product.get('title', ''), product.get('brand', ''))
+        if not lowest_price or lowest_price <= 0:
+            product['status'] = '❌ 최저가 검색 실패'
+            product['needs_update'] = False
+            return None
+        needs_update = decide_price(product, lowest_price, discount, min_margin)
+        if self.history is not None:
+            self.history.record(product)
+        return needs_update
+
+    @traced("update.batch")
+    def reprice(self, driver, plan, should_stop=None):
+        """가격 수정 계획(RepricePlan)의 'update' 항목을 판매 목록 페이지 단위로 적용 - {상품ID: 결과}"""
+        page_loads = self.bulk_price_editor.stats['page_loads']
+        results = self.bulk_price_editor.apply(driver, plan.targets(), should_stop=should_stop)
+        plan.record(results, self.bulk_price_editor.stats['page_loads'] - page_loads)
+        return results
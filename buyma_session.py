@@ -0,0 +1,198 @@
+# BUYMA 자동화 프로그램 - 인증 HTTP 세션 모듈
+import re
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from job_executor import bind_current_job
+from lazy_imports import lazy_import
+
+# requests 는 첫 HTTP 조회 때 import (프로그램 시작 시간 단축)
+requests = lazy_import('requests')
+HTTPAdapter = lazy_import('requests.adapters', 'HTTPAdapter')
+Retry = lazy_import('urllib3.util.retry', 'Retry')
+
+
+BUYMA_BASE_URL = "https://www.buyma.com"
+
+# 내 상품 검색 결과의 가격 표시 요소
+MY_SELL_PRICE_PATTERN = re.compile(
+    r'<span[^>]*class="[^"]*js-item-price-display[^"]*"[^>]*>(.*?)</span>', re.S
+)
+
+
+def parse_my_sell_prices(html):
+    """/my/sell 페이지 HTML에서 가격 목록 추출 (표시 순서대로)"""
+    prices = []
+    for raw in MY_SELL_PRICE_PATTERN.findall(html or ""):
+        text = re.sub(r'<[^>]+>', '', raw)
+        numbers = re.findall(r'[\d,]+', text)
+        if numbers:
+            try:
+                prices.append(int(numbers[0].replace(',', '')))
+            except ValueError:
+                continue
+    return prices
+
+
+class BuymaSessionBridge:
+    """Selenium 로그인 쿠키를 requests.Session 으로 옮겨 인증 페이지를 HTTP로 읽는 클래스"""
+
+    def __init__(self, driver_getter, log=print, pool_size=8, timeout=10, rate_limiter=None):
+        self.driver_getter = driver_getter
+        self.log = log
+        self.rate_limiter = rate_limiter
+        self.pool_size = pool_size
+        self.timeout = timeout
+
+        self.session = None
+        self._driver_session_id = None
+        self._lock = threading.Lock()
+
+    def _build_session(self, user_agent=None):
+        """keep-alive 연결 풀 + 재시도 + gzip 설정된 세션 생성"""
+        session = requests.Session()
+
+        retry = Retry(
+            total=3,
+            backoff_factor=0.5,
+            status_forcelist=[429, 500, 502, 503, 504],
+            allowed_methods=["GET", "HEAD"],
+        )
+        adapter = HTTPAdapter(pool_connections=self.pool_size, pool_maxsize=self.pool_size, max_retries=retry)
+        session.mount("https://", adapter)
+        session.mount("http://", adapter)
+
+        session.headers.update({
+            'Accept-Encoding': 'gzip, deflate',
+            'Accept-Language': 'ja,ko;q=0.9,en;q=0.8',
+            'Connection': 'keep-alive',
+        })
+        if user_agent:
+            session.headers['User-Agent'] = user_agent
+
+        return session
+
+    def sync_from_driver(self, driver=None):
+        """브라우저 쿠키를 세션으로 복사 (로그인/브라우저 재시작 후 호출)"""
+        driver = driver or self.driver_getter()
+        if not driver:
+            return False
+
+        with self._lock:
+            try:
+                try:
+                    user_agent = driver.execute_script("return navigator.userAgent;")
+                except Exception:
+                    user_agent = None
+
+                session = self._build_session(user_agent)
+                for cookie in driver.get_cookies():
+                    session.cookies.set(
+                        cookie['name'],
+                        cookie['value'],
+                        domain=cookie.get('domain'),
+                        path=cookie.get('path', '/'),
+                    )
+
+                old_session = self.session
+                self.session = session
+                self._driver_session_id = getattr(driver, 'session_id', None)
+
+                if old_session:
+                    old_session.close()
+
+                self.log(f"🔗 HTTP 세션 동기화 완료 (쿠키 {len(session.cookies)}개)")
+                return True
+
+            except Exception as e:
+                self.log(f"⚠️ HTTP 세션 동기화 실패: {str(e)}")
+                return False
+
+    def invalidate(self):
+        """세션 폐기 (로그아웃 시)"""
+        with self._lock:
+            if self.session:
+                self.session.close()
+            self.session = None
+            self._driver_session_id = None
+
+    def _ensure_session(self):
+        """브라우저 세션이 바뀌었으면 쿠키 재동기화"""
+        driver = self.driver_getter()
+        current_id = getattr(driver, 'session_id', None) if driver else None
+
+        if self.session is None or (current_id and current_id != self._driver_session_id):
+            return self.sync_from_driver(driver)
+        return True
+
+    @staticmethod
+    def _is_login_redirect(response):
+        return "login" in response.url.lower()
+
+    def get(self, path_or_url, **kwargs):
+        """인증 GET 요청 - 로그인 페이지로 튕기면 1회 재동기화 후 재시도, 실패 시 None"""
+        url = path_or_url if path_or_url.startswith("http") else BUYMA_BASE_URL + path_or_url
+        if self.rate_limiter:
+            url = self.rate_limiter.rebase(url)
+        kwargs.setdefault('timeout', self.timeout)
+
+        if not self._ensure_session():
+            return None
+
+        for attempt in range(2):
+            if self.rate_limiter:
+                self.rate_limiter.acquire('my_sell')
+            start = time.monotonic()
+            try:
+                response = self.session.get(url, **kwargs)
+            except requests.exceptions.RequestException as e:
+                if self.rate_limiter:
+                    self.rate_limiter.observe('my_sell', status_code=599)
+                self.log(f"⚠️ HTTP 요청 실패: {str(e)}")
+                return None
+
+            if self.rate_limiter:
+                self.rate_limiter.observe('my_sell', status_code=response.status_code,
+                                          latency=time.monotonic() - start)
+
+            if response.status_code == 200 and not self._is_login_redirect(response):
+                if self.rate_limiter:
+                    self.rate_limiter.record_response(response)
+                return response
+
+            if attempt == 0 and self._is_login_redirect(response):
+                # 브라우저 쪽에서 쿠키가 갱신되었을 수 있으므로 다시 가져옴
+                if not self.sync_from_driver():
+                    return None
+                continue
+
+            return None
+
+        return None
+
+    def get_many(self, paths, max_workers=None):
+        """여러 인증 페이지를 동시에 조회 (입력 순서대로 응답 반환)"""
+        if not self._ensure_session():
+            return [None] * len(paths)
+
+        workers = max_workers or self.pool_size
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            return list(executor.map(bind_current_job(self.get), paths))
+
+    def is_session_valid(self):
+        """마이페이지 접근 가능 여부로 로그인 유지 확인"""
+        return self.get("/my/") is not None
+
+    def fetch_my_sell_price(self, keyword):
+        """내 상품 검색 결과의 첫 번째 상품 가격 조회 (HTTP) - 찾지 못하면 None"""
+        response = self.get("/my/sell/search", params={
+            'sale_kind': 'all',
+            'duty_kind': 'all',
+            'keyword': keyword,
+        })
+        if response is None:
+            return None
+
+        prices = parse_my_sell_prices(response.text)
+        return prices[0] if prices else None
@@ -6,7 +6,13 @@ a = Analysis(
     pathex=[],
     binaries=[],
     datas=[],
-    hiddenimports=[],
+    hiddenimports=[
+        # lazy_imports.py 로 처음 사용할 때 import 하는 모듈 (정적 분석에서 보이지 않음)
+        'psutil', 'requests', 'requests.adapters', 'urllib3.util.retry',
+        'selenium.webdriver', 'selenium.webdriver.chrome.service', 'selenium.webdriver.chrome.options',
+        'selenium.webdriver.common.by', 'selenium.webdriver.common.keys',
+        'selenium.webdriver.support.ui', 'selenium.webdriver.support.expected_conditions',
+    ],
     hookspath=[],
     hooksconfig={},
     runtime_hooks=[],
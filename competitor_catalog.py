@@ -0,0 +1,164 @@
+# BUYMA 자동화 프로그램 - 경쟁사 상품 카탈로그 모듈 (검색 결과 누적 저장)
+import re
+import sqlite3
+import threading
+import time
+
+from name_matcher import NameMatcher
+
+
+CATALOG_FILE = "경쟁사_카탈로그.db"
+
+
+def normalize_query(text):
+    """검색어/상품명 비교용 정규화 (소문자 + 공백 정리)"""
+    return re.sub(r'\s+', ' ', (text or "").lower()).strip()
+
+
+class CompetitorCatalog:
+    """검색 중 본 경쟁사 상품(이름, 가격, URL, 판매자, 확인 시각)을 SQLite에 쌓아두고
+    최근에 전체 검색한 검색어로 답할 수 있는 조회는 실시간 검색 없이 처리하는 클래스
+    최저가는 실시간 검색과 같은 NameMatcher(검색어, 브랜드) 기준으로 계산하므로 검색 기록은 브랜드별로 저장"""
+
+    def __init__(self, path=CATALOG_FILE, ttl_hours=6):
+        self.path = path
+        self.ttl_seconds = ttl_hours * 3600
+        self.stats = {'hits': 0, 'misses': 0}
+
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        columns = [row[1] for row in self._conn.execute("PRAGMA table_info(searches)")]
+        if columns and 'brand_norm' not in columns:
+            # 브랜드 구분 없는 이전 형식 - 검색 기록은 몇 시간짜리 캐시이므로 다시 쌓음
+            self._conn.execute("DROP TABLE searches")
+        self._conn.executescript("""
+            CREATE TABLE IF NOT EXISTS tiles (
+                item_url TEXT PRIMARY KEY,
+                name TEXT NOT NULL,
+                name_norm TEXT NOT NULL,
+                price INTEGER NOT NULL,
+                seller TEXT,
+                seen_at REAL NOT NULL
+            );
+            CREATE INDEX IF NOT EXISTS idx_tiles_seen_at ON tiles(seen_at);
+            CREATE TABLE IF NOT EXISTS searches (
+                query_norm TEXT NOT NULL,
+                brand_norm TEXT NOT NULL DEFAULT '',
+                searched_at REAL NOT NULL,
+                complete INTEGER NOT NULL,
+                lowest_price INTEGER,
+                PRIMARY KEY (query_norm, brand_norm)
+            );
+            CREATE TABLE IF NOT EXISTS search_tiles (
+                query_norm TEXT NOT NULL,
+                item_url TEXT NOT NULL,
+                PRIMARY KEY (query_norm, item_url)
+            );
+        """)
+        self._conn.commit()
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
+
+    def record_search(self, query, tiles, lowest_price=None, complete=True, seen_at=None, brand=""):
+        """검색 결과 저장 - tiles: [{'name', 'price', 'url', 'seller'}]
+        lowest_price 는 같은 검색어+브랜드 재조회 시 그대로 응답,
+        complete=True 는 마지막 페이지까지 검색했음을 의미 (더 구체적인 검색어도 응답 가능)"""
+        seen_at = seen_at or time.time()
+        rows = []
+        for tile in tiles:
+            name = (tile.get('name') or "").strip()
+            price = tile.get('price')
+            url = tile.get('url') or f"{name}|{price}"  # URL이 없으면 이름+가격으로 구분
+            if not name or not price:
+                continue
+            rows.append((url, name, normalize_query(name), int(price), tile.get('seller', ''), seen_at))
+
+        query_norm = normalize_query(query)
+        with self._lock:
+            self._conn.executemany("""
+                INSERT INTO tiles (item_url, name, name_norm, price, seller, seen_at)
+                VALUES (?, ?, ?, ?, ?, ?)
+                ON CONFLICT(item_url) DO UPDATE SET
+                    name = excluded.name, name_norm = excluded.name_norm,
+                    price = excluded.price, seller = excluded.seller, seen_at = excluded.seen_at
+            """, rows)
+            self._conn.execute("DELETE FROM search_tiles WHERE query_norm = ?", (query_norm,))
+            self._conn.executemany("INSERT OR IGNORE INTO search_tiles (query_norm, item_url) VALUES (?, ?)",
+                                   [(query_norm, row[0]) for row in rows])
+            self._conn.execute("""
+                INSERT INTO searches (query_norm, brand_norm, searched_at, complete, lowest_price) VALUES (?, ?, ?, ?, ?)
+                ON CONFLICT(query_norm, brand_norm) DO UPDATE SET
+                    searched_at = excluded.searched_at, complete = excluded.complete,
+                    lowest_price = excluded.lowest_price
+            """, (query_norm, normalize_query(brand), seen_at, 1 if complete else 0, lowest_price))
+            self._conn.commit()
+        return len(rows)
+
+    def _covering_search(self, query_norm, fresh_after):
+        """query 를 포함하는(더 넓은) 검색어 중 최근에 전체 검색한 것이 있는지 확인"""
+        row = self._conn.execute("""
+            SELECT query_norm FROM searches
+            WHERE complete = 1 AND searched_at >= ? AND instr(?, query_norm) > 0
+            ORDER BY searched_at DESC LIMIT 1
+        """, (fresh_after, query_norm)).fetchone()
+        return row[0] if row else None
+
+    def _covered_tiles(self, covering_norm, fresh_after):
+        """더 넓은 검색어의 검색 결과로 본 상품 중 최근 확인한 것 [{'name', 'price'}]"""
+        rows = self._conn.execute("""
+            SELECT t.name, t.price FROM search_tiles s JOIN tiles t ON t.item_url = s.item_url
+            WHERE s.query_norm = ? AND t.seen_at >= ?
+        """, (covering_norm, fresh_after)).fetchall()
+        return [{'name': name, 'price': price} for name, price in rows]
+
+    def lookup_lowest_price(self, query, brand="", now=None, covering=True):
+        """카탈로그로 최저가 응답 - (응답 가능 여부, 최저가 또는 None)
+        응답 가능하지만 일치 상품이 없으면 (True, None)
+        covering=False 면 같은 검색어+브랜드 기록만 사용 (상품명 검사 없이 검색하는 경우)"""
+        query_norm = normalize_query(query)
+        if not query_norm:
+            return False, None
+
+        fresh_after = (now or time.time()) - self.ttl_seconds
+        with self._lock:
+            # 1) 같은 검색어를 최근에 검색했으면 그 결과 그대로
+            row = self._conn.execute("""
+                SELECT lowest_price FROM searches WHERE query_norm = ? AND brand_norm = ? AND searched_at >= ?
+            """, (query_norm, normalize_query(brand), fresh_after)).fetchone()
+            if row:
+                self.stats['hits'] += 1
+                return True, row[0]
+
+            # 2) 더 넓은 검색어를 끝까지 검색했으면 그 결과 상품 중 실시간 검색과 같은 기준으로 일치하는 상품 최저가
+            covering_norm = self._covering_search(query_norm, fresh_after) if covering else None
+            if not covering_norm:
+                self.stats['misses'] += 1
+                return False, None
+            tiles = self._covered_tiles(covering_norm, fresh_after)
+            self.stats['hits'] += 1
+
+        prices = [tile['price'] for tile, _ in NameMatcher(query, brand).match_page(tiles)]
+        return True, (min(prices) if prices else None)
+
+    def prune(self, older_than_days=30):
+        """오래된 항목 정리"""
+        cutoff = time.time() - older_than_days * 86400
+        with self._lock:
+            self._conn.execute("DELETE FROM tiles WHERE seen_at < ?", (cutoff,))
+            self._conn.execute("DELETE FROM searches WHERE searched_at < ?", (cutoff,))
+            self._conn.execute("""
+                DELETE FROM search_tiles
+                WHERE query_norm NOT IN (SELECT query_norm FROM searches)
+                   OR item_url NOT IN (SELECT item_url FROM tiles)
+            """)
+            self._conn.commit()
+
+    def summary(self):
+        """카탈로그 크기와 캐시 적중률 문자열"""
+        with self._lock:
+            tiles = self._conn.execute("SELECT COUNT(*) FROM tiles").fetchone()[0]
+        total = self.stats['hits'] + self.stats['misses']
+        rate = (self.stats['hits'] / total * 100) if total else 0
+        return f"경쟁사 카탈로그 {tiles:,}개 상품, 검색 생략 {self.stats['hits']}/{total}회 ({rate:.0f}%)"
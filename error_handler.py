@@ -7,6 +7,8 @@ import os
 from datetime import datetime
 from PyQt6.QtWidgets import QMessageBox
 
+from rate_limiter import RateLimiterRegistry
+
 class ErrorHandler:
     """에러 처리 및 세션 관리 클래스"""
     
@@ -14,6 +16,8 @@ class ErrorHandler:
         self.main_window = main_window
         self.max_retries = 3
         self.retry_delay = 5
+        # 메인 창과 같은 속도 제한기를 공유 (없으면 자체 생성)
+        self.rate_limiter = getattr(main_window, 'rate_limiter', None) or RateLimiterRegistry()
     
     def check_session_validity(self, driver):
         """세션 유효성 확인"""
@@ -28,6 +32,12 @@ class ErrorHandler:
                 self.main_window.log_message("⚠️ 세션이 만료되었습니다.")
                 return False
             
+            # 로그인 쿠키를 공유하는 HTTP 세션이 있으면 페이지 이동 없이 확인
+            session_bridge = getattr(self.main_window, 'session_bridge', None)
+            if session_bridge and session_bridge.is_session_valid():
+                self.main_window.log_message("✅ 세션이 유효합니다.")
+                return True
+
             # 마이페이지 접근 테스트
             try:
                 original_url = current_url
@@ -83,23 +93,27 @@ class ErrorHandler:
             try:
                 self.main_window.log_message(f"🌐 네트워크 요청 시도 {attempt + 1}/{self.max_retries}: {url}")
                 
+                # 고정 대기 대신 속도 제한기가 응답 상태에 따라 다음 요청 간격을 조절
+                self.rate_limiter.acquire('http')
+                start = time.monotonic()
                 response = requests.get(url, timeout=timeout)
+                self.rate_limiter.observe('http', status_code=response.status_code,
+                                          latency=time.monotonic() - start)
                 
                 if response.status_code == 200:
                     self.main_window.log_message("✅ 네트워크 요청 성공")
                     return response
                 elif response.status_code == 429:  # Too Many Requests
-                    self.main_window.log_message("⚠️ 요청 제한 - 대기 후 재시도")
-                    time.sleep(30)  # 30초 대기
+                    self.main_window.log_message("⚠️ 요청 제한 - 속도를 낮춰 재시도")
                     continue
                 elif response.status_code == 503:  # Service Unavailable
-                    self.main_window.log_message("⚠️ 서비스 일시 중단 - 대기 후 재시도")
-                    time.sleep(60)  # 1분 대기
+                    self.main_window.log_message("⚠️ 서비스 일시 중단 - 속도를 낮춰 재시도")
                     continue
                 else:
                     self.main_window.log_message(f"⚠️ HTTP 오류 코드: {response.status_code}")
                     
             except requests.exceptions.Timeout:
+                self.rate_limiter.observe('http', status_code=599)
                 self.main_window.log_message(f"⏰ 타임아웃 발생 (시도 {attempt + 1}/{self.max_retries})")
                 if attempt < self.max_retries - 1:
                     time.sleep(self.retry_delay)
@@ -0,0 +1,407 @@
+# BUYMA 자동화 프로그램 - 브라우저 없이 HTML 로 동작하는 가짜 WebDriver 모듈 (추출 로직 테스트·벤치마크용)
+import re
+from functools import lru_cache
+from urllib.parse import urljoin
+
+import lxml.html
+from cssselect import HTMLTranslator
+
+from buyma_engine import MY_SELL_SCRIPT
+from bulk_price_editor import ROW_SCRIPT
+from page_fixtures import find_fixture
+from search_tiles import TILE_SCRIPT
+from variation_extractor import VARIATION_SCRIPT
+
+try:
+    from selenium.common.exceptions import NoSuchElementException
+except ImportError:  # selenium 없이 추출 로직만 테스트하는 환경
+    class NoSuchElementException(Exception):
+        pass
+
+
+# selenium By 값 (selenium 없이도 같은 문자열로 동작)
+CSS_SELECTOR = "css selector"
+XPATH = "xpath"
+
+# innerText 에서 줄을 나누는 요소
+BLOCK_TAGS = ('p', 'div', 'li', 'tr', 'td', 'th', 'ul', 'ol', 'table', 'h1', 'h2', 'h3', 'h4', 'section')
+
+# 클릭하면 같은 순서의 목록을 펼치고/닫는 버튼 (BUYMA 색상/사이즈 선택)
+DEFAULT_TOGGLES = {'p.colorsize_selector': 'ul.colorsize_list'}
+
+WHITESPACE = re.compile(r'\s+')  # HTML 원문의 줄바꿈/공백은 화면에서 공백 1개
+
+_translator = HTMLTranslator()
+
+
+@lru_cache(maxsize=512)
+def _xpath(by, value, relative):
+    """selenium 찾기 방식 → lxml XPath (요소 기준 검색은 하위 요소만)"""
+    prefix = 'descendant::' if relative else 'descendant-or-self::'
+    if by == CSS_SELECTOR:
+        return _translator.css_to_xpath(value, prefix=prefix)
+    if by == XPATH:
+        return value
+    if by == "id":
+        return _translator.css_to_xpath(f"#{value}", prefix=prefix)
+    if by == "name":
+        return f"{prefix}*[@name={_literal(value)}]"
+    if by == "class name":
+        return _translator.css_to_xpath(f".{value}", prefix=prefix)
+    if by == "tag name":
+        return f"{prefix}{value}"
+    if by == "link text":
+        return f"{prefix}a[normalize-space(.)={_literal(value)}]"
+    if by == "partial link text":
+        return f"{prefix}a[contains(., {_literal(value)})]"
+    raise ValueError(f"지원하지 않는 찾기 방식: {by}")
+
+
+def _literal(text):
+    if "'" not in text:
+        return f"'{text}'"
+    return "concat('" + "', \"'\", '".join(text.split("'")) + "')"
+
+
+def _hidden(node):
+    """style="display:none" / hidden 속성이 있는 요소 또는 그 하위 요소인지"""
+    while node is not None:
+        style = (node.get('style') or '').replace(' ', '').lower()
+        if 'display:none' in style or node.get('hidden') is not None:
+            return True
+        node = node.getparent()
+    return False
+
+
+def text_content(node):
+    """textContent - 숨김 여부와 관계없이 모든 텍스트"""
+    return node.text_content()
+
+
+def inner_text(node):
+    """innerText / WebElement.text 근사 - 숨겨진 요소는 빈 문자열, 줄 단위 공백 정리"""
+    if _hidden(node):
+        return ''
+    parts = []
+    for child in node.iter():
+        if isinstance(child.tag, str) and child.tag not in ('script', 'style') and not _hidden(child):
+            if child.tag == 'br' or child.tag in BLOCK_TAGS and child is not node:
+                parts.append('\n')
+            parts.append(WHITESPACE.sub(' ', child.text or ''))
+        if child is not node and child.tail and not _hidden(child.getparent()):
+            parts.append(WHITESPACE.sub(' ', child.tail))
+    lines = (re.sub(' +', ' ', line).strip() for line in ''.join(parts).split('\n'))
+    return '\n'.join(line for line in lines if line)
+
+
+class FakeElement:
+    """lxml 노드를 감싼 WebElement 대용"""
+
+    def __init__(self, driver, node):
+        self._driver = driver
+        self._node = node
+
+    def __eq__(self, other):
+        return isinstance(other, FakeElement) and other._node is self._node
+
+    def __hash__(self):
+        return hash(id(self._node))
+
+    @property
+    def tag_name(self):
+        return self._node.tag
+
+    @property
+    def text(self):
+        return inner_text(self._node)
+
+    def get_attribute(self, name):
+        node = self._node
+        if name == 'textContent':
+            return text_content(node)
+        if name == 'innerText':
+            return inner_text(node)
+        if name == 'innerHTML':
+            return (node.text or '') + ''.join(lxml.html.tostring(c, encoding='unicode') for c in node)
+        if name == 'outerHTML':
+            return lxml.html.tostring(node, encoding='unicode', with_tail=False)
+        if name in ('href', 'src') and node.get(name) is not None:
+            return urljoin(self._driver.current_url, node.get(name))
+        if name == 'value' and node.tag == 'textarea':
+            return node.text or ''
+        if name == 'checked':
+            return 'true' if node.get('checked') is not None else None
+        return node.get(name)
+
+    def is_displayed(self):
+        return not _hidden(self._node)
+
+    def is_selected(self):
+        return self._node.get('checked') is not None or self._node.get('selected') is not None
+
+    def is_enabled(self):
+        return self._node.get('disabled') is None
+
+    def find_element(self, by=CSS_SELECTOR, value=None):
+        return self._driver.execute('findChildElement', {'id': self, 'using': by, 'value': value})['value']
+
+    def find_elements(self, by=CSS_SELECTOR, value=None):
+        return self._driver.execute('findChildElements', {'id': self, 'using': by, 'value': value})['value']
+
+    def click(self):
+        self._driver.execute('clickElement', {'id': self})
+
+    def clear(self):
+        self._set_value('')
+
+    def send_keys(self, *values):
+        self._set_value((self.get_attribute('value') or '') + ''.join(str(v) for v in values))
+
+    def _set_value(self, value):
+        if self._node.tag == 'textarea':
+            self._node.text = value
+        else:
+            self._node.set('value', value)
+
+
+class FakeDriver:
+    """fixture HTML 위에서 find_element(s)/.text/get_attribute/click/execute_script 를 흉내 내는 WebDriver 대용
+    pages 는 {주소: HTML} 또는 주소 → HTML 함수. 모든 명령은 실제 드라이버처럼 execute(명령, 인자) 를 거치므로
+    Tracer.instrument_driver 로 명령 수를 셀 수 있다."""
+
+    def __init__(self, pages=None, toggles=None):
+        self.pages = pages if pages is not None else {}
+        self.toggles = dict(DEFAULT_TOGGLES if toggles is None else toggles)
+        self.scripts = dict(DEFAULT_SCRIPTS)
+        self.current_url = "about:blank"
+        self.visited = []
+        self.clicks = []
+        self.cookies = []
+        self._document = lxml.html.document_fromstring("<html><body></body></html>")
+        self._commands = {
+            'get': lambda p: self._load(p['url']),
+            'findElement': lambda p: self._find(p['using'], p['value'], None, single=True),
+            'findElements': lambda p: self._find(p['using'], p['value'], None),
+            'findChildElement': lambda p: self._find(p['using'], p['value'], p['id']._node, single=True),
+            'findChildElements': lambda p: self._find(p['using'], p['value'], p['id']._node),
+            'clickElement': lambda p: self._click(p['id']),
+            'executeScript': lambda p: self._run_script(p['script'], p['args']),
+            'getPageSource': lambda p: lxml.html.tostring(self._document, encoding='unicode'),
+            'getTitle': lambda p: self._document.findtext('.//title') or '',
+            'getCurrentUrl': lambda p: self.current_url,
+            'refresh': lambda p: self._load(self.current_url),
+            'quit': lambda p: None,
+        }
+
+    @classmethod
+    def from_fixtures(cls, directory, **kwargs):
+        """PageRecorder 로 기록한 폴더의 페이지를 주소로 찾아 여는 드라이버"""
+        def load(url):
+            path = find_fixture(directory, url)
+            if not path:
+                return None
+            with open(path, 'r', encoding='utf-8') as f:
+                return f.read()
+        return cls(load, **kwargs)
+
+    # ----- selenium 드라이버 인터페이스 -----
+
+    def execute(self, command, params=None):
+        if command not in self._commands:
+            raise NotImplementedError(f"FakeDriver 미지원 명령: {command}")
+        return {'value': self._commands[command](params or {})}
+
+    def get(self, url):
+        self.execute('get', {'url': url})
+
+    def find_element(self, by=CSS_SELECTOR, value=None):
+        return self.execute('findElement', {'using': by, 'value': value})['value']
+
+    def find_elements(self, by=CSS_SELECTOR, value=None):
+        return self.execute('findElements', {'using': by, 'value': value})['value']
+
+    def execute_script(self, script, *args):
+        return self.execute('executeScript', {'script': script, 'args': list(args)})['value']
+
+    @property
+    def page_source(self):
+        return self.execute('getPageSource')['value']
+
+    @property
+    def title(self):
+        return self.execute('getTitle')['value']
+
+    def refresh(self):
+        self.execute('refresh')
+
+    def back(self):
+        if len(self.visited) > 1:
+            self.visited.pop()
+            self._load(self.visited.pop())
+
+    def quit(self):
+        self.execute('quit')
+
+    def implicitly_wait(self, seconds):
+        pass
+
+    def set_page_load_timeout(self, seconds):
+        pass
+
+    def get_cookies(self):
+        return list(self.cookies)
+
+    def add_cookie(self, cookie):
+        self.cookies.append(dict(cookie))
+
+    def delete_all_cookies(self):
+        self.cookies = []
+
+    # ----- 내부 구현 -----
+
+    def _load(self, url):
+        html = self.pages(url) if callable(self.pages) else self.pages.get(url)
+        if html is None:
+            html = "<html><head><title>404 Not Found</title></head><body></body></html>"
+        self._document = lxml.html.document_fromstring(html or "<html></html>")
+        self.current_url = url
+        self.visited.append(url)
+
+    def _find(self, by, value, node, single=False):
+        root = self._document if node is None else node
+        nodes = root.xpath(_xpath(by, value, node is not None))
+        if single:
+            if not nodes:
+                raise NoSuchElementException(f"요소 없음: {by}={value}")
+            return FakeElement(self, nodes[0])
+        return [FakeElement(self, n) for n in nodes]
+
+    def _click(self, element):
+        """체크박스/라디오 선택, 등록된 토글 버튼은 대상 목록 표시 전환, 링크는 이동"""
+        node = element._node
+        self.clicks.append(element)
+        if node.tag == 'input' and node.get('type') in ('checkbox', 'radio'):
+            if node.get('checked') is None:
+                node.set('checked', 'checked')
+            elif node.get('type') == 'checkbox':
+                del node.attrib['checked']
+            return
+        for button_css, target_css in self.toggles.items():
+            buttons = self._document.xpath(_xpath(CSS_SELECTOR, button_css, False))
+            if node in buttons:
+                targets = self._document.xpath(_xpath(CSS_SELECTOR, target_css, False))
+                position = buttons.index(node)
+                if position < len(targets):
+                    target = targets[position]
+                    style = target.get('style') or ''
+                    if 'display:none' in style.replace(' ', ''):
+                        target.set('style', re.sub(r'display\s*:\s*none;?', '', style))
+                    else:
+                        target.set('style', 'display:none;' + style)
+                return
+        href = node.get('href')
+        if node.tag == 'a' and href and not href.startswith(('#', 'javascript:')):
+            self._load(urljoin(self.current_url, href))
+
+    def _run_script(self, script, args):
+        handler = self.scripts.get(script.strip())
+        if handler is None:
+            raise NotImplementedError(f"FakeDriver 미지원 스크립트: {script.strip()[:60]}")
+        return handler(self, *args)
+
+    def css(self, selector, node=None):
+        """CSS 선택자로 노드 목록 (스크립트 구현용)"""
+        root = self._document if node is None else node
+        return root.xpath(_xpath(CSS_SELECTOR, selector, node is not None))
+
+    def first(self, selector, node=None):
+        nodes = self.css(selector, node)
+        return nodes[0] if nodes else None
+
+    def absolute(self, href):
+        return urljoin(self.current_url, href) if href else ''
+
+
+# ----- 번들 스크립트의 Python 구현 (결과 형식은 브라우저 실행 결과와 동일) -----
+
+def _tile_script(driver):
+    product_list = driver.first('ul.product_lists')
+    if product_list is None:
+        return None
+    items = product_list.xpath('.//li')
+    tiles = []
+    for li in items:
+        name = driver.first('div.product_name', li)
+        if name is None:
+            continue
+        price = driver.first('span.Price_Txt', li)
+        link = driver.first('a', name)
+        seller = driver.first('.product_Buyer, .product_buyer, .buyer_name', li)
+        tiles.append({
+            'name': inner_text(name).strip(),
+            'price': inner_text(price).strip() if price is not None else '',
+            'url': driver.absolute(link.get('href')) if link is not None else '',
+            'seller': inner_text(seller).strip() if seller is not None else '',
+        })
+    return {'count': len(items), 'tiles': tiles}
+
+
+def _my_sell_script(driver, row_selector):
+    rows = []
+    for row in driver.css(row_selector):
+        link = driver.first('a.fab-design-d--b', row)
+        name = driver.first('td.item_name', row)
+        price = driver.first('span.js-item-price-display', row)
+        if link is None or name is None:
+            continue
+        rows.append({
+            'title': inner_text(name).strip(),
+            'price': inner_text(price).strip() if price is not None else '',
+            'url': driver.absolute(link.get('href')),
+        })
+    total = driver.first('p.itemedit_actions_nums')
+    return {'total': inner_text(total) if total is not None else '', 'rows': rows}
+
+
+def _row_script(driver, row_selector):
+    result = []
+    for index, row in enumerate(driver.css(row_selector)):
+        link = driver.first('a.fab-design-d--b', row)
+        price = driver.first('span.js-item-price-display', row)
+        match = re.search(r'/item/(\d+)/', driver.absolute(link.get('href'))) if link is not None else None
+        if not match:
+            continue
+        result.append({'index': index, 'product_id': match.group(1),
+                       'price': text_content(price) if price is not None else ''})
+    return result
+
+
+def _variation_script(driver):
+    def clean(text):
+        return re.sub(r'\s+', ' ', text or '').strip()
+
+    result = {'selectors': len(driver.css('p.colorsize_selector')), 'colors': [], 'sizes': [], 'embedded': []}
+    color_list = driver.first('ul.colorsize_list:not(.js-size-list)')
+    if color_list is not None:
+        for li in driver.css('li', color_list):
+            span = driver.first('span.item_color', li)
+            category = (span.get('class') or '').replace('item_color', '').strip() if span is not None else ''
+            result['colors'].append([category, clean(text_content(li))])
+    size_list = driver.first('.colorsize_list.js-size-list')
+    if size_list is not None:
+        result['sizes'] = [clean(text_content(li)) for li in driver.css('li', size_list)]
+    if not result['colors'] and not result['sizes']:
+        result['embedded'] = [text_content(s) for s in
+                              driver.css('script[type="application/ld+json"], script[type="application/json"]')]
+    return result
+
+
+DEFAULT_SCRIPTS = {
+    TILE_SCRIPT.strip(): _tile_script,
+    MY_SELL_SCRIPT.strip(): _my_sell_script,
+    ROW_SCRIPT.strip(): _row_script,
+    VARIATION_SCRIPT.strip(): _variation_script,
+    "return navigator.userAgent;": lambda driver: "Mozilla/5.0 (FakeDriver)",
+    "window.location.reload(true);": lambda driver: None,
+    "return document.readyState": lambda driver: "complete",
+}
@@ -0,0 +1,339 @@
+# BUYMA 자동화 프로그램 - 백그라운드 작업 실행 모듈 (스레드 풀 + 작업 목록 + 취소 토큰)
+import itertools
+import queue
+import threading
+import time
+
+
+QUEUED = 'queued'
+RUNNING = 'running'
+DONE = 'done'
+FAILED = 'failed'
+CANCELLED = 'cancelled'
+
+STATE_NAMES = {QUEUED: "대기", RUNNING: "실행 중", DONE: "완료", FAILED: "오류", CANCELLED: "중지됨"}
+
+
+class JobCancelled(BaseException):
+    """중지 요청을 받은 작업이 더 진행하면 안 되는 지점(페이지 이동 등)에서 발생
+    작업 함수 곳곳의 except Exception 에 잡혀 '오류'로 기록되거나 다음 상품으로 넘어가지 않도록
+    asyncio.CancelledError 처럼 BaseException 을 상속한다."""
+
+
+class CancelToken:
+    """작업 1개의 중지/일시정지 상태
+    sleep()/checkpoint() 는 중지·재개 요청 즉시 깨어나므로 긴 대기 중에도 중지가 바로 반영된다."""
+
+    def __init__(self):
+        self._condition = threading.Condition()
+        self._cancelled = False
+        self._paused = False
+
+    @property
+    def cancelled(self):
+        return self._cancelled
+
+    @property
+    def paused(self):
+        return self._paused and not self._cancelled
+
+    def cancel(self):
+        with self._condition:
+            self._cancelled = True
+            self._condition.notify_all()
+
+    def pause(self):
+        with self._condition:
+            self._paused = True
+
+    def resume(self):
+        with self._condition:
+            self._paused = False
+            self._condition.notify_all()
+
+    def checkpoint(self):
+        """일시정지 중이면 재개/중지까지 대기 - 계속 진행해도 되면 True"""
+        with self._condition:
+            self._condition.wait_for(lambda: self._cancelled or not self._paused)
+            return not self._cancelled
+
+    def sleep(self, seconds):
+        """최대 seconds 초 대기 (중지 요청 시 즉시 반환, 일시정지 중이면 재개까지 연장) - 계속 진행해도 되면 True"""
+        with self._condition:
+            self._condition.wait_for(lambda: self._cancelled, timeout=max(seconds, 0))
+        return self.checkpoint()
+
+
+class Job:
+    """실행기에 제출한 작업 1개 - 상태, 진행률, 소요 시간"""
+
+    def __init__(self, job_id, name, title):
+        self.id = job_id
+        self.name = name
+        self.title = title
+        self.token = CancelToken()
+        self.state = QUEUED
+        self.created = time.time()
+        self.started = None
+        self.finished = None
+        self.current = 0
+        self.total = 0
+        self.status = ""
+        self.error = None
+        self._done = threading.Event()
+
+    @property
+    def active(self):
+        return self.state in (QUEUED, RUNNING)
+
+    @property
+    def elapsed(self):
+        if self.started is None:
+            return 0.0
+        return (self.finished or time.time()) - self.started
+
+    @property
+    def rate(self):
+        """분당 처리 개수 (진행률 보고 기준)"""
+        return self.current / self.elapsed * 60 if self.elapsed > 0 else 0.0
+
+    def report(self, current, total=None, status=None):
+        self.current = current
+        if total is not None:
+            self.total = total
+        if status is not None:
+            self.status = status
+
+    def cancel(self):
+        self.token.cancel()
+
+    def wait(self, timeout=None):
+        """작업이 끝날 때까지 대기 - 끝났으면 True"""
+        return self._done.wait(timeout)
+
+    def describe(self):
+        text = f"{self.title} {STATE_NAMES[self.state]}"
+        if self.token.paused:
+            text += "(일시정지)"
+        if self.total:
+            text += f" {self.current}/{self.total}"
+        if self.state == RUNNING and self.current and self.elapsed >= 1:
+            text += f" ({self.rate:.1f}개/분)"
+        return text
+
+    def snapshot(self):
+        return {
+            'id': self.id, 'name': self.name, 'title': self.title, 'state': self.state,
+            'paused': self.token.paused, 'current': self.current, 'total': self.total,
+            'status': self.status, 'elapsed': self.elapsed, 'rate': self.rate, 'error': self.error,
+        }
+
+
+_local = threading.local()
+
+
+def current_job():
+    """지금 스레드에서 실행 중인 작업 (작업 스레드가 아니면 None)"""
+    return getattr(_local, 'job', None)
+
+
+def is_cancelled():
+    """지금 스레드의 작업이 중지 요청을 받았는지 (작업 스레드가 아니면 항상 False)"""
+    job = current_job()
+    return job is not None and job.token.cancelled
+
+
+def checkpoint():
+    """일시정지 중이면 대기 - 계속 진행해도 되면 True (작업 스레드가 아니면 항상 True)"""
+    job = current_job()
+    return job.token.checkpoint() if job is not None else True
+
+
+def cancellable_sleep(seconds):
+    """중지 요청에 바로 깨어나는 대기 - 계속 진행해도 되면 True (작업 스레드가 아니면 time.sleep)"""
+    job = current_job()
+    if job is None:
+        time.sleep(seconds)
+        return True
+    return job.token.sleep(seconds)
+
+
+def raise_if_cancelled():
+    """중지 요청을 받은 작업이면 JobCancelled - 되돌릴 수 없는 동작(페이지 이동, 가격 수정) 직전에 호출"""
+    if is_cancelled():
+        raise JobCancelled(f"작업 중지 요청 ({current_job().title})")
+
+
+def bind_current_job(fn):
+    """지금 스레드의 작업을 다른 스레드에서도 이어받도록 감싼 함수 (작업이 직접 만드는 보조 스레드용)
+    보조 스레드에서도 중지/일시정지가 그대로 반영된다."""
+    job = current_job()
+
+    def run(*args, **kwargs):
+        previous = current_job()
+        _local.job = job
+        try:
+            return fn(*args, **kwargs)
+        finally:
+            _local.job = previous
+
+    return run
+
+
+def report_progress(current, total=None, status=None):
+    """지금 스레드의 작업 진행률 기록 (작업 스레드가 아니면 무시)"""
+    job = current_job()
+    if job is not None:
+        job.report(current, total, status)
+
+
+class JobExecutor:
+    """백그라운드 작업 실행기 - 동시 실행 수 제한 스레드 풀 + 작업 목록
+    같은 이름의 작업이 이미 대기/실행 중이면 새로 제출하지 않아 작업이 쌓이지 않는다.
+    작업 스레드는 데몬 스레드 (브라우저 호출에서 멈춘 작업이 있어도 프로그램 종료를 막지 않음)
+    on_change(job) 는 작업 상태가 바뀔 때 작업 스레드에서 호출 (GUI 는 시그널 emit 을 넘김)"""
+
+    def __init__(self, max_workers=4, max_pending=4, history=50, log=None, on_change=None):
+        self.max_workers = max_workers
+        self.max_pending = max_pending
+        self.history = history
+        self.log = log or (lambda message: None)
+        self.on_change = on_change
+        self.paused = False
+        self._jobs = []
+        self._ids = itertools.count(1)
+        self._lock = threading.Lock()
+        self._queue = queue.Queue()
+        self._workers = []
+
+    def submit(self, name, fn, *args, title=None, **kwargs):
+        """작업 제출 - Job 반환 (같은 이름이 실행 중이거나 대기 작업이 너무 많으면 None)"""
+        title = title or name
+        with self._lock:
+            active = [job for job in self._jobs if job.active]
+            if any(job.name == name for job in active):
+                self.log(f"⚠️ '{title}' 작업이 이미 실행 중입니다.")
+                return None
+            if len(active) >= self.max_workers + self.max_pending:
+                self.log(f"⚠️ 실행/대기 중인 작업이 너무 많아 '{title}' 작업을 시작하지 않습니다.")
+                return None
+            job = Job(next(self._ids), name, title)
+            if self.paused:
+                job.token.pause()
+            self._jobs.append(job)
+            finished = [old for old in self._jobs if not old.active]
+            for old in finished[:max(len(finished) - self.history, 0)]:
+                self._jobs.remove(old)
+            if len(self._workers) < min(len(active) + 1, self.max_workers):
+                worker = threading.Thread(target=self._work, name=f"job-{len(self._workers) + 1}", daemon=True)
+                self._workers.append(worker)
+                worker.start()
+        self._notify(job)
+        self._queue.put((job, fn, args, kwargs))
+        return job
+
+    def _work(self):
+        while True:
+            item = self._queue.get()
+            if item is None:
+                return
+            self._run(*item)
+
+    def _run(self, job, fn, args, kwargs):
+        if job.token.cancelled:
+            self._finish(job, CANCELLED)
+            return
+        _local.job = job
+        job.state = RUNNING
+        job.started = time.time()
+        self._notify(job)
+        state = DONE
+        try:
+            fn(*args, **kwargs)
+        except JobCancelled:
+            pass
+        except Exception as e:
+            state = FAILED
+            job.error = str(e)
+            self.log(f"❌ '{job.title}' 작업 오류: {str(e)}")
+        finally:
+            _local.job = None
+        if state == DONE and job.token.cancelled:
+            state = CANCELLED
+        self._finish(job, state)
+
+    def _finish(self, job, state):
+        job.state = state
+        job.finished = time.time()
+        job._done.set()
+        self._notify(job)
+
+    def _notify(self, job):
+        if self.on_change:
+            try:
+                self.on_change(job.snapshot())
+            except Exception:
+                pass
+
+    def _select(self, name=None):
+        with self._lock:
+            return [job for job in self._jobs if job.active and (name is None or job.name == name)]
+
+    def find(self, name):
+        """대기/실행 중인 같은 이름의 작업 (없으면 None)"""
+        jobs = self._select(name)
+        return jobs[0] if jobs else None
+
+    def is_active(self, name):
+        return self.find(name) is not None
+
+    def active_jobs(self):
+        return self._select()
+
+    def jobs(self):
+        """최근 작업 목록 (끝난 작업 포함, 제출 순)"""
+        with self._lock:
+            return list(self._jobs)
+
+    def cancel(self, name=None):
+        """작업 중지 요청 (name 이 없으면 전체) - 중지 요청한 작업 수"""
+        jobs = self._select(name)
+        for job in jobs:
+            job.cancel()
+        return len(jobs)
+
+    def pause(self):
+        """실행 중인 작업 전체 일시정지 (대기 함수/체크포인트에서 멈춤)"""
+        self.paused = True
+        for job in self._select():
+            job.token.pause()
+
+    def resume(self):
+        self.paused = False
+        for job in self._select():
+            job.token.resume()
+
+    def wait(self, name=None, timeout=None):
+        """작업이 끝날 때까지 대기 - 모두 끝났으면 True"""
+        deadline = None if timeout is None else time.monotonic() + timeout
+        for job in self._select(name):
+            remaining = None if deadline is None else max(deadline - time.monotonic(), 0)
+            if not job.wait(remaining):
+                return False
+        return True
+
+    def summary(self):
+        """실행/대기 중인 작업 요약 (모니터링 화면용)"""
+        jobs = self._select()
+        return ", ".join(job.describe() for job in jobs) if jobs else "없음"
+
+    def shutdown(self, timeout=3.0):
+        """전체 중지 요청 후 최대 timeout 초 대기 - 모두 끝났으면 True"""
+        self.resume()
+        self.cancel()
+        finished = self.wait(timeout=timeout)
+        with self._lock:
+            for _ in self._workers:
+                self._queue.put(None)
+            self._workers = []
+        return finished
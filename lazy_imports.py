@@ -0,0 +1,72 @@
+# BUYMA 자동화 프로그램 - 무거운 모듈 지연 import 모듈 (시작 시간 단축)
+import importlib
+import threading
+
+
+class LazyModule:
+    """처음 사용할 때 import 하는 모듈(또는 모듈 속성) 대리 객체
+    requests.get(...), By.CSS_SELECTOR, WebDriverWait(driver, 10) 처럼 원래 이름 그대로 쓰면 되고,
+    except requests.exceptions.RequestException 도 그 시점에 실제 클래스로 바뀐다."""
+
+    def __init__(self, module_name, attribute=None):
+        self._module_name = module_name
+        self._attribute = attribute
+        self._target = None
+        self._lock = threading.Lock()
+
+    def _resolve(self):
+        if self._target is None:
+            with self._lock:
+                if self._target is None:
+                    target = importlib.import_module(self._module_name)
+                    if self._attribute:
+                        target = getattr(target, self._attribute)
+                    self._target = target
+        return self._target
+
+    @property
+    def loaded(self):
+        return self._target is not None
+
+    def __getattr__(self, name):
+        if name.startswith('__') and name.endswith('__'):
+            raise AttributeError(name)
+        return getattr(self._resolve(), name)
+
+    def __call__(self, *args, **kwargs):
+        return self._resolve()(*args, **kwargs)
+
+    def __repr__(self):
+        name = f"{self._module_name}.{self._attribute}" if self._attribute else self._module_name
+        return f"<LazyModule {name} ({'loaded' if self.loaded else 'not loaded'})>"
+
+
+_registry = []
+
+
+def lazy_import(module_name, attribute=None):
+    """지연 import 대리 객체 생성 - preload() 대상에 등록"""
+    module = LazyModule(module_name, attribute)
+    _registry.append(module)
+    return module
+
+
+def pending_modules():
+    """아직 import 하지 않은 지연 모듈 이름"""
+    return sorted({module._module_name for module in _registry if not module.loaded})
+
+
+def preload(log=None):
+    """등록된 지연 모듈을 백그라운드 스레드에서 미리 import (첫 화면 이후 호출 - 첫 사용 시 지연 제거)"""
+    log = log or (lambda message: None)
+
+    def run():
+        for module in list(_registry):
+            try:
+                module._resolve()
+            except Exception as e:
+                log(f"⚠️ 모듈 미리 불러오기 실패 ({module._module_name}): {str(e)}")
+
+    thread = threading.Thread(target=run, name="module-preload", daemon=True)
+    thread.start()
+    return thread
@@ -0,0 +1,97 @@
+# BUYMA 자동화 프로그램 - 탭 지연 생성 모듈 (처음 열 때 탭 내용 생성)
+import dis
+import time
+
+
+def stored_attributes(func):
+    """함수가 self.<이름> = ... 으로 만드는 속성 이름들
+    소스가 아니라 바이트코드에서 읽으므로 PyInstaller 실행 파일(소스 없음)에서도 동작한다."""
+    code = getattr(func, '__func__', func).__code__
+    names = set()
+    previous = None
+    for instruction in dis.get_instructions(code):
+        if instruction.opname == 'STORE_ATTR' and previous is not None and previous.opname.startswith('LOAD_FAST'):
+            target = previous.argval[-1] if isinstance(previous.argval, tuple) else previous.argval
+            if target == 'self':
+                names.add(instruction.argval)
+        previous = instruction
+    return names
+
+
+class LazyTabs:
+    """탭 내용을 처음 열 때(또는 그 탭의 위젯에 처음 접근할 때) 만드는 관리자
+    시작할 때는 빈 자리 위젯만 탭에 넣고, 생성 함수(create_*_tab)는 그대로 탭을 끝에 추가하게 둔 뒤
+    만들어진 내용을 빈 자리 위젯 안으로 옮긴다 - 탭 순서/번호는 처음부터 바뀌지 않는다.
+    placeholder 는 레이아웃이 있는 빈 위젯을 만드는 함수, on_built(key) 는 탭을 만든 직후 호출 (설정 값 적용 등)"""
+
+    def __init__(self, tab_widget, placeholder, on_built=None, log=None):
+        self.tab_widget = tab_widget
+        self.placeholder = placeholder
+        self.on_built = on_built
+        self.log = log or (lambda message: None)
+        self.built = []          # 만들어진 탭 key (만든 순서)
+        self.build_times = {}    # key -> 생성 소요 시간(초)
+        self._pending = {}       # key -> (빈 자리 위젯, 생성 함수)
+        self._owners = {}        # 속성 이름 -> 그 속성을 만드는 탭 key
+        self._keys = []          # 탭 번호 순서의 key
+
+    def add(self, key, title, builder, lazy=True):
+        """탭 등록 - lazy 가 아니면 바로 생성 (첫 화면에 보이는 탭 등)"""
+        self._keys.append(key)
+        if not lazy:
+            self._run(key, builder)
+            return
+        page = self.placeholder()
+        self.tab_widget.addTab(page, title)
+        self._pending[key] = (page, builder)
+        for name in stored_attributes(builder):
+            self._owners.setdefault(name, key)
+
+    def _run(self, key, builder):
+        started = time.perf_counter()
+        builder()
+        self.build_times[key] = time.perf_counter() - started
+        self.built.append(key)
+        if self.on_built:
+            self.on_built(key)
+
+    def build(self, key):
+        """아직 만들지 않은 탭이면 지금 생성 - 생성했으면 True"""
+        if key not in self._pending:
+            return False
+        page, builder = self._pending.pop(key)
+        for name in [name for name, owner in self._owners.items() if owner == key]:
+            del self._owners[name]
+
+        def build_into_placeholder():
+            builder()
+            # 생성 함수가 끝에 추가한 탭을 빼서 빈 자리 위젯 안으로 옮김
+            last = self.tab_widget.count() - 1
+            content = self.tab_widget.widget(last)
+            self.tab_widget.removeTab(last)
+            page.layout().addWidget(content)
+
+        self._run(key, build_into_placeholder)
+        self.log(f"🗂️ '{key}' 탭 생성 ({self.build_times[key] * 1000:.0f}ms)")
+        return True
+
+    def build_index(self, index):
+        """탭 번호로 생성 (탭 전환 시그널용)"""
+        if 0 <= index < len(self._keys):
+            return self.build(self._keys[index])
+        return False
+
+    def build_all(self):
+        for key in list(self._pending):
+            self.build(key)
+
+    def owner_of(self, name):
+        """아직 만들지 않은 탭 중 이 속성을 만드는 탭 key (없으면 None)"""
+        return self._owners.get(name)
+
+    def is_built(self, key):
+        return key in self.built
+
+    @property
+    def pending(self):
+        return list(self._pending)
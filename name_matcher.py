@@ -0,0 +1,70 @@
+# BUYMA 자동화 프로그램 - 경쟁사 상품명 매칭 모듈 (토큰 역색인)
+import re
+import unicodedata
+from collections import Counter
+
+
+# ★☆ 등 상품명 장식 기호와 구분자는 공백으로 취급
+DECORATION_PATTERN = re.compile(r'[★☆◆◇■□●○♪※【】\[\]()（）「」『』/|,・･:;!?"\'+&-]')
+SPACE_PATTERN = re.compile(r'\s+')
+
+
+def normalize_name(text):
+    """상품명 비교용 정규화 - 전각/반각 통일(NFKC), 소문자, 장식 기호 제거, 공백 정리"""
+    text = unicodedata.normalize('NFKC', text or "").lower()
+    text = DECORATION_PATTERN.sub(' ', text)
+    return SPACE_PATTERN.sub(' ', text).strip()
+
+
+def tokenize(text):
+    """정규화한 상품명을 토큰 목록으로 분리"""
+    normalized = normalize_name(text)
+    return normalized.split(' ') if normalized else []
+
+
+class NameMatcher:
+    """검색어 토큰 집합과 결과 페이지 상품명의 토큰 겹침 + 브랜드 일치로 점수를 매기는 클래스
+    단어 순서나 추가 수식어가 달라도 검색어 토큰이 대부분 들어 있으면 일치로 판단"""
+
+    def __init__(self, query, brand="", threshold=0.75, brand_weight=0.2):
+        self.query_tokens = set(tokenize(query))
+        self.brand_tokens = set(tokenize(brand))
+        self.threshold = threshold
+        self.brand_weight = brand_weight if self.brand_tokens else 0.0
+
+    def build_index(self, tiles):
+        """결과 페이지의 상품명 역색인 {토큰: [타일 위치]} - 페이지당 1회 생성"""
+        index = {}
+        for position, tile in enumerate(tiles):
+            for token in set(tokenize(tile.get('name'))):
+                index.setdefault(token, []).append(position)
+        return index
+
+    def score_page(self, tiles):
+        """페이지의 모든 상품 점수 {타일 위치: 점수} - 검색어 토큰이 하나도 없는 상품은 제외"""
+        if not self.query_tokens:
+            return {}
+
+        index = self.build_index(tiles)
+        overlap = Counter()
+        for token in self.query_tokens:
+            overlap.update(index.get(token, ()))
+
+        brand_positions = None
+        if self.brand_tokens:
+            brand_positions = set.intersection(*(set(index.get(token, ())) for token in self.brand_tokens))
+
+        query_size = len(self.query_tokens)
+        scores = {}
+        for position, count in overlap.items():
+            score = (1.0 - self.brand_weight) * count / query_size
+            if brand_positions is not None and position in brand_positions:
+                score += self.brand_weight
+            scores[position] = score
+        return scores
+
+    def match_page(self, tiles):
+        """기준 점수 이상인 상품 [(타일, 점수)] - 페이지 내 순서 유지"""
+        scores = self.score_page(tiles)
+        return [(tiles[position], scores[position])
+                for position in sorted(scores) if scores[position] >= self.threshold]
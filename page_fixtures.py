@@ -0,0 +1,186 @@
+# BUYMA 자동화 프로그램 - 페이지 기록 / 재생 서버 모듈 (네트워크 없이 추출 로직 테스트·벤치마크)
+import argparse
+import hashlib
+import json
+import os
+import re
+import threading
+import time
+from urllib.parse import parse_qsl, unquote, urlencode, urlsplit
+
+
+LIVE_BASE_URL = "https://www.buyma.com"
+FIXTURE_DIR = "페이지_기록"
+INDEX_FILE = "index.json"
+
+# 캐시 무효화용 파라미터는 같은 페이지로 취급
+IGNORED_PARAMS = ('t',)
+
+CONTENT_TYPES = {'.html': "text/html; charset=utf-8", '.json': "application/json; charset=utf-8"}
+
+
+def rebase(url, base_url):
+    """BUYMA 주소를 다른 기본 주소(재생 서버 등)로 바꾸기 - base_url 이 없으면 그대로"""
+    if not base_url or not url.startswith(LIVE_BASE_URL):
+        return url
+    return base_url.rstrip('/') + url[len(LIVE_BASE_URL):]
+
+
+def fixture_name(url):
+    """주소 → 기록 파일 이름 (확장자 제외) - 호스트/#조각/캐시 무효화 파라미터는 무시
+    같은 경로와 쿼리면 실제 BUYMA 주소와 재생 서버 주소가 같은 이름이 된다."""
+    parts = urlsplit(url)
+    path = re.sub(r'[^0-9A-Za-z._-]+', '_', unquote(parts.path).strip('/')) or 'index'
+    params = sorted((k, v) for k, v in parse_qsl(parts.query, keep_blank_values=True) if k not in IGNORED_PARAMS)
+    if len(path) > 80:
+        path = path[:60] + '_' + hashlib.sha1(path.encode('utf-8')).hexdigest()[:10]
+    if params:
+        path += '__' + hashlib.sha1(urlencode(params).encode('utf-8')).hexdigest()[:10]
+    return path
+
+
+def find_fixture(directory, url):
+    """주소(또는 요청 경로)에 해당하는 기록 파일 경로 (없으면 None)"""
+    name = fixture_name(url)
+    for ext in CONTENT_TYPES:
+        candidate = os.path.join(directory, name + ext)
+        if os.path.exists(candidate):
+            return candidate
+    return None
+
+
+class PageRecorder:
+    """브라우저/HTTP 응답을 주소별 파일로 저장 (index.json 에 원래 주소와 저장 시각 기록)"""
+
+    def __init__(self, directory=FIXTURE_DIR, log=None):
+        self.directory = directory
+        self.log = log or (lambda message: None)
+        self.saved = 0
+        self._lock = threading.Lock()
+        os.makedirs(directory, exist_ok=True)
+
+    def _index_path(self):
+        return os.path.join(self.directory, INDEX_FILE)
+
+    def save(self, url, body, content_type="text/html"):
+        """응답 본문 1개 저장 - 저장한 파일 경로 반환"""
+        ext = '.json' if 'json' in (content_type or '') else '.html'
+        name = fixture_name(url) + ext
+        path = os.path.join(self.directory, name)
+        with self._lock:
+            with open(path, 'w', encoding='utf-8') as f:
+                f.write(body or '')
+            index = {}
+            if os.path.exists(self._index_path()):
+                try:
+                    with open(self._index_path(), 'r', encoding='utf-8') as f:
+                        index = json.load(f)
+                except ValueError:
+                    index = {}
+            index[name] = {'url': url, 'saved_at': time.time()}
+            with open(self._index_path(), 'w', encoding='utf-8') as f:
+                json.dump(index, f, ensure_ascii=False, indent=2)
+            self.saved += 1
+        return path
+
+    def record_driver(self, driver, url=None):
+        """브라우저에 열린 페이지 저장 (url 을 주면 그 주소 기준, 리다이렉트 전 주소 유지용)"""
+        try:
+            return self.save(url or driver.current_url, driver.page_source)
+        except Exception as e:
+            self.log(f"⚠️ 페이지 기록 실패: {str(e)}")
+            return None
+
+    def record_response(self, response):
+        """requests 응답 저장 (XHR/HTTP 조회)"""
+        try:
+            return self.save(response.url, response.text, response.headers.get('Content-Type', ''))
+        except Exception as e:
+            self.log(f"⚠️ 응답 기록 실패: {str(e)}")
+            return None
+
+
+class FixtureServer:
+    """기록한 페이지를 원래 주소 형태 그대로 돌려주는 로컬 HTTP 재생 서버
+    base_url 을 속도 제한기/엔진의 기본 주소로 지정하면 네트워크 없이 같은 흐름을 실행할 수 있다."""
+
+    def __init__(self, directory=FIXTURE_DIR, host="127.0.0.1", port=0):
+        # http.server 는 재생할 때만 필요 - GUI 시작 시 import 하지 않음 (rate_limiter 가 rebase 를 쓰므로)
+        from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+        self.directory = directory
+        self.stats = {'hits': 0, 'misses': 0}
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                server._serve(self)
+
+            def log_message(self, format, *args):
+                pass  # 요청마다 stderr 출력하지 않음
+
+        self._httpd = ThreadingHTTPServer((host, port), Handler)
+        self._thread = None
+
+    @property
+    def base_url(self):
+        host, port = self._httpd.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def find(self, path):
+        """요청 경로에 해당하는 기록 파일 (없으면 None)"""
+        return find_fixture(self.directory, path)
+
+    def _serve(self, handler):
+        path = self.find(handler.path)
+        if not path:
+            self.stats['misses'] += 1
+            handler.send_error(404)
+            return
+        self.stats['hits'] += 1
+        with open(path, 'rb') as f:
+            body = f.read()
+        handler.send_response(200)
+        handler.send_header("Content-Type", CONTENT_TYPES[os.path.splitext(path)[1]])
+        handler.send_header("Content-Length", str(len(body)))
+        handler.end_headers()
+        handler.wfile.write(body)
+
+    def start(self):
+        """백그라운드 스레드에서 서버 시작 - base_url 반환"""
+        self._thread = threading.Thread(target=self._httpd.serve_forever, daemon=True)
+        self._thread.start()
+        return self.base_url
+
+    def stop(self):
+        self._httpd.shutdown()
+        self._httpd.server_close()
+
+    def __enter__(self):
+        self.start()
+        return self
+
+    def __exit__(self, *exc):
+        self.stop()
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="기록한 BUYMA 페이지 재생 서버")
+    parser.add_argument('--dir', default=FIXTURE_DIR, help="기록 폴더")
+    parser.add_argument('--host', default="127.0.0.1")
+    parser.add_argument('--port', type=int, default=8765)
+    args = parser.parse_args(argv)
+
+    server = FixtureServer(args.dir, args.host, args.port)
+    print(f"▶️ 재생 서버: {server.base_url} (폴더: {args.dir}) - Ctrl+C 로 종료")
+    try:
+        server._httpd.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server._httpd.server_close()
+        print(f"⏹️ 재생 서버 종료 (응답 {server.stats['hits']}회, 없음 {server.stats['misses']}회)")
+
+
+if __name__ == "__main__":
+    main()
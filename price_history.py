@@ -0,0 +1,142 @@
+# BUYMA 자동화 프로그램 - 가격 이력 저장소 모듈 (상품별 확인 시계열)
+import json
+import sqlite3
+import threading
+import time
+from datetime import datetime
+
+from product_index import product_id_of
+from search_tiles import parse_price
+
+
+HISTORY_FILE = "가격_이력.db"
+
+
+def _to_int(value):
+    if value is None or value == "":
+        return None
+    if isinstance(value, (int, float)):
+        return int(value)
+    return parse_price(str(value))
+
+
+class PriceHistory:
+    """가격 분석 결과를 상품별로 한 줄씩 SQLite 에 쌓는 시계열 저장소
+    스냅샷 JSON 전체를 읽지 않고 최근 가격, 기간별 최저/최고, 변동률을 인덱스로 조회"""
+
+    def __init__(self, path=HISTORY_FILE):
+        self.path = path
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.executescript("""
+            CREATE TABLE IF NOT EXISTS price_checks (
+                product_id TEXT NOT NULL,
+                checked_at REAL NOT NULL,
+                current_price INTEGER,
+                lowest_price INTEGER,
+                suggested_price INTEGER,
+                price_difference INTEGER,
+                status TEXT
+            );
+            CREATE UNIQUE INDEX IF NOT EXISTS idx_checks_product_time ON price_checks(product_id, checked_at);
+            CREATE INDEX IF NOT EXISTS idx_checks_time ON price_checks(checked_at);
+        """)
+        self._conn.commit()
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
+
+    @staticmethod
+    def _row(product, checked_at):
+        product_id = product_id_of(product)
+        if not product_id:
+            return None
+        return (product_id, checked_at, _to_int(product.get('current_price')), _to_int(product.get('lowest_price')),
+                _to_int(product.get('suggested_price')), _to_int(product.get('price_difference')),
+                product.get('status', ''))
+
+    def record(self, product, checked_at=None):
+        """분석한 상품 1개 기록 - 상품ID 가 없으면 False"""
+        return self.record_many([product], checked_at) == 1
+
+    def record_many(self, products, checked_at=None):
+        """상품 여러 개를 같은 시각으로 기록 (같은 상품/시각은 한 번만) - 기록한 개수 반환"""
+        checked_at = checked_at or time.time()
+        rows = [row for row in (self._row(product, checked_at) for product in products) if row]
+        with self._lock:
+            before = self._conn.total_changes
+            self._conn.executemany("INSERT OR IGNORE INTO price_checks VALUES (?, ?, ?, ?, ?, ?, ?)", rows)
+            self._conn.commit()
+            return self._conn.total_changes - before
+
+    def import_snapshot(self, path):
+        """상품정보_*.json 스냅샷의 분석 결과를 수집 시각으로 기록 (이미 있는 기록은 무시)"""
+        with open(path, 'r', encoding='utf-8') as f:
+            data = json.load(f)
+        if isinstance(data, list):
+            products, checked_at = data, None
+        else:
+            products = data.get("상품_목록", [])
+            info = data.get("수집_정보") or data  # 수집 날짜/시간이 최상위 또는 수집_정보 안에 있음
+            try:
+                checked_at = datetime.strptime(
+                    f"{info.get('수집_날짜')} {info.get('수집_시간')}", '%Y-%m-%d %H:%M:%S'
+                ).timestamp()
+            except (TypeError, ValueError):
+                checked_at = None
+        analyzed = [product for product in products if _to_int(product.get('lowest_price'))]
+        return self.record_many(analyzed, checked_at)
+
+    def last(self, product_id):
+        """가장 최근 기록 dict (없으면 None)"""
+        with self._lock:
+            cursor = self._conn.execute("""
+                SELECT * FROM price_checks WHERE product_id = ? ORDER BY checked_at DESC LIMIT 1
+            """, (str(product_id),))
+            row = cursor.fetchone()
+            columns = [column[0] for column in cursor.description]
+        return dict(zip(columns, row)) if row else None
+
+    def last_checked_map(self):
+        """{상품ID: 마지막 확인 시각} - 스케줄러가 한 번에 조회"""
+        with self._lock:
+            return dict(self._conn.execute(
+                "SELECT product_id, MAX(checked_at) FROM price_checks GROUP BY product_id"
+            ).fetchall())
+
+    def window(self, product_id, days=7, now=None):
+        """최근 days 일 동안의 경쟁사 최저가 통계 {'count', 'min', 'max', 'first', 'last'}"""
+        since = (now or time.time()) - days * 86400
+        with self._lock:
+            rows = self._conn.execute("""
+                SELECT lowest_price FROM price_checks
+                WHERE product_id = ? AND checked_at >= ? AND lowest_price IS NOT NULL
+                ORDER BY checked_at
+            """, (str(product_id), since)).fetchall()
+        prices = [row[0] for row in rows]
+        if not prices:
+            return {'count': 0, 'min': None, 'max': None, 'first': None, 'last': None}
+        return {'count': len(prices), 'min': min(prices), 'max': max(prices), 'first': prices[0], 'last': prices[-1]}
+
+    def change_rate(self, product_id, days=7, now=None):
+        """최근 days 일 동안 경쟁사 최저가 변동률 (마지막/처음 - 1), 기록이 2개 미만이면 None"""
+        stats = self.window(product_id, days, now)
+        if stats['count'] < 2 or not stats['first']:
+            return None
+        return stats['last'] / stats['first'] - 1
+
+    def prune(self, older_than_days=365):
+        """오래된 기록 정리"""
+        cutoff = time.time() - older_than_days * 86400
+        with self._lock:
+            self._conn.execute("DELETE FROM price_checks WHERE checked_at < ?", (cutoff,))
+            self._conn.commit()
+
+    def summary(self):
+        """저장된 기록 수 / 상품 수 문자열"""
+        with self._lock:
+            rows, products = self._conn.execute(
+                "SELECT COUNT(*), COUNT(DISTINCT product_id) FROM price_checks"
+            ).fetchone()
+        return f"가격 이력 {rows:,}건 ({products:,}개 상품)"
@@ -0,0 +1,92 @@
+# BUYMA 자동화 프로그램 - 내 상품 조회 인덱스 모듈
+import re
+
+from name_matcher import normalize_name
+
+
+TITLE_ID_PATTERN = re.compile(r'商品ID[:：\s]*(\d+)')
+
+
+def title_key(title):
+    """제목 비교용 키 - 商品ID 앞부분만 정규화"""
+    return normalize_name((title or "").split("商品ID")[0])
+
+
+def product_id_of(product):
+    """상품 dict 의 상품ID - product_id 필드 우선, 없으면 제목의 商品ID"""
+    product_id = str(product.get('product_id') or '').strip()
+    if product_id.isdigit():
+        return product_id
+    match = TITLE_ID_PATTERN.search(product.get('title') or product.get('name') or '')
+    return match.group(1) if match else None
+
+
+class ProductIndex:
+    """all_products 의 상품 dict 를 상품ID / 정규화 제목으로 바로 찾는 인덱스
+    dict 는 복사하지 않고 참조만 보관하므로 분석 결과를 쓰면 all_products 에 그대로 반영된다.
+    현재 화면에 표시된 페이지의 행 ↔ 상품 매핑도 함께 관리 (테이블 셀을 다시 읽지 않도록)"""
+
+    def __init__(self, products=None):
+        self.rebuild(products or [])
+
+    def rebuild(self, products):
+        """전체 상품 목록이 바뀌었을 때 인덱스 재생성"""
+        by_id, by_title, positions = {}, {}, {}
+        for position, product in enumerate(products):
+            self._register(product, position, by_id, by_title, positions)
+        # 다른 스레드에서 읽는 중일 수 있으므로 완성된 인덱스로 한 번에 교체
+        self._by_id, self._by_title, self._positions = by_id, by_title, positions
+        self._view = []
+        self._view_rows = {}
+
+    @staticmethod
+    def _register(product, position, by_id, by_title, positions):
+        product_id = product_id_of(product)
+        if product_id:
+            by_id[product_id] = product
+        key = title_key(product.get('title') or product.get('name'))
+        if key:
+            by_title.setdefault(key, product)
+        positions[id(product)] = position
+
+    def add(self, product):
+        """상품 1개 추가 등록 (all_products 끝에 추가한 경우)"""
+        self._register(product, len(self._positions), self._by_id, self._by_title, self._positions)
+
+    def __len__(self):
+        return len(self._positions)
+
+    def get(self, product_id):
+        """상품ID로 조회"""
+        return self._by_id.get(str(product_id)) if product_id else None
+
+    def find(self, name_or_id):
+        """상품명(商品ID 포함 가능) 또는 상품ID로 조회 - 商品ID 우선, 없으면 정규화 제목"""
+        text = str(name_or_id or '')
+        if text.isdigit():
+            return self.get(text)
+        match = TITLE_ID_PATTERN.search(text)
+        if match and match.group(1) in self._by_id:
+            return self._by_id[match.group(1)]
+        return self._by_title.get(title_key(text))
+
+    def position(self, product):
+        """all_products 안의 위치 (없으면 None)"""
+        return self._positions.get(id(product))
+
+    def set_view(self, products):
+        """테이블에 표시한 페이지의 상품 목록 (행 순서) 등록"""
+        self._view = list(products)
+        self._view_rows = {id(product): row for row, product in enumerate(self._view)}
+
+    def product_at_row(self, row):
+        """현재 화면 행의 상품 (없으면 None)"""
+        return self._view[row] if 0 <= row < len(self._view) else None
+
+    def row_of(self, product):
+        """상품이 현재 화면에 표시된 행 (다른 페이지면 None)"""
+        return self._view_rows.get(id(product))
+
+    def view_items(self):
+        """현재 화면의 (행, 상품) 목록"""
+        return list(enumerate(self._view))
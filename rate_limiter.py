@@ -0,0 +1,188 @@
+# BUYMA 자동화 프로그램 - 적응형 요청 속도 제한 모듈
+import threading
+import time
+
+from job_executor import cancellable_sleep, raise_if_cancelled
+from page_fixtures import rebase
+from tracing import Tracer
+
+
+# 차단/캡차 페이지 판별용 키워드 (페이지 제목 또는 URL)
+BLOCK_KEYWORDS = ('captcha', 'recaptcha', 'access denied', 'too many requests',
+                  'アクセスが集中', 'しばらく時間をおいて')
+
+# 엔드포인트 종류별 기본 설정 (초당 요청 수)
+DEFAULT_LIMITS = {
+    'crawl':   {'initial_rate': 0.5, 'min_rate': 0.05, 'max_rate': 1.0},   # 상품 상세 페이지
+    'search':  {'initial_rate': 0.5, 'min_rate': 0.05, 'max_rate': 1.0},   # 경쟁사 검색 페이지
+    'update':  {'initial_rate': 0.33, 'min_rate': 0.05, 'max_rate': 0.5},  # 가격 수정 (/my/sell)
+    'my_sell': {'initial_rate': 2.0, 'min_rate': 0.1, 'max_rate': 5.0},    # 인증 HTTP 조회
+    'http':    {'initial_rate': 1.0, 'min_rate': 0.02, 'max_rate': 5.0},   # 기타 HTTP 요청
+}
+
+
+def is_block_page(*texts):
+    """페이지 제목/URL에 차단 또는 캡차 표시가 있는지 확인"""
+    for text in texts:
+        lowered = (text or "").lower()
+        if any(keyword.lower() in lowered for keyword in BLOCK_KEYWORDS):
+            return True
+    return False
+
+
+class AdaptiveRateLimiter:
+    """토큰 버킷 + AIMD(성공 시 가산 증가, 이상 신호 시 곱셈 감소) 속도 제한기"""
+
+    def __init__(self, initial_rate=0.5, min_rate=0.05, max_rate=1.0,
+                 increase=0.05, decrease=0.5, burst=1, slow_seconds=8.0):
+        self.min_rate = min_rate
+        self.max_rate = max_rate
+        self.rate = min(max(initial_rate, min_rate), max_rate)
+        self.increase = increase
+        self.decrease = decrease
+        self.burst = burst
+        self.slow_seconds = slow_seconds
+
+        self.tokens = float(burst)
+        self.last_refill = time.monotonic()
+        self.stats = {'acquired': 0, 'waited': 0.0, 'increases': 0, 'decreases': 0}
+        self._lock = threading.Lock()
+
+    def _refill(self, now):
+        elapsed = now - self.last_refill
+        self.tokens = min(self.burst, self.tokens + elapsed * self.rate)
+        self.last_refill = now
+
+    def acquire(self, should_stop=None):
+        """토큰 1개 획득 (필요하면 대기) - 대기한 시간(초) 반환, 중지 요청 시 즉시 반환
+        작업 스레드의 중지 요청은 대기 중에도 바로 깨어나고, 일시정지 중이면 재개까지 대기"""
+        waited = 0.0
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self._refill(now)
+                if self.tokens >= 1:
+                    self.tokens -= 1
+                    self.stats['acquired'] += 1
+                    self.stats['waited'] += waited
+                    return waited
+                wait = (1 - self.tokens) / self.rate
+
+            # should_stop 을 빠르게 반영하도록 짧게 나눠서 대기
+            step = min(wait, 0.1)
+            proceed = cancellable_sleep(step)
+            waited += step
+            if not proceed or (should_stop and should_stop()):
+                return waited
+
+    def report_success(self, latency=None):
+        """정상 응답 - 느린 응답이면 감속, 아니면 가산 증가"""
+        if latency is not None and latency > self.slow_seconds:
+            self.report_failure()
+            return
+        with self._lock:
+            if self.rate < self.max_rate:
+                self.rate = min(self.max_rate, self.rate + self.increase)
+                self.stats['increases'] += 1
+
+    def report_failure(self, severe=False):
+        """429/5xx/느린 응답 - 곱셈 감소, 차단 페이지(severe)는 최저 속도로"""
+        with self._lock:
+            self.rate = self.min_rate if severe else max(self.min_rate, self.rate * self.decrease)
+            self.tokens = min(self.tokens, 0.0)
+            self.stats['decreases'] += 1
+
+    def observe(self, status_code=None, latency=None, blocked=False):
+        """응답 결과 반영 (상태 코드/소요 시간/차단 여부)"""
+        if blocked:
+            self.report_failure(severe=True)
+        elif status_code is not None and (status_code == 429 or status_code >= 500):
+            self.report_failure()
+        else:
+            self.report_success(latency)
+
+    @property
+    def interval(self):
+        """현재 요청 간격(초)"""
+        return 1.0 / self.rate
+
+
+class RateLimiterRegistry:
+    """엔드포인트 종류별 속도 제한기 모음 (모든 BUYMA 요청이 여기서 토큰을 받음)
+    base_url 을 지정하면 BUYMA 주소를 그 주소(재생 서버 등)로 바꿔 접속하고,
+    recorder(PageRecorder) 를 지정하면 접속한 페이지를 기록한다.
+    tracer(Tracer) 로 토큰 대기(rate_wait)와 페이지 이동(page.<종류>) 시간을 측정한다."""
+
+    def __init__(self, limits=None, should_stop=None, base_url=None, recorder=None, tracer=None):
+        self.limits = {name: dict(cfg) for name, cfg in DEFAULT_LIMITS.items()}
+        for name, cfg in (limits or {}).items():
+            self.limits.setdefault(name, {}).update(cfg)
+        self.should_stop = should_stop
+        self.base_url = base_url
+        self.recorder = recorder
+        self.tracer = tracer or Tracer()
+        self._limiters = {}
+        self._lock = threading.Lock()
+
+    def get(self, name):
+        with self._lock:
+            if name not in self._limiters:
+                self._limiters[name] = AdaptiveRateLimiter(**self.limits.get(name, DEFAULT_LIMITS['http']))
+            return self._limiters[name]
+
+    def configure(self, name, **kwargs):
+        """설정 변경 (기존 제한기는 새 설정으로 교체)"""
+        with self._lock:
+            self.limits.setdefault(name, {}).update(kwargs)
+            self._limiters.pop(name, None)
+
+    def acquire(self, name):
+        with self.tracer.span('rate_wait', 'rate_limit', endpoint=name):
+            return self.get(name).acquire(self.should_stop)
+
+    def observe(self, name, status_code=None, latency=None, blocked=False):
+        self.get(name).observe(status_code=status_code, latency=latency, blocked=blocked)
+
+    def observe_driver(self, name, driver, latency=None):
+        """Selenium 페이지 이동 결과 반영 (제목/URL로 차단 페이지 감지)"""
+        try:
+            blocked = is_block_page(driver.title, driver.current_url)
+        except Exception:
+            blocked = False
+        self.observe(name, latency=latency, blocked=blocked)
+        return not blocked
+
+    def rebase(self, url):
+        """접속할 실제 주소 (base_url 지정 시 BUYMA 주소를 바꿈)"""
+        return rebase(url, self.base_url)
+
+    def navigate(self, driver, url):
+        """토큰 없이 페이지 이동 (로그인/등록 폼 등) - 기본 주소 변경과 페이지 기록만 적용 (중지된 작업이면 JobCancelled)"""
+        raise_if_cancelled()
+        driver.get(self.rebase(url))
+        if self.recorder:
+            self.recorder.record_driver(driver, url)
+
+    def record_response(self, response):
+        """HTTP 응답 기록 (recorder 지정 시)"""
+        if self.recorder and response is not None:
+            self.recorder.record_response(response)
+
+    def get_page(self, name, driver, url):
+        """토큰 획득 → driver.get → 결과 반영을 한 번에 수행 (차단 페이지면 False)
+        중지 요청을 받은 작업이면 페이지를 열지 않고 JobCancelled"""
+        self.acquire(name)
+        raise_if_cancelled()
+        start = time.monotonic()
+        try:
+            with self.tracer.span(f'page.{name}', 'page'):
+                self.navigate(driver, url)
+        except Exception:
+            self.observe(name, latency=time.monotonic() - start, status_code=599)
+            raise
+        return self.observe_driver(name, driver, time.monotonic() - start)
+
+    def snapshot(self):
+        """현재 엔드포인트별 요청 간격(초)"""
+        with self._lock:
+            return {name: round(limiter.interval, 2) for name, limiter in self._limiters.items()}
@@ -0,0 +1,226 @@
+# BUYMA 자동화 프로그램 - 가격 분석 → 가격 수정 파이프라인 모듈
+import queue
+import threading
+import time
+
+from job_executor import JobCancelled, bind_current_job
+
+
+_DONE = object()   # 분석 작업 종료 표시
+_CLOSE = object()  # 그룹(페이지) 분석 종료 표시 - 일괄 수정 모드에서 모아둔 상품 수정
+
+
+class RepricePipeline:
+    """가격 분석(경쟁사 검색)과 가격 수정을 겹쳐서 실행하는 생산자/소비자 파이프라인
+
+    분석 작업자는 호출한 스레드에서 상품을 하나씩 분석하고, 수정이 필요한 상품을
+    크기가 제한된 큐에 넣는다. 수정 작업자 스레드는 큐를 비우면서 가격을 수정한다.
+    전체 소요 시간이 (분석 + 수정) 합계가 아니라 둘 중 큰 쪽에 가까워진다.
+
+    analyze(product) -> True: 수정 필요, False: 수정 불필요, None: 분석 실패/건너뜀
+    update(product)  -> True: 수정 완료
+    update_batch(products) -> 수정 완료 개수 (지정하면 그룹(페이지) 단위로 모아서 한 번에 수정)
+    overlap=False 이면 같은 브라우저를 쓰는 경우를 위해 분석 직후 같은 스레드에서 수정
+    수정 중 JobCancelled(중지 요청)가 나면 남은 수정은 건너뛰고 큐만 비운 뒤 정상 종료
+    """
+
+    def __init__(self, analyze, update, queue_size=20, overlap=True, should_stop=None, log=None,
+                 update_batch=None):
+        self.analyze = analyze
+        self.update = update
+        self.update_batch = update_batch
+        self.queue_size = queue_size
+        self.overlap = overlap
+        self.should_stop = should_stop or (lambda: False)
+        self.log = log or (lambda message: None)
+
+        self._lock = threading.Lock()
+        self._pending = {}     # {그룹: 아직 끝나지 않은 상품 수}
+        self._closed = set()   # 분석 작업자가 지나간 그룹
+        self._batches = {}     # {그룹: 일괄 수정 대기 상품} - 수정하는 스레드에서만 사용
+        self._on_group_done = None
+        self._cancelled = False  # 수정 중 JobCancelled 발생
+        self.stats = {}
+
+    def _reset(self):
+        self._pending = {}
+        self._closed = set()
+        self._batches = {}
+        self._cancelled = False
+        self.stats = {
+            'analyzed': 0, 'failed': 0, 'queued': 0, 'updated': 0,
+            'max_queue': 0, 'analyze_seconds': 0.0, 'update_seconds': 0.0, 'elapsed': 0.0,
+        }
+
+    def _stopping(self):
+        return self._cancelled or self.should_stop()
+
+    def _cancel(self):
+        """수정 콜백이 중지 요청으로 멈춤 - 이후 상품은 수정하지 않고 완료 처리만"""
+        if not self._cancelled:
+            self._cancelled = True
+            self.log("⏹️ 중지 요청으로 가격 수정을 멈춥니다.")
+
+    def _count(self, key, amount=1):
+        with self._lock:
+            self.stats[key] += amount
+
+    def _finish(self, group):
+        """상품 하나 처리 완료 - 그룹(페이지)의 모든 상품이 끝났으면 콜백 호출"""
+        with self._lock:
+            self._pending[group] -= 1
+            done = self._pending[group] == 0 and group in self._closed
+        if done and self._on_group_done:
+            self._on_group_done(group)
+
+    def _close_group(self, group):
+        """분석 작업자가 그룹을 모두 지나감 - 남은 수정이 없으면 바로 완료"""
+        with self._lock:
+            self._closed.add(group)
+            done = self._pending.get(group, 0) == 0
+        if done and self._on_group_done:
+            self._on_group_done(group)
+
+    def _update_one(self, product, group):
+        started = time.monotonic()
+        try:
+            if self.update(product):
+                self._count('updated')
+        except JobCancelled:
+            self._cancel()
+        except Exception as e:
+            self.log(f"❌ 가격 수정 오류: {str(e)}")
+        finally:
+            self._count('update_seconds', time.monotonic() - started)
+            self._finish(group)
+
+    def _flush_batch(self, group):
+        """그룹에 모아둔 상품을 한 번에 수정"""
+        products = self._batches.pop(group, [])
+        if not products:
+            return
+        started = time.monotonic()
+        try:
+            if not self._stopping():
+                self._count('updated', self.update_batch(products) or 0)
+        except JobCancelled:
+            self._cancel()
+        except Exception as e:
+            self.log(f"❌ 일괄 가격 수정 오류: {str(e)}")
+        finally:
+            self._count('update_seconds', time.monotonic() - started)
+            for _ in products:
+                self._finish(group)
+
+    def _handle(self, product, group):
+        """수정 대상 1개 처리 - 일괄 모드면 그룹에 모으고, 아니면 바로 수정"""
+        if self.update_batch:
+            self._batches.setdefault(group, []).append(product)
+        elif self._stopping():
+            self._finish(group)
+        else:
+            self._update_one(product, group)
+
+    def _update_worker(self, work_queue):
+        while True:
+            item = work_queue.get()
+            if item is _DONE:
+                return
+            product, group = item
+            if product is _CLOSE:
+                self._flush_batch(group)
+            else:
+                self._handle(product, group)
+
+    def _put(self, work_queue, worker, item, droppable=False):
+        """수정 작업자 큐에 넣기 - 큐가 가득 차면 작업자가 따라올 때까지 대기
+        대기 중에도 중지 요청(droppable 이면 넣지 않음)과 작업자 종료를 확인. 넣었으면 True"""
+        while worker.is_alive():
+            try:
+                work_queue.put(item, timeout=0.2)
+                return True
+            except queue.Full:
+                if droppable and self._stopping():
+                    return False
+        return False
+
+    def _end_group(self, group, work_queue, worker):
+        """분석 작업자가 그룹을 모두 지나감 - 일괄 모드면 모아둔 상품 수정 요청"""
+        if self.update_batch:
+            if not worker or not self._put(work_queue, worker, (_CLOSE, group)):
+                self._flush_batch(group)
+        self._close_group(group)
+
+    def run(self, products, group_of=None, on_group_done=None):
+        """상품 목록 처리 후 통계 반환
+        group_of(product) 로 상품을 그룹(페이지)으로 묶으면, 그룹의 분석과 수정이 모두 끝날 때
+        on_group_done(group) 호출 (그룹은 연속으로 나온다고 가정)"""
+        self._reset()
+        self._on_group_done = on_group_done
+        group_of = group_of or (lambda product: None)
+        started = time.monotonic()
+
+        work_queue = queue.Queue(maxsize=self.queue_size)
+        worker = None
+        if self.overlap:
+            worker = threading.Thread(target=bind_current_job(self._update_worker), args=(work_queue,), daemon=True)
+            worker.start()
+
+        current_group = _DONE
+        try:
+            for product in products:
+                if self._stopping():
+                    self.log("⏹️ 중지 요청으로 가격 분석을 멈춥니다.")
+                    break
+
+                group = group_of(product)
+                if group != current_group:
+                    if current_group is not _DONE:
+                        self._end_group(current_group, work_queue, worker)
+                    current_group = group
+                with self._lock:
+                    self._pending[group] = self._pending.get(group, 0) + 1
+
+                analyze_started = time.monotonic()
+                try:
+                    needs_update = self.analyze(product)
+                except Exception as e:
+                    self.log(f"❌ 상품 분석 오류: {str(e)}")
+                    needs_update = None
+                self._count('analyze_seconds', time.monotonic() - analyze_started)
+
+                if needs_update is None:
+                    self._count('failed')
+                    self._finish(group)
+                    continue
+
+                self._count('analyzed')
+                if not needs_update:
+                    self._finish(group)
+                    continue
+
+                self._count('queued')
+                if worker:
+                    if not self._put(work_queue, worker, (product, group), droppable=True):
+                        self._finish(group)  # 중지 요청 - 수정하지 않고 완료 처리
+                        continue
+                    with self._lock:
+                        self.stats['max_queue'] = max(self.stats['max_queue'], work_queue.qsize())
+                else:
+                    self._handle(product, group)
+        finally:
+            if current_group is not _DONE:
+                self._end_group(current_group, work_queue, worker)
+            if worker and self._put(work_queue, worker, _DONE):
+                worker.join()
+            self.stats['elapsed'] = time.monotonic() - started
+
+        return dict(self.stats)
+
+    def summary(self):
+        """처리 결과와 겹침 효과(분석/수정 시간 합 대비 실제 소요 시간) 문자열"""
+        stats = self.stats
+        busy = stats['analyze_seconds'] + stats['update_seconds']
+        return (f"파이프라인: 분석 {stats['analyzed']}개, 실패 {stats['failed']}개, 수정 {stats['updated']}/{stats['queued']}개, "
+                f"소요 {stats['elapsed']:.0f}초 (분석 {stats['analyze_seconds']:.0f}초 + 수정 {stats['update_seconds']:.0f}초 = {busy:.0f}초), "
+                f"최대 대기열 {stats['max_queue']}")
@@ -0,0 +1,138 @@
+# BUYMA 자동화 프로그램 - 가격 수정 계획 (드라이런) 모듈
+import json
+from collections import Counter
+from datetime import datetime
+
+from bulk_price_editor import ROWS_PER_PAGE
+from product_index import product_id_of
+from search_tiles import parse_price
+
+
+# 계획 항목의 사유 - 'update' 만 실제로 BUYMA 에서 수정
+REASON_UPDATE = "update"              # 제안가가 현재가와 다름 → 수정
+REASON_NO_CHANGE = "no_change"        # 수정 필요로 분석됐지만 제안가 == 현재가 → 수정 생략
+REASON_NOT_NEEDED = "not_needed"      # 분석 결과 수정 불필요 (현재가 적정 / 손실 예상)
+REASON_EXCLUDED = "excluded"          # 사용자가 제외한 상품
+REASON_NOT_ANALYZED = "not_analyzed"  # 최저가 분석 결과 없음
+REASON_NO_ID = "no_product_id"        # 상품ID 를 알 수 없음
+
+REASON_LABELS = {
+    REASON_UPDATE: "수정",
+    REASON_NO_CHANGE: "변경 없음",
+    REASON_NOT_NEEDED: "수정 불필요",
+    REASON_EXCLUDED: "제외",
+    REASON_NOT_ANALYZED: "분석 없음",
+    REASON_NO_ID: "상품ID 없음",
+}
+
+PLAN_FIELDS = ('product_id', 'title', 'current', 'lowest', 'proposed', 'delta', 'reason', 'page', 'low_7d', 'change_7d')
+
+
+def plan_entry(product, page=None, history=None):
+    """분석이 끝난 상품 dict (캐시 데이터) 로 계획 항목 1개 생성 - BUYMA 에 접속하지 않음
+    history(PriceHistory) 를 주면 최근 7일 경쟁사 최저가와 변동률을 함께 기록 (검토용)"""
+    current = parse_price(str(product.get('current_price', ''))) or 0
+    lowest = int(product.get('lowest_price') or 0)
+    proposed = int(product.get('suggested_price') or 0)
+
+    if not product_id_of(product):
+        reason = REASON_NO_ID
+    elif product.get('excluded', False):
+        reason = REASON_EXCLUDED
+    elif lowest <= 0 or proposed <= 0:
+        reason = REASON_NOT_ANALYZED
+    elif not product.get('needs_update', False):
+        reason = REASON_NOT_NEEDED
+    elif proposed == current:
+        reason = REASON_NO_CHANGE
+    else:
+        reason = REASON_UPDATE
+
+    low_7d = change_7d = None
+    if history is not None and product_id_of(product):
+        low_7d = history.window(product_id_of(product), days=7)['min']
+        change_7d = history.change_rate(product_id_of(product), days=7)
+
+    return {
+        'product_id': product_id_of(product),
+        'title': product.get('title') or product.get('name', ''),
+        'current': current,
+        'lowest': lowest,
+        'proposed': proposed,
+        'delta': proposed - current if proposed > 0 else 0,
+        'reason': reason,
+        'page': page,
+        'low_7d': low_7d,
+        'change_7d': round(change_7d, 4) if change_7d is not None else None,
+    }
+
+
+class RepricePlan:
+    """전체 상품의 가격 수정 계획 - 드라이런으로 만들고 검토 후 'update' 항목만 적용
+    적용 결과를 기록해 생략한 브라우저 작업 수를 보고"""
+
+    def __init__(self, entries, created_at=None):
+        self.entries = list(entries)
+        self.created_at = created_at or datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+        self.results = {}   # {상품ID: 'updated' | 'unchanged' | 'failed' | 'not_found' | 'skipped'}
+        self.page_loads = 0
+
+    @classmethod
+    def from_products(cls, products, rows_per_page=ROWS_PER_PAGE, history=None):
+        """내 상품 목록 순서로 판매 목록 페이지 번호를 붙여 계획 생성"""
+        return cls([plan_entry(product, position // rows_per_page + 1, history)
+                    for position, product in enumerate(products)])
+
+    def updates(self):
+        """실제로 수정할 항목"""
+        return [entry for entry in self.entries if entry['reason'] == REASON_UPDATE]
+
+    def targets(self):
+        """BulkPriceEditor.apply 에 넘길 수정 대상"""
+        return [{'product_id': entry['product_id'], 'new_price': entry['proposed'], 'page': entry['page']}
+                for entry in self.updates()]
+
+    def counts(self):
+        """사유별 항목 수"""
+        return Counter(entry['reason'] for entry in self.entries)
+
+    def record(self, results, page_loads=0):
+        """적용 결과 기록 - results: {상품ID: 결과}"""
+        self.results.update({str(product_id): result for product_id, result in results.items()})
+        self.page_loads += page_loads
+
+    def avoided_operations(self):
+        """생략한 가격 수정 작업 수 (계획 단계 변경 없음 + 적용 시 실시간 가격 일치)"""
+        live_unchanged = sum(1 for result in self.results.values() if result == 'unchanged')
+        return self.counts()[REASON_NO_CHANGE] + live_unchanged
+
+    def summary(self):
+        """계획/적용 결과 문자열"""
+        counts = self.counts()
+        parts = [f"{REASON_LABELS[reason]} {counts[reason]}개" for reason in REASON_LABELS if counts[reason]]
+        text = f"수정 계획: 전체 {len(self.entries)}개 ({', '.join(parts) or '항목 없음'})"
+        if self.results:
+            applied = Counter(self.results.values())
+            text += (f" | 적용: 수정 {applied['updated']}개, 실시간 가격 일치 {applied['unchanged']}개, "
+                     f"실패 {applied['failed']}개, 목록에 없음 {applied['not_found']}개, "
+                     f"페이지 로딩 {self.page_loads}회 (상품별 수정 시 {len(self.updates()) + counts[REASON_NO_CHANGE]}회)")
+        return text + f" | 생략한 가격 수정 작업 {self.avoided_operations()}회"
+
+    def save(self, path):
+        """계획을 JSON 으로 저장 (검토용)"""
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump({
+                "생성_시간": self.created_at,
+                "요약": {reason: count for reason, count in self.counts().items()},
+                "계획": [{field: entry.get(field) for field in PLAN_FIELDS} for entry in self.entries],
+                "적용_결과": self.results,
+            }, f, ensure_ascii=False, indent=2)
+
+    @classmethod
+    def load(cls, path):
+        """저장한 계획 불러오기"""
+        with open(path, 'r', encoding='utf-8') as f:
+            data = json.load(f)
+        plan = cls(data.get("계획", []), created_at=data.get("생성_시간"))
+        plan.results = data.get("적용_결과", {})
+        return plan
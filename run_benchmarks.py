@@ -0,0 +1,29 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+BUYMA 자동화 프로그램 벤치마크 실행 스크립트
+
+결과는 .benchmarks/ 에 커밋별로 자동 저장되고, 이전 결과가 있으면 마지막 결과와 비교해
+평균이 20% 이상 느려진 항목이 있으면 실패로 종료한다.
+
+  python run_benchmarks.py            # 측정 + 저장 + 직전 결과와 비교
+  python run_benchmarks.py -k excel   # 일부만 측정 (pytest 인자 그대로 전달)
+"""
+
+import glob
+import os
+import sys
+
+import pytest
+
+
+def main(argv):
+    args = ["test_benchmarks.py", "-q", "-m", "benchmark", "--benchmark-only", "--benchmark-autosave",
+            "--benchmark-columns=min,mean,median,stddev,rounds"]
+    if glob.glob(os.path.join(".benchmarks", "*", "*.json")):
+        args += ["--benchmark-compare", "--benchmark-compare-fail=mean:20%"]
+    return pytest.main(args + list(argv))
+
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv[1:]))
@@ -0,0 +1,83 @@
+# BUYMA 자동화 프로그램 - 최저가 검색 전략 모듈 (가격순 정렬 + 조기 종료)
+import random
+import threading
+
+
+SEARCH_BASE_URL = "https://www.buyma.com/r"
+
+SORT_RELEVANCE = "relevance"   # 기본 (관련도순) - 최저가를 찾으려면 모든 페이지 확인 필요
+SORT_PRICE_ASC = "price_asc"   # 가격이 낮은 순 - 검색어 일치 상품이 처음 나온 페이지에서 종료
+
+# 검색 URL 정렬 파라미터 (가격이 낮은 순)
+PRICE_ASC_ORDER = "-O3"
+
+# 조회 시간 히스토그램 구간 (초)
+LOOKUP_BUCKETS = (2, 5, 10, 20, 40, 80)
+
+
+def build_search_url(search_name, page_number, sort=SORT_RELEVANCE):
+    """검색어/페이지/정렬 방식으로 BUYMA 검색 URL 생성"""
+    order = PRICE_ASC_ORDER if sort == SORT_PRICE_ASC else ""
+    return f"{SEARCH_BASE_URL}/-R120{order}/{search_name}_{page_number}/"
+
+
+def bucket_label(seconds):
+    """조회 시간이 속하는 히스토그램 구간 이름"""
+    lower = 0
+    for upper in LOOKUP_BUCKETS:
+        if seconds < upper:
+            return f"{lower}-{upper}s"
+        lower = upper
+    return f"{lower}s+"
+
+
+class SearchLookupStats:
+    """검색 전략별 조회 시간/페이지 수 히스토그램과 가격순 결과 검증 통계"""
+
+    def __init__(self, verify_rate=0.05, rng=None):
+        self.verify_rate = verify_rate
+        self._rng = rng or random.Random()
+        self._lock = threading.Lock()
+        self.lookups = {}       # {전략: {'count', 'seconds', 'pages', 'histogram': {구간: 횟수}}}
+        self.consistency = {'checked': 0, 'mismatched': 0}
+
+    def record_lookup(self, sort, seconds, pages):
+        """검색 1회의 소요 시간과 방문 페이지 수 기록"""
+        with self._lock:
+            entry = self.lookups.setdefault(sort, {'count': 0, 'seconds': 0.0, 'pages': 0, 'histogram': {}})
+            entry['count'] += 1
+            entry['seconds'] += seconds
+            entry['pages'] += pages
+            label = bucket_label(seconds)
+            entry['histogram'][label] = entry['histogram'].get(label, 0) + 1
+
+    def should_verify(self):
+        """이번 가격순 검색 결과를 전체 페이지 검색과 비교할지 (표본 추출)"""
+        return self.verify_rate > 0 and self._rng.random() < self.verify_rate
+
+    def record_consistency(self, sorted_price, exhaustive_price):
+        """가격순 검색 결과와 전체 검색 결과 비교 - 일치하면 True"""
+        matched = sorted_price == exhaustive_price
+        with self._lock:
+            self.consistency['checked'] += 1
+            if not matched:
+                self.consistency['mismatched'] += 1
+        return matched
+
+    def summary(self):
+        """전략별 평균 소요 시간/페이지 수, 히스토그램, 검증 결과 문자열"""
+        with self._lock:
+            parts = []
+            for sort, entry in self.lookups.items():
+                count = entry['count']
+                histogram = ", ".join(
+                    f"{label} {entry['histogram'][label]}"
+                    for label in sorted(entry['histogram'], key=lambda l: float(l.split('-')[0].rstrip('s+')))
+                )
+                parts.append(
+                    f"{sort} {count}회 평균 {entry['seconds'] / count:.1f}초/{entry['pages'] / count:.1f}페이지 [{histogram}]"
+                )
+            checked = self.consistency['checked']
+            if checked:
+                parts.append(f"가격순 검증 {checked - self.consistency['mismatched']}/{checked} 일치")
+        return "검색 통계: " + (" | ".join(parts) if parts else "기록 없음")
@@ -0,0 +1,63 @@
+# BUYMA 자동화 프로그램 - 검색 결과 상품 타일 일괄 추출 모듈
+import re
+
+
+# ul.product_lists 안의 모든 상품 정보를 스크립트 1회 호출로 수집
+# (li 마다 find_element/.text 를 호출하면 120개 페이지에서 480회 이상 왕복이 발생)
+TILE_SCRIPT = """
+var list = document.querySelector('ul.product_lists');
+if (!list) { return null; }
+var items = list.getElementsByTagName('li');
+var tiles = [];
+for (var i = 0; i < items.length; i++) {
+    var li = items[i];
+    var nameEl = li.querySelector('div.product_name');
+    if (!nameEl) { continue; }
+    var priceEl = li.querySelector('span.Price_Txt');
+    var linkEl = nameEl.querySelector('a');
+    var sellerEl = li.querySelector('.product_Buyer, .product_buyer, .buyer_name');
+    tiles.push({
+        name: (nameEl.innerText || '').trim(),
+        price: priceEl ? (priceEl.innerText || '').trim() : '',
+        url: linkEl ? linkEl.href : '',
+        seller: sellerEl ? (sellerEl.innerText || '').trim() : ''
+    });
+}
+return {count: items.length, tiles: tiles};
+"""
+
+PRICE_PATTERN = re.compile(r'[\d,]+')
+
+
+def parse_price(text):
+    """가격 텍스트에서 숫자 추출 (¥12,000 → 12000), 없으면 None"""
+    match = PRICE_PATTERN.search(text or "")
+    if not match:
+        return None
+    digits = match.group(0).replace(',', '')
+    return int(digits) if digits else None
+
+
+def parse_tiles(raw_tiles):
+    """스크립트 결과를 [{'name', 'price', 'url', 'seller'}] 로 변환 (가격 없는 상품 제외)"""
+    tiles = []
+    for raw in raw_tiles or []:
+        price = parse_price(raw.get('price'))
+        if price is None:
+            continue
+        tiles.append({
+            'name': raw.get('name', ''),
+            'price': price,
+            'url': raw.get('url', ''),
+            'seller': raw.get('seller', ''),
+        })
+    return tiles
+
+
+def read_product_tiles(driver):
+    """검색 결과 페이지의 상품 타일 일괄 추출 - (li 개수, 타일 목록) 반환
+    li 개수는 다음 페이지 존재 여부(120개) 판단에 사용"""
+    data = driver.execute_script(TILE_SCRIPT)
+    if not data:
+        return 0, []
+    return data.get('count', 0), parse_tiles(data.get('tiles'))
@@ -0,0 +1,136 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+BUYMA 자동화 프로그램 시작 시간 벤치마크
+
+프로그램을 여러 번 실행해 첫 화면 표시(first_paint)와 조작 가능 시점(interactive)까지의 시간을 잰다.
+실행할 때 BUYMA_STARTUP_REPORT 를 지정하면 프로그램이 측정 결과 1줄을 기록하고 바로 종료한다 (startup_timer.py).
+결과는 .benchmarks/startup.jsonl 에 저장되고, 같은 대상의 직전 결과보다 중앙값이 20% 이상 느려지면 실패로 종료한다.
+
+  python startup_benchmark.py                      # buyma.py 5회
+  python startup_benchmark.py --target buyma_pyside.py -n 10
+  python startup_benchmark.py --exe dist/BUYMA.exe # PyInstaller 실행 파일 (압축 해제 시간 포함)
+  python startup_benchmark.py --offscreen          # 화면 없는 환경 (CI)
+"""
+
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+
+from startup_timer import LAUNCHED_ENV, MARKS, REPORT_ENV
+
+
+RESULT_FILE = os.path.join(".benchmarks", "startup.jsonl")
+FAIL_RATIO = 1.2
+
+
+def run_once(command, offscreen=False, timeout=120):
+    """프로그램 1회 실행 - 측정 결과 dict (실패 시 None)"""
+    fd, report_path = tempfile.mkstemp(suffix=".jsonl")
+    os.close(fd)
+    env = dict(os.environ)
+    env[REPORT_ENV] = report_path
+    env[LAUNCHED_ENV] = repr(time.time())
+    if offscreen:
+        env["QT_QPA_PLATFORM"] = "offscreen"
+    try:
+        subprocess.run(command, env=env, timeout=timeout,
+                       stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+        with open(report_path, 'r', encoding='utf-8') as f:
+            lines = [line for line in f if line.strip()]
+        return json.loads(lines[-1]) if lines else None
+    except (subprocess.TimeoutExpired, OSError, ValueError):
+        return None
+    finally:
+        os.remove(report_path)
+
+
+def summarize(reports):
+    """단계별 중앙값/최솟값 (실행 시각 기준, 초)"""
+    summary = {}
+    for name in MARKS:
+        values = [(report['from_process_start'] or report['marks'])[name] for report in reports
+                  if name in (report['from_process_start'] or report['marks'])]
+        if values:
+            summary[name] = {'median': statistics.median(values), 'min': min(values)}
+    return summary
+
+
+def previous_result(target):
+    """같은 대상의 직전 결과 (없으면 None)"""
+    if not os.path.exists(RESULT_FILE):
+        return None
+    previous = None
+    with open(RESULT_FILE, 'r', encoding='utf-8') as f:
+        for line in f:
+            try:
+                result = json.loads(line)
+            except ValueError:
+                continue
+            if result.get('target') == target:
+                previous = result
+    return previous
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="BUYMA 프로그램 시작 시간 측정")
+    parser.add_argument('--target', default="buyma.py", help="실행할 GUI 스크립트")
+    parser.add_argument('--exe', help="PyInstaller 실행 파일 경로 (지정하면 --target 대신 사용)")
+    parser.add_argument('-n', '--runs', type=int, default=5, help="실행 횟수")
+    parser.add_argument('--offscreen', action='store_true', help="화면 없이 실행 (QT_QPA_PLATFORM=offscreen)")
+    parser.add_argument('--no-save', action='store_true', help="결과 저장/비교 생략")
+    args = parser.parse_args(argv)
+
+    target = args.exe or args.target
+    command = [args.exe] if args.exe else [sys.executable, args.target]
+
+    reports = []
+    for run in range(1, args.runs + 1):
+        report = run_once(command, args.offscreen)
+        if report is None:
+            print(f"❌ {run}회차 측정 실패 (결과 없음/시간 초과)")
+            continue
+        marks = report['from_process_start'] or report['marks']
+        print(f"⏱️ {run}회차: " + ", ".join(f"{name} {marks[name]:.3f}초" for name in MARKS if name in marks))
+        reports.append(report)
+
+    if not reports:
+        print("❌ 측정 결과가 없습니다.")
+        return 1
+
+    summary = summarize(reports)
+    print(f"\n📊 {target} ({len(reports)}회, 실행 시각 기준)")
+    for name, value in summary.items():
+        print(f"  {name:<12} 중앙값 {value['median']:.3f}초  최소 {value['min']:.3f}초")
+
+    if args.no_save:
+        return 0
+
+    status = 0
+    previous = previous_result(target)
+    if previous:
+        for name in ('first_paint', 'interactive'):
+            before = previous['summary'].get(name, {}).get('median')
+            after = summary.get(name, {}).get('median')
+            if before and after:
+                change = (after / before - 1) * 100
+                print(f"  {name:<12} 직전 {before:.3f}초 → {after:.3f}초 ({change:+.1f}%)")
+                if after > before * FAIL_RATIO:
+                    print(f"❌ {name} 이(가) 직전 결과보다 {change:.0f}% 느려졌습니다.")
+                    status = 1
+
+    os.makedirs(os.path.dirname(RESULT_FILE), exist_ok=True)
+    with open(RESULT_FILE, 'a', encoding='utf-8') as f:
+        f.write(json.dumps({'time': time.strftime('%Y-%m-%d %H:%M:%S'), 'target': target,
+                            'frozen': reports[0]['frozen'], 'runs': len(reports), 'summary': summary},
+                           ensure_ascii=False) + "\n")
+    return status
+
+
+if __name__ == "__main__":
+    sys.exit(main())
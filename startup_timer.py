@@ -0,0 +1,77 @@
+# BUYMA 자동화 프로그램 - 시작 시간 측정 모듈 (첫 화면 표시 / 조작 가능 시점)
+import json
+import os
+import sys
+import time
+
+
+# 이 환경 변수에 파일 경로를 지정하면 조작 가능 시점에 측정 결과 1줄(JSON)을 추가하고 프로그램을 종료
+# (startup_benchmark.py 가 사용 - 콘솔 없는 PyInstaller 실행 파일에서도 동작)
+REPORT_ENV = "BUYMA_STARTUP_REPORT"
+# 실행한 쪽에서 기록한 실행 시각 (time.time()) - 있으면 프로세스 시작 시각 대신 사용
+LAUNCHED_ENV = "BUYMA_STARTUP_LAUNCHED"
+
+MARKS = ('imports', 'window', 'first_paint', 'interactive')
+
+
+def process_started_at():
+    """현재 프로세스 시작 시각 (PyInstaller onefile 압축 해제 시간 포함) - 알 수 없으면 None
+    실행한 쪽이 LAUNCHED_ENV 를 넘겨주면 그 값을 사용 (리눅스의 프로세스 시작 시각은 부팅 시각 기준이라 1초 단위 오차)"""
+    launched = os.environ.get(LAUNCHED_ENV)
+    if launched:
+        try:
+            return float(launched)
+        except ValueError:
+            pass
+    try:
+        import psutil
+        return psutil.Process(os.getpid()).create_time()
+    except Exception:
+        return None
+
+
+class StartupTimer:
+    """프로그램 시작 단계별 시각 기록 - GUI 모듈 맨 앞에서 생성
+    imports: 모듈 import 완료, window: 메인 창 생성, first_paint: 첫 화면 그리기 완료,
+    interactive: 시작 후속 작업까지 끝나 입력을 바로 처리할 수 있는 시점"""
+
+    def __init__(self, clock=time.time):
+        self.clock = clock
+        self.started = clock()
+        self.marks = {}
+
+    def mark(self, name):
+        """단계 시각 기록 (같은 단계는 처음 한 번만) - 모듈 시작 이후 경과 초 반환"""
+        if name not in self.marks:
+            self.marks[name] = self.clock() - self.started
+        return self.marks[name]
+
+    def report(self, process_start=None):
+        """측정 결과 dict - 프로세스 시작 시각을 알면 모든 단계에 프로세스 시작~모듈 시작 시간을 더한 값도 기록"""
+        process_start = process_started_at() if process_start is None else process_start
+        launch = max(self.started - process_start, 0.0) if process_start else None
+        return {
+            'time': time.strftime('%Y-%m-%d %H:%M:%S'),
+            'frozen': bool(getattr(sys, 'frozen', False)),
+            'python': sys.version.split()[0],
+            'launch': launch,
+            'marks': dict(self.marks),
+            'from_process_start': {name: value + launch for name, value in self.marks.items()} if launch is not None else None,
+        }
+
+    def summary(self, report=None):
+        report = report or self.report()
+        marks = report['from_process_start'] or report['marks']
+        basis = "프로세스 시작 기준" if report['from_process_start'] else "모듈 시작 기준"
+        parts = [f"{name} {marks[name]:.2f}초" for name in MARKS if name in marks]
+        return f"시작 시간 ({basis}): " + ", ".join(parts)
+
+    def write(self, path, report=None):
+        """측정 결과 1줄 추가 (JSON Lines)"""
+        with open(path, 'a', encoding='utf-8') as f:
+            f.write(json.dumps(report or self.report(), ensure_ascii=False) + "\n")
+
+
+def requested_report_path():
+    """시작 시간 측정 모드면 결과 파일 경로 (아니면 None)"""
+    return os.environ.get(REPORT_ENV) or None
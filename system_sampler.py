@@ -0,0 +1,93 @@
+# BUYMA 자동화 프로그램 - 시스템 상태 백그라운드 측정 모듈
+import threading
+import time
+
+from lazy_imports import lazy_import
+
+psutil = lazy_import('psutil')  # 첫 측정 때 import (프로그램 시작 시간 단축)
+
+
+BUYMA_URL = "https://www.buyma.com/"
+SLOW_SECONDS = 3.0  # 이보다 느린 응답은 '불안정'으로 표시
+
+
+def probe_url(url, timeout=5.0):
+    """주소 응답 확인 - (상태 코드, 소요 시간 초), 연결 실패 시 예외"""
+    import requests
+    start = time.monotonic()
+    response = requests.head(url, timeout=timeout, allow_redirects=True)
+    return response.status_code, time.monotonic() - start
+
+
+def network_state(status_code, latency):
+    """응답 결과 → 'ok' | 'slow' | 'down'"""
+    if status_code is None or status_code >= 500:
+        return 'down'
+    if status_code == 429 or latency > SLOW_SECONDS:
+        return 'slow'
+    return 'ok'
+
+
+class SystemSampler:
+    """CPU/메모리/Chrome 메모리/BUYMA 접속 상태를 백그라운드 스레드 1개에서 주기적으로 측정하는 클래스
+    측정 결과(dict)는 publish 로 전달 - GUI 는 시그널의 emit 을 넘겨 화면 스레드에서 표시한다.
+    CPU 사용률은 직전 측정 이후 평균(cpu_percent(interval=None))이라 측정 중 대기하지 않는다."""
+
+    def __init__(self, publish, interval=5.0, network_interval=30.0, url=BUYMA_URL,
+                 watchdog=None, probe=probe_url, log=None):
+        self.publish = publish
+        self.interval = interval                  # 측정 주기 (초)
+        self.network_interval = network_interval  # 접속 확인 주기 (초) - 측정 주기보다 길게
+        self.url = url
+        self.watchdog = watchdog                  # BrowserWatchdog - 프로그램이 띄운 Chrome 메모리
+        self.probe = probe
+        self.log = log or (lambda message: None)
+
+        self._network = {'network': 'unknown', 'network_latency': None}
+        self._last_probe = None
+        self._stop = threading.Event()
+        self._thread = None
+
+    def _check_network(self, now):
+        if self._last_probe is not None and now - self._last_probe < self.network_interval:
+            return
+        self._last_probe = now
+        try:
+            status_code, latency = self.probe(self.url)
+            self._network = {'network': network_state(status_code, latency), 'network_latency': latency}
+        except Exception:
+            self._network = {'network': 'down', 'network_latency': None}
+
+    def sample(self, now=None):
+        """측정 1회 - {'cpu', 'memory', 'chrome_rss_mb', 'chrome_processes', 'network', 'network_latency', 'time'}"""
+        now = time.monotonic() if now is None else now
+        chrome = self.watchdog.tracked_usage() if self.watchdog else {'rss_mb': 0.0, 'processes': 0}
+        self._check_network(now)
+        return dict({
+            'cpu': psutil.cpu_percent(interval=None),
+            'memory': psutil.virtual_memory().percent,
+            'chrome_rss_mb': chrome['rss_mb'],
+            'chrome_processes': chrome['processes'],
+            'time': time.time(),
+        }, **self._network)
+
+    def _run(self):
+        psutil.cpu_percent(interval=None)  # 기준점 (첫 호출은 항상 0.0)
+        while not self._stop.wait(self.interval):
+            try:
+                self.publish(self.sample())
+            except Exception as e:
+                self.log(f"⚠️ 시스템 상태 측정 오류: {str(e)}")
+
+    def start(self):
+        if self._thread and self._thread.is_alive():
+            return
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, name="system-sampler", daemon=True)
+        self._thread.start()
+
+    def stop(self, timeout=2.0):
+        self._stop.set()
+        if self._thread:
+            self._thread.join(timeout)
+            self._thread = None
@@ -0,0 +1,79 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+가격 분석 우선순위 스케줄러 테스트
+"""
+
+import os
+import tempfile
+
+from analysis_scheduler import AnalysisScheduler, price_band_score
+
+
+class FakeClock:
+    def __init__(self, now=1_000_000.0):
+        self.now = now
+
+    def __call__(self):
+        return self.now
+
+
+def _product(product_id, price="¥50,000"):
+    return {'title': f'ITEM {product_id} 商品ID: {product_id}', 'current_price': price}
+
+
+def test_never_checked_and_stale_first():
+    """확인한 적 없는 상품 > 오래전에 확인한 상품 > 방금 확인한 상품"""
+    clock = FakeClock()
+    scheduler = AnalysisScheduler(clock=clock)
+    fresh, stale, never = _product('1'), _product('2'), _product('3')
+    scheduler.record_check(stale, 50000)
+    clock.now += 48 * 3600
+    scheduler.record_check(fresh, 50000)
+    assert scheduler.order([fresh, stale, never]) == [never, stale, fresh]
+    assert fresh['last_checked'] == clock.now
+
+
+def test_volatility_favorite_and_price_band():
+    """같은 시각에 확인한 상품은 변동률 / 주력상품 / 가격대 순으로 가산"""
+    clock = FakeClock()
+    scheduler = AnalysisScheduler(clock=clock)
+    calm, volatile, favorite = _product('1'), _product('2'), _product('3')
+    for product in (calm, volatile, favorite):
+        scheduler.record_check(product, 50000)
+    scheduler.record_check(volatile, 40000)
+    scheduler.record_check(calm, 50000)
+    scheduler.record_check(favorite, 50000)
+    assert volatile['volatility'] > 0 and calm['volatility'] == 0
+    assert scheduler.order([calm, volatile, favorite], favorites={'3'}) == [favorite, volatile, calm]
+
+    assert price_band_score(None) == 0.0 and price_band_score(1_000_000) == 1.0
+    assert price_band_score(10000) < price_band_score(100000)
+
+
+def test_time_boxed_and_persistence():
+    """시간 제한이 지나면 중단, 상태는 상품ID 기준으로 파일에 저장되어 새 상품 dict 에도 적용"""
+    clock = FakeClock()
+    path = os.path.join(tempfile.mkdtemp(), "schedule.json")
+    scheduler = AnalysisScheduler(state_file=path, clock=clock)
+    products = [_product(str(i)) for i in range(5)]
+
+    taken = []
+    for product in scheduler.time_boxed(products, budget_seconds=60):
+        taken.append(product)
+        scheduler.record_check(product, 50000)
+        clock.now += 25
+    assert len(taken) == 3
+    assert len(list(scheduler.time_boxed(products, 0))) == 5
+    scheduler.save()
+
+    reloaded = AnalysisScheduler(state_file=path, clock=clock)
+    reloaded_products = [_product(str(i)) for i in range(5)]
+    assert reloaded.order(reloaded_products)[:2] == reloaded_products[3:]
+
+
+if __name__ == "__main__":
+    test_never_checked_and_stale_first()
+    test_volatility_favorite_and_price_band()
+    test_time_boxed_and_persistence()
+    print("=== 테스트 완료 ===")
@@ -0,0 +1,203 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+크롤링/검색/분석/저장 핵심 경로 벤치마크 (pytest-benchmark)
+
+네트워크 없이 저장소의 상품정보_*.json 스냅샷과 테스트 안에서 만든 페이지 데이터로 측정한다.
+커밋별 결과 저장 및 직전 결과와 비교는 run_benchmarks.py 로 실행.
+"""
+
+import copy
+import glob
+import json
+import os
+import random
+
+import pytest
+
+pytest.importorskip("pytest_benchmark")
+
+# 기본 pytest 실행에서는 제외 (pytest.ini), run_benchmarks.py 가 -m benchmark 로 실행
+pytestmark = pytest.mark.benchmark
+
+from analysis_report import append_report, create_report, report_row
+from buyma_engine import clean_search_name, decide_price, load_snapshot, parse_sell_rows
+from buyma_session import parse_my_sell_prices
+from name_matcher import NameMatcher, normalize_name
+from product_index import ProductIndex
+from reprice_plan import RepricePlan
+from search_tiles import parse_tiles, read_product_tiles
+from variation_extractor import parse_embedded_variations
+
+
+def _largest_snapshot():
+    paths = glob.glob(os.path.join(os.path.dirname(os.path.abspath(__file__)), "상품정보_*.json"))
+    return max(paths, key=os.path.getsize) if paths else None
+
+
+SNAPSHOT = _largest_snapshot()
+
+
+@pytest.fixture(scope="module")
+def products():
+    if not SNAPSHOT:
+        pytest.skip("상품정보_*.json 스냅샷 없음")
+    return load_snapshot(SNAPSHOT)[1]
+
+
+@pytest.fixture(scope="module")
+def raw_tiles(products):
+    """검색 결과 1페이지 (120개) 스크립트 결과 형태"""
+    rng = random.Random(0)
+    names = [product.get('original_title') or product.get('title', '') for product in products[:120]]
+    return [{'name': name.split('\n')[0], 'price': f"¥{rng.randint(3000, 300000):,}",
+             'url': f"https://www.buyma.com/item/{i}/", 'seller': f"seller{i}"} for i, name in enumerate(names)]
+
+
+# ----- 상품 페이지 추출 -----
+
+def test_item_page_variations(benchmark):
+    """상품 페이지에 포함된 JSON 에서 색상/사이즈 추출"""
+    json_texts = [json.dumps({'@type': 'Product', 'offers': [
+        {'color': {'name': f"color{c}"}, 'size': [f"{s}" for s in ("XS", "S", "M", "L", "XL")]}
+        for c in range(12)]})] * 3
+    colors, sizes = benchmark(parse_embedded_variations, json_texts)
+    assert len(colors) == 12 and len(sizes) == 5
+
+
+# ----- 경쟁사 / 판매 목록 페이지 파싱 -----
+
+def test_competitor_page_parse_and_match(benchmark, raw_tiles):
+    """검색 결과 1페이지 타일 변환 + 상품명 일치 판단"""
+    matcher = NameMatcher(raw_tiles[0]['name'])
+
+    def run():
+        return matcher.match_page(parse_tiles(raw_tiles))
+
+    assert benchmark(run)
+
+
+def test_search_page_fake_driver(benchmark, raw_tiles):
+    """검색 결과 1페이지 (120개) HTML → 가짜 드라이버 타일 스크립트 → 타일 변환"""
+    from fake_driver import FakeDriver
+
+    url = "https://www.buyma.com/r/-O3/bench_1/"
+    items = "".join(f'<li><div class="product_name"><a href="/item/{i}/">{tile["name"]}</a></div>'
+                    f'<span class="Price_Txt">{tile["price"]}</span><p class="product_Buyer">{tile["seller"]}</p></li>'
+                    for i, tile in enumerate(raw_tiles))
+    driver = FakeDriver({url: f'<html><body><ul class="product_lists">{items}</ul></body></html>'})
+
+    def run():
+        driver.get(url)
+        return read_product_tiles(driver)
+
+    count, tiles = benchmark(run)
+    assert count == len(raw_tiles)
+
+
+def test_my_sell_page_parse(benchmark, products):
+    """판매 목록 1페이지 (100행) HTML 가격 추출 + 행 변환"""
+    html = "".join(f'<tr><td class="item_name">{p["title"]}</td>'
+                   f'<span class="js-item-price-display">¥{p["current_price"]}</span></tr>'
+                   for p in products[:100])
+    rows = [{'title': p.get('original_title', ''), 'price': p.get('current_price', ''), 'url': p.get('url', '')}
+            for p in products[:100]]
+
+    def run():
+        return parse_my_sell_prices(html), parse_sell_rows(rows)
+
+    prices, parsed = benchmark(run)
+    assert len(parsed) == len(rows)
+
+
+# ----- 검색어 정리 / 가격 판단 -----
+
+def test_search_term_normalization(benchmark, products):
+    """전체 상품명 → 검색어 / 비교용 정규화"""
+    titles = [product.get('title', '') for product in products]
+
+    def run():
+        return [(clean_search_name(title), normalize_name(title)) for title in titles]
+
+    assert len(benchmark(run)) == len(titles)
+
+
+def test_price_decision(benchmark, products):
+    """전체 상품 제안가/수정 필요 판단 + 수정 계획 생성"""
+    work = [dict(product) for product in products]
+
+    def run():
+        for product in work:
+            decide_price(product, product.get('lowest_price') or 10000, 100, 500)
+        return RepricePlan.from_products(work)
+
+    assert len(benchmark(run).entries) == len(work)
+
+
+# ----- 저장 -----
+
+def test_snapshot_load(benchmark):
+    """실제 상품정보 스냅샷 JSON 불러오기"""
+    if not SNAPSHOT:
+        pytest.skip("상품정보_*.json 스냅샷 없음")
+    data, loaded = benchmark(load_snapshot, SNAPSHOT)
+    assert loaded
+
+
+def test_snapshot_save(benchmark, products, tmp_path):
+    """실제 상품정보 스냅샷 JSON 저장 (GUI 중간 저장과 같은 형식)"""
+    path = tmp_path / "snapshot.json"
+    data = {"상품_목록": copy.deepcopy(products)}
+
+    def run():
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump(data, f, ensure_ascii=False, indent=2)
+
+    benchmark(run)
+    assert path.stat().st_size > 0
+
+
+def test_excel_append(benchmark, products, tmp_path):
+    """가격 분석 결과 엑셀에 1페이지 (100행) 추가"""
+    pytest.importorskip("pandas")
+    pytest.importorskip("openpyxl")
+    path = str(tmp_path / "report.xlsx")
+    rows = [report_row(product, 1) for product in products[:100]]
+
+    def setup():
+        create_report(path)
+        return (path, rows), {}
+
+    benchmark.pedantic(append_report, setup=setup, rounds=10)
+
+
+# ----- 화면 -----
+
+def test_table_population(benchmark, products):
+    """내 상품 테이블 1페이지 (100행) 표시"""
+    os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+    buyma = pytest.importorskip("buyma")
+    from PyQt6.QtWidgets import QApplication, QTableWidget
+
+    app = QApplication.instance() or QApplication([])
+    page = products[:100]
+
+    class TableHolder:
+        """Main 의 테이블 표시 메서드만 실행하는 객체"""
+        price_table = QTableWidget(0, 7)
+        log_message = staticmethod(lambda message: None)
+        add_action_buttons_to_row = buyma.Main.add_action_buttons_to_row
+        add_remaining_action_buttons = staticmethod(lambda start_row, total_rows: None)
+        add_to_favorite_from_price_table = staticmethod(lambda row: None)
+
+    holder = TableHolder()
+    index = ProductIndex()
+
+    def run():
+        index.rebuild(products)
+        index.set_view(page)
+        buyma.Main.display_products_in_table_optimized(holder, page)
+
+    benchmark(run)
+    assert holder.price_table.rowCount() == len(page)
+    app.processEvents()
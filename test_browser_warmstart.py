@@ -0,0 +1,96 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+브라우저 웜 스타트 (로그인 쿠키 저장/복원) 테스트
+"""
+
+import json
+import os
+import tempfile
+import time
+
+from browser_warmstart import CookieStore
+from fake_driver import FakeDriver
+from rate_limiter import RateLimiterRegistry
+
+
+class LoginDriver(FakeDriver):
+    """쿠키가 유효하지 않으면 마이페이지 접속 시 로그인 페이지로 보내는 가짜 드라이버"""
+
+    def __init__(self, logged_in=True):
+        super().__init__()
+        self.logged_in = logged_in
+
+    def _load(self, url):
+        if url.endswith("/my/") and not (self.logged_in and self.cookies):
+            url = url[:-len("/my/")] + "/login/"
+        super()._load(url)
+
+
+def make_store(**kwargs):
+    return CookieStore(path=os.path.join(tempfile.mkdtemp(), "cookies.json"), log=lambda message: None, **kwargs)
+
+
+def saved_store(cookies):
+    store = make_store()
+    source = FakeDriver()
+    for cookie in cookies:
+        source.add_cookie(cookie)
+    assert store.save(source)
+    return store
+
+
+def test_save_and_load_with_expiry():
+    """저장한 쿠키를 불러오고, 만료된 쿠키와 72시간 지난 파일은 사용하지 않음"""
+    now = time.time()
+    store = saved_store([
+        {'name': 'session', 'value': 'a'},
+        {'name': 'remember', 'value': 'b', 'expiry': now + 3600},
+        {'name': 'old', 'value': 'c', 'expiry': now - 3600},
+    ])
+    assert [c['name'] for c in store.load()] == ['session', 'remember']
+    assert store.save(FakeDriver()) is False   # 쿠키가 없으면 기존 파일 유지
+    assert len(store.load()) == 2
+
+    with open(store.path, 'r', encoding='utf-8') as f:
+        data = json.load(f)
+    data['saved_at'] = now - 73 * 3600
+    with open(store.path, 'w', encoding='utf-8') as f:
+        json.dump(data, f)
+    assert store.load() == []
+
+    store.clear()
+    assert not os.path.exists(store.path) and store.load() == []
+
+
+def test_warm_start_and_cold_fallback():
+    """유효한 쿠키면 웜 스타트, 쿠키가 없거나 만료되었으면 False (폼 로그인으로 진행)"""
+    store = saved_store([{'name': 'session', 'value': 'a', 'domain': '.buyma.com', 'sameSite': 'Lax'}])
+    driver = LoginDriver()
+    assert store.warm_start(driver)
+    assert driver.cookies == [{'name': 'session', 'value': 'a', 'domain': '.buyma.com'}]
+    assert driver.visited == ["https://www.buyma.com/", "https://www.buyma.com/my/"]
+    assert len(store.start_times['warm']) == 1
+
+    assert not store.warm_start(LoginDriver(logged_in=False))
+    assert not make_store().warm_start(LoginDriver())
+    assert len(store.start_times['warm']) == 1
+
+    store.record_start('cold', 12.0)
+    assert store.summary().startswith("콜드 1회 평균 12.0초, 웜 1회")
+
+
+def test_warm_start_uses_rate_limiter_base_url():
+    """속도 제한기에 재생 서버 주소가 있으면 복원/로그인 확인도 그 주소로 접속"""
+    store = saved_store([{'name': 'session', 'value': 'a'}])
+    store.rate_limiter = RateLimiterRegistry(base_url="http://127.0.0.1:8765")
+    driver = LoginDriver()
+    assert store.warm_start(driver)
+    assert driver.visited == ["http://127.0.0.1:8765/", "http://127.0.0.1:8765/my/"]
+
+
+if __name__ == "__main__":
+    test_save_and_load_with_expiry()
+    test_warm_start_and_cold_fallback()
+    test_warm_start_uses_rate_limiter_base_url()
+    print("=== 테스트 완료 ===")
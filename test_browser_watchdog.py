@@ -0,0 +1,155 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+브라우저 메모리 감시 (재시작 기준 / 남은 Chrome 프로세스 정리) 테스트
+"""
+
+from contextlib import contextmanager
+from types import SimpleNamespace
+
+import browser_watchdog
+from browser_watchdog import BrowserWatchdog
+
+
+class NoSuchProcess(Exception):
+    pass
+
+
+class AccessDenied(Exception):
+    pass
+
+
+class StubProcess:
+    """psutil.Process 대용 - 메모리/파일 핸들/하위 프로세스만 흉내"""
+
+    def __init__(self, table, pid, name, rss_mb, fds=10, children=()):
+        self.table = table
+        self.pid = pid
+        self._name = name
+        self.rss_mb = rss_mb
+        self.fds = fds
+        self.child_pids = list(children)
+
+    def name(self):
+        return self._name
+
+    def memory_info(self):
+        return SimpleNamespace(rss=int(self.rss_mb * 1024 * 1024))
+
+    def num_fds(self):
+        return self.fds
+
+    def children(self, recursive=False):
+        result = []
+        for pid in self.child_pids:
+            if pid in self.table.processes:
+                child = self.table.processes[pid]
+                result.append(child)
+                if recursive:
+                    result.extend(child.children(recursive=True))
+        return result
+
+    def kill(self):
+        self.table.killed.append(self.pid)
+        del self.table.processes[self.pid]
+
+
+class ProcessTable:
+    """PID → StubProcess 표를 가진 psutil 모듈 대용"""
+
+    NoSuchProcess = NoSuchProcess
+    AccessDenied = AccessDenied
+
+    def __init__(self):
+        self.processes = {}
+        self.killed = []
+
+    def add(self, pid, name, rss_mb, fds=10, children=()):
+        self.processes[pid] = StubProcess(self, pid, name, rss_mb, fds, children)
+
+    def Process(self, pid):
+        if pid not in self.processes:
+            raise NoSuchProcess(pid)
+        return self.processes[pid]
+
+    def pid_exists(self, pid):
+        return pid in self.processes
+
+
+@contextmanager
+def stub_psutil(table):
+    original = browser_watchdog.psutil
+    browser_watchdog.psutil = table
+    try:
+        yield table
+    finally:
+        browser_watchdog.psutil = original
+
+
+def make_driver(pid):
+    return SimpleNamespace(service=SimpleNamespace(process=SimpleNamespace(pid=pid)))
+
+
+def browser_tree(table, root, rss_mb=500):
+    """chromedriver 1개 + Chrome 2개 (두 번째는 첫 번째의 하위 프로세스)"""
+    table.add(root, "chromedriver", 10, children=[root + 1])
+    table.add(root + 1, "chrome", rss_mb, children=[root + 2])
+    table.add(root + 2, "chrome", rss_mb)
+
+
+def test_check_thresholds():
+    """메모리/핸들/프로세스 수 중 하나라도 기준을 넘으면 재시작 필요"""
+    messages = []
+    with stub_psutil(ProcessTable()) as table:
+        browser_tree(table, 100)
+        driver = make_driver(100)
+
+        watchdog = BrowserWatchdog(max_rss_mb=1200, max_handles=100, max_processes=5, log=messages.append)
+        assert watchdog.sample(driver) == {'rss_mb': 1010.0, 'handles': 30, 'processes': 3}
+        assert watchdog.check(driver) is False
+
+        table.processes[102].rss_mb = 700
+        assert watchdog.check(driver) is True
+        assert "메모리 1210MB > 1200MB" in messages[-1] and watchdog.recycle_count == 1
+
+        assert BrowserWatchdog(max_handles=20, log=messages.append).should_recycle(driver) == \
+            (True, "핸들 30개 > 20개")
+        assert BrowserWatchdog(max_processes=2, log=messages.append).should_recycle(driver) == \
+            (True, "프로세스 3개 > 2개")
+
+        # PID 를 알 수 없거나 이미 종료된 드라이버는 재시작 판단 안 함
+        assert watchdog.check(SimpleNamespace()) is False
+        assert watchdog.check(make_driver(999)) is False
+        assert watchdog.recycle_count == 1
+
+
+def test_kill_orphans_only_released_or_dead_trees():
+    """종료한 드라이버와 비정상 종료된 드라이버의 Chrome 만 정리, PID 재사용 프로세스와 사용 중인 브라우저는 유지"""
+    with stub_psutil(ProcessTable()) as table:
+        browser_tree(table, 100)
+        browser_tree(table, 200)
+        browser_tree(table, 300)
+        watchdog = BrowserWatchdog(log=lambda message: None)
+        for root in (100, 200, 300):
+            watchdog.track(make_driver(root))
+
+        # 새 렌더러 프로세스도 측정할 때 정리 대상에 추가
+        table.add(103, "chrome", 100)
+        table.processes[102].child_pids.append(103)
+        watchdog.sample(make_driver(100))
+
+        watchdog.release(make_driver(100))         # 정상 종료 요청
+        del table.processes[200]                   # chromedriver 가 비정상 종료 (Chrome 만 남음)
+        table.add(202, "python", 10)               # 같은 PID 를 다른 프로세스가 재사용
+
+        assert watchdog.kill_orphans() == 5
+        assert sorted(table.killed) == [100, 101, 102, 103, 201]
+        assert sorted(table.processes) == [202, 300, 301, 302]
+        assert watchdog.killed_count == 5
+        assert watchdog.kill_orphans() == 0
+
+
+if __name__ == "__main__":
+    test_check_thresholds()
+    test_kill_orphans_only_released_or_dead_trees()
+    print("=== 테스트 완료 ===")
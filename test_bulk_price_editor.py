@@ -0,0 +1,102 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+판매 목록 페이지 일괄 가격 수정 테스트
+"""
+
+from bulk_price_editor import BulkPriceEditor, group_targets_by_page, read_sell_rows
+from job_executor import JobCancelled
+
+
+class ScriptDriver:
+    """execute_script 결과만 돌려주는 드라이버"""
+
+    def __init__(self, result):
+        self.result = result
+
+    def execute_script(self, script, *args):
+        return self.result
+
+
+class FakePageEditor(BulkPriceEditor):
+    """페이지 로딩/행 수정을 메모리 데이터로 대신하는 편집기"""
+
+    def __init__(self, pages, fail_ids=(), cancel_page=None):
+        super().__init__()
+        self.pages = pages
+        self.fail_ids = set(fail_ids)
+        self.cancel_page = cancel_page
+        self.edits = []
+
+    def _load_page(self, driver, page):
+        if page == self.cancel_page:
+            raise JobCancelled("작업 중지 요청")
+        self.stats['page_loads'] += 1
+        return {pid: (index, price) for index, (pid, price) in enumerate(self.pages.get(page, []))}
+
+    def edit_row(self, driver, row_index, new_price):
+        self.edits.append((row_index, new_price))
+        return row_index not in self.fail_ids
+
+
+def test_read_rows_and_group_targets():
+    """행 정보 파싱과 페이지별 묶기"""
+    rows = read_sell_rows(ScriptDriver([
+        {'index': 0, 'product_id': '111', 'price': '¥12,000'},
+        {'index': 2, 'product_id': '222', 'price': ''},
+    ]))
+    assert rows == {'111': (0, 12000), '222': (2, None)}
+
+    grouped = group_targets_by_page([
+        {'product_id': 1, 'new_price': 1000, 'page': 2},
+        {'product_id': 2, 'new_price': 1000, 'page': 1},
+        {'product_id': 3, 'new_price': 1000, 'page': 2},
+    ])
+    assert list(grouped) == [1, 2]
+    assert [t['product_id'] for t in grouped[2]] == [1, 3]
+
+
+def test_one_page_load_per_page():
+    """같은 페이지 상품은 페이지 1회 로딩으로 모두 수정, 같은 가격은 건너뜀"""
+    editor = FakePageEditor({1: [('11', 5000), ('12', 6000), ('13', 7000)]})
+    results = editor.apply(None, [
+        {'product_id': '11', 'new_price': 4500, 'page': 1},
+        {'product_id': '12', 'new_price': 6000, 'page': 1},
+        {'product_id': '13', 'new_price': 6500, 'page': 1},
+    ])
+    assert results == {'11': 'updated', '12': 'unchanged', '13': 'updated'}
+    assert editor.stats['page_loads'] == 1
+    assert editor.edits == [(0, 4500), (2, 6500)]
+
+
+def test_shifted_rows_and_failures():
+    """예상 페이지에 없으면 다음 페이지 확인, 끝내 없으면 not_found"""
+    editor = FakePageEditor({1: [('21', 1000)], 2: [('22', 2000), ('23', 3000)]}, fail_ids={1})
+    results = editor.apply(None, [
+        {'product_id': '22', 'new_price': 1900, 'page': 1},
+        {'product_id': '23', 'new_price': 2900, 'page': 1},
+        {'product_id': '99', 'new_price': 100, 'page': 1},
+    ])
+    assert results == {'22': 'updated', '23': 'failed', '99': 'not_found'}
+    assert editor.stats['page_loads'] == 2
+
+
+def test_cancel_keeps_finished_results():
+    """페이지 로딩 중 중지 요청이 오면 멈추고, 이미 수정한 상품 결과와 통계는 그대로 반환"""
+    editor = FakePageEditor({1: [('31', 1000)], 3: [('33', 3000)]}, cancel_page=3)
+    results = editor.apply(None, [
+        {'product_id': '31', 'new_price': 900, 'page': 1},
+        {'product_id': '33', 'new_price': 2900, 'page': 3},
+    ])
+    assert results['31'] == 'updated'
+    assert results['33'] == 'not_found'
+    assert editor.edits == [(0, 900)]
+    assert editor.stats['updated'] == 1 and editor.stats['page_loads'] == 1
+
+
+if __name__ == "__main__":
+    test_read_rows_and_group_targets()
+    test_one_page_load_per_page()
+    test_shifted_rows_and_failures()
+    test_cancel_keeps_finished_results()
+    print("=== 테스트 완료 ===")
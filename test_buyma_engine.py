@@ -0,0 +1,157 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+화면 없이 동작하는 가격 관리 엔진 / 명령줄 테스트
+"""
+
+import json
+import os
+import tempfile
+
+import pytest
+
+from analysis_report import AnalysisReport
+from buyma_cli import build_parser
+from buyma_engine import SORT_PRICE_ASC, SORT_RELEVANCE, BuymaEngine, build_snapshot, clean_search_name, decide_price, extract_product_id, \
+    load_snapshot, parse_sell_rows
+from competitor_catalog import CompetitorCatalog
+
+
+def test_clean_search_name():
+    """商品ID 이전까지, 숫자 포함 단어 제거 후 영어만"""
+    assert clean_search_name("★PRADA Re-Nylon M0455 bag 商品ID: 1001") == "PRADA ReNylon bag"
+    assert clean_search_name("★PRADA 나일론 M0455 商品ID: 1001", english_only=False) == "PRADA 나일론 M0455"
+
+
+def test_decide_price():
+    """최소 마진 이내면 수정, 넘으면 손실 예상"""
+    product = {'current_price': '¥10,000'}
+    assert decide_price(product, 10500, 100, 500) is True
+    assert product['suggested_price'] == 10400 and product['price_difference'] == 400
+
+    product = {'current_price': '¥10,000'}
+    assert decide_price(product, 9000, 100, 500) is False
+    assert product['status'].startswith('⚠️ 손실 예상')
+
+
+def test_parse_sell_rows_and_snapshot():
+    """판매 목록 행 → 내 상품 dict → 스냅샷 저장/불러오기"""
+    products = parse_sell_rows([
+        {'title': 'PRADA bag', 'price': '¥100,000', 'url': 'https://www.buyma.com/item/1001/'},
+        {'title': 'no link', 'price': '', 'url': ''},
+    ])
+    assert products[0]['title'] == "PRADA bag 商品ID: 1001" and products[0]['product_id'] == "1001"
+    assert products[1]['product_id'] == "ID 없음"
+    prefixed = parse_sell_rows([{'title': 'PRADA bag', 'url': '/item/1001/'}], id_prefix="0")
+    assert prefixed[0]['product_id'] == "01001" and prefixed[0]['title'] == "PRADA bag 商品ID: 01001"
+
+    path = os.path.join(tempfile.mkdtemp(), "snapshot.json")
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump(build_snapshot(products), f, ensure_ascii=False)
+    data, loaded = load_snapshot(path)
+    assert data["수집_정보"]["총_상품수"] == 2
+    assert loaded == products
+
+
+def test_lowest_price_from_catalog():
+    """카탈로그로 답할 수 있으면 브라우저 없이 최저가 반환"""
+    catalog = CompetitorCatalog(path=":memory:")
+    catalog.record_search("PRADA bag", [{'name': 'PRADA bag', 'price': 9000, 'url': 'u1', 'seller': 's'}],
+                          lowest_price=9000, complete=True)
+    messages = []
+    engine = BuymaEngine(log=messages.append, catalog=catalog)
+
+    product = {'title': 'PRADA bag 商品ID: 1001', 'current_price': '¥9,200'}
+    assert engine.analyze_product(None, product, 100, 500) is True
+    assert product['lowest_price'] == 9000 and product['suggested_price'] == 8900
+    assert any('카탈로그 응답' in message for message in messages)
+
+
+def test_lowest_price_sort_without_name_matching():
+    """상품명 검사를 끄면 가격순 대신 관련도순 첫 페이지만 검색"""
+    scans = []
+
+    def scan(driver, search_name, sort, max_page=20, brand_name=""):
+        scans.append((sort, max_page))
+        return {'lowest_price': 5000, 'found_products': 1, 'tiles': [], 'pages': 1, 'complete': True, 'failed': False}
+
+    for name_matching in (True, False):
+        engine = BuymaEngine(log=lambda message: None, catalog=CompetitorCatalog(path=":memory:"),
+                             name_matching=name_matching)
+        engine.search_stats.should_verify = lambda: False
+        engine.scan_search_pages = scan
+        assert engine.lowest_price(object(), "PRADA bag") == 5000
+    assert scans == [(SORT_PRICE_ASC, 20), (SORT_RELEVANCE, 1)]
+
+
+def test_extract_product_id():
+    """商品ID → ID → 마지막 숫자 묶음 순서"""
+    assert extract_product_id("PRADA 2024 bag 商品ID: 1001") == "1001"
+    assert extract_product_id("GUCCI ID:77 wallet 2") == "77"
+    assert extract_product_id("GUCCI wallet 2024") == "2024"
+    assert extract_product_id("GUCCI wallet") is None
+
+
+def test_current_price_from_session_and_favorite_without_driver():
+    """현재가는 HTTP 세션 조회가 되면 브라우저 없이 반환, 주력상품 검색은 브라우저가 없으면 None"""
+    class Bridge:
+        def __init__(self):
+            self.keywords = []
+
+        def fetch_my_sell_price(self, keyword):
+            self.keywords.append(keyword)
+            return 45000
+
+    bridge = Bridge()
+    messages = []
+    engine = BuymaEngine(log=messages.append, catalog={}, session_bridge=bridge)
+    assert engine.current_price(None, "GUCCI wallet 商品ID: 98765") == 45000
+    assert engine.current_price(None, "GUCCI wallet", product_id="111") == 45000
+    assert bridge.keywords == ["98765", "111"]
+
+    assert engine.favorite_lowest_price(None, "★PRADA bag 商品ID: 1001") is None
+    assert "🔍 주력상품 검색어: 'PRADA bag'" in messages
+
+    # 메시지만 다른 곳으로 보내는 엔진 - 상태는 공유
+    other = []
+    view = engine.with_log(other.append)
+    assert view.catalog is engine.catalog and view.session_bridge is bridge
+    view.log("작업 로그")
+    assert other == ["작업 로그"] and "작업 로그" not in messages
+
+
+def test_analysis_report_pages():
+    """헤더 생성 후 페이지/묶음 단위로 행 추가 - 상품별 페이지 함수 지원"""
+    pd = pytest.importorskip("pandas")
+    pytest.importorskip("openpyxl")
+    report = AnalysisReport(os.path.join(tempfile.mkdtemp(), "report.xlsx"))
+    report.create()
+    products = [{'title': 'PRADA bag 商品ID: 1', 'current_price': '¥10,000', 'lowest_price': 9000, 'status': '💰'},
+                {'title': 'GUCCI wallet', 'current_price': '¥5,000', 'status': '❌'}]
+    assert report.append(products, 1) == 2
+    assert report.append(products[:1], lambda product: 7) == 1
+
+    df = pd.read_excel(report.path)
+    assert report.rows == 3 and list(df['페이지']) == [1, 1, 7]
+    assert df['상품명'][0] == "PRADA bag" and df['가격차이'][0] == "+1,000엔"
+
+
+def test_cli_parser():
+    """서브 명령 인자"""
+    args = build_parser().parse_args(['analyze', 'a.json', '--discount', '200', '--time-limit', '30'])
+    assert args.command == 'analyze' and args.discount == 200 and args.time_limit == 30
+    args = build_parser().parse_args(['reprice', 'a.json', '--dry-run'])
+    assert args.dry_run and args.handler.__name__ == 'cmd_reprice'
+
+
+if __name__ == "__main__":
+    test_clean_search_name()
+    test_decide_price()
+    test_parse_sell_rows_and_snapshot()
+    test_lowest_price_from_catalog()
+    test_lowest_price_sort_without_name_matching()
+    test_extract_product_id()
+    test_current_price_from_session_and_favorite_without_driver()
+    test_analysis_report_pages()
+    test_cli_parser()
+    print("=== 테스트 완료 ===")
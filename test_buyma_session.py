@@ -0,0 +1,128 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+인증 HTTP 세션 (쿠키 동기화 / 로그인 재동기화) 테스트
+"""
+
+from types import SimpleNamespace
+
+from buyma_session import BuymaSessionBridge, parse_my_sell_prices
+from fake_driver import FakeDriver
+
+
+def response(url, text="", status_code=200):
+    return SimpleNamespace(url=url, text=text, status_code=status_code)
+
+
+class StubCookies(dict):
+    def set(self, name, value, domain=None, path='/'):
+        self[name] = value
+
+
+class StubSession:
+    """미리 정한 응답을 차례로 돌려주는 requests.Session 대용"""
+
+    def __init__(self, responses, user_agent):
+        self.responses = responses
+        self.cookies = StubCookies()
+        self.headers = {'User-Agent': user_agent}
+        self.requested = []
+        self.closed = False
+
+    def get(self, url, **kwargs):
+        self.requested.append((url, kwargs.get('params')))
+        return self.responses.pop(0)
+
+    def close(self):
+        self.closed = True
+
+
+class StubBridge(BuymaSessionBridge):
+    """네트워크 대신 StubSession 을 만드는 세션 브리지"""
+
+    def __init__(self, driver, responses):
+        super().__init__(lambda: driver, log=lambda message: None)
+        self.responses = responses
+        self.built = []
+
+    def _build_session(self, user_agent=None):
+        session = StubSession(self.responses, user_agent)
+        self.built.append(session)
+        return session
+
+
+def make_driver(session_id="s1"):
+    driver = FakeDriver()
+    driver.session_id = session_id
+    driver.add_cookie({'name': 'buyma_session', 'value': 'abc', 'domain': '.buyma.com'})
+    return driver
+
+
+def test_parse_my_sell_prices():
+    """가격 표시 요소만 표시 순서대로, 숫자가 없는 항목은 건너뜀"""
+    html = """
+        <span class="js-item-price-display fab-price">¥12,300</span>
+        <span class="other">¥1</span>
+        <span class="js-item-price-display"><em>¥</em>9,800</span>
+        <span class="js-item-price-display">-</span>
+    """
+    assert parse_my_sell_prices(html) == [12300, 9800]
+    assert parse_my_sell_prices(None) == []
+
+
+def test_login_redirect_resyncs_cookies_once():
+    """로그인 페이지로 튕기면 브라우저 쿠키를 다시 가져와 1회만 재시도"""
+    driver = make_driver()
+    ok = response("https://www.buyma.com/my/", "ok")
+    bridge = StubBridge(driver, [response("https://www.buyma.com/login/"), ok])
+
+    assert bridge.get("/my/") is ok
+    assert len(bridge.built) == 2 and bridge.built[0].closed
+    assert bridge.session.cookies == {'buyma_session': 'abc'}
+    assert bridge.session.headers['User-Agent'] == "Mozilla/5.0 (FakeDriver)"
+
+    bridge.responses.extend([response("https://www.buyma.com/login/"), response("https://www.buyma.com/login/")])
+    assert bridge.get("/my/") is None
+    assert bridge.responses == []
+
+    bridge.responses.append(response("https://www.buyma.com/my/", status_code=500))
+    assert bridge.is_session_valid() is False
+
+
+def test_session_id_change_resyncs():
+    """브라우저 세션(재시작)이 바뀌었을 때만 쿠키 재동기화"""
+    driver = make_driver("s1")
+    bridge = StubBridge(driver, [response("https://www.buyma.com/my/", "ok") for _ in range(3)])
+
+    bridge.get("/my/")
+    bridge.get("https://www.buyma.com/my/")
+    assert len(bridge.built) == 1
+    assert bridge.built[0].requested[0][0] == "https://www.buyma.com/my/"
+
+    driver.session_id = "s2"
+    driver.cookies = [{'name': 'buyma_session', 'value': 'new'}]
+    bridge.get("/my/")
+    assert len(bridge.built) == 2
+    assert bridge.session.cookies == {'buyma_session': 'new'}
+
+    bridge.invalidate()
+    assert bridge.session is None and bridge.built[1].closed
+
+
+def test_fetch_my_sell_price():
+    """내 상품 검색 결과의 첫 가격, 찾지 못하면 None"""
+    html = '<span class="js-item-price-display">¥7,700</span><span class="js-item-price-display">¥8,800</span>'
+    bridge = StubBridge(make_driver(), [response("https://www.buyma.com/my/sell/search", html),
+                                        response("https://www.buyma.com/my/sell/search", "")])
+
+    assert bridge.fetch_my_sell_price("1001") == 7700
+    assert bridge.session.requested[0][1]['keyword'] == "1001"
+    assert bridge.fetch_my_sell_price("1002") is None
+
+
+if __name__ == "__main__":
+    test_parse_my_sell_prices()
+    test_login_redirect_resyncs_cookies_once()
+    test_session_id_change_resyncs()
+    test_fetch_my_sell_price()
+    print("=== 테스트 완료 ===")
@@ -0,0 +1,83 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+경쟁사 카탈로그 (검색 생략) 테스트
+"""
+
+from competitor_catalog import CompetitorCatalog
+
+
+def make_catalog():
+    return CompetitorCatalog(path=":memory:", ttl_hours=1)
+
+
+def test_same_query_is_answered_from_catalog():
+    """같은 검색어는 저장된 최저가로 응답"""
+    catalog = make_catalog()
+    assert catalog.lookup_lowest_price("Prada Re Nylon") == (False, None)
+
+    catalog.record_search("Prada Re Nylon", [
+        {'name': 'PRADA Re Nylon bag', 'price': 120000, 'url': 'https://www.buyma.com/item/1/'},
+    ], lowest_price=120000, complete=False)
+
+    assert catalog.lookup_lowest_price("prada  re nylon") == (True, 120000)
+
+
+def test_narrower_query_uses_complete_search():
+    """더 넓은 검색어를 끝까지 검색했으면 구체적인 검색어도 카탈로그에서 응답"""
+    catalog = make_catalog()
+    catalog.record_search("Prada", [
+        {'name': 'PRADA Re Nylon bag', 'price': 120000, 'url': 'https://www.buyma.com/item/1/'},
+        {'name': 'PRADA Re Nylon bag black', 'price': 98000, 'url': 'https://www.buyma.com/item/2/'},
+        {'name': 'PRADA Galleria', 'price': 300000, 'url': 'https://www.buyma.com/item/3/'},
+    ], lowest_price=98000, complete=True)
+
+    assert catalog.lookup_lowest_price("Prada Re Nylon") == (True, 98000)
+    assert catalog.lookup_lowest_price("Prada Cleo") == (True, None)
+
+
+def test_incomplete_search_does_not_cover_other_queries():
+    """중간에 멈춘 검색은 다른 검색어 응답에 사용하지 않음"""
+    catalog = make_catalog()
+    catalog.record_search("Prada", [
+        {'name': 'PRADA Re Nylon bag', 'price': 120000, 'url': 'https://www.buyma.com/item/1/'},
+    ], lowest_price=120000, complete=False)
+
+    assert catalog.lookup_lowest_price("Prada Re Nylon") == (False, None)
+
+
+def test_stale_entries_are_ignored():
+    """TTL이 지난 검색 결과는 사용하지 않음"""
+    catalog = make_catalog()
+    catalog.record_search("Prada", [], lowest_price=None, complete=True, seen_at=1000.0)
+
+    assert catalog.lookup_lowest_price("Prada", now=1000.0 + 7200) == (False, None)
+
+
+def test_covering_answer_matches_live_scan():
+    """넓은 검색어 응답은 그 검색의 결과 상품만, 실시간 검색과 같은 토큰/브랜드 기준으로 계산"""
+    catalog = make_catalog()
+    catalog.record_search("Nylon", [
+        {'name': 'MIUMIU Nylon pouch re', 'price': 50000, 'url': 'https://www.buyma.com/item/9/'},
+    ], lowest_price=50000, complete=True)
+    catalog.record_search("Prada", [
+        {'name': 'Re-Nylon PRADA shoulder bag', 'price': 110000, 'url': 'https://www.buyma.com/item/1/'},
+        {'name': 'Re Nylon pouch', 'price': 40000, 'url': 'https://www.buyma.com/item/2/'},
+    ], lowest_price=40000, complete=True)
+
+    # 단어 순서가 달라도 일치, 다른 검색(Nylon)에서 본 상품은 후보가 아님
+    assert catalog.lookup_lowest_price("Prada Re Nylon", brand="PRADA") == (True, 110000)
+    # 같은 검색어라도 브랜드가 다르면 따로 저장/응답
+    catalog.record_search("Prada Re Nylon", [], lowest_price=90000, complete=False, brand="PRADA")
+    assert catalog.lookup_lowest_price("Prada Re Nylon", brand="PRADA") == (True, 90000)
+    assert catalog.lookup_lowest_price("Prada Re Nylon", brand="") == (True, 110000)
+    assert catalog.lookup_lowest_price("Prada Re Nylon", brand="MIUMIU", covering=False) == (False, None)
+
+
+if __name__ == "__main__":
+    test_same_query_is_answered_from_catalog()
+    test_narrower_query_uses_complete_search()
+    test_incomplete_search_does_not_cover_other_queries()
+    test_stale_entries_are_ignored()
+    test_covering_answer_matches_live_scan()
+    print("=== 테스트 완료 ===")
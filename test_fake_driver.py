@@ -0,0 +1,186 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+가짜 WebDriver(lxml) 로 브라우저 없이 추출 로직 테스트
+"""
+
+import json
+import tempfile
+
+import pytest
+
+from bulk_price_editor import MY_SELL_LIST_URL, ROW_SELECTOR, read_sell_rows
+from buyma_engine import MY_SELL_SCRIPT, MY_SELL_SEARCH_URL, parse_sell_rows
+from fake_driver import FakeDriver, NoSuchElementException
+from page_fixtures import PageRecorder
+from search_tiles import read_product_tiles
+from tracing import Tracer
+from variation_extractor import VariationExtractor
+
+
+SEARCH_URL = "https://www.buyma.com/r/-O3/PRADA%20bag_1/"
+
+SEARCH_HTML = """
+<html><head><title>PRADA bag | BUYMA</title></head><body>
+<ul class="product_lists">
+  <li><div class="product_name"><a href="/item/111/">PRADA  Re-Nylon
+      bag</a></div><span class="Price_Txt">¥120,000</span><p class="product_Buyer">shopA</p></li>
+  <li><div class="product_name"><a href="/item/222/">PRADA tote</a></div><span class="Price_Txt">¥98,000</span></li>
+  <li><div class="product_name"><a href="/item/333/">PRADA sold out</a></div></li>
+  <li class="ad">광고</li>
+</ul>
+</body></html>
+"""
+
+MY_SELL_HTML = """
+<html><body>
+<p class="itemedit_actions_nums">1～100件(全 2,962件)</p>
+<table>
+  <tr class="cursor_pointer js-checkbox-check-row">
+    <td class="item_name">GUCCI wallet</td>
+    <td><a class="fab-design-d--b" href="https://www.buyma.com/item/98765/">편집</a>
+        <span class="js-item-price-display">¥45,000</span></td>
+  </tr>
+  <tr class="cursor_pointer js-checkbox-check-row"><td>태그 행</td></tr>
+  <tr class="cursor_pointer js-checkbox-check-row">
+    <td class="item_name">PRADA bag</td>
+    <td><a class="fab-design-d--b" href="/item/12345/">편집</a>
+        <span class="js-item-price-display">¥120,000</span></td>
+  </tr>
+</table>
+</body></html>
+"""
+
+ITEM_HTML = """
+<html><body>
+<p class="colorsize_selector">색상</p>
+<ul class="colorsize_list" style="display:none">
+  <li><span class="item_color black"></span> Black </li>
+  <li><span class="item_color white"></span> White</li>
+</ul>
+<p class="colorsize_selector">사이즈</p>
+<ul class="colorsize_list js-size-list" style="display: none;"><li>S</li><li> M </li></ul>
+<input type="checkbox" name="agree">
+<script type="application/ld+json">{"color": "Red"}</script>
+</body></html>
+"""
+
+
+def test_find_text_and_attributes():
+    """CSS/XPath/이름 찾기, 보이는 텍스트, 절대 주소 href"""
+    driver = FakeDriver({SEARCH_URL: SEARCH_HTML})
+    driver.get(SEARCH_URL)
+    assert driver.title == "PRADA bag | BUYMA"
+    items = driver.find_elements("css selector", "ul.product_lists li")
+    assert len(items) == 4
+    link = items[0].find_element("tag name", "a")
+    assert link.text == "PRADA Re-Nylon bag"
+    assert link.get_attribute("href") == "https://www.buyma.com/item/111/"
+    assert driver.find_element("xpath", "//span[@class='Price_Txt']").text == "¥120,000"
+    with pytest.raises(NoSuchElementException):
+        items[3].find_element("css selector", "div.product_name")
+
+
+def test_bundled_scripts_match_browser_results():
+    """검색 타일 / 판매 목록 / 가격 수정 행 스크립트"""
+    driver = FakeDriver({SEARCH_URL: SEARCH_HTML, MY_SELL_LIST_URL.format(page=1): MY_SELL_HTML})
+    driver.get(SEARCH_URL)
+    count, tiles = read_product_tiles(driver)
+    assert count == 4
+    assert [(t['name'], t['price'], t['seller']) for t in tiles] == [
+        ("PRADA Re-Nylon bag", 120000, "shopA"), ("PRADA tote", 98000, "")]
+
+    driver.get(MY_SELL_LIST_URL.format(page=1))
+    data = driver.execute_script(MY_SELL_SCRIPT, ROW_SELECTOR)
+    assert "全 2,962件" in data['total']
+    products = parse_sell_rows(data['rows'])
+    assert [p['product_id'] for p in products] == ["98765", "12345"]
+    assert read_sell_rows(driver) == {"98765": (0, 45000), "12345": (2, 120000)}
+
+
+def test_variations_hidden_lists_and_toggles():
+    """숨겨진 목록은 .text 가 비어도 스크립트(textContent) 로 추출, 클릭하면 표시 전환"""
+    driver = FakeDriver({"https://www.buyma.com/item/1/": ITEM_HTML})
+    driver.get("https://www.buyma.com/item/1/")
+    assert VariationExtractor().read_page(driver) == ([["black", "Black"], ["white", "White"]], ["S", "M"])
+
+    buttons = driver.find_elements("css selector", "p.colorsize_selector")
+    size_list = driver.find_element("css selector", ".colorsize_list.js-size-list")
+    assert not size_list.is_displayed() and size_list.find_element("tag name", "li").text == ""
+    buttons[1].click()
+    assert size_list.is_displayed() and [li.text for li in size_list.find_elements("tag name", "li")] == ["S", "M"]
+    buttons[1].click()
+    assert not size_list.is_displayed()
+
+    checkbox = driver.find_element("name", "agree")
+    checkbox.click()
+    assert checkbox.is_selected()
+
+
+def test_recorded_fixtures_and_command_counts():
+    """PageRecorder 로 기록한 폴더를 그대로 열고, 명령은 execute 를 거쳐 추적기로 집계"""
+    directory = tempfile.mkdtemp()
+    PageRecorder(directory).save(SEARCH_URL, SEARCH_HTML)
+    tracer = Tracer(enabled=True)
+    driver = tracer.instrument_driver(FakeDriver.from_fixtures(directory))
+
+    driver.get(SEARCH_URL + "?t=123")
+    assert read_product_tiles(driver)[0] == 4
+    driver.find_element("css selector", "ul.product_lists").find_elements("tag name", "li")
+    assert tracer.counters["webdriver.get"] == 1
+    assert tracer.counters["webdriver.executeScript"] == 1
+    assert tracer.counters["webdriver.findChildElements"] == 1
+
+    driver.get("https://www.buyma.com/r/없는페이지/")
+    assert "404" in driver.title
+    with pytest.raises(NotImplementedError):
+        driver.execute_script("return window.innerWidth;")
+
+
+def test_engine_reads_my_sell_page():
+    """엔진 판매 목록 읽기를 브라우저 없이 실행 (WebDriverWait 포함)"""
+    pytest.importorskip("selenium")
+    from buyma_engine import BuymaEngine
+    from rate_limiter import RateLimiterRegistry
+
+    limiter = RateLimiterRegistry()
+    limiter.configure('update', initial_rate=1000, max_rate=1000, burst=1000)
+    engine = BuymaEngine(log=lambda message: None, rate_limiter=limiter, catalog={})
+    driver = FakeDriver({MY_SELL_LIST_URL.format(page=1): MY_SELL_HTML})
+    products, total = engine.read_my_sell_page(driver, 1)
+    assert total == 2962 and [p['product_id'] for p in products] == ["98765", "12345"]
+    assert json.dumps(products, ensure_ascii=False)
+
+
+def test_engine_syncs_products_and_current_price():
+    """GUI 내 상품 불러오기 / 현재가 조회가 쓰는 엔진 경로 (제외 목록, 상품ID 접두어, 페이지 콜백)"""
+    pytest.importorskip("selenium")
+    from buyma_engine import BuymaEngine
+    from rate_limiter import RateLimiterRegistry
+
+    limiter = RateLimiterRegistry()
+    limiter.configure('update', initial_rate=1000, max_rate=1000, burst=1000)
+    engine = BuymaEngine(log=lambda message: None, rate_limiter=limiter, catalog={}, product_id_prefix="0")
+    driver = FakeDriver({
+        MY_SELL_LIST_URL.format(page=1): MY_SELL_HTML,
+        MY_SELL_SEARCH_URL.format(keyword="098765"): MY_SELL_HTML,
+    })
+    pages = []
+    products = engine.sync_my_products(driver, exclude_ids=["012345"],
+                                       prepare=lambda d, page: pages.append(('prepare', page)),
+                                       on_page=lambda page, found, total: pages.append((page, len(found), total)))
+    assert [p['product_id'] for p in products] == ["098765"]
+    assert pages == [('prepare', 1), (1, 1, 2962)]
+
+    assert engine.current_price(driver, "GUCCI wallet 商品ID: 098765") == 45000
+    assert engine.current_price(driver, "없는 상품") is None
+
+
+if __name__ == "__main__":
+    test_find_text_and_attributes()
+    test_bundled_scripts_match_browser_results()
+    test_variations_hidden_lists_and_toggles()
+    test_recorded_fixtures_and_command_counts()
+    test_engine_reads_my_sell_page()
+    test_engine_syncs_products_and_current_price()
+    print("=== 테스트 완료 ===")
@@ -0,0 +1,141 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+백그라운드 작업 실행기 / 취소 토큰 테스트
+"""
+
+import threading
+import time
+
+from fake_driver import FakeDriver
+from job_executor import (CANCELLED, DONE, FAILED, CancelToken, JobCancelled, JobExecutor,
+                          bind_current_job, cancellable_sleep, current_job, report_progress)
+from rate_limiter import RateLimiterRegistry
+from tracing import Tracer
+
+
+def test_token_sleep_wakes_on_cancel_and_waits_while_paused():
+    """취소하면 긴 대기도 바로 끝나고, 일시정지 중에는 재개까지 대기"""
+    token = CancelToken()
+    threading.Timer(0.1, token.cancel).start()
+    started = time.monotonic()
+    assert token.sleep(30) is False
+    assert time.monotonic() - started < 1.0
+
+    token = CancelToken()
+    token.pause()
+    threading.Timer(0.2, token.resume).start()
+    started = time.monotonic()
+    assert token.sleep(0) is True
+    assert time.monotonic() - started >= 0.2
+
+
+def test_submit_runs_job_and_rejects_duplicates():
+    """같은 이름의 작업은 끝날 때까지 다시 제출되지 않고, 실행 한도를 넘는 제출도 거절"""
+    messages = []
+    changes = []
+    executor = JobExecutor(max_workers=1, max_pending=1, log=messages.append, on_change=changes.append)
+    release = threading.Event()
+    seen = {}
+
+    def work(value):
+        seen['job'] = current_job().name
+        report_progress(1, 2, "진행 중")
+        release.wait(5)
+        seen['value'] = value
+
+    job = executor.submit('crawl', work, 42, title="크롤링")
+    assert executor.submit('crawl', work, 1) is None
+    assert executor.submit('upload', lambda: None) is not None      # 대기 1개까지 허용
+    assert executor.submit('login', lambda: None) is None           # 실행 1 + 대기 1 초과
+    assert len(messages) == 2
+
+    time.sleep(0.1)
+    assert "크롤링 실행 중 1/2" in executor.summary()
+    release.set()
+    assert executor.wait(timeout=5)
+    assert job.state == DONE and seen == {'job': 'crawl', 'value': 42}
+    assert current_job() is None
+    assert changes[0]['state'] == 'queued' and changes[-1]['state'] == DONE
+    assert executor.summary() == "없음"
+    assert executor.submit('crawl', work, 7) is not None            # 끝난 뒤에는 다시 제출 가능
+    executor.shutdown(1)
+
+
+def test_cancel_and_failure_states():
+    """중지 요청은 대기 중인 작업을 바로 깨우고, 예외는 로그와 함께 FAILED"""
+    messages = []
+    executor = JobExecutor(log=messages.append)
+    slept = {}
+
+    def long_wait():
+        started = time.monotonic()
+        slept['ok'] = cancellable_sleep(30)
+        slept['seconds'] = time.monotonic() - started
+
+    def broken():
+        raise ValueError("테스트 오류")
+
+    waiting = executor.submit('favorite', long_wait)
+    failing = executor.submit('upload', broken, title="업로드")
+    time.sleep(0.1)
+    assert executor.cancel('favorite') == 1
+    assert executor.wait(timeout=2)
+    assert waiting.state == CANCELLED and slept['ok'] is False and slept['seconds'] < 1.0
+    assert failing.state == FAILED and failing.error == "테스트 오류"
+    assert any("업로드" in message and "테스트 오류" in message for message in messages)
+    executor.shutdown(1)
+
+
+def test_pause_applies_to_running_and_new_jobs():
+    """일시정지 중에는 실행 중인 작업도, 새로 제출한 작업도 대기 지점에서 멈춤"""
+    executor = JobExecutor()
+    executor.pause()
+    done = threading.Event()
+    job = executor.submit('bulk_analysis', lambda: cancellable_sleep(0) and done.set())
+    time.sleep(0.2)
+    assert not done.is_set() and job.describe().endswith("(일시정지)")
+    executor.resume()
+    assert done.wait(2)
+    assert executor.shutdown(1)
+
+
+def test_wait_layer_stops_cancelled_job():
+    """Tracer.sleep / 속도 제한기 / 보조 스레드가 작업의 중지 요청을 그대로 반영"""
+    tracer = Tracer()
+    registry = RateLimiterRegistry(tracer=tracer)
+    registry.configure('search', initial_rate=0.05, min_rate=0.05)
+    driver = FakeDriver({"https://www.buyma.com/r/": "<html><title>BUYMA</title></html>"})
+    executor = JobExecutor()
+    result = {}
+
+    def work():
+        registry.get_page('search', driver, "https://www.buyma.com/r/")   # 첫 토큰은 바로 사용
+        result['slept'] = tracer.sleep(30)
+        helper = threading.Thread(target=bind_current_job(lambda: result.setdefault('helper', current_job())))
+        helper.start()
+        helper.join()
+        try:
+            registry.get_page('search', driver, "https://www.buyma.com/r/")
+        except JobCancelled:
+            result['refused'] = True
+            raise
+
+    job = executor.submit('price_analysis', work)
+    time.sleep(0.2)
+    started = time.monotonic()
+    job.cancel()
+    assert job.wait(2) and time.monotonic() - started < 1.0
+    assert result == {'slept': False, 'helper': job, 'refused': True}
+    assert job.state == CANCELLED and job.error is None
+    assert len(driver.visited) == 1
+    executor.shutdown(1)
+
+
+if __name__ == "__main__":
+    test_token_sleep_wakes_on_cancel_and_waits_while_paused()
+    test_submit_runs_job_and_rejects_duplicates()
+    test_cancel_and_failure_states()
+    test_pause_applies_to_running_and_new_jobs()
+    test_wait_layer_stops_cancelled_job()
+    print("=== 테스트 완료 ===")
@@ -0,0 +1,42 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+무거운 모듈 지연 import 테스트
+"""
+
+import sys
+
+from lazy_imports import LazyModule, lazy_import, pending_modules, preload
+
+
+def test_lazy_module_imports_on_first_use():
+    """처음 속성에 접근/호출할 때 import, 모듈 속성도 대리 가능"""
+    sys.modules.pop('colorsys', None)
+    module = LazyModule('colorsys')
+    assert not module.loaded and 'colorsys' not in sys.modules
+    assert module.rgb_to_hsv(1.0, 0.0, 0.0) == (0.0, 1.0, 1.0)
+    assert module.loaded and 'colorsys' in sys.modules
+
+    ordered = LazyModule('collections', 'OrderedDict')
+    assert list(ordered(a=1)) == ['a']
+    assert 'not loaded' not in repr(ordered)
+    assert not hasattr(LazyModule('json'), '__wrapped__')  # 특수 이름은 import 하지 않음
+
+
+def test_preload_imports_registered_modules():
+    """preload() 는 등록된 모듈을 백그라운드에서 import, 실패는 로그로만"""
+    sys.modules.pop('fractions', None)
+    fractions = lazy_import('fractions', 'Fraction')
+    missing = lazy_import('no_such_module_for_test')
+    assert 'fractions' in pending_modules()
+
+    errors = []
+    preload(log=errors.append).join(5)
+    assert fractions.loaded and str(fractions(1, 2)) == "1/2"
+    assert not missing.loaded and any('no_such_module_for_test' in e for e in errors)
+
+
+if __name__ == "__main__":
+    test_lazy_module_imports_on_first_use()
+    test_preload_imports_registered_modules()
+    print("=== 테스트 완료 ===")
@@ -0,0 +1,95 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+탭 지연 생성 테스트 (Qt 없이 가짜 탭 위젯 사용)
+"""
+
+from lazy_tabs import LazyTabs, stored_attributes
+
+
+class FakeLayout:
+    def __init__(self):
+        self.widgets = []
+
+    def addWidget(self, widget):
+        self.widgets.append(widget)
+
+
+class FakePage:
+    def __init__(self, name="placeholder"):
+        self.name = name
+        self._layout = FakeLayout()
+
+    def layout(self):
+        return self._layout
+
+
+class FakeTabWidget:
+    def __init__(self):
+        self.tabs = []
+
+    def addTab(self, widget, title):
+        self.tabs.append((widget, title))
+
+    def count(self):
+        return len(self.tabs)
+
+    def widget(self, index):
+        return self.tabs[index][0]
+
+    def removeTab(self, index):
+        del self.tabs[index]
+
+
+class FakeWindow:
+    def __init__(self):
+        self.tab_widget = FakeTabWidget()
+        self.calls = []
+
+    def create_first_tab(self):
+        self.calls.append('first')
+        self.first_input = 1
+        self.tab_widget.addTab(FakePage('first'), "첫 번째")
+
+    def create_second_tab(self):
+        self.calls.append('second')
+        self.second_table, self.second_label = 2, 3
+        self.tab_widget.addTab(FakePage('second'), "두 번째")
+
+
+def test_stored_attributes():
+    """self.<이름> = ... 으로 만드는 속성 (튜플 대입 포함)"""
+    assert stored_attributes(FakeWindow.create_first_tab) == {'first_input'}
+    assert stored_attributes(FakeWindow().create_second_tab) == {'second_table', 'second_label'}
+
+
+def test_lazy_tab_built_on_demand_keeps_order():
+    """지연 탭은 빈 자리만 추가, 생성하면 내용이 그 자리로 들어가고 탭 순서 유지"""
+    window = FakeWindow()
+    built = []
+    tabs = LazyTabs(window.tab_widget, FakePage, on_built=built.append)
+    tabs.add('first', "첫 번째", window.create_first_tab, lazy=False)
+    tabs.add('second', "두 번째", window.create_second_tab)
+
+    assert window.calls == ['first'] and built == ['first']
+    assert tabs.pending == ['second'] and not tabs.is_built('second')
+    assert tabs.owner_of('second_table') == 'second' and tabs.owner_of('first_input') is None
+    placeholder = window.tab_widget.widget(1)
+    assert window.tab_widget.tabs[1][1] == "두 번째" and placeholder.name == 'placeholder'
+
+    assert tabs.build_index(1)
+    assert window.calls == ['first', 'second'] and built == ['first', 'second']
+    assert window.tab_widget.count() == 2 and window.tab_widget.widget(1) is placeholder
+    assert [page.name for page in placeholder.layout().widgets] == ['second']
+    assert tabs.owner_of('second_table') is None and 'second' in tabs.build_times
+
+    # 이미 만든 탭 / 범위 밖 번호는 무시
+    assert not tabs.build('second') and not tabs.build_index(5)
+    tabs.build_all()
+    assert window.calls == ['first', 'second']
+
+
+if __name__ == "__main__":
+    test_stored_attributes()
+    test_lazy_tab_built_on_demand_keeps_order()
+    print("=== 테스트 완료 ===")
@@ -0,0 +1,44 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+경쟁사 상품명 토큰 매칭 테스트
+"""
+
+from name_matcher import NameMatcher, normalize_name, tokenize
+
+
+def test_normalize_width_case_and_markers():
+    """전각/반각, 대소문자, ★ 장식 기호 정규화"""
+    assert normalize_name("★ＰＲＡＤＡ★  Re-Nylon　バッグ") == "prada re nylon バッグ"
+    assert tokenize("【関税込】PRADA/Cleo") == ["関税込", "prada", "cleo"]
+    assert tokenize("") == []
+
+
+def test_word_order_and_extra_words():
+    """단어 순서가 다르거나 수식어가 추가되어도 일치"""
+    tiles = [
+        {'name': '★国内発送★ PRADA Nylon Re bag', 'price': 98000},
+        {'name': 'PRADA Galleria', 'price': 300000},
+        {'name': 'GUCCI Re Nylon', 'price': 50000},
+    ]
+    matches = NameMatcher("Prada Re Nylon").match_page(tiles)
+    assert [tile['price'] for tile, _ in matches] == [98000]
+
+
+def test_brand_weighs_into_score():
+    """브랜드가 일치하면 토큰 일부가 빠져도 일치, 브랜드가 다르면 불일치"""
+    tiles = [
+        {'name': 'PRADA Re Nylon shoulder bag', 'price': 120000},
+        {'name': 'MIUMIU Re Nylon shoulder bag', 'price': 80000},
+    ]
+    matcher = NameMatcher("Re Nylon shoulder pouch", brand="PRADA")
+    scores = matcher.score_page(tiles)
+    assert scores[0] > scores[1]
+    assert [tile['price'] for tile, _ in matcher.match_page(tiles)] == [120000]
+
+
+if __name__ == "__main__":
+    test_normalize_width_case_and_markers()
+    test_word_order_and_extra_words()
+    test_brand_weighs_into_score()
+    print("=== 테스트 완료 ===")
@@ -0,0 +1,72 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+페이지 기록 / 재생 서버 테스트
+"""
+
+import tempfile
+import urllib.error
+import urllib.request
+
+from page_fixtures import FixtureServer, PageRecorder, fixture_name, rebase
+from rate_limiter import RateLimiterRegistry
+
+
+class RecordingDriver:
+    """get 한 주소와 고정 HTML 만 가진 드라이버"""
+
+    def __init__(self, html):
+        self.visited = []
+        self.page_source = html
+        self.current_url = ""
+        self.title = "BUYMA"
+
+    def get(self, url):
+        self.visited.append(url)
+        self.current_url = url
+
+
+def test_fixture_name_matches_live_and_replay_urls():
+    """호스트/#조각/캐시 무효화 파라미터와 관계없이 같은 이름"""
+    live = "https://www.buyma.com/my/sell?page=2&rows=100&status=for_sale#/"
+    replay = "http://127.0.0.1:8765/my/sell?rows=100&status=for_sale&page=2"
+    assert fixture_name(live) == fixture_name(replay) == fixture_name("/my/sell?status=for_sale&page=2&rows=100")
+    assert fixture_name(live) != fixture_name(live.replace("page=2", "page=3"))
+    assert fixture_name("https://www.buyma.com/r/-R120/PRADA bag_1/?t=123") == fixture_name("/r/-R120/PRADA%20bag_1/")
+
+
+def test_rebase():
+    """BUYMA 주소만 기본 주소 변경"""
+    assert rebase("https://www.buyma.com/r/x_1/", "http://127.0.0.1:8765/") == "http://127.0.0.1:8765/r/x_1/"
+    assert rebase("https://example.com/a", "http://127.0.0.1:8765") == "https://example.com/a"
+    assert rebase("https://www.buyma.com/r/x_1/", None) == "https://www.buyma.com/r/x_1/"
+
+
+def test_record_then_replay():
+    """속도 제한기로 기록한 페이지를 재생 서버가 같은 주소 형태로 응답"""
+    directory = tempfile.mkdtemp()
+    url = "https://www.buyma.com/r/-R120-O3/PRADA_1/"
+
+    limiter = RateLimiterRegistry(recorder=PageRecorder(directory))
+    driver = RecordingDriver("<ul class='product_lists'><li>PRADA</li></ul>")
+    limiter.get_page('search', driver, url)
+    assert limiter.recorder.saved == 1
+
+    with FixtureServer(directory) as server:
+        limiter = RateLimiterRegistry(base_url=server.base_url)
+        assert limiter.rebase(url).startswith(server.base_url)
+        with urllib.request.urlopen(limiter.rebase(url) + "?t=999") as response:
+            assert "PRADA" in response.read().decode('utf-8')
+        try:
+            urllib.request.urlopen(server.base_url + "/r/-R120-O3/GUCCI_1/")
+            assert False, "기록 없는 페이지는 404"
+        except urllib.error.HTTPError as e:
+            assert e.code == 404
+        assert server.stats == {'hits': 1, 'misses': 1}
+
+
+if __name__ == "__main__":
+    test_fixture_name_matches_live_and_replay_urls()
+    test_rebase()
+    test_record_then_replay()
+    print("=== 테스트 완료 ===")
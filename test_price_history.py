@@ -0,0 +1,77 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+가격 이력 저장소 테스트
+"""
+
+import json
+import os
+import tempfile
+
+from price_history import PriceHistory
+from analysis_scheduler import AnalysisScheduler
+from reprice_plan import RepricePlan
+
+DAY = 86400
+NOW = 2_000_000_000.0
+
+
+def _history():
+    return PriceHistory(os.path.join(tempfile.mkdtemp(), "history.db"))
+
+
+def _product(lowest, product_id='1001'):
+    return {'title': f'PRADA 商品ID: {product_id}', 'current_price': '¥100,000', 'lowest_price': lowest,
+            'suggested_price': lowest - 100, 'price_difference': lowest - 100 - 100000, 'status': '💰 가격 수정 필요',
+            'needs_update': True}
+
+
+def test_record_last_window_and_change_rate():
+    """확인마다 1줄 기록, 최근 기록/기간 최저·최고/변동률 조회"""
+    history = _history()
+    for days_ago, lowest in ((10, 90000), (5, 100000), (3, 80000), (1, 95000)):
+        assert history.record(_product(lowest), checked_at=NOW - days_ago * DAY)
+    assert not history.record({'title': '상품ID 없음', 'lowest_price': 1})
+    assert not history.record(_product(95000), checked_at=NOW - DAY)  # 같은 상품/시각은 한 번만
+
+    last = history.last('1001')
+    assert last['lowest_price'] == 95000 and last['current_price'] == 100000 and last['suggested_price'] == 94900
+    window = history.window('1001', days=7, now=NOW)
+    assert (window['count'], window['min'], window['max']) == (3, 80000, 100000)
+    assert history.change_rate('1001', days=7, now=NOW) == 95000 / 100000 - 1
+    assert history.change_rate('1001', days=2, now=NOW) is None
+    assert history.last('9999') is None
+    assert history.last_checked_map() == {'1001': NOW - DAY}
+
+
+def test_import_snapshot_once():
+    """스냅샷 JSON 의 분석된 상품만 수집 시각으로 추가, 다시 불러와도 중복 없음"""
+    history = _history()
+    path = os.path.join(tempfile.mkdtemp(), "상품정보.json")
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump({"수집_날짜": "2025-09-01", "수집_시간": "10:00:00",
+                   "상품_목록": [_product(90000, '1'), _product(80000, '2'), {'title': 'X 商品ID: 3'}]},
+                  f, ensure_ascii=False)
+    assert history.import_snapshot(path) == 2
+    assert history.import_snapshot(path) == 0
+    assert "2건" in history.summary()
+
+
+def test_scheduler_and_plan_use_history():
+    """스케줄러는 상태 파일에 없는 상품의 마지막 확인 시각을, 계획은 최근 7일 최저가를 이력에서 조회"""
+    history = _history()
+    history.record(_product(90000, '1'), checked_at=NOW - 60)
+    scheduler = AnalysisScheduler(clock=lambda: NOW, history=history)
+    recent, never = _product(90000, '1'), _product(90000, '2')
+    assert scheduler.order([recent, never]) == [never, recent]
+
+    history.record(_product(80000, '1'), checked_at=NOW - 2 * DAY)
+    entry = RepricePlan.from_products([recent], history=history).entries[0]
+    assert entry['low_7d'] == 80000
+
+
+if __name__ == "__main__":
+    test_record_last_window_and_change_rate()
+    test_import_snapshot_once()
+    test_scheduler_and_plan_use_history()
+    print("=== 테스트 완료 ===")
@@ -0,0 +1,66 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+내 상품 조회 인덱스 테스트
+"""
+
+from product_index import ProductIndex, product_id_of, title_key
+
+
+def _products():
+    return [
+        {'title': '★PRADA★ Re-Nylon バッグ 商品ID: 1001', 'product_id': '1001', 'lowest_price': 98000},
+        {'title': 'GUCCI GG Marmont 商品ID：1002', 'lowest_price': 150000},
+        {'title': 'CELINE Triomphe', 'product_id': '1003'},
+    ]
+
+
+def test_product_id_and_title_key():
+    """product_id 필드 우선, 없으면 제목의 商品ID / 제목 키는 商品ID 앞부분 정규화"""
+    products = _products()
+    assert product_id_of(products[0]) == '1001'
+    assert product_id_of(products[1]) == '1002'
+    assert product_id_of({'title': '상품ID 없음'}) is None
+    assert title_key(products[0]['title']) == "prada re nylon バッグ"
+
+
+def test_lookup_returns_same_dict():
+    """상품ID/제목으로 찾은 상품은 all_products 의 같은 dict (분석 결과가 그대로 반영)"""
+    products = _products()
+    index = ProductIndex(products)
+    assert index.get(1001) is products[0]
+    assert index.find('1002') is products[1]
+    assert index.find(products[1]['title']) is products[1]
+    assert index.find('prada RE nylon バッグ') is products[0]
+    assert index.find('없는 상품') is None
+    assert index.position(products[2]) == 2
+
+    index.find('1003')['lowest_price'] = 70000
+    assert products[2]['lowest_price'] == 70000
+
+    extra = {'title': 'LOEWE Puzzle 商品ID 1004'}
+    products.append(extra)
+    index.add(extra)
+    assert index.get('1004') is extra and index.position(extra) == 3 and len(index) == 4
+
+
+def test_view_rows_follow_page():
+    """화면 행 ↔ 상품 매핑은 표시 중인 페이지 기준, 페이지가 바뀌면 이전 상품은 행 없음"""
+    products = _products()
+    index = ProductIndex(products)
+    index.set_view(products[1:])
+    assert index.product_at_row(0) is products[1]
+    assert index.product_at_row(5) is None and index.product_at_row(-1) is None
+    assert index.row_of(products[2]) == 1
+    assert index.row_of(products[0]) is None
+    assert [row for row, _ in index.view_items()] == [0, 1]
+
+    index.rebuild(products[:1])
+    assert index.product_at_row(0) is None and index.get('1002') is None
+
+
+if __name__ == "__main__":
+    test_product_id_and_title_key()
+    test_lookup_returns_same_dict()
+    test_view_rows_follow_page()
+    print("=== 테스트 완료 ===")
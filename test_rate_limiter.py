@@ -0,0 +1,62 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+적응형 요청 속도 제한기 테스트
+"""
+
+from rate_limiter import AdaptiveRateLimiter, RateLimiterRegistry, is_block_page
+
+
+def test_aimd_rate_changes():
+    """정상 응답은 가산 증가, 429/느린 응답은 곱셈 감소"""
+    limiter = AdaptiveRateLimiter(initial_rate=0.5, min_rate=0.1, max_rate=1.0, increase=0.1, decrease=0.5)
+
+    limiter.observe(status_code=200, latency=1.0)
+    assert abs(limiter.rate - 0.6) < 1e-9
+
+    limiter.observe(status_code=429)
+    assert abs(limiter.rate - 0.3) < 1e-9
+
+    limiter.observe(status_code=200, latency=limiter.slow_seconds + 1)
+    assert abs(limiter.rate - 0.15) < 1e-9
+
+    limiter.observe(blocked=True)
+    assert limiter.rate == limiter.min_rate
+
+    for _ in range(50):
+        limiter.observe(status_code=200, latency=0.5)
+    assert limiter.rate == limiter.max_rate
+
+
+def test_acquire_uses_burst_without_waiting():
+    """버킷에 토큰이 있으면 대기 없이 통과"""
+    limiter = AdaptiveRateLimiter(initial_rate=1.0, burst=2)
+    assert limiter.acquire() == 0.0
+    assert limiter.acquire() == 0.0
+
+
+def test_acquire_stops_on_request():
+    """중지 요청 시 대기를 즉시 끝냄"""
+    limiter = AdaptiveRateLimiter(initial_rate=0.05, min_rate=0.05)
+    limiter.acquire()
+    waited = limiter.acquire(should_stop=lambda: True)
+    assert waited < 1.0
+
+
+def test_registry_and_block_page():
+    """엔드포인트별 제한기 분리 및 차단 페이지 감지"""
+    registry = RateLimiterRegistry()
+    registry.configure('crawl', initial_rate=0.25, max_rate=0.5)
+    assert registry.get('crawl').interval == 4.0
+    assert registry.get('search') is not registry.get('crawl')
+
+    assert is_block_page("reCAPTCHA 확인", "https://www.buyma.com/")
+    assert not is_block_page("BUYMA（バイマ）", "https://www.buyma.com/r/-R120/bag_1/")
+
+
+if __name__ == "__main__":
+    test_aimd_rate_changes()
+    test_acquire_uses_burst_without_waiting()
+    test_acquire_stops_on_request()
+    test_registry_and_block_page()
+    print("=== 테스트 완료 ===")
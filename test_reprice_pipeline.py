@@ -0,0 +1,130 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+가격 분석 → 가격 수정 파이프라인 테스트
+"""
+
+import threading
+import time
+
+from job_executor import CANCELLED, JobExecutor, raise_if_cancelled
+from reprice_pipeline import RepricePipeline
+
+
+def make_products(count, page_size=3):
+    return [{'id': i, 'page': i // page_size} for i in range(count)]
+
+
+def test_updates_overlap_with_analysis():
+    """수정은 별도 스레드에서 분석과 겹쳐 실행되고, 총 시간은 합계보다 짧음"""
+    update_threads = set()
+
+    def analyze(product):
+        time.sleep(0.02)
+        return product['id'] % 2 == 0
+
+    def update(product):
+        update_threads.add(threading.get_ident())
+        time.sleep(0.02)
+        return True
+
+    pipeline = RepricePipeline(analyze, update, queue_size=2)
+    stats = pipeline.run(make_products(10))
+
+    assert stats['analyzed'] == 10
+    assert stats['queued'] == 5
+    assert stats['updated'] == 5
+    assert threading.get_ident() not in update_threads
+    assert stats['elapsed'] < stats['analyze_seconds'] + stats['update_seconds']
+
+
+def test_page_done_after_its_updates():
+    """페이지 완료 콜백은 해당 페이지의 분석과 수정이 모두 끝난 뒤 페이지 순서대로 호출"""
+    updated = []
+    done_pages = []
+
+    def on_page_done(page):
+        page_ids = [product['id'] for product in products if product['page'] == page]
+        assert all(i in updated for i in page_ids if i % 3 != 1)
+        done_pages.append(page)
+
+    def update(product):
+        time.sleep(0.01)
+        updated.append(product['id'])
+        return True
+
+    products = make_products(7)
+    RepricePipeline(lambda product: product['id'] % 3 != 1, update).run(
+        products, group_of=lambda product: product['page'], on_group_done=on_page_done
+    )
+    assert sorted(done_pages) == [0, 1, 2]
+
+
+def test_failures_stop_and_inline_mode():
+    """분석 실패 집계, 중지 요청, 같은 스레드 수정 모드"""
+    calls = []
+    stop = {'flag': False}
+
+    def analyze(product):
+        calls.append(product['id'])
+        if product['id'] == 3:
+            stop['flag'] = True
+        return None if product['id'] == 1 else True
+
+    update_threads = set()
+    pipeline = RepricePipeline(analyze, lambda product: update_threads.add(threading.get_ident()) or True,
+                               overlap=False, should_stop=lambda: stop['flag'])
+    stats = pipeline.run(make_products(10))
+
+    assert calls == [0, 1, 2, 3]
+    assert stats['failed'] == 1
+    assert stats['updated'] == 2  # 중지 요청 후에는 수정하지 않음
+    assert update_threads == {threading.get_ident()}
+
+
+def test_batch_updates_per_page():
+    """일괄 수정 모드는 페이지별로 모아서 한 번에 수정"""
+    batches = []
+
+    def update_batch(products):
+        batches.append([product['id'] for product in products])
+        return len(products)
+
+    stats = RepricePipeline(lambda product: product['id'] != 4, None, update_batch=update_batch).run(
+        make_products(8), group_of=lambda product: product['page']
+    )
+    assert batches == [[0, 1, 2], [3, 5], [6, 7]]
+    assert stats['updated'] == 7
+
+
+def test_cancel_during_update_does_not_hang():
+    """수정 중 중지 요청(JobCancelled)이 나도 큐가 가득 찬 분석 작업자가 멈추지 않고 작업이 끝남"""
+    updated = []
+
+    def update(product):
+        time.sleep(0.05)
+        raise_if_cancelled()
+        updated.append(product['id'])
+        return True
+
+    result = {}
+    pipeline = RepricePipeline(lambda product: True, update, queue_size=3)
+    executor = JobExecutor()
+    job = executor.submit('price_analysis', lambda: result.update(pipeline.run(make_products(200))))
+    time.sleep(0.2)
+    job.cancel()
+
+    assert job.wait(5)
+    assert job.state == CANCELLED
+    assert result['updated'] == len(updated) < result['queued']
+    assert executor.submit('price_analysis', lambda: None) is not None   # 다시 시작 가능
+    executor.shutdown(1)
+
+
+if __name__ == "__main__":
+    test_updates_overlap_with_analysis()
+    test_page_done_after_its_updates()
+    test_failures_stop_and_inline_mode()
+    test_batch_updates_per_page()
+    test_cancel_during_update_does_not_hang()
+    print("=== 테스트 완료 ===")
@@ -0,0 +1,69 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+가격 수정 계획 (드라이런) 테스트
+"""
+
+import os
+import tempfile
+
+from reprice_plan import RepricePlan, plan_entry, REASON_UPDATE, REASON_NO_CHANGE, REASON_NOT_NEEDED, \
+    REASON_EXCLUDED, REASON_NOT_ANALYZED, REASON_NO_ID
+
+
+def _products():
+    return [
+        {'title': 'PRADA 商品ID: 1001', 'current_price': '¥100,000', 'lowest_price': 95000,
+         'suggested_price': 94900, 'needs_update': True},
+        {'title': 'GUCCI 商品ID: 1002', 'current_price': '¥94,900', 'lowest_price': 95000,
+         'suggested_price': 94900, 'needs_update': True},
+        {'title': 'CELINE 商品ID: 1003', 'current_price': '¥50,000', 'lowest_price': 40000,
+         'suggested_price': 39900, 'needs_update': False},
+        {'title': 'LOEWE 商品ID: 1004', 'current_price': '¥70,000', 'lowest_price': 60000,
+         'suggested_price': 59900, 'needs_update': True, 'excluded': True},
+        {'title': 'FENDI 商品ID: 1005', 'current_price': '¥80,000'},
+        {'title': '상품ID 없음', 'current_price': '¥10,000', 'lowest_price': 9000,
+         'suggested_price': 8900, 'needs_update': True},
+    ]
+
+
+def test_plan_entries_and_reasons():
+    """캐시된 분석 결과만으로 항목별 사유 결정 - 제안가 == 현재가면 수정 생략"""
+    entries = [plan_entry(product) for product in _products()]
+    assert [entry['reason'] for entry in entries] == [
+        REASON_UPDATE, REASON_NO_CHANGE, REASON_NOT_NEEDED, REASON_EXCLUDED, REASON_NOT_ANALYZED, REASON_NO_ID,
+    ]
+    first = entries[0]
+    assert (first['product_id'], first['current'], first['lowest'], first['proposed'], first['delta']) == \
+        ('1001', 100000, 95000, 94900, -5100)
+
+
+def test_targets_pages_and_avoided_operations():
+    """수정 대상만 판매 목록 페이지 번호와 함께 전달, 생략한 작업 수 = 계획 단계 + 실시간 일치"""
+    plan = RepricePlan.from_products(_products(), rows_per_page=2)
+    assert plan.targets() == [{'product_id': '1001', 'new_price': 94900, 'page': 1}]
+    assert plan.avoided_operations() == 1
+
+    plan.record({'1001': 'unchanged'}, page_loads=1)
+    assert plan.avoided_operations() == 2
+    assert "실시간 가격 일치 1개" in plan.summary()
+
+
+def test_save_and_load():
+    """계획 JSON 저장 후 다시 불러오기"""
+    plan = RepricePlan.from_products(_products())
+    plan.record({'1001': 'updated'})
+    path = os.path.join(tempfile.mkdtemp(), "plan.json")
+    plan.save(path)
+
+    loaded = RepricePlan.load(path)
+    assert loaded.targets() == plan.targets()
+    assert loaded.results == {'1001': 'updated'}
+    assert loaded.counts() == plan.counts()
+
+
+if __name__ == "__main__":
+    test_plan_entries_and_reasons()
+    test_targets_pages_and_avoided_operations()
+    test_save_and_load()
+    print("=== 테스트 완료 ===")
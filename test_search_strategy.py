@@ -0,0 +1,53 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+최저가 검색 전략 (가격순 정렬 + 조기 종료) 테스트
+"""
+
+import random
+
+from search_strategy import (
+    SearchLookupStats, bucket_label, build_search_url, SORT_PRICE_ASC, SORT_RELEVANCE,
+)
+
+
+def test_search_url_by_sort():
+    """정렬 방식에 따라 검색 URL 생성"""
+    assert build_search_url("Prada Cleo", 1) == "https://www.buyma.com/r/-R120/Prada Cleo_1/"
+    assert build_search_url("Prada Cleo", 2, SORT_PRICE_ASC) == "https://www.buyma.com/r/-R120-O3/Prada Cleo_2/"
+
+
+def test_lookup_histogram():
+    """전략별 조회 시간 히스토그램과 평균 페이지 수"""
+    stats = SearchLookupStats(verify_rate=0)
+    stats.record_lookup(SORT_RELEVANCE, 45.0, 12)
+    stats.record_lookup(SORT_PRICE_ASC, 3.0, 1)
+    stats.record_lookup(SORT_PRICE_ASC, 1.0, 1)
+
+    assert bucket_label(1.0) == "0-2s"
+    assert bucket_label(100) == "80s+"
+    assert stats.lookups[SORT_PRICE_ASC]['histogram'] == {"0-2s": 1, "2-5s": 1}
+    assert stats.lookups[SORT_RELEVANCE]['histogram'] == {"40-80s": 1}
+
+    summary = stats.summary()
+    assert "price_asc 2회 평균 2.0초/1.0페이지" in summary
+    assert "relevance 1회 평균 45.0초/12.0페이지" in summary
+
+
+def test_consistency_sampling():
+    """표본 검증 비율과 불일치 집계"""
+    assert not SearchLookupStats(verify_rate=0).should_verify()
+    assert SearchLookupStats(verify_rate=1.0).should_verify()
+
+    stats = SearchLookupStats(verify_rate=0.5, rng=random.Random(1))
+    assert stats.record_consistency(98000, 98000)
+    assert not stats.record_consistency(98000, 95000)
+    assert stats.consistency == {'checked': 2, 'mismatched': 1}
+    assert "가격순 검증 1/2 일치" in stats.summary()
+
+
+if __name__ == "__main__":
+    test_search_url_by_sort()
+    test_lookup_histogram()
+    test_consistency_sampling()
+    print("=== 테스트 완료 ===")
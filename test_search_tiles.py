@@ -0,0 +1,56 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+검색 결과 상품 타일 일괄 추출 테스트
+"""
+
+from search_tiles import parse_price, parse_tiles, read_product_tiles
+
+
+class ScriptDriver:
+    """execute_script 결과만 돌려주는 드라이버"""
+
+    def __init__(self, result):
+        self.result = result
+        self.calls = 0
+
+    def execute_script(self, script, *args):
+        self.calls += 1
+        return self.result
+
+
+def test_parse_price():
+    """가격 텍스트에서 숫자만 추출"""
+    assert parse_price("¥12,000") == 12000
+    assert parse_price("参考価格 ¥ 98,500") == 98500
+    assert parse_price("") is None
+    assert parse_price(None) is None
+
+
+def test_tiles_without_price_are_dropped():
+    """가격 정보가 없는 상품은 제외"""
+    tiles = parse_tiles([
+        {'name': 'PRADA Re Nylon', 'price': '¥120,000', 'url': 'https://www.buyma.com/item/1/', 'seller': 'shopA'},
+        {'name': 'PRADA Galleria', 'price': '', 'url': 'https://www.buyma.com/item/2/', 'seller': ''},
+    ])
+    assert tiles == [
+        {'name': 'PRADA Re Nylon', 'price': 120000, 'url': 'https://www.buyma.com/item/1/', 'seller': 'shopA'},
+    ]
+
+
+def test_read_product_tiles_uses_one_script_call():
+    """페이지 전체를 스크립트 1회 호출로 읽고 li 개수를 함께 반환"""
+    driver = ScriptDriver({'count': 120, 'tiles': [{'name': 'A', 'price': '¥1,000', 'url': '', 'seller': ''}]})
+    count, tiles = read_product_tiles(driver)
+    assert driver.calls == 1
+    assert count == 120
+    assert tiles[0]['price'] == 1000
+
+    assert read_product_tiles(ScriptDriver(None)) == (0, [])
+
+
+if __name__ == "__main__":
+    test_parse_price()
+    test_tiles_without_price_are_dropped()
+    test_read_product_tiles_uses_one_script_call()
+    print("=== 테스트 완료 ===")
@@ -0,0 +1,70 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+시작 시간 측정 테스트
+"""
+
+import json
+import os
+import tempfile
+
+from startup_timer import LAUNCHED_ENV, StartupTimer, process_started_at
+
+
+class FakeClock:
+    def __init__(self, now=100.0):
+        self.now = now
+
+    def __call__(self):
+        return self.now
+
+
+def test_marks_and_report():
+    """단계는 처음 한 번만 기록, 프로세스 시작 기준 값은 실행~모듈 시작 시간을 더함"""
+    clock = FakeClock()
+    timer = StartupTimer(clock=clock)
+    clock.now = 100.2
+    assert abs(timer.mark('imports') - 0.2) < 1e-9
+    clock.now = 100.5
+    timer.mark('first_paint')
+    clock.now = 101.0
+    timer.mark('first_paint')  # 다시 기록하지 않음
+
+    report = timer.report(process_start=99.5)
+    assert abs(report['launch'] - 0.5) < 1e-9
+    assert abs(report['marks']['first_paint'] - 0.5) < 1e-9
+    assert abs(report['from_process_start']['first_paint'] - 1.0) < 1e-9
+    assert "first_paint 1.00초" in timer.summary(report) and "프로세스 시작 기준" in timer.summary(report)
+
+
+def test_write_appends_json_lines():
+    timer = StartupTimer()
+    timer.mark('interactive')
+    path = os.path.join(tempfile.mkdtemp(), "startup.jsonl")
+    timer.write(path)
+    timer.write(path)
+    with open(path, 'r', encoding='utf-8') as f:
+        lines = f.read().splitlines()
+    assert len(lines) == 2 and 'interactive' in json.loads(lines[0])['marks']
+
+
+def test_launch_time_from_environment():
+    """실행한 쪽이 넘겨준 실행 시각 우선, 없으면 현재 프로세스 시작 시각"""
+    previous = os.environ.get(LAUNCHED_ENV)
+    os.environ[LAUNCHED_ENV] = "1234.5"
+    try:
+        assert process_started_at() == 1234.5
+    finally:
+        if previous is None:
+            del os.environ[LAUNCHED_ENV]
+        else:
+            os.environ[LAUNCHED_ENV] = previous
+    started = process_started_at()
+    assert started is None or started > 1234.5
+
+
+if __name__ == "__main__":
+    test_marks_and_report()
+    test_write_appends_json_lines()
+    test_launch_time_from_environment()
+    print("=== 테스트 완료 ===")
@@ -0,0 +1,73 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+시스템 상태 백그라운드 측정 테스트
+"""
+
+import threading
+
+from system_sampler import SystemSampler, network_state
+
+
+class FakeWatchdog:
+    def tracked_usage(self):
+        return {'rss_mb': 512.0, 'processes': 3}
+
+
+def test_network_state():
+    """응답 코드/소요 시간 → 접속 상태"""
+    assert network_state(200, 0.3) == 'ok'
+    assert network_state(302, 0.3) == 'ok'
+    assert network_state(200, 10.0) == 'slow'
+    assert network_state(429, 0.3) == 'slow'
+    assert network_state(503, 0.3) == 'down'
+
+
+def test_sample_probes_network_on_its_own_interval():
+    """접속 확인은 network_interval 마다만, 실패하면 'down'"""
+    calls = []
+
+    def probe(url):
+        calls.append(url)
+        if len(calls) > 1:
+            raise OSError("연결 실패")
+        return 200, 0.2
+
+    sampler = SystemSampler(lambda snapshot: None, network_interval=30, url="http://127.0.0.1:1/",
+                            watchdog=FakeWatchdog(), probe=probe)
+    first = sampler.sample(now=0)
+    assert first['network'] == 'ok' and first['network_latency'] == 0.2
+    assert first['chrome_rss_mb'] == 512.0 and first['chrome_processes'] == 3
+    assert 0 <= first['cpu'] <= 100 and 0 < first['memory'] <= 100
+
+    assert sampler.sample(now=10)['network'] == 'ok'  # 아직 주기 전 - 이전 결과
+    assert len(calls) == 1
+    assert sampler.sample(now=31)['network'] == 'down'
+    assert calls == ["http://127.0.0.1:1/"] * 2
+
+
+def test_background_thread_publishes_snapshots():
+    """스레드 1개가 주기적으로 측정 결과를 전달하고 stop 으로 종료"""
+    received = []
+    done = threading.Event()
+
+    def publish(snapshot):
+        received.append(snapshot)
+        if len(received) >= 2:
+            done.set()
+
+    sampler = SystemSampler(publish, interval=0.05, probe=lambda url: (200, 0.01))
+    sampler.start()
+    sampler.start()  # 중복 시작 시 스레드를 새로 만들지 않음
+    assert done.wait(5)
+    thread = sampler._thread
+    sampler.stop()
+    assert not thread.is_alive()
+    assert received[0]['network'] == 'ok' and received[0]['chrome_processes'] == 0
+
+
+if __name__ == "__main__":
+    test_network_state()
+    test_sample_probes_network_on_its_own_interval()
+    test_background_thread_publishes_snapshots()
+    print("=== 테스트 완료 ===")
@@ -0,0 +1,77 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+처리 속도(EWMA) / 예상 완료 시간 측정 테스트
+"""
+
+from throughput_meter import StageMetrics, ThroughputMeter, format_duration, metered
+
+
+def test_rate_and_eta_follow_progress():
+    """진행률 기준 처리 속도와 남은 시간 - 속도가 바뀌면 EWMA 가 따라감"""
+    stage = StageMetrics(total=100, now=0)
+    for i in range(1, 11):  # 6초에 1개 = 10개/분
+        stage.progress(i, now=i * 6)
+    assert abs(stage.current_rate(now=60) - 10) < 0.01
+    assert abs(stage.eta(now=60) - 90 * 6) < 1
+
+    for i in range(11, 41):  # 2초에 1개 = 30개/분 으로 빨라짐
+        stage.progress(i, now=60 + (i - 10) * 2)
+    assert 20 < stage.current_rate(now=120) <= 30
+    assert stage.eta(now=120) < 60 * 60 * 6 / 10
+
+    # 오래 멈춰 있으면 표시 속도도 낮아짐
+    assert stage.current_rate(now=120 + 60) <= 1.0
+
+
+def test_progress_restart_resets_stage():
+    """진행률이 처음부터 다시 시작하면 새 작업으로 처리"""
+    stage = StageMetrics(total=10, now=0)
+    stage.progress(10, now=10)
+    stage.progress(0, 3000, now=20)
+    assert stage.done == 0 and stage.total == 3000 and stage.rate is None
+
+
+def test_record_latency_errors_and_describe():
+    """항목 처리 시간/오류율 - 진행률이 없는 단계는 기록 수가 완료 수"""
+    stage = StageMetrics(now=0)
+    stage.record(2.0, now=2)
+    stage.record(4.0, error=True, now=6)
+    assert stage.done == 2 and stage.error_rate == 0.5
+    assert 2.0 < stage.latency < 4.0
+    text = stage.describe(now=6)
+    assert "개/분" in text and "오류 50%" in text and "남음" not in text
+    assert format_duration(3725) == "1시간 2분" and format_duration(125) == "2분 5초" and format_duration(None) == "--:--"
+
+
+def test_metered_decorator():
+    """데코레이터가 결과/예외로 오류를 집계"""
+    class Worker:
+        def __init__(self):
+            self.metrics = ThroughputMeter()
+
+        @metered("price", failed=lambda result: result is None)
+        def analyze(self, value):
+            if value < 0:
+                raise ValueError(value)
+            return value or None
+
+    worker = Worker()
+    worker.analyze(1)
+    worker.analyze(0)
+    try:
+        worker.analyze(-1)
+    except ValueError:
+        pass
+    snapshot = worker.metrics.snapshot("price")
+    assert snapshot['done'] == 3 and abs(snapshot['error_rate'] - 2 / 3) < 1e-9
+    assert worker.metrics.active == "price"
+    assert worker.metrics.summary()[0].startswith("가격분석: ")
+
+
+if __name__ == "__main__":
+    test_rate_and_eta_follow_progress()
+    test_progress_restart_resets_stage()
+    test_record_latency_errors_and_describe()
+    test_metered_decorator()
+    print("=== 테스트 완료 ===")
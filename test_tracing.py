@@ -0,0 +1,111 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+단계별 소요 시간 측정 / Chrome 추적 내보내기 테스트
+"""
+
+import json
+import os
+import tempfile
+
+from rate_limiter import RateLimiterRegistry
+from tracing import NULL_SPAN, Tracer, percentile, traced
+
+
+class FakeDriver:
+    """execute 만 가진 WebDriver 대용"""
+
+    def __init__(self):
+        self.commands = []
+        self.current_url = ""
+        self.title = "BUYMA"
+
+    def execute(self, command, params=None):
+        self.commands.append(command)
+        return {'value': None}
+
+    def get(self, url):
+        self.current_url = url
+        self.execute('get', {'url': url})
+
+
+class Worker:
+    def __init__(self, tracer):
+        self.tracer = tracer
+
+    @traced("crawl.item")
+    def crawl(self, value):
+        return value * 2
+
+
+def test_disabled_tracer_records_nothing():
+    """측정을 끈 상태에서는 빈 구간만 돌려주고 기록 없음"""
+    tracer = Tracer()
+    assert tracer.span("crawl.item") is NULL_SPAN
+    with tracer.span("crawl.item"):
+        pass
+    tracer.count("webdriver.get")
+    assert Worker(tracer).crawl(2) == 4
+    assert tracer.events == [] and tracer.stats() == {} and not tracer.counters
+
+
+def test_percentiles_and_summary():
+    """구간별 p50/p95/최대 집계"""
+    values = sorted(float(i) for i in range(1, 101))
+    assert percentile(values, 0.5) == 50.0
+    assert percentile(values, 0.95) == 95.0
+    assert percentile([], 0.5) == 0.0
+
+    tracer = Tracer(enabled=True)
+    worker = Worker(tracer)
+    for i in range(5):
+        worker.crawl(i)
+    try:
+        with tracer.span("upload.item"):
+            raise ValueError("실패")
+    except ValueError:
+        pass
+    stats = tracer.stats()
+    assert stats["crawl.item"]['count'] == 5
+    assert stats["crawl.item"]['p50'] <= stats["crawl.item"]['p95'] <= stats["crawl.item"]['max']
+    assert tracer.counters["upload.item.error"] == 1
+    assert "crawl.item 5회" in tracer.summary()
+
+
+def test_driver_commands_and_chrome_trace():
+    """속도 제한기 페이지 이동 + WebDriver 명령이 추적 파일에 기록"""
+    tracer = Tracer(enabled=True)
+    limiter = RateLimiterRegistry(tracer=tracer)
+    driver = tracer.instrument_driver(FakeDriver())
+    assert tracer.instrument_driver(driver) is driver  # 중복 계측 없음
+    limiter.get_page('search', driver, "https://www.buyma.com/r/PRADA_1/")
+    driver.execute('findElement')
+
+    assert driver.commands == ['get', 'findElement']
+    assert tracer.counters["webdriver.get"] == 1
+    assert {"rate_wait", "page.search", "webdriver.get", "webdriver.findElement"} <= set(tracer.stats())
+
+    path = os.path.join(tempfile.mkdtemp(), "trace.json")
+    tracer.export_chrome_trace(path)
+    with open(path, encoding='utf-8') as f:
+        trace = json.load(f)
+    events = {event['name']: event for event in trace['traceEvents']}
+    assert events["page.search"]['ph'] == 'X'
+    assert events["rate_wait"]['args'] == {'endpoint': 'search'}
+    # 페이지 이동 구간이 그 안의 driver.get 명령을 포함
+    page, get = events["page.search"], events["webdriver.get"]
+    assert page['ts'] <= get['ts'] and get['ts'] + get['dur'] <= page['ts'] + page['dur'] + 1
+    assert trace['otherData']['counters']["webdriver.get"] == 1
+
+    # 측정을 끄면 계측한 드라이버도 기록 없이 그대로 동작
+    tracer.enabled = False
+    tracer.reset()
+    driver.execute('getTitle')
+    assert driver.commands[-1] == 'getTitle' and not tracer.counters
+
+
+if __name__ == "__main__":
+    test_disabled_tracer_records_nothing()
+    test_percentiles_and_summary()
+    test_driver_commands_and_chrome_trace()
+    print("=== 테스트 완료 ===")
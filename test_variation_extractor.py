@@ -0,0 +1,71 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+색상/사이즈 클릭 없는 추출 테스트
+"""
+
+import json
+
+from variation_extractor import VariationExtractor, normalize_variations, parse_embedded_variations
+
+
+class ScriptOnlyDriver:
+    """execute_script 결과만 돌려주는 테스트용 드라이버"""
+
+    def __init__(self, data):
+        self.data = data
+
+    def execute_script(self, script, *args):
+        return self.data
+
+
+def test_normalize_variations():
+    """공백 정리 및 중복/빈 값 제거"""
+    colors, sizes = normalize_variations(
+        [["black", " ブラック "], ["black", "ブラック"], ["", ""]],
+        ["S", " M ", "S", ""]
+    )
+    assert colors == [["black", "ブラック"]]
+    assert sizes == ["S", "M"]
+
+
+def test_parse_embedded_variations():
+    """내장 JSON에서 색상/사이즈 수집"""
+    texts = [
+        json.dumps({"@type": "Product", "offers": [{"color": "Navy", "size": "M"}, {"color": "Navy", "size": "L"}]}),
+        "not json",
+    ]
+    colors, sizes = parse_embedded_variations(texts)
+    assert colors == [["", "Navy"]]
+    assert sizes == ["M", "L"]
+
+
+def test_extractor_prefers_hidden_dom():
+    """숨겨진 DOM에서 읽히면 클릭 폴백을 사용하지 않음"""
+    extractor = VariationExtractor()
+    driver = ScriptOnlyDriver({'selectors': 2, 'colors': [["red", "レッド"]], 'sizes': ["F"], 'embedded': []})
+
+    colors, sizes = extractor.extract(driver, log=lambda m: None)
+
+    assert colors == [["red", "レッド"]]
+    assert sizes == ["F"]
+    assert extractor.stats['dom'] == 1
+    assert extractor.stats['fallback'] == 0
+
+
+def test_extractor_without_option_buttons():
+    """옵션 버튼이 없는 상품은 빈 결과 (폴백 없음)"""
+    extractor = VariationExtractor()
+    driver = ScriptOnlyDriver({'selectors': 0, 'colors': [], 'sizes': [], 'embedded': []})
+
+    assert extractor.extract(driver, log=lambda m: None) == ([], [])
+    assert extractor.stats['no_options'] == 1
+    assert extractor.stats['fallback'] == 0
+
+
+if __name__ == "__main__":
+    test_normalize_variations()
+    test_parse_embedded_variations()
+    test_extractor_prefers_hidden_dom()
+    test_extractor_without_option_buttons()
+    print("=== 테스트 완료 ===")
@@ -0,0 +1,176 @@
+# BUYMA 자동화 프로그램 - 처리 속도(EWMA) / 예상 완료 시간 측정 모듈
+import functools
+import math
+import threading
+import time
+
+
+RATE_HALF_LIFE = 60.0     # 처리 속도 EWMA 반감기 (초) - 작을수록 최근 변화에 민감
+LATENCY_WEIGHT = 0.2      # 항목 처리 시간 EWMA 가중치
+
+STAGE_NAMES = {'crawl': "크롤링", 'price': "가격분석", 'update': "가격수정", 'upload': "업로드"}
+
+
+def format_duration(seconds):
+    """초 → '1시간 2분' / '3분 4초' / '5초'"""
+    if seconds is None:
+        return "--:--"
+    seconds = int(seconds)
+    if seconds >= 3600:
+        return f"{seconds // 3600}시간 {seconds % 3600 // 60}분"
+    if seconds >= 60:
+        return f"{seconds // 60}분 {seconds % 60}초"
+    return f"{seconds}초"
+
+
+class StageMetrics:
+    """작업 단계 1개의 진행 상황 - 처리 속도(개/분, 시간 기반 EWMA), 항목 처리 시간, 오류율, 남은 시간"""
+
+    def __init__(self, total=0, now=None):
+        self.start(total, now)
+
+    def start(self, total=0, now=None):
+        now = time.monotonic() if now is None else now
+        self.started = now
+        self.last_time = now
+        self.total = total
+        self.done = 0
+        self.items = 0            # record() 로 기록한 항목 수
+        self.errors = 0
+        self.rate = None          # 개/분 (EWMA)
+        self.latency = None       # 항목당 처리 시간 (초, EWMA)
+        self.progress_driven = False
+
+    def _advance(self, done, now):
+        delta = done - self.done
+        if delta <= 0:
+            return
+        elapsed = max(now - self.last_time, 1e-6)
+        instant = delta / elapsed * 60
+        if self.rate is None:
+            self.rate = instant
+        else:
+            alpha = 1 - math.exp(-elapsed * math.log(2) / RATE_HALF_LIFE)
+            self.rate += alpha * (instant - self.rate)
+        self.done = done
+        self.last_time = now
+
+    def progress(self, current, total=None, now=None):
+        """진행률 표시와 같은 값으로 완료 수/전체 수 갱신"""
+        now = time.monotonic() if now is None else now
+        self.progress_driven = True
+        if total:
+            self.total = total
+        if current < self.done:  # 진행률이 처음부터 다시 시작 (새 작업)
+            self.start(total or self.total, now)
+            self.progress_driven = True
+        self._advance(current, now)
+
+    def record(self, latency, error=False, now=None):
+        """항목 1개 처리 결과 - 진행률을 따로 받지 않는 단계는 완료 수도 증가"""
+        now = time.monotonic() if now is None else now
+        self.items += 1
+        if error:
+            self.errors += 1
+        self.latency = latency if self.latency is None else self.latency + LATENCY_WEIGHT * (latency - self.latency)
+        if not self.progress_driven:
+            self._advance(self.done + 1, now)
+
+    def current_rate(self, now=None):
+        """현재 처리 속도 (개/분) - 마지막 완료 후 오래 멈춰 있으면 그만큼 낮춰서 표시"""
+        if self.rate is None:
+            return None
+        now = time.monotonic() if now is None else now
+        idle = now - self.last_time
+        return min(self.rate, 60 / idle) if idle > 0 else self.rate
+
+    def eta(self, now=None):
+        """남은 시간 (초) - 전체 수를 모르거나 속도를 아직 모르면 None"""
+        rate = self.current_rate(now)
+        if not self.total or not rate:
+            return None
+        return max(self.total - self.done, 0) / rate * 60
+
+    @property
+    def error_rate(self):
+        return self.errors / self.items if self.items else 0.0
+
+    def snapshot(self, now=None):
+        now = time.monotonic() if now is None else now
+        return {
+            'done': self.done, 'total': self.total, 'rate': self.current_rate(now),
+            'eta': self.eta(now), 'latency': self.latency, 'error_rate': self.error_rate,
+            'elapsed': now - self.started,
+        }
+
+    def describe(self, now=None):
+        """'⚡ 12.5개/분 · ⏳ 3분 20초 남음 · 항목당 4.8초 · 오류 2%'"""
+        s = self.snapshot(now)
+        parts = [f"⚡ {s['rate']:.1f}개/분" if s['rate'] is not None else "⚡ 측정 중"]
+        if s['eta'] is not None:
+            parts.append(f"⏳ {format_duration(s['eta'])} 남음")
+        if s['latency'] is not None:
+            parts.append(f"항목당 {s['latency']:.1f}초")
+        if self.items:
+            parts.append(f"오류 {s['error_rate']:.0%}")
+        return " · ".join(parts)
+
+
+class ThroughputMeter:
+    """단계별(crawl/price/update/upload) 처리 속도 모음 - 작업 스레드에서 기록, 화면 타이머에서 표시"""
+
+    def __init__(self):
+        self._stages = {}
+        self._lock = threading.Lock()
+        self.active = None  # 가장 최근에 진행된 단계
+
+    def start(self, stage, total=0):
+        with self._lock:
+            self._stages[stage] = StageMetrics(total)
+            self.active = stage
+
+    def progress(self, stage, current, total=None):
+        with self._lock:
+            self._stages.setdefault(stage, StageMetrics()).progress(current, total)
+            self.active = stage
+
+    def record(self, stage, latency, error=False):
+        with self._lock:
+            self._stages.setdefault(stage, StageMetrics()).record(latency, error)
+            self.active = stage
+
+    def snapshot(self, stage):
+        with self._lock:
+            metrics = self._stages.get(stage)
+            return metrics.snapshot() if metrics else None
+
+    def describe(self, stage):
+        with self._lock:
+            metrics = self._stages.get(stage)
+            return metrics.describe() if metrics else ""
+
+    def summary(self):
+        """진행된 단계별 한 줄 요약"""
+        with self._lock:
+            return [f"{STAGE_NAMES.get(stage, stage)}: {metrics.describe()}" for stage, metrics in self._stages.items()]
+
+
+def metered(stage, failed=None):
+    """항목 1개를 처리하는 메서드의 처리 시간/오류를 self.metrics 에 기록하는 데코레이터
+    failed(결과) 가 참이거나 예외가 나면 오류로 집계"""
+    def decorate(func):
+        @functools.wraps(func)
+        def wrapper(self, *args, **kwargs):
+            metrics = getattr(self, 'metrics', None)
+            if metrics is None:
+                return func(self, *args, **kwargs)
+            start = time.monotonic()
+            error = True
+            try:
+                result = func(self, *args, **kwargs)
+                error = bool(failed and failed(result))
+                return result
+            finally:
+                metrics.record(stage, time.monotonic() - start, error)
+        return wrapper
+    return decorate
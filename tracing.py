@@ -0,0 +1,182 @@
+# BUYMA 자동화 프로그램 - 단계별 소요 시간 측정 / 추적 내보내기 모듈
+import functools
+import json
+import math
+import os
+import threading
+import time
+from collections import Counter
+
+from job_executor import cancellable_sleep
+
+
+HISTOGRAM_LIMIT = 5000   # 단계별로 보관할 최근 소요 시간 수 (백분위 계산용)
+EVENT_LIMIT = 200000     # 추적 파일로 내보낼 최대 이벤트 수
+
+
+class _NullSpan:
+    """측정을 끈 상태에서 돌려주는 빈 구간 - 아무 일도 하지 않음"""
+    __slots__ = ()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+
+NULL_SPAN = _NullSpan()
+
+
+class _Span:
+    __slots__ = ('tracer', 'name', 'category', 'args', 'start')
+
+    def __init__(self, tracer, name, category, args):
+        self.tracer = tracer
+        self.name = name
+        self.category = category
+        self.args = args
+
+    def __enter__(self):
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, exc_type, *exc):
+        self.tracer._finish(self, time.perf_counter(), exc_type)
+        return False
+
+
+def percentile(sorted_values, fraction):
+    """정렬된 목록의 백분위 값 (nearest-rank)"""
+    if not sorted_values:
+        return 0.0
+    rank = min(max(math.ceil(fraction * len(sorted_values)) - 1, 0), len(sorted_values) - 1)
+    return sorted_values[rank]
+
+
+class Tracer:
+    """크롤링/검색/수정/업로드 단계의 구간 시간을 모아 히스토그램(p50/p95/최대)과
+    WebDriver 명령 횟수를 집계하고, Chrome trace-event JSON 으로 내보내는 클래스
+    enabled=False 이면 span() 이 빈 구간을 돌려주므로 측정 비용이 거의 없다."""
+
+    def __init__(self, enabled=False, log=None):
+        self.enabled = enabled
+        self.log = log or (lambda message: None)
+        self._origin = time.perf_counter()
+        self._lock = threading.Lock()
+        self.reset()
+
+    def reset(self):
+        with self._lock:
+            self.events = []
+            self.durations = {}      # {구간 이름: [초, ...]}
+            self.counters = Counter()  # {이름: 횟수} - WebDriver 명령, 오류 등
+            self.dropped = 0
+
+    def span(self, name, category="stage", **args):
+        """with 블록 구간 측정 - 측정을 끈 상태면 빈 구간"""
+        if not self.enabled:
+            return NULL_SPAN
+        return _Span(self, name, category, args)
+
+    def sleep(self, seconds, name="sleep"):
+        """고정 대기 - 측정 중이면 대기 시간도 구간으로 기록
+        작업 스레드에서는 중지 요청 즉시 깨어남 (계속 진행해도 되면 True)"""
+        with self.span(name, "sleep"):
+            return cancellable_sleep(seconds)
+
+    def count(self, name, amount=1):
+        if self.enabled:
+            with self._lock:
+                self.counters[name] += amount
+
+    def _finish(self, span, end, exc_type):
+        seconds = end - span.start
+        event = {
+            'name': span.name, 'cat': span.category, 'ph': 'X',
+            'ts': round((span.start - self._origin) * 1e6, 1), 'dur': round(seconds * 1e6, 1),
+            'pid': os.getpid(), 'tid': threading.get_ident(),
+        }
+        if span.args or exc_type:
+            event['args'] = dict(span.args, **({'error': exc_type.__name__} if exc_type else {}))
+        with self._lock:
+            durations = self.durations.setdefault(span.name, [])
+            durations.append(seconds)
+            if len(durations) > HISTOGRAM_LIMIT:
+                del durations[:len(durations) - HISTOGRAM_LIMIT]
+            if exc_type:
+                self.counters[f"{span.name}.error"] += 1
+            if len(self.events) < EVENT_LIMIT:
+                self.events.append(event)
+            else:
+                self.dropped += 1
+
+    def instrument_driver(self, driver):
+        """WebDriver 명령(get, findElement, executeScript ...) 마다 횟수/시간 기록 - 드라이버당 1회"""
+        if getattr(driver, '_tracer_instrumented', False):
+            return driver
+        original = driver.execute
+
+        def execute(command, params=None):
+            if not self.enabled:
+                return original(command, params)
+            self.count(f"webdriver.{command}")
+            with self.span(f"webdriver.{command}", "webdriver"):
+                return original(command, params)
+
+        driver.execute = execute
+        driver._tracer_instrumented = True
+        return driver
+
+    def stats(self):
+        """{구간 이름: {'count', 'total', 'p50', 'p95', 'max'}} (초)"""
+        with self._lock:
+            snapshot = {name: sorted(values) for name, values in self.durations.items()}
+        return {
+            name: {
+                'count': len(values),
+                'total': sum(values),
+                'p50': percentile(values, 0.50),
+                'p95': percentile(values, 0.95),
+                'max': values[-1] if values else 0.0,
+            }
+            for name, values in snapshot.items()
+        }
+
+    def summary(self, top=8):
+        """총 소요 시간이 큰 구간 순 요약 문자열"""
+        stats = sorted(self.stats().items(), key=lambda item: -item[1]['total'])[:top]
+        if not stats:
+            return "측정 기록 없음"
+        parts = [f"{name} {s['count']}회 합계 {s['total']:.1f}초 (p50 {s['p50'] * 1000:.0f}ms, "
+                 f"p95 {s['p95'] * 1000:.0f}ms, 최대 {s['max'] * 1000:.0f}ms)" for name, s in stats]
+        commands = sum(count for name, count in self.counters.items() if name.startswith("webdriver."))
+        return f"단계별 소요 시간: {' | '.join(parts)} | WebDriver 명령 {commands:,}회"
+
+    def export_chrome_trace(self, path):
+        """Chrome trace-event JSON 저장 (chrome://tracing, Perfetto 에서 열기)"""
+        with self._lock:
+            events = list(self.events)
+            counters = dict(self.counters)
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump({
+                'traceEvents': events,
+                'displayTimeUnit': 'ms',
+                'otherData': {'counters': counters, 'dropped_events': self.dropped},
+            }, f, ensure_ascii=False)
+        self.log(f"🧭 추적 파일 저장: {path} ({len(events):,}개 구간)")
+        return path
+
+
+def traced(name, category="stage"):
+    """메서드 전체를 구간으로 측정하는 데코레이터 - 호출 시 self.tracer 를 사용"""
+    def decorate(func):
+        @functools.wraps(func)
+        def wrapper(self, *args, **kwargs):
+            tracer = getattr(self, 'tracer', None)
+            if tracer is None or not tracer.enabled:
+                return func(self, *args, **kwargs)
+            with tracer.span(name, category):
+                return func(self, *args, **kwargs)
+        return wrapper
+    return decorate
@@ -0,0 +1,220 @@
+# BUYMA 자동화 프로그램 - 색상/사이즈 추출 모듈
+import json
+import threading
+import time
+
+
+# 숨겨진 DOM(ul.colorsize_list)과 페이지에 포함된 JSON을 한 번의 스크립트 호출로 읽음
+# - .text 는 숨겨진 요소에서 빈 문자열을 반환하므로 textContent 를 사용
+VARIATION_SCRIPT = """
+var clean = function(t) { return (t || '').replace(/\\s+/g, ' ').trim(); };
+var result = {
+    selectors: document.querySelectorAll('p.colorsize_selector').length,
+    colors: [],
+    sizes: [],
+    embedded: []
+};
+var colorList = document.querySelector('ul.colorsize_list:not(.js-size-list)');
+if (colorList) {
+    colorList.querySelectorAll('li').forEach(function(li) {
+        var span = li.querySelector('span.item_color');
+        var category = span ? (span.getAttribute('class') || '').replace('item_color', '').trim() : '';
+        result.colors.push([category, clean(li.textContent)]);
+    });
+}
+var sizeList = document.querySelector('.colorsize_list.js-size-list');
+if (sizeList) {
+    sizeList.querySelectorAll('li').forEach(function(li) {
+        result.sizes.push(clean(li.textContent));
+    });
+}
+if (!result.colors.length && !result.sizes.length) {
+    document.querySelectorAll('script[type="application/ld+json"], script[type="application/json"]').forEach(function(s) {
+        result.embedded.push(s.textContent || '');
+    });
+}
+return result;
+"""
+
+COLOR_KEYS = ('color', 'colors', 'colorName', 'color_name')
+SIZE_KEYS = ('size', 'sizes', 'sizeName', 'size_name')
+
+
+def normalize_variations(raw_colors, raw_sizes):
+    """스크립트 결과를 기존 형식([[카테고리, 색상명]], [사이즈])으로 정리 (중복/빈 값 제거)"""
+    colors = []
+    for item in raw_colors or []:
+        if isinstance(item, (list, tuple)) and len(item) == 2:
+            category, text = item
+        else:
+            category, text = "", item
+        category = str(category or "").strip()
+        text = " ".join(str(text or "").split())
+        if text and [category, text] not in colors:
+            colors.append([category, text])
+
+    sizes = []
+    for item in raw_sizes or []:
+        text = " ".join(str(item or "").split())
+        if text and text not in sizes:
+            sizes.append(text)
+
+    return colors, sizes
+
+
+def parse_embedded_variations(json_texts):
+    """페이지에 포함된 JSON(ld+json 등)에서 색상/사이즈 값 수집"""
+    raw_colors = []
+    raw_sizes = []
+
+    def collect(value, target):
+        if isinstance(value, str):
+            target.append(value)
+        elif isinstance(value, list):
+            for v in value:
+                collect(v, target)
+        elif isinstance(value, dict):
+            name = value.get('name') or value.get('value')
+            if isinstance(name, str):
+                target.append(name)
+
+    def walk(node):
+        if isinstance(node, dict):
+            for key, value in node.items():
+                if key in COLOR_KEYS:
+                    collect(value, raw_colors)
+                elif key in SIZE_KEYS:
+                    collect(value, raw_sizes)
+                else:
+                    walk(value)
+        elif isinstance(node, list):
+            for v in node:
+                walk(v)
+
+    for text in json_texts or []:
+        try:
+            walk(json.loads(text))
+        except (ValueError, TypeError):
+            continue
+
+    return normalize_variations(raw_colors, raw_sizes)
+
+
+def extract_variations_by_clicking(driver, log=print):
+    """기존 방식: 색상/사이즈 버튼을 클릭해 목록을 펼친 뒤 읽기 (폴백 전용)"""
+    from selenium.webdriver.common.by import By
+
+    colors = []
+    sizes = []
+
+    color_size_buttons = driver.find_elements(By.CSS_SELECTOR, "p.colorsize_selector")
+
+    if len(color_size_buttons) >= 1:
+        # 색상 정보 추출
+        try:
+            color_size_buttons[0].click()
+            time.sleep(1)
+
+            colors_ul = driver.find_element(By.CSS_SELECTOR, "ul.colorsize_list")
+            colors_li_elements = colors_ul.find_elements(By.TAG_NAME, "li")
+
+            for li in colors_li_elements:
+                try:
+                    try:
+                        color_category_element = li.find_element(By.CSS_SELECTOR, "span.item_color")
+                        color_category = color_category_element.get_attribute("class").replace("item_color ", "").strip()
+                    except Exception:
+                        color_category = ""  # 카테고리를 찾을 수 없는 경우 빈 문자열
+
+                    color_text = li.text.strip()
+                    if color_text and [color_category, color_text] not in colors:
+                        colors.append([color_category, color_text])
+                except Exception as li_e:
+                    log(f"❌ 색상 li 처리 오류: {str(li_e)}")
+                    continue
+
+            # 색상 정보 옵션 종료
+            color_size_buttons[0].click()
+            time.sleep(1)
+
+        except Exception as e:
+            log(f"⚠️ 색상 정보 추출 실패: {str(e)}")
+
+    # 사이즈 정보 추출 (두 번째 버튼이 있는 경우에만)
+    if len(color_size_buttons) >= 2:
+        try:
+            color_size_buttons[1].click()
+            time.sleep(1)
+
+            sizes_ul = driver.find_element(By.CSS_SELECTOR, ".colorsize_list.js-size-list")
+            sizes_li_elements = sizes_ul.find_elements(By.TAG_NAME, "li")
+
+            for li in sizes_li_elements:
+                try:
+                    size_text = li.text.strip()
+                    if size_text and size_text not in sizes:
+                        sizes.append(size_text)
+                except Exception:
+                    continue
+
+            # 사이즈 정보 옵션 종료
+            color_size_buttons[1].click()
+            time.sleep(1)
+
+        except Exception as e:
+            log(f"⚠️ 사이즈 정보 추출 실패: {str(e)}")
+
+    return colors, sizes
+
+
+class VariationExtractor:
+    """클릭 없이 색상/사이즈를 추출하고, 실패 시에만 클릭 방식으로 폴백하는 클래스"""
+
+    def __init__(self):
+        self.stats = {'dom': 0, 'embedded': 0, 'no_options': 0, 'fallback': 0}
+        self._lock = threading.Lock()
+
+    def _count(self, key):
+        with self._lock:
+            self.stats[key] += 1
+
+    def read_page(self, driver):
+        """스크립트 1회 호출로 색상/사이즈 추출 - 찾지 못하면 None 반환"""
+        data = driver.execute_script(VARIATION_SCRIPT) or {}
+
+        colors, sizes = normalize_variations(data.get('colors'), data.get('sizes'))
+        if colors or sizes:
+            self._count('dom')
+            return colors, sizes
+
+        colors, sizes = parse_embedded_variations(data.get('embedded'))
+        if colors or sizes:
+            self._count('embedded')
+            return colors, sizes
+
+        # 옵션 버튼 자체가 없는 상품은 클릭해도 얻을 것이 없음
+        if not data.get('selectors'):
+            self._count('no_options')
+            return [], []
+
+        return None
+
+    def extract(self, driver, log=print):
+        """색상/사이즈 추출 (DOM/JSON 우선, 실패 시 클릭 폴백)"""
+        try:
+            result = self.read_page(driver)
+            if result is not None:
+                return result
+        except Exception as e:
+            log(f"⚠️ 색상/사이즈 스크립트 추출 실패: {str(e)}")
+
+        self._count('fallback')
+        log(f"🖱️ 색상/사이즈 클릭 추출로 대체 (누적 {self.stats['fallback']}회)")
+        return extract_variations_by_clicking(driver, log)
+
+    def summary(self):
+        """추출 경로별 통계 문자열"""
+        with self._lock:
+            s = dict(self.stats)
+        return (f"색상/사이즈 추출 통계 - DOM: {s['dom']}, JSON: {s['embedded']}, "
+                f"옵션없음: {s['no_options']}, 클릭 폴백: {s['fallback']}")